@@ -35,6 +35,11 @@ export const SOCRATA_RAG_ARTIFACTS: RagArtifactReference[] = [
     description: "Combined Socrata RAG bundle",
     path: "docs/Socrata.rag.bundle.jsonl"
   },
+  {
+    id: "socrata_bundle_aliases",
+    description: "Ids of near-duplicate chunks dropped from the bundle, mapped to the kept chunk",
+    path: "docs/Socrata.rag.bundle.aliases.json"
+  },
   {
     id: "socrata_index",
     description: "Socrata RAG index manifest",
@@ -52,15 +52,175 @@ const spec = {
       "maxOffsetPlusLimit": 10000
     },
     "sourceChunkIds": [
-      "section-purpose-1",
-      "endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-summary-1",
-      "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1",
-      "endpoint-get-catalog-v1-names-name-find-assets-by-name-summary-1",
-      "endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1",
-      "endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1",
-      "endpoint-get-catalog-v1-only-type-find-assets-by-type-summary-1",
-      "endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-summary-1"
-    ]
+      "endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-req-query-1",
+      "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1",
+      "endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1",
+      "endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1",
+      "endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1"
+    ],
+    "paramChunkIds": {
+      "approval_status": [
+        "endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-req-query-1",
+        "endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1"
+      ],
+      "attribution": [
+        "endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-req-query-1",
+        "endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-summary-1"
+      ],
+      "audience": [
+        "endpoint-get-catalog-v1-audience-audience-find-by-audience-req-query-1",
+        "endpoint-get-catalog-v1-audience-audience-find-by-audience-summary-1"
+      ],
+      "boostDesc": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1"
+      ],
+      "boostDomains[{DomainName}]": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1"
+      ],
+      "boostOfficial": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1"
+      ],
+      "boostTitle": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1"
+      ],
+      "boost{Datatype}": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1"
+      ],
+      "boost{key}": [
+        "endpoint-get-catalog-v1-boost-key-number-boost-assets-summary-1"
+      ],
+      "categories": [
+        "endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1",
+        "endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1"
+      ],
+      "column_names": [
+        "endpoint-get-catalog-v1-column-names-name-find-by-column-name-req-query-1",
+        "endpoint-get-catalog-v1-column-names-name-find-by-column-name-summary-1"
+      ],
+      "custom-metadata_key": [
+        "endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-req-query-1"
+      ],
+      "deduplicate": [
+        "endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-req-query-1",
+        "endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-summary-1"
+      ],
+      "derived": [
+        "endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-req-query-1",
+        "endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-summary-1"
+      ],
+      "derived_from": [
+        "endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-req-query-1",
+        "endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-summary-1"
+      ],
+      "domains": [
+        "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1",
+        "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1"
+      ],
+      "explicitly_hidden": [
+        "endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-req-query-1",
+        "endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-summary-1"
+      ],
+      "for_user": [
+        "endpoint-get-catalog-v1-for-user-4x4-find-by-owner-req-query-1",
+        "endpoint-get-catalog-v1-for-user-4x4-find-by-owner-summary-1"
+      ],
+      "ids": [
+        "endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-req-query-1",
+        "endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-summary-1"
+      ],
+      "license": [
+        "endpoint-get-catalog-v1-license-license-find-assets-by-license-req-query-1",
+        "endpoint-get-catalog-v1-license-license-find-assets-by-license-summary-1"
+      ],
+      "limit": [
+        "endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1",
+        "endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1",
+        "endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-req-query-1",
+        "endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1"
+      ],
+      "min_should_match": [
+        "endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-req-query-1",
+        "endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-summary-1"
+      ],
+      "names": [
+        "endpoint-get-catalog-v1-names-name-find-assets-by-name-req-query-1",
+        "endpoint-get-catalog-v1-names-name-find-assets-by-name-summary-1"
+      ],
+      "offset": [
+        "endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1"
+      ],
+      "only": [
+        "endpoint-get-catalog-v1-only-type-find-assets-by-type-req-query-1",
+        "endpoint-get-catalog-v1-only-type-find-assets-by-type-summary-1"
+      ],
+      "order": [
+        "endpoint-get-catalog-v1-order-sort-order-sort-results-req-query-1",
+        "endpoint-get-catalog-v1-order-sort-order-sort-results-summary-1"
+      ],
+      "parent_ids": [
+        "endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-req-query-1",
+        "endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-summary-1"
+      ],
+      "provenance": [
+        "endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-req-query-1",
+        "endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-summary-1"
+      ],
+      "published": [
+        "endpoint-get-catalog-v1-published-true-false-find-by-publication-status-req-query-1",
+        "endpoint-get-catalog-v1-published-true-false-find-by-publication-status-summary-1"
+      ],
+      "q": [
+        "endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-req-query-1",
+        "endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-summary-1",
+        "endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-req-query-1",
+        "endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-summary-1",
+        "endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-req-query-1",
+        "endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-summary-1"
+      ],
+      "reviewer_id": [
+        "endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-req-query-1",
+        "endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-summary-1"
+      ],
+      "scroll_id": [
+        "endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1"
+      ],
+      "search_context": [
+        "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1",
+        "endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1",
+        "endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1",
+        "endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1",
+        "endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1",
+        "endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1",
+        "endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-summary-1"
+      ],
+      "shared_to": [
+        "endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-req-query-1",
+        "endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-summary-1"
+      ],
+      "show_visibility": [
+        "endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-req-query-1",
+        "endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1"
+      ],
+      "submitter_id": [
+        "endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-req-query-1",
+        "endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-summary-1"
+      ],
+      "tags": [
+        "endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1",
+        "endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1"
+      ],
+      "target_audience": [
+        "endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-req-query-1",
+        "endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1"
+      ],
+      "visibility": [
+        "endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-req-query-1",
+        "endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1"
+      ],
+      "{custom_metadata_key}": [
+        "endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-summary-1"
+      ]
+    }
   },
   "soda": {
     "v2": {
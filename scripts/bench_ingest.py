@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Benchmark the RAG ingest path on synthetic Discovery-style manuals.
+
+The generator writes manuals shaped like docs/Discovery_API.md (whitelisted
+sections, endpoint title + method lines, REQUEST/RESPONSE markers, parameter
+blocks, Field/Type/Description tables and long blank runs) at a multiple of its
+size. Each scale runs in a fresh worker process so memory figures do not leak
+between scales; stages run in order within it:
+
+    read            map the file and index its lines (rag_input.open_lines)
+    parse           parse() in discovery mode
+    build_chunks    chunks for the parsed document
+    endpoints       build_endpoints_jsonl()
+    serialize       write_document(): .rag.json, chunks and endpoints JSONL
+    parse_generic   parse_generic_sections() over the same lines
+    parse_parallel  parse_parallel() with ``--parse-jobs`` processes (only when given)
+
+Per stage the report has wall time (best of ``--repeat``), the process peak RSS
+after the stage, how much the stage raised it, and throughput in input lines/s
+and MB/s. Output is JSON on stdout or ``--out``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from parse_discovery_api import (
+    SECTION_WHITELIST,
+    build_chunks,
+    build_endpoints_jsonl,
+    parse,
+    parse_generic_sections,
+    parse_parallel,
+    write_document,
+)
+from rag_input import open_lines
+from rag_ir import Document
+
+
+REFERENCE_MANUAL = Path(__file__).resolve().parent.parent / "docs" / "Discovery_API.md"
+REFERENCE_BYTES = 394_217  # size of docs/Discovery_API.md, used when it is not on disk
+STAGES = ("read", "parse", "build_chunks", "endpoints", "serialize", "parse_generic")
+
+WORDS = (
+    "asset dataset domain catalog search filter result query category tag owner audience "
+    "publication approval federation metadata attribution provenance license column view "
+    "record identifier resource response request parameter value list repeated official"
+).split()
+TYPES = ("string", "integer", "boolean", "[string]", "array of strings", "Resource", "[Asset]", "object")
+ANNOTATIONS = (
+    "Search by this field here.",
+    "Search within this field here.",
+    "Sort by this field here.",
+    "Autocomplete this field here.",
+)
+PARAM_MARKERS = ("QUERY-STRING PARAMETERS", "PATH PARAMETERS", "HEADER PARAMETERS")
+
+
+def sentence(rng: random.Random, low: int = 6, high: int = 24) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+
+def synthetic_endpoint(rng: random.Random, n: int) -> List[str]:
+    param = rng.choice(WORDS)
+    out = [
+        f"Find assets by {param} {n}",
+        f"get /catalog/v{n % 3 + 1}/{param}s?{param}={{{param}}}&page={n}",
+        paragraph(rng, rng.randint(1, 4)),
+        "",
+        "Examples",
+    ]
+    out.extend(f"?{param}={rng.choice(WORDS)}-{rng.randint(0, 9999)}" for _ in range(rng.randint(1, 4)))
+    out.extend(["", "REQUEST"])
+    for marker in rng.sample(PARAM_MARKERS, rng.randint(1, 2)):
+        out.append(marker)
+        for _ in range(rng.randint(1, 5)):
+            out.extend([rng.choice(WORDS) + f"_{rng.randint(0, 99)}", rng.choice(TYPES[:4]), sentence(rng), "", ""])
+    out.extend(
+        [
+            "RESPONSE",
+            "MODEL",
+            "EXAMPLE",
+            "application/json",
+            f"200 - Search Response - {sentence(rng, 4, 8)}",
+            "",
+            "Field",
+            "Type",
+            "Description",
+        ]
+    )
+    for _ in range(rng.randint(8, 40)):
+        out.extend([rng.choice(WORDS) + f"_{rng.randint(0, 999)}", rng.choice(TYPES), sentence(rng)])
+        out.append("")
+        out.extend(rng.sample(ANNOTATIONS, rng.randint(0, 3)))
+        out.extend([""] * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            out.append(f"Example: {sentence(rng, 3, 10)}")
+        if rng.random() < 0.05:
+            out.extend([""] * rng.randint(20, 80))
+    return out
+
+
+def generate_manual(scale: float, *, seed: int = 0, reference_bytes: Optional[int] = None) -> str:
+    """A deterministic Discovery-style manual of about ``scale`` times the
+    reference size, with CRLF line endings like the source document."""
+    if reference_bytes is None:
+        reference_bytes = REFERENCE_MANUAL.stat().st_size if REFERENCE_MANUAL.exists() else REFERENCE_BYTES
+    target = int(reference_bytes * scale)
+    rng = random.Random(seed)
+    lines = ["Discovery API 1.0", ""]
+    size = 0
+    n = 0
+    while size < target:
+        block: List[str] = []
+        if n % 25 == 0:
+            for heading in sorted(SECTION_WHITELIST):
+                block.append(heading)
+                for _ in range(rng.randint(1, 4)):
+                    block.extend([paragraph(rng, rng.randint(2, 6)), ""])
+        block.extend(synthetic_endpoint(rng, n))
+        size += sum(len(line) + 2 for line in block)
+        lines.extend(block)
+        n += 1
+    return "\r\n".join(lines) + "\r\n"
+
+
+def encode(doc: Document) -> str:
+    return json.dumps(doc.to_dict(), ensure_ascii=True)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scale(
+    scale: float, seed: int, repeat: int, reference_bytes: Optional[int] = None, parse_jobs: int = 0
+) -> Dict[str, Any]:
+    """Worker entry point: generate one corpus and time every stage on it."""
+    data = generate_manual(scale, seed=seed, reference_bytes=reference_bytes).encode("utf-8")
+    mb = len(data) / (1024 * 1024)
+    state: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix="bench-ingest-") as tmp, ExitStack() as stack:
+        out = Path(tmp)
+        source = out / "synthetic.md"
+        source.write_bytes(data)
+
+        def read() -> None:
+            state["lines"] = stack.enter_context(open_lines(source))
+
+        def run_parse() -> None:
+            state["doc"] = parse(state["lines"], section_whitelist=SECTION_WHITELIST)
+
+        def chunks() -> None:
+            state["chunks"] = build_chunks(state["doc"], source_file="synthetic.md", doc_id="synthetic")
+
+        def endpoints() -> None:
+            state["endpoints"] = build_endpoints_jsonl(state["doc"])
+
+        def serialize() -> None:
+            write_document(
+                state["doc"],
+                state["chunks"],
+                state["endpoints"],
+                out_json=str(out / "synthetic.rag.json"),
+                out_jsonl=str(out / "synthetic.rag.chunks.jsonl"),
+                out_endpoints_jsonl=str(out / "synthetic.rag.endpoints.jsonl"),
+            )
+
+        def generic() -> None:
+            state["generic"] = parse_generic_sections(state["lines"])
+
+        def parallel() -> None:
+            state["parallel"] = parse_parallel(state["lines"], SECTION_WHITELIST, jobs=parse_jobs)
+
+        steps: Dict[str, Callable[[], None]] = {
+            "read": read,
+            "parse": run_parse,
+            "build_chunks": chunks,
+            "endpoints": endpoints,
+            "serialize": serialize,
+            "parse_generic": generic,
+            "parse_parallel": parallel,
+        }
+        stages: Dict[str, Dict[str, Any]] = {}
+        line_count = 0
+        for name in STAGES + (("parse_parallel",) if parse_jobs > 1 else ()):
+            before = peak_rss_mb()
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                steps[name]()
+                best = min(best, time.perf_counter() - start)
+            if name == "read":
+                line_count = len(state["lines"])
+            after = peak_rss_mb()
+            stages[name] = {
+                "wall_s": round(best, 6),
+                "peak_rss_mb": round(after, 1),
+                "peak_rss_growth_mb": round(after - before, 1),
+                "lines_per_s": round(line_count / best) if best else None,
+                "mb_per_s": round(mb / best, 2) if best else None,
+            }
+
+    doc = state["doc"]
+    if "parallel" in state and encode(state["parallel"]) != encode(doc):
+        raise RuntimeError(f"parse_parallel disagrees with parse at scale {scale}")
+    return {
+        "scale": scale,
+        "input_bytes": len(data),
+        "input_lines": line_count,
+        "sections": len(doc.sections),
+        "endpoints": len(doc.endpoints),
+        "chunks": len(state["chunks"]),
+        "generic_sections": len(state["generic"].sections),
+        "stages": stages,
+    }
+
+
+def run_benchmarks(
+    scales: List[float],
+    *,
+    seed: int = 0,
+    repeat: int = 1,
+    reference_bytes: Optional[int] = None,
+    parse_jobs: int = 0,
+) -> Dict[str, Any]:
+    runs = []
+    for scale in scales:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            runs.append(pool.submit(run_scale, scale, seed, repeat, reference_bytes, parse_jobs).result())
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": seed,
+        "repeat": repeat,
+        "parse_jobs": parse_jobs,
+        "runs": runs,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated multiples of docs/Discovery_API.md")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per stage; the best wall time is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--parse-jobs",
+        type=int,
+        default=0,
+        help="Also time parse_parallel() with this many processes (checked against parse())",
+    )
+    parser.add_argument("--out", default="", help="Write the JSON report here instead of stdout")
+    parser.add_argument(
+        "--write-corpus",
+        default="",
+        help="Only write the synthetic manual for the first scale to this path (e.g. to feed the CLI)",
+    )
+    args = parser.parse_args()
+    scales = [float(s) for s in args.scales.split(",") if s.strip()]
+    if not scales:
+        parser.error("--scales needs at least one value")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if args.write_corpus:
+        Path(args.write_corpus).write_bytes(generate_manual(scales[0], seed=args.seed).encode("utf-8"))
+        return
+
+    report = json.dumps(
+        run_benchmarks(scales, seed=args.seed, repeat=args.repeat, parse_jobs=args.parse_jobs), indent=2
+    )
+    if args.out:
+        Path(args.out).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
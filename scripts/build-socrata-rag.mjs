@@ -1,11 +1,12 @@
 import { execSync } from "node:child_process";
+import crypto from "node:crypto";
 import fs from "node:fs";
 import path from "node:path";
 
 const ROOT = new URL("..", import.meta.url).pathname;
 
 const run = (cmd) => {
-  execSync(cmd, { stdio: "inherit" });
+  execSync(cmd, { stdio: "inherit", cwd: ROOT });
 };
 
 const assertLocalFile = (relativePath) => {
@@ -19,167 +20,59 @@ const assertLocalFile = (relativePath) => {
   return fullPath;
 };
 
-const parseJsonl = (text) => {
-  return text
-    .split(/\r?\n/)
-    .map((line) => line.trim())
-    .filter(Boolean)
-    .flatMap((line) => {
-      try {
-        return [JSON.parse(line)];
-      } catch (_) {
-        return [];
-      }
-    });
-};
-
 const writeFile = (relativePath, content) => {
   fs.writeFileSync(path.join(ROOT, relativePath), content, "utf8");
 };
 
 const readFile = (relativePath) => fs.readFileSync(path.join(ROOT, relativePath), "utf8");
 
-const buildBundle = () => {
-  const discovery = readFile("docs/Discovery_API.rag.chunks.jsonl");
-  const soda = readFile("docs/Discovery_API_2.rag.chunks.jsonl");
-  const joined = [discovery.trim(), soda.trim()].filter(Boolean).join("\n") + "\n";
-  writeFile("docs/Socrata.rag.bundle.jsonl", joined);
-  return joined;
-};
-
-const buildIndexManifest = () => {
-  const manifest = {
-    title: "Socrata RAG Index",
-    version: "1.0",
-    artifacts: [
-      {
-        doc_id: "socrata_discovery",
-        source_file: "docs/Discovery_API.md",
-        rag_json: "docs/Discovery_API.rag.json",
-        chunks_jsonl: "docs/Discovery_API.rag.chunks.jsonl",
-        endpoints_jsonl: "docs/Discovery_API.rag.endpoints.jsonl"
-      },
-      {
-        doc_id: "socrata_soda_api",
-        source_file: "docs/Discovery_API_2.txt",
-        rag_json: "docs/Discovery_API_2.rag.json",
-        chunks_jsonl: "docs/Discovery_API_2.rag.chunks.jsonl"
-      },
-      {
-        doc_id: "socrata_bundle",
-        source_file: [
-          "docs/Discovery_API.rag.chunks.jsonl",
-          "docs/Discovery_API_2.rag.chunks.jsonl"
-        ],
-        chunks_jsonl: "docs/Socrata.rag.bundle.jsonl"
-      }
-    ]
-  };
-  writeFile("docs/Socrata.rag.index.json", JSON.stringify(manifest, null, 2));
-};
-
-const normalizeParamName = (name) => name.trim();
-
-const isParamNameValid = (name) => {
-  if (!name) return false;
-  if (/^constraints/i.test(name)) return false;
-  if (name.includes(":")) return false;
-  if (/\s/.test(name)) return false;
-  return true;
+const readBundleAliases = () => {
+  const aliasesPath = "docs/Socrata.rag.bundle.aliases.json";
+  if (!fs.existsSync(path.join(ROOT, aliasesPath))) return {};
+  return JSON.parse(readFile(aliasesPath)).aliases || {};
 };
 
-const extractPathParams = (pathValue) => {
-  if (!pathValue || typeof pathValue !== "string") return [];
-  const idx = pathValue.indexOf("?");
-  if (idx === -1) return [];
-  const query = pathValue.slice(idx + 1);
-  return query
-    .split("&")
-    .map((part) => part.split("=")[0])
-    .map((name) => normalizeParamName(name || ""))
-    .filter((name) => isParamNameValid(name));
-};
-
-const buildSpec = (bundleText) => {
-  const endpoints = parseJsonl(readFile("docs/Discovery_API.rag.endpoints.jsonl"));
-  const allowedParams = new Set();
-  for (const endpoint of endpoints) {
-    const params = endpoint?.request?.query || [];
-    for (const param of params) {
-      const name = normalizeParamName(param?.name || "");
-      if (!isParamNameValid(name)) continue;
-      allowedParams.add(name);
-    }
-    const pathParams = extractPathParams(endpoint?.path || "");
-    pathParams.forEach((param) => allowedParams.add(param));
-  }
-
-  const bundle = parseJsonl(bundleText);
-  const pickChunkIds = (predicate, limit = 8) => {
-    const hits = bundle.filter(predicate).slice(0, limit).map((chunk) => chunk.id).filter(Boolean);
-    return Array.from(new Set(hits));
-  };
-
-  const discoveryChunks = pickChunkIds(
-    (chunk) => chunk.doc_id === "socrata_discovery" && /catalog\/v1/i.test(chunk.text)
-  );
-  const sodaV2Chunks = pickChunkIds(
-    (chunk) => chunk.doc_id === "socrata_soda_api" && /\/resource\//i.test(chunk.text)
-  );
-  const sodaV3Chunks = pickChunkIds(
-    (chunk) => chunk.doc_id === "socrata_soda_api" && /api\/v3\/views/i.test(chunk.text)
-  );
-
-  const spec = {
-    version: 1,
-    discovery: {
-      catalogBaseUrls: {
-        us: "https://api.us.socrata.com/api/catalog/v1",
-        eu: "https://api.eu.socrata.com/api/catalog/v1"
-      },
-      allowedParams: Array.from(allowedParams.values()).sort(),
-      pagination: {
-        defaultLimit: 100,
-        maxOffsetPlusLimit: 10000
-      },
-      sourceChunkIds: discoveryChunks
-    },
-    soda: {
-      v2: {
-        resourcePath: "/resource/{id}.json",
-        sourceChunkIds: sodaV2Chunks
-      },
-      v3: {
-        queryPath: "/api/v3/views/{id}/query.json",
-        exportPath: "/api/v3/views/{id}/export.csv",
-        sourceChunkIds: sodaV3Chunks
-      }
-    }
-  };
-
-  writeFile("data/socrataRagSpec.json", JSON.stringify(spec, null, 2));
-  writeFile("data/socrataRagSpec.ts", `const spec = ${JSON.stringify(spec, null, 2)};\nexport default spec;\n`);
+const readAnswerCache = () => {
+  const cachePath = "docs/Socrata.rag.answers.json";
+  if (!fs.existsSync(path.join(ROOT, cachePath))) return null;
+  return JSON.parse(readFile(cachePath));
 };
 
 const buildWorkerBundle = (bundleText) => {
-  const payload = `export const SOCRATA_RAG_BUNDLE_JSONL = ${JSON.stringify(bundleText)};\n`;
+  // ids of near-duplicate chunks dropped from the bundle resolve to their survivor
+  const aliases = readBundleAliases();
+  // the answer cache is only used while it matches the bundle's hash
+  const sha256 = crypto.createHash("sha256").update(bundleText, "utf8").digest("hex");
+  const answers = readAnswerCache();
+  const payload =
+    'import type { RagAnswerCache } from "../services/ragAnswerCache";\n\n' +
+    `export const SOCRATA_RAG_BUNDLE_JSONL = ${JSON.stringify(bundleText)};\n` +
+    `export const SOCRATA_RAG_BUNDLE_ALIASES: Record<string, string> = ${JSON.stringify(aliases)};\n` +
+    `export const SOCRATA_RAG_BUNDLE_SHA256 = ${JSON.stringify(sha256)};\n` +
+    `export const SOCRATA_RAG_ANSWER_CACHE: RagAnswerCache | null = ${JSON.stringify(answers)};\n`;
   writeFile("workers/socrataRagBundle.ts", payload);
 };
 
 const main = () => {
   const parseScript = assertLocalFile("scripts/parse_discovery_api.py");
-  const discoveryInput = assertLocalFile("docs/Discovery_API.md");
-  const sodaInput = assertLocalFile("docs/Discovery_API_2.txt");
-  run(
-    `python3 ${parseScript} --input ${discoveryInput} --out-json docs/Discovery_API.rag.json --out-jsonl docs/Discovery_API.rag.chunks.jsonl --out-endpoints-jsonl docs/Discovery_API.rag.endpoints.jsonl --mode discovery --doc-id socrata_discovery`
-  );
-  run(
-    `python3 ${parseScript} --input ${sodaInput} --out-json docs/Discovery_API_2.rag.json --out-jsonl docs/Discovery_API_2.rag.chunks.jsonl --mode generic --doc-id socrata_soda_api`
-  );
-
-  const bundleText = buildBundle();
-  buildIndexManifest();
-  buildSpec(bundleText);
+  const indexFile = assertLocalFile("docs/Socrata.rag.index.json");
+  const index = JSON.parse(readFile("docs/Socrata.rag.index.json"));
+  for (const artifact of index.artifacts || []) {
+    if (typeof artifact.source_file === "string") {
+      assertLocalFile(artifact.source_file);
+    }
+  }
+  // Parses every document listed in the index in parallel, merges the bundle
+  // and rewrites the index; paths in the index are relative to the repo root.
+  // --profile leaves a .profile.json with stage timings next to each .rag.json.
+  // The bundle's "spec" entry also regenerates data/socrataRagSpec.{json,ts}
+  // from the parameter/field inverted index (scripts/rag_spec.py), and its
+  // "answer_cache" entry precomputes the hits of docs/Socrata.rag.queries.json
+  // (scripts/rag_answer_cache.py) for the worker.
+  const profile = process.argv.includes("--profile") ? " --profile" : "";
+  run(`python3 ${parseScript} --manifest ${indexFile}${profile}`);
+
+  const bundleText = readFile("docs/Socrata.rag.bundle.jsonl");
   buildWorkerBundle(bundleText);
 };
 
@@ -4,10 +4,48 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
+import hashlib
 import json
+import os
 import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Dict, Any, Optional, Tuple
+from typing import Callable, ContextManager, Iterable, Iterator, List, Dict, Any, Optional, TextIO, Tuple, TypeVar, Union
+
+from rag_answer_cache import write_answer_cache
+from rag_blocks import DEFAULT_BLOCK_BYTES, DEFAULT_LEVEL, block_paths, write_block_jsonl, write_compressed_json
+from rag_bm25 import load_chunks_jsonl, write_prebuilt_index
+from rag_chunker import TOKENIZERS, Chunker, chunk_text, make_chunker
+from rag_dedup import DEFAULT_NUM_PERM, MinHasher, dedup_bundle
+from rag_input import open_lines
+from rag_ir import (
+    PARAM_SECTIONS,
+    Chunk,
+    Document,
+    Endpoint,
+    EndpointRecord,
+    Field,
+    Param,
+    Section,
+    join_paragraphs,
+    slugify,
+)
+from rag_openapi import iter_openapi, load_spec, openapi_document, spec_title
+from rag_publish import publish_index
+from rag_server import ChunkCatalog, file_signature, serve
+from rag_shards import write_shards
+from rag_shared_schema import write_shared_endpoints_jsonl, write_shared_json
+from rag_spec import write_spec_artifacts
+from rag_store import write_chunk_store
 
 
 MARKERS = {
@@ -23,6 +61,8 @@ MARKERS = {
 }
 
 METHOD_RE = re.compile(r"^(get|post|put|delete|patch)\s+/(.+)", re.I)
+STATUS_RE = re.compile(r"^\d{3}\s+-")
+METHOD_PREFIX_RE = re.compile(r"\s*(?:get|post|put|delete|patch)\s", re.I)
 
 SECTION_WHITELIST = {
     "Purpose",
@@ -32,6 +72,9 @@ SECTION_WHITELIST = {
     "Additional API facts",
 }
 
+# modes whose documents have endpoints, and so an endpoints JSONL
+ENDPOINT_MODES = ("discovery", "openapi")
+
 IGNORE_LINES = {
     "Search by this field here.",
     "Search within this field here.",
@@ -47,27 +90,6 @@ IGNORE_PREFIXES = (
 )
 
 
-def slugify(text: str) -> str:
-    text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return text.strip("-") or "section"
-
-
-def join_paragraphs(lines: List[str]) -> List[str]:
-    paragraphs: List[str] = []
-    cur: List[str] = []
-    for line in lines:
-        if not line.strip():
-            if cur:
-                paragraphs.append(" ".join(cur).strip())
-                cur = []
-            continue
-        cur.append(line.strip())
-    if cur:
-        paragraphs.append(" ".join(cur).strip())
-    return paragraphs
-
-
 def is_type_line(line: str) -> bool:
     s = line.strip()
     if not s:
@@ -92,410 +114,680 @@ def is_ignored_line(line: str) -> bool:
     return False
 
 
-def next_nonempty(lines: List[str], idx: int) -> Optional[int]:
-    i = idx
-    while i < len(lines):
-        if lines[i].strip():
-            return i
-        i += 1
-    return None
-
-
-def is_endpoint_start(lines: List[str], idx: int) -> bool:
-    if idx >= len(lines):
-        return False
-    title = lines[idx].strip()
-    if not title:
-        return False
-    if title in MARKERS:
-        return False
-    if title.startswith("http") or title.startswith("?"):
-        return False
-    j = next_nonempty(lines, idx + 1)
-    if j is None:
-        return False
-    return METHOD_RE.match(lines[j].strip()) is not None
-
-
 def is_section_heading(line: str) -> bool:
     return line.strip() in SECTION_WHITELIST
 
 
-def read_blocks_until(lines: List[str], idx: int, stop_pred) -> Tuple[List[List[str]], int]:
-    blocks: List[List[str]] = []
-    cur: List[str] = []
+# Line classification flags; a line may carry several (e.g. a type line that is
+# also an endpoint title), so they are stored as a bit mask per line.
+LINE_BLANK = 0x01
+LINE_MARKER = 0x02
+LINE_METHOD = 0x04
+LINE_ENDPOINT_START = 0x08
+LINE_SECTION_HEADING = 0x10
+LINE_IGNORED = 0x20
+LINE_TYPE = 0x40
+LINE_TITLE_CASE = 0x80  # short title-case line; a heading candidate in generic mode
+
+
+class LineTable:
+    """Lines of a document classified once up front.
+
+    ``stripped`` holds each line stripped, ``flags`` the LINE_* bit mask and
+    ``next_nonempty`` the index of the first non-blank line at or after each
+    position (-1 when only blank lines remain), so the parser never rescans
+    blank runs.
+    """
+
+    __slots__ = ("lines", "stripped", "flags", "next_nonempty")
+
+    def __init__(self, lines: List[str], stripped: List[str], flags: bytearray, next_nonempty: array) -> None:
+        self.lines = lines
+        self.stripped = stripped
+        self.flags = flags
+        self.next_nonempty = next_nonempty
+
+    def __len__(self) -> int:
+        return len(self.stripped)
+
+
+def discovery_line_token(s: str) -> int:
+    """LINE_* flags of a stripped, non-blank line that depend on the line alone."""
+    f = 0
+    if s in MARKERS:
+        f |= LINE_MARKER
+    if METHOD_RE.match(s):
+        f |= LINE_METHOD
+    if s in SECTION_WHITELIST:
+        f |= LINE_SECTION_HEADING
+    if s in IGNORE_LINES or s.startswith(IGNORE_PREFIXES):
+        f |= LINE_IGNORED
+    if is_type_line(s):
+        f |= LINE_TYPE
+    return f
+
+
+def generic_line_token(s: str) -> int:
+    """The flags iter_generic_sections needs: ignored lines and heading candidates."""
+    f = LINE_IGNORED if s in IGNORE_LINES or s.startswith(IGNORE_PREFIXES) else 0
+    if len(s) <= 70 and s == s.title() and not s.startswith("http"):
+        f |= LINE_TITLE_CASE
+    return f
+
+
+def lex_lines(lines: List[str], line_token: Callable[[str], int]) -> Tuple[List[str], bytearray]:
+    """Strip every line once and tag it with ``line_token(stripped)``.
+
+    Manuals repeat the same lines over and over (type names, field annotations,
+    markers), so each distinct stripped line is classified once and the flags
+    are then mapped back over the whole document. Repeats also share one string
+    object, which (with lines decoded lazily from ``rag_input.open_lines``) makes
+    this list of distinct strings the only per-line text held while parsing.
+    """
+    distinct: Dict[str, str] = {}
+    intern = distinct.setdefault
+    stripped = [intern(s, s) for s in map(str.strip, lines)]
+    tokens = {s: line_token(s) if s else LINE_BLANK for s in distinct}
+    return stripped, bytearray(map(tokens.__getitem__, stripped))
+
+
+def classify_lines(lines: List[str]) -> LineTable:
+    """Lex every line once, then walk backwards so each line knows its next
+    non-empty successor (needed for endpoint title detection)."""
+    n = len(lines)
+    stripped, flags = lex_lines(lines, discovery_line_token)
+    next_idx = array("q", [-1]) * (n + 1)
+    following = -1
+    for i in range(n - 1, -1, -1):
+        f = flags[i]
+        if f & LINE_BLANK:
+            next_idx[i] = following
+            continue
+        if (
+            following != -1
+            and flags[following] & LINE_METHOD
+            and not f & LINE_MARKER
+            and not stripped[i].startswith(("http", "?"))
+        ):
+            flags[i] = f | LINE_ENDPOINT_START
+        next_idx[i] = i
+        following = i
+    return LineTable(lines, stripped, flags, next_idx)
+
+
+def read_blocks_until(table: LineTable, idx: int, stop_pred) -> Tuple[List[List[int]], int]:
+    """Group non-blank lines into blank-separated blocks of line indices."""
+    blocks: List[List[int]] = []
+    cur: List[int] = []
+    flags = table.flags
     i = idx
-    while i < len(lines):
-        line = lines[i]
+    n = len(table)
+    while i < n:
         if stop_pred(i):
             break
-        if not line.strip():
+        if flags[i] & LINE_BLANK:
             if cur:
                 blocks.append(cur)
                 cur = []
         else:
-            cur.append(line.strip())
+            cur.append(i)
         i += 1
     if cur:
         blocks.append(cur)
     return blocks, i
 
 
-def parse_param_blocks(blocks: List[List[str]]) -> Tuple[List[Dict[str, Any]], List[str]]:
-    params: List[Dict[str, Any]] = []
+def parse_param_blocks(table: LineTable, blocks: List[List[int]]) -> Tuple[List[Param], List[str]]:
+    params: List[Param] = []
     notes: List[str] = []
+    stripped = table.stripped
+    flags = table.flags
     for block in blocks:
-        if block and all(is_ignored_line(line) for line in block):
+        if block and all(flags[j] & LINE_IGNORED for j in block):
             continue
-        if len(block) >= 2 and is_type_line(block[1]):
+        if len(block) >= 2 and flags[block[1]] & LINE_TYPE:
             params.append(
-                {
-                    "name": block[0],
-                    "type": block[1],
-                    "description": " ".join(block[2:]).strip(),
-                }
+                Param(stripped[block[0]], stripped[block[1]], " ".join(stripped[j] for j in block[2:]).strip())
             )
         else:
-            note = " ".join(block).strip()
+            note = " ".join(stripped[j] for j in block).strip()
             if note and not is_ignored_line(note):
                 notes.append(note)
     return params, notes
 
 
-def parse_field_blocks(lines: List[str], idx: int) -> Tuple[List[Dict[str, Any]], int]:
-    fields: List[Dict[str, Any]] = []
+def parse_field_blocks(table: LineTable, idx: int) -> Tuple[List[Field], int]:
+    fields: List[Field] = []
+    stripped = table.stripped
+    flags = table.flags
 
     def stop_pred(i: int) -> bool:
-        line = lines[i].strip()
-        if not line:
+        f = flags[i]
+        if f & LINE_BLANK:
             return False
-        if line in MARKERS:
-            return True
-        if is_endpoint_start(lines, i):
-            return True
-        if is_section_heading(line):
-            return True
-        return False
+        return bool(f & (LINE_MARKER | LINE_ENDPOINT_START | LINE_SECTION_HEADING))
 
-    blocks, new_idx = read_blocks_until(lines, idx, stop_pred)
+    blocks, new_idx = read_blocks_until(table, idx, stop_pred)
     for block in blocks:
         if not block:
             continue
-        if all(is_ignored_line(line) for line in block):
+        if all(flags[j] & LINE_IGNORED for j in block):
             continue
-        if block[0].startswith(IGNORE_PREFIXES):
+        first = stripped[block[0]]
+        if first.startswith(IGNORE_PREFIXES):
             continue
-        if len(block) >= 2 and is_type_line(block[1]):
-            if block[0].startswith(IGNORE_PREFIXES):
-                continue
-            fields.append(
-                {
-                    "name": block[0],
-                    "type": block[1],
-                    "description": " ".join(block[2:]).strip(),
-                }
-            )
+        if len(block) >= 2 and flags[block[1]] & LINE_TYPE:
+            fields.append(Field(first, stripped[block[1]], " ".join(stripped[j] for j in block[2:]).strip()))
         else:
             if fields:
-                note = " ".join(block).strip()
+                note = " ".join(stripped[j] for j in block).strip()
                 if note and not is_ignored_line(note):
-                    fields[-1].setdefault("notes", []).append(note)
+                    fields[-1].add_note(note)
     return fields, new_idx
 
 
-def parse(lines: List[str], section_whitelist: Optional[set] = None) -> Dict[str, Any]:
-    doc_title = lines[0].strip() if lines else "Discovery API"
-    sections: List[Dict[str, Any]] = []
-    endpoints: List[Dict[str, Any]] = []
+def parse_endpoint(table: LineTable, i: int) -> Tuple[Endpoint, int]:
+    """Parse the endpoint whose title is on line ``i``; returns it with the index
+    of the first line after it."""
+    stripped = table.stripped
+    flags = table.flags
+    n = len(table)
 
-    i = 0
-    current_section: Optional[Dict[str, Any]] = None
-
-    def ensure_section(title: str) -> Dict[str, Any]:
-        nonlocal current_section
-        if current_section is None or current_section["title"] != title:
-            current_section = {
-                "id": slugify(title),
-                "title": title,
-                "paragraphs": [],
-                "raw_lines": [],
-            }
-            sections.append(current_section)
-        return current_section
-
-    while i < len(lines):
-        line = lines[i].rstrip()
-        if is_endpoint_start(lines, i):
-            title = lines[i].strip()
-            method_line_idx = next_nonempty(lines, i + 1)
-            method_line = lines[method_line_idx].strip() if method_line_idx is not None else ""
-            m = METHOD_RE.match(method_line)
-            method = m.group(1).upper() if m else ""
-            path = "/" + m.group(2) if m else method_line
-            endpoint: Dict[str, Any] = {
-                "id": slugify(f"{method}-{path}-{title}"),
-                "title": title,
-                "method": method,
-                "path": path,
-                "summary": "",
-                "description": [],
-                "examples": [],
-                "request": {"query": [], "path": [], "header": [], "body": [], "notes": []},
-                "response": {"content_type": None, "status": None, "fields": []},
-            }
-            i = (method_line_idx + 1) if method_line_idx is not None else i + 1
-
-            # description until Examples / REQUEST / RESPONSE / next endpoint
-            desc_lines: List[str] = []
-            while i < len(lines):
-                cur = lines[i].strip()
-                if cur in {"Examples", "REQUEST", "RESPONSE"} or is_endpoint_start(lines, i):
-                    break
-                desc_lines.append(lines[i])
-                i += 1
-            endpoint["description"] = join_paragraphs(desc_lines)
-            endpoint["summary"] = endpoint["description"][0] if endpoint["description"] else ""
+    def request_stop(j: int) -> bool:
+        linej = stripped[j]
+        if linej == "RESPONSE":
+            return True
+        if linej.endswith("PARAMETERS"):
+            return True
+        return bool(flags[j] & LINE_ENDPOINT_START)
+
+    title = stripped[i]
+    method_line_idx = table.next_nonempty[i + 1]
+    method_line = stripped[method_line_idx]
+    m = METHOD_RE.match(method_line)
+    method = m.group(1).upper() if m else ""
+    path = "/" + m.group(2) if m else method_line
+    endpoint = Endpoint(slugify(f"{method}-{path}-{title}"), title, method, path)
+    request = endpoint.request
+    response = endpoint.response
+    i = method_line_idx + 1
+
+    # description until Examples / REQUEST / RESPONSE / next endpoint
+    desc_start = i
+    while i < n:
+        cur = stripped[i]
+        if cur in {"Examples", "REQUEST", "RESPONSE"} or flags[i] & LINE_ENDPOINT_START:
+            break
+        i += 1
+    endpoint.description = join_paragraphs(stripped[desc_start:i])
+    endpoint.summary = endpoint.description[0] if endpoint.description else ""
 
-            # examples
-            if i < len(lines) and lines[i].strip() == "Examples":
-                i += 1
-                ex_lines: List[str] = []
-                while i < len(lines):
-                    cur = lines[i].strip()
-                    if cur in {"REQUEST", "RESPONSE"} or is_endpoint_start(lines, i):
-                        break
-                    if cur:
-                        ex_lines.append(cur)
-                    i += 1
-                endpoint["examples"] = ex_lines
+    # examples
+    if i < n and stripped[i] == "Examples":
+        i += 1
+        ex_lines: List[str] = []
+        while i < n:
+            cur = stripped[i]
+            if cur in {"REQUEST", "RESPONSE"} or flags[i] & LINE_ENDPOINT_START:
+                break
+            if cur:
+                ex_lines.append(cur)
+            i += 1
+        endpoint.examples = ex_lines
 
-            # request params
-            if i < len(lines) and lines[i].strip() == "REQUEST":
+    # request params
+    if i < n and stripped[i] == "REQUEST":
+        i += 1
+        while i < n:
+            cur = stripped[i]
+            if cur == "RESPONSE" or flags[i] & LINE_ENDPOINT_START:
+                break
+            if cur.endswith("PARAMETERS"):
+                section_name = cur.replace("-", " ").lower()
+                if "query" in section_name:
+                    key = "query"
+                elif "path" in section_name:
+                    key = "path"
+                elif "header" in section_name:
+                    key = "header"
+                elif "body" in section_name:
+                    key = "body"
+                else:
+                    key = "notes"
                 i += 1
-                while i < len(lines):
-                    cur = lines[i].strip()
-                    if cur == "RESPONSE" or is_endpoint_start(lines, i):
-                        break
-                    if cur.endswith("PARAMETERS"):
-                        section_name = cur.replace("-", " ").lower()
-                        if "query" in section_name:
-                            key = "query"
-                        elif "path" in section_name:
-                            key = "path"
-                        elif "header" in section_name:
-                            key = "header"
-                        elif "body" in section_name:
-                            key = "body"
-                        else:
-                            key = "notes"
-                        i += 1
-
-                        def stop_pred(j: int) -> bool:
-                            linej = lines[j].strip()
-                            if linej in {"RESPONSE"}:
-                                return True
-                            if linej.endswith("PARAMETERS"):
-                                return True
-                            if is_endpoint_start(lines, j):
-                                return True
-                            return False
-
-                        blocks, i = read_blocks_until(lines, i, stop_pred)
-                        params, notes = parse_param_blocks(blocks)
-                        if key == "notes":
-                            endpoint["request"]["notes"].extend(notes)
-                        else:
-                            endpoint["request"][key].extend(params)
-                            if notes:
-                                endpoint["request"].setdefault("notes", []).extend(notes)
-                        continue
-                    i += 1
+                blocks, i = read_blocks_until(table, i, request_stop)
+                params, notes = parse_param_blocks(table, blocks)
+                if key != "notes":
+                    getattr(request, key).extend(params)
+                request.notes.extend(notes)
+                continue
+            i += 1
 
-            # response
-            if i < len(lines) and lines[i].strip() == "RESPONSE":
+    # response
+    if i < n and stripped[i] == "RESPONSE":
+        i += 1
+        while i < n:
+            cur = stripped[i]
+            if not cur:
                 i += 1
-                while i < len(lines):
-                    cur = lines[i].strip()
-                    if not cur:
-                        i += 1
-                        continue
-                    if cur in {"MODEL", "EXAMPLE"}:
-                        i += 1
-                        continue
-                    if cur.startswith("application/"):
-                        endpoint["response"]["content_type"] = cur
-                        i += 1
-                        continue
-                    if re.match(r"^\d{3}\s+-", cur):
-                        endpoint["response"]["status"] = cur
-                        i += 1
-                        continue
-                    if cur == "Field":
-                        # expect next lines Type, Description
-                        i += 1
-                        if i < len(lines) and lines[i].strip() == "Type":
-                            i += 1
-                        if i < len(lines) and lines[i].strip() == "Description":
-                            i += 1
-                        fields, i = parse_field_blocks(lines, i)
-                        endpoint["response"]["fields"].extend(fields)
-                        continue
-                    if is_endpoint_start(lines, i) or is_section_heading(cur):
-                        break
-                    # unknown line, treat as response note
-                    endpoint["response"].setdefault("notes", []).append(cur)
+                continue
+            if cur in {"MODEL", "EXAMPLE"}:
+                i += 1
+                continue
+            if cur.startswith("application/"):
+                response.content_type = cur
+                i += 1
+                continue
+            if STATUS_RE.match(cur):
+                response.status = cur
+                i += 1
+                continue
+            if cur == "Field":
+                # expect next lines Type, Description
+                i += 1
+                if i < n and stripped[i] == "Type":
                     i += 1
+                if i < n and stripped[i] == "Description":
+                    i += 1
+                fields, i = parse_field_blocks(table, i)
+                response.fields.extend(fields)
+                continue
+            if flags[i] & (LINE_ENDPOINT_START | LINE_SECTION_HEADING):
+                break
+            # unknown line, treat as response note
+            response.add_note(cur)
+            i += 1
+
+    return endpoint, i
+
+
+class IngestProfile:
+    """Wall time per stage and counters for one document, written by --profile.
+
+    Stage times accumulate, so a stage entered once per endpoint reports the
+    total. ``parse`` includes its ``classify``, ``parse_endpoints`` and
+    ``finalize_sections`` sub-stages.
+    """
+
+    __slots__ = ("stages", "counters")
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def count_record(self, kind: str, record: Union[Section, Endpoint]) -> None:
+        if kind == "section":
+            self.count("sections")
+            return
+        request = record.request
+        self.count("endpoints")
+        self.count("params", sum(len(getattr(request, key)) for key in request.__slots__))
+        self.count("fields", len(record.response.fields))
+
+    def count_bytes_written(self, paths: Iterable[str]) -> None:
+        self.count("bytes_written", sum(os.path.getsize(path) for path in paths if path and os.path.exists(path)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+        }
 
-            endpoints.append(endpoint)
+
+T = TypeVar("T")
+
+
+def profile_stage(profile: Optional[IngestProfile], name: str) -> ContextManager[None]:
+    return profile.stage(name) if profile is not None else nullcontext()
+
+
+def profiled_iter(profile: Optional[IngestProfile], name: str, items: Iterable[T]) -> Iterator[T]:
+    """Charge the time spent producing each item (not consuming it) to ``name``."""
+    if profile is None:
+        yield from items
+        return
+    it = iter(items)
+    while True:
+        with profile.stage(name):
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+        yield item
+
+
+def default_profile_path(out_json: str) -> Path:
+    return Path(out_json).with_suffix(".profile.json")
+
+
+def write_profile(profile: IngestProfile, path: Path, **context: Any) -> None:
+    """Write the --profile sidecar: ``context`` (input, mode, ...) then stages and counters."""
+    report = {**context, **profile.to_dict()}
+    write_text_atomic(path, json.dumps(report, indent=2, ensure_ascii=True))
+
+
+def new_section(title: str) -> Section:
+    return Section(slugify(title), title)
+
+
+def finalize_section(section: Section) -> Section:
+    section.paragraphs = join_paragraphs(section.raw_lines or [])
+    section.raw_lines = None
+    return section
+
+
+def iter_parse(
+    lines: List[str], section_whitelist: Optional[set] = None, profile: Optional[IngestProfile] = None
+) -> Iterator[Tuple[str, Union[Section, Endpoint]]]:
+    """Yield ("section", section) and ("endpoint", endpoint) records as they complete.
+
+    Endpoints are yielded as soon as they are parsed. Text between endpoints keeps
+    flowing into the open section, so a section is only yielded once the next
+    whitelisted heading (or the end of the document) closes it.
+    """
+    with profile_stage(profile, "classify"):
+        table = classify_lines(lines)
+    stripped = table.stripped
+    flags = table.flags
+    n = len(table)
+    if profile is not None:
+        # every non-blank line is checked once for an endpoint title
+        profile.count("endpoint_start_checks", n - flags.count(LINE_BLANK))
+
+    i = 0
+    current_section: Optional[Section] = None
+
+    while i < n:
+        if flags[i] & LINE_ENDPOINT_START:
+            with profile_stage(profile, "parse_endpoints"):
+                endpoint, i = parse_endpoint(table, i)
+            yield "endpoint", endpoint
             continue
 
         # sections (non-endpoint text)
-        if line.strip():
-            if section_whitelist and line.strip() in section_whitelist:
-                current_section = ensure_section(line.strip())
+        line = stripped[i]
+        if line:
+            if section_whitelist and line in section_whitelist:
+                if current_section is None or current_section.title != line:
+                    if current_section is not None:
+                        with profile_stage(profile, "finalize_sections"):
+                            section = finalize_section(current_section)
+                        yield "section", section
+                    current_section = new_section(line)
                 i += 1
                 continue
             if current_section is None:
                 i += 1
                 continue
-            if not is_ignored_line(line):
-                current_section["raw_lines"].append(line)
+            if not flags[i] & LINE_IGNORED:
+                current_section.raw_lines.append(lines[i].rstrip())
         i += 1
 
-    # finalize section paragraphs
-    for section in sections:
-        section["paragraphs"] = join_paragraphs(section.get("raw_lines", []))
-        section.pop("raw_lines", None)
+    if current_section is not None:
+        with profile_stage(profile, "finalize_sections"):
+            section = finalize_section(current_section)
+        yield "section", section
+
+
+def parse(
+    lines: List[str], section_whitelist: Optional[set] = None, profile: Optional[IngestProfile] = None
+) -> Document:
+    doc = Document(lines[0].strip() if lines else "Discovery API")
+    for kind, record in iter_parse(lines, section_whitelist, profile):
+        if kind == "endpoint":
+            doc.endpoints.append(record)
+        else:
+            doc.sections.append(record)
+    return doc
 
-    return {
-        "title": doc_title,
-        "sections": sections,
-        "endpoints": endpoints,
-    }
 
+# Titles parse_endpoint may consume as part of the previous endpoint even though
+# they start the next one, so a shard never begins on them.
+SHARD_UNSAFE_TITLES = frozenset({"Examples", "REQUEST", "RESPONSE", "MODEL", "EXAMPLE", "Field", "Type", "Description"})
+MIN_SHARD_LINES = 4096
 
-def chunk_text(text: str, max_chars: int = 1400) -> List[str]:
-    chunks: List[str] = []
-    cur = ""
-    for para in text.split("\n"):
-        if not para.strip():
+
+def next_shard_start(lines: List[str], start: int) -> Optional[int]:
+    """The first endpoint title (a line followed by a METHOD_RE line) at or after
+    ``start`` where a shard can begin: the serial parse is bound to reach it as an
+    endpoint start, and everything before it parses the same with the document
+    cut there."""
+    for m in range(start, len(lines)):
+        line = lines[m]
+        if not METHOD_PREFIX_RE.match(line) or not METHOD_RE.match(line.strip()):
             continue
-        candidate = (cur + "\n" + para).strip() if cur else para
-        if len(candidate) > max_chars and cur:
-            chunks.append(cur.strip())
-            cur = para
-        else:
-            cur = candidate
-    if cur:
-        chunks.append(cur.strip())
-    return chunks
+        t = m - 1
+        while t >= start and not lines[t].strip():
+            t -= 1
+        if t < start:
+            continue
+        title = lines[t].strip()
+        if (
+            title in MARKERS
+            or title in SHARD_UNSAFE_TITLES
+            or title.startswith(("http", "?", "application/"))
+            or STATUS_RE.match(title)
+            or METHOD_RE.match(title)
+        ):
+            continue
+        return t
+    return None
 
 
-def build_chunks(doc: Dict[str, Any], *, source_file: str, doc_id: str) -> List[Dict[str, Any]]:
-    chunks: List[Dict[str, Any]] = []
-    # sections
-    for section in doc.get("sections", []):
-        text = "\n".join([section["title"]] + section.get("paragraphs", []))
-        for n, chunk in enumerate(chunk_text(text)):
-            chunks.append(
-                {
-                    "id": f"section-{section['id']}-{n+1}",
-                    "type": "section",
-                    "title": section["title"],
-                    "path": [doc["title"], section["title"]],
-                    "text": chunk,
-                    "tags": ["section"],
-                    "source_file": source_file,
-                    "doc_id": doc_id,
-                }
+def plan_shards(lines: List[str], shards: int, min_lines: int = MIN_SHARD_LINES) -> List[Tuple[int, int]]:
+    """Split the document into at most ``shards`` contiguous line ranges of about
+    equal size. Each cut is the next safe endpoint title after the ideal offset, so
+    only the lines between the two are scanned; the text before the first cut is
+    a shard of its own."""
+    n = len(lines)
+    target = max(min_lines, -(-n // max(1, shards)))
+    bounds = [0]
+    while True:
+        cut = next_shard_start(lines, bounds[-1] + target)
+        if cut is None or n - cut < min_lines:
+            break
+        bounds.append(cut)
+    bounds.append(n)
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_shard(
+    lines: List[str], section_whitelist: Optional[set] = None
+) -> Tuple[List[Endpoint], List[Tuple[bool, str]]]:
+    """Process-pool entry point: the main loop of ``iter_parse`` over one shard.
+
+    Endpoints are parsed outright. Which section the text between them belongs
+    to depends on earlier shards, so that text comes back as ops, (True, heading)
+    or (False, line), for ``parse_parallel`` to replay in order.
+    """
+    table = classify_lines(lines)
+    stripped = table.stripped
+    flags = table.flags
+    n = len(table)
+    endpoints: List[Endpoint] = []
+    ops: List[Tuple[bool, str]] = []
+    i = 0
+    while i < n:
+        if flags[i] & LINE_ENDPOINT_START:
+            endpoint, i = parse_endpoint(table, i)
+            endpoints.append(endpoint)
+            continue
+        line = stripped[i]
+        if line:
+            if section_whitelist and line in section_whitelist:
+                ops.append((True, line))
+            elif not flags[i] & LINE_IGNORED:
+                ops.append((False, lines[i].rstrip()))
+        i += 1
+    return endpoints, ops
+
+
+def parse_parallel(
+    lines: List[str],
+    section_whitelist: Optional[set] = None,
+    *,
+    jobs: int,
+    profile: Optional[IngestProfile] = None,
+    min_shard_lines: int = MIN_SHARD_LINES,
+) -> Document:
+    """``parse`` across ``jobs`` processes: the document is sharded at endpoint
+    titles, shards are parsed independently and merged in document order, so the
+    result (ids included) is identical to a serial parse. Documents too small to
+    shard are parsed serially."""
+    with profile_stage(profile, "plan_shards"):
+        shards = plan_shards(lines, jobs * 4, min_shard_lines)
+    if profile is not None:
+        profile.count("shards", len(shards))
+    if jobs <= 1 or len(shards) == 1:
+        return parse(lines, section_whitelist=section_whitelist, profile=profile)
+
+    with profile_stage(profile, "parse_shards"):
+        with ProcessPoolExecutor(max_workers=min(jobs, len(shards))) as pool:
+            results = list(
+                pool.map(parse_shard, (lines[a:b] for a, b in shards), [section_whitelist] * len(shards))
             )
-    # endpoints
-    for endpoint in doc.get("endpoints", []):
-        summary = [
-            f"{endpoint['title']}\n{endpoint['method']} {endpoint['path']}",
-        ]
-        summary.extend(endpoint.get("description", []))
-        if endpoint.get("examples"):
-            summary.append("Examples:\n" + "\n".join(endpoint["examples"]))
-        for n, chunk in enumerate(chunk_text("\n".join(summary))):
-            chunks.append(
-                {
-                    "id": f"endpoint-{endpoint['id']}-summary-{n+1}",
-                    "type": "endpoint",
-                    "title": endpoint["title"],
-                    "path": [doc["title"], endpoint["title"]],
-                    "text": chunk,
-                    "tags": ["endpoint", endpoint.get("method", "").lower(), endpoint.get("path", "")],
-                    "source_file": source_file,
-                    "doc_id": doc_id,
-                }
+
+    doc = Document(lines[0].strip() if lines else "Discovery API")
+    current_section: Optional[Section] = None
+    with profile_stage(profile, "merge_shards"):
+        for shard_endpoints, ops in results:
+            doc.endpoints.extend(shard_endpoints)
+            for heading, text in ops:
+                if heading:
+                    if current_section is None or current_section.title != text:
+                        if current_section is not None:
+                            doc.sections.append(finalize_section(current_section))
+                        current_section = new_section(text)
+                elif current_section is not None:
+                    current_section.raw_lines.append(text)
+        if current_section is not None:
+            doc.sections.append(finalize_section(current_section))
+    return doc
+
+
+def section_chunks(
+    section: Section, *, doc_title: str, source_file: str, doc_id: str, chunker: Chunker = chunk_text
+) -> List[Chunk]:
+    text = "\n".join([section.title] + section.paragraphs)
+    return [
+        Chunk(
+            f"section-{section.id}-{n+1}",
+            "section",
+            section.title,
+            [doc_title, section.title],
+            chunk,
+            ["section"],
+            source_file,
+            doc_id,
+        )
+        for n, chunk in enumerate(chunker(text))
+    ]
+
+
+def endpoint_chunks(
+    endpoint: Endpoint, *, doc_title: str, source_file: str, doc_id: str, chunker: Chunker = chunk_text
+) -> List[Chunk]:
+    chunks: List[Chunk] = []
+    summary = [
+        f"{endpoint.title}\n{endpoint.method} {endpoint.path}",
+    ]
+    summary.extend(endpoint.description)
+    if endpoint.examples:
+        summary.append("Examples:\n" + "\n".join(endpoint.examples))
+    for n, chunk in enumerate(chunker("\n".join(summary))):
+        chunks.append(
+            Chunk(
+                f"endpoint-{endpoint.id}-summary-{n+1}",
+                "endpoint",
+                endpoint.title,
+                [doc_title, endpoint.title],
+                chunk,
+                endpoint.tags,
+                source_file,
+                doc_id,
             )
-        # request params
-        req = endpoint.get("request", {})
-        for section_name in ("query", "path", "header", "body"):
-            params = req.get(section_name, [])
-            if not params:
-                continue
-            lines = [f"{endpoint['title']} - {section_name} parameters"]
-            for p in params:
-                desc = p.get("description", "")
-                lines.append(f"- {p['name']} ({p['type']}): {desc}")
-            for n, chunk in enumerate(chunk_text("\n".join(lines))):
-                chunks.append(
-                    {
-                        "id": f"endpoint-{endpoint['id']}-req-{section_name}-{n+1}",
-                        "type": "request-params",
-                        "title": endpoint["title"],
-                        "path": [doc["title"], endpoint["title"], "Request", section_name],
-                        "text": chunk,
-                        "tags": ["request", section_name],
-                        "source_file": source_file,
-                        "doc_id": doc_id,
-                    }
+        )
+    # request params
+    for section_name in PARAM_SECTIONS:
+        params = getattr(endpoint.request, section_name)
+        if not params:
+            continue
+        lines = [f"{endpoint.title} - {section_name} parameters"]
+        for p in params:
+            lines.append(f"- {p.name} ({p.type}): {p.description}")
+        for n, chunk in enumerate(chunker("\n".join(lines))):
+            chunks.append(
+                Chunk(
+                    f"endpoint-{endpoint.id}-req-{section_name}-{n+1}",
+                    "request-params",
+                    endpoint.title,
+                    [doc_title, endpoint.title, "Request", section_name],
+                    chunk,
+                    ["request", section_name],
+                    source_file,
+                    doc_id,
                 )
-        # response fields
-        fields = endpoint.get("response", {}).get("fields", [])
-        if fields:
-            lines = [f"{endpoint['title']} - response fields"]
-            for f in fields:
-                desc = f.get("description", "")
-                lines.append(f"- {f['name']} ({f['type']}): {desc}")
-                for note in f.get("notes", []) if isinstance(f.get("notes"), list) else []:
-                    lines.append(f"  note: {note}")
-            for n, chunk in enumerate(chunk_text("\n".join(lines))):
-                chunks.append(
-                    {
-                        "id": f"endpoint-{endpoint['id']}-resp-{n+1}",
-                        "type": "response-fields",
-                        "title": endpoint["title"],
-                        "path": [doc["title"], endpoint["title"], "Response"],
-                        "text": chunk,
-                        "tags": ["response"],
-                        "source_file": source_file,
-                        "doc_id": doc_id,
-                    }
+            )
+    # response fields
+    fields = endpoint.response.fields
+    if fields:
+        lines = [f"{endpoint.title} - response fields"]
+        for f in fields:
+            lines.append(f"- {f.name} ({f.type}): {f.description}")
+            for note in f.notes or []:
+                lines.append(f"  note: {note}")
+        for n, chunk in enumerate(chunker("\n".join(lines))):
+            chunks.append(
+                Chunk(
+                    f"endpoint-{endpoint.id}-resp-{n+1}",
+                    "response-fields",
+                    endpoint.title,
+                    [doc_title, endpoint.title, "Response"],
+                    chunk,
+                    ["response"],
+                    source_file,
+                    doc_id,
                 )
+            )
     return chunks
 
 
-def parse_generic_sections(lines: List[str]) -> Dict[str, Any]:
+def build_chunks(doc: Document, *, source_file: str, doc_id: str, chunker: Chunker = chunk_text) -> List[Chunk]:
+    chunks: List[Chunk] = []
+    for section in doc.sections:
+        chunks.extend(
+            section_chunks(section, doc_title=doc.title, source_file=source_file, doc_id=doc_id, chunker=chunker)
+        )
+    for endpoint in doc.endpoints:
+        chunks.extend(
+            endpoint_chunks(endpoint, doc_title=doc.title, source_file=source_file, doc_id=doc_id, chunker=chunker)
+        )
+    return chunks
+
+
+def iter_generic_sections(lines: List[str], profile: Optional[IngestProfile] = None) -> Iterator[Section]:
+    """Yield each section of a plain-text manual once the next heading closes it."""
     doc_title = lines[0].strip() if lines else "Socrata API"
-    sections: List[Dict[str, Any]] = []
-    current: Optional[Dict[str, Any]] = None
-
-    def ensure(title: str) -> Dict[str, Any]:
-        nonlocal current
-        if current is None or current["title"] != title:
-            current = {"id": slugify(title), "title": title, "paragraphs": [], "raw_lines": []}
-            sections.append(current)
-        return current
-
-    for line in lines:
-        s = line.strip()
-        if not s:
+    current: Optional[Section] = None
+    with profile_stage(profile, "classify"):
+        stripped, flags = lex_lines(lines, generic_line_token)
+
+    for s, f in zip(stripped, flags):
+        if f & LINE_BLANK:
             continue
         # treat title-case short lines as headings
-        if len(s) <= 70 and s == s.title() and not s.startswith("http"):
+        if f & LINE_TITLE_CASE:
             # skip obvious header-like lines (HTTP header examples, JSON fragments)
             if ":" in s or s.startswith("[") or s.startswith("{"):
                 continue
@@ -503,92 +795,32 @@ def parse_generic_sections(lines: List[str]) -> Dict[str, Any]:
                 continue
             if "\t" in s:
                 continue
-            ensure(s)
+            if current is None or current.title != s:
+                if current is not None:
+                    yield finalize_section(current)
+                current = new_section(s)
             continue
         if current is None:
-            ensure(doc_title)
-        if not is_ignored_line(s):
-            current["raw_lines"].append(s)
-
-    for section in sections:
-        section["paragraphs"] = join_paragraphs(section.get("raw_lines", []))
-        section.pop("raw_lines", None)
-
-    return {"title": doc_title, "sections": sections, "endpoints": [], "chunks": []}
-
-
-def build_endpoints_jsonl(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    for endpoint in doc.get("endpoints", []):
-        req = endpoint.get("request", {})
-        resp = endpoint.get("response", {})
-        record = {
-            "id": endpoint.get("id"),
-            "type": "endpoint",
-            "title": endpoint.get("title"),
-            "method": endpoint.get("method"),
-            "path": endpoint.get("path"),
-            "summary": endpoint.get("summary"),
-            "description": endpoint.get("description", []),
-            "examples": endpoint.get("examples", []),
-            "request": {
-                "query": req.get("query", []),
-                "path": req.get("path", []),
-                "header": req.get("header", []),
-                "body": req.get("body", []),
-                "notes": req.get("notes", []),
-            },
-            "response": {
-                "content_type": resp.get("content_type"),
-                "status": resp.get("status"),
-                "fields": resp.get("fields", []),
-                "notes": resp.get("notes", []),
-            },
-            "tags": ["endpoint", endpoint.get("method", "").lower(), endpoint.get("path", "")],
-        }
-        records.append(record)
-    return records
+            current = new_section(doc_title)
+        if not f & LINE_IGNORED:
+            current.raw_lines.append(s)
 
+    if current is not None:
+        yield finalize_section(current)
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--input", default="docs/Discovery_API.md")
-    parser.add_argument("--out-json", default="docs/Discovery_API.rag.json")
-    parser.add_argument("--out-jsonl", default="docs/Discovery_API.rag.chunks.jsonl")
-    parser.add_argument(
-        "--out-endpoints-jsonl",
-        default="docs/Discovery_API.rag.endpoints.jsonl",
-    )
-    parser.add_argument(
-        "--mode",
-        choices=["discovery", "generic"],
-        default="discovery",
-    )
-    parser.add_argument(
-        "--section-whitelist",
-        help="Comma-separated section headings to include (generic mode)",
-        default="",
-    )
-    parser.add_argument("--doc-id", default="")
-    args = parser.parse_args()
 
-    path = Path(args.input)
-    text = path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-    whitelist = None
-    if args.mode == "discovery":
-        whitelist = SECTION_WHITELIST
-    elif args.section_whitelist:
-        whitelist = {s.strip() for s in args.section_whitelist.split(",") if s.strip()}
+def parse_generic_sections(lines: List[str], profile: Optional[IngestProfile] = None) -> Document:
+    doc_title = lines[0].strip() if lines else "Socrata API"
+    return Document(doc_title, list(iter_generic_sections(lines, profile)), generic=True)
 
-    if args.mode == "generic":
-        doc = parse_generic_sections(lines)
-    else:
-        doc = parse(lines, section_whitelist=whitelist)
-    doc_id = args.doc_id or Path(args.input).stem
-    chunks = build_chunks(doc, source_file=str(args.input), doc_id=doc_id)
-    endpoints_jsonl = build_endpoints_jsonl(doc) if args.mode == "discovery" else []
-    doc["schema"] = {
+
+def build_endpoints_jsonl(doc: Document) -> List[EndpointRecord]:
+    """The endpoints JSONL records: views on the parsed endpoints, encoded by the writer."""
+    return [EndpointRecord(endpoint) for endpoint in doc.endpoints]
+
+
+def rag_schema() -> Dict[str, Any]:
+    return {
         "title": "Socrata RAG Schema",
         "version": "1.0",
         "doc": {
@@ -646,16 +878,1167 @@ def main() -> None:
             "tags": "array<string>",
         },
     }
-    doc["chunks"] = chunks
 
-    Path(args.out_json).write_text(json.dumps(doc, indent=2, ensure_ascii=True), encoding="utf-8")
-    with Path(args.out_jsonl).open("w", encoding="utf-8") as f:
+
+class JsonArraySpool:
+    """Elements of one indented JSON array, spooled to a temp file until the
+    enclosing document can be assembled in key order."""
+
+    def __init__(self, depth: int) -> None:
+        self.prefix = "  " * depth
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        if self.count:
+            self.file.write(",\n")
+        encoded = json.dumps(value, indent=2, ensure_ascii=True)
+        self.file.write(self.prefix + encoded.replace("\n", "\n" + self.prefix))
+        self.count += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def write_json_array(out: TextIO, spools: List[JsonArraySpool], close_prefix: str) -> None:
+    """Write the concatenation of ``spools`` as a single indented JSON array."""
+    filled = [spool for spool in spools if spool.count]
+    if not filled:
+        out.write("[]")
+        return
+    out.write("[\n")
+    for n, spool in enumerate(filled):
+        if n:
+            out.write(",\n")
+        spool.file.seek(0)
+        shutil.copyfileobj(spool.file, out)
+    out.write("\n" + close_prefix + "]")
+
+
+def write_json_items(out: TextIO, items: Iterable[Dict[str, Any]], close_prefix: str) -> None:
+    """Write ``items`` as an indented JSON array, encoding one element at a time."""
+    prefix = close_prefix + "  "
+    empty = True
+    for item in items:
+        out.write("[\n" if empty else ",\n")
+        out.write(prefix + json.dumps(item, indent=2, ensure_ascii=True).replace("\n", "\n" + prefix))
+        empty = False
+    out.write("[]" if empty else "\n" + close_prefix + "]")
+
+
+def write_rag_json(
+    out: TextIO,
+    title: str,
+    *,
+    generic: bool,
+    sections: Callable[[TextIO], None],
+    endpoints: Callable[[TextIO], None],
+    chunks: Callable[[TextIO], None],
+) -> None:
+    """Lay out a .rag.json exactly as ``json.dumps(doc, indent=2)`` would, with each
+    array written by its callback."""
+    schema = json.dumps(rag_schema(), indent=2, ensure_ascii=True).replace("\n", "\n  ")
+    out.write("{\n")
+    out.write(f'  "title": {json.dumps(title, ensure_ascii=True)},\n')
+    out.write('  "sections": ')
+    sections(out)
+    out.write(',\n  "endpoints": ')
+    endpoints(out)
+    # generic docs carry a "chunks" key from parse_generic_sections, so the
+    # schema lands after it there and before it in discovery mode
+    if generic:
+        out.write(',\n  "chunks": ')
+        chunks(out)
+        out.write(',\n  "schema": ' + schema)
+    else:
+        out.write(',\n  "schema": ' + schema)
+        out.write(',\n  "chunks": ')
+        chunks(out)
+    out.write("\n}")
+
+
+def write_streaming(
+    lines: List[str],
+    *,
+    mode: str,
+    whitelist: Optional[set],
+    source_file: str,
+    doc_id: str,
+    out_json: str,
+    out_jsonl: str,
+    out_endpoints_jsonl: str,
+    chunker: Chunker = chunk_text,
+    profile: Optional[IngestProfile] = None,
+    spec: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Parse and write all outputs incrementally.
+
+    Each record is serialized as soon as it is complete and spooled to disk, so
+    no list of sections, endpoints or chunks is built up; the ``lines`` table is
+    still held in full, so memory is O(lines). Output is byte-identical to
+    the buffered path in main(). Parsing and writing interleave here, so the
+    profiled ``write`` stage is whatever ``parse`` and ``chunk`` did not take.
+    In openapi mode the records come from the loaded ``spec`` instead of ``lines``.
+    """
+    start = time.perf_counter()
+    if mode == "openapi":
+        doc_title = spec_title(spec)
+        events: Iterable[Tuple[str, Union[Section, Endpoint]]] = iter_openapi(spec)
+    elif mode == "generic":
+        doc_title = lines[0].strip() if lines else "Socrata API"
+        events = (("section", section) for section in iter_generic_sections(lines, profile))
+    else:
+        doc_title = lines[0].strip() if lines else "Discovery API"
+        events = iter_parse(lines, section_whitelist=whitelist, profile=profile)
+    events = profiled_iter(profile, "parse", events)
+
+    sections = JsonArraySpool(2)
+    endpoints = JsonArraySpool(2)
+    section_chunk_items = JsonArraySpool(2)
+    endpoint_chunk_items = JsonArraySpool(2)
+    spools = [sections, endpoints, section_chunk_items, endpoint_chunk_items]
+    section_chunk_lines = tempfile.TemporaryFile("w+", encoding="utf-8")
+    endpoint_chunk_lines = tempfile.TemporaryFile("w+", encoding="utf-8")
+    # like the buffered path, the endpoints file is only written when there are endpoints
+    endpoints_out: Optional[TextIO] = None
+    try:
+        for kind, record in events:
+            if profile is not None:
+                profile.count_record(kind, record)
+            if kind == "section":
+                sections.add(record.to_dict())
+                chunk_items, chunk_lines = section_chunk_items, section_chunk_lines
+                with profile_stage(profile, "chunk"):
+                    chunks = section_chunks(
+                        record, doc_title=doc_title, source_file=source_file, doc_id=doc_id, chunker=chunker
+                    )
+            else:
+                endpoints.add(record.to_dict())
+                if mode in ENDPOINT_MODES:
+                    if endpoints_out is None:
+                        endpoints_out = Path(out_endpoints_jsonl).open("w", encoding="utf-8")
+                    endpoints_out.write(json.dumps(record.to_record(), ensure_ascii=True) + "\n")
+                chunk_items, chunk_lines = endpoint_chunk_items, endpoint_chunk_lines
+                with profile_stage(profile, "chunk"):
+                    chunks = endpoint_chunks(
+                        record, doc_title=doc_title, source_file=source_file, doc_id=doc_id, chunker=chunker
+                    )
+            if profile is not None:
+                profile.count("chunks", len(chunks))
+            for chunk in chunks:
+                item = chunk.to_dict()
+                chunk_items.add(item)
+                chunk_lines.write(json.dumps(item, ensure_ascii=True) + "\n")
+
+        with Path(out_jsonl).open("w", encoding="utf-8") as f:
+            for spool in (section_chunk_lines, endpoint_chunk_lines):
+                spool.seek(0)
+                shutil.copyfileobj(spool, f)
+
+        with Path(out_json).open("w", encoding="utf-8") as f:
+            write_rag_json(
+                f,
+                doc_title,
+                generic=mode == "generic",
+                sections=lambda out: write_json_array(out, [sections], "  "),
+                endpoints=lambda out: write_json_array(out, [endpoints], "  "),
+                chunks=lambda out: write_json_array(out, [section_chunk_items, endpoint_chunk_items], "  "),
+            )
+    finally:
+        for spool in spools:
+            spool.close()
+        section_chunk_lines.close()
+        endpoint_chunk_lines.close()
+        if endpoints_out is not None:
+            endpoints_out.close()
+
+    if profile is not None:
+        elapsed = time.perf_counter() - start
+        profile.stages["write"] = elapsed - profile.stages.get("parse", 0.0) - profile.stages.get("chunk", 0.0)
+        profile.count_bytes_written([out_json, out_jsonl, out_endpoints_jsonl if endpoints_out is not None else ""])
+
+
+INGEST_MANIFEST_VERSION = 1
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def entity_hash(record: Union[Section, Endpoint]) -> str:
+    return sha256_text(json.dumps(record.to_dict(), sort_keys=True, ensure_ascii=True))
+
+
+def keyed(ids: Iterable[str]) -> List[str]:
+    """Make ids unique by suffixing repeats ("id#2", ...); generic manuals reuse
+    heading slugs, so section and chunk ids are not unique on their own."""
+    seen: Dict[str, int] = {}
+    keys: List[str] = []
+    for value in ids:
+        n = seen.get(value, 0) + 1
+        seen[value] = n
+        keys.append(value if n == 1 else f"{value}#{n}")
+    return keys
+
+
+def default_ingest_manifest_path(out_json: str) -> Path:
+    # docs/Discovery_API.rag.json -> docs/Discovery_API.rag.manifest.json
+    return Path(out_json).with_suffix(".manifest.json")
+
+
+def load_ingest_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != INGEST_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def output_unchanged(path: str, expected: Optional[str]) -> bool:
+    if not expected:
+        return False
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest() == expected
+    except OSError:
+        return False
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_lines_if_exists(path: str) -> Optional[List[str]]:
+    try:
+        return Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+
+
+def run_incremental(
+    input_path: Path,
+    *,
+    mode: str,
+    whitelist: Optional[set],
+    source_file: str,
+    doc_id: str,
+    out_json: str,
+    out_jsonl: str,
+    out_endpoints_jsonl: str,
+    manifest_path: Path,
+    chunking: Optional[Dict[str, Any]] = None,
+    profile: Optional[IngestProfile] = None,
+) -> Dict[str, Any]:
+    """Rebuild only what changed since the run recorded in ``manifest_path``.
+
+    The manifest stores a content hash per section, endpoint and chunk. When the
+    input and options are unchanged and the outputs still match their recorded
+    hashes nothing is parsed or written. Otherwise unchanged sections/endpoints
+    reuse their previously serialized chunk and endpoint lines (unless the
+    document title, part of every chunk path, changed), outputs whose
+    bytes did not change are left untouched, and the chunk id delta (added,
+    removed, changed) is returned and recorded so caches can refresh by delta.
+    """
+    with profile_stage(profile, "read"):
+        input_sha = file_sha256(input_path)
+    options = {
+        "mode": mode,
+        "whitelist": sorted(whitelist) if whitelist else [],
+        "source_file": source_file,
+        "doc_id": doc_id,
+    }
+    if chunking:
+        options["chunking"] = chunking
+    chunker = make_chunker(chunking)
+    outputs = {"json": out_json, "jsonl": out_jsonl, "endpoints_jsonl": out_endpoints_jsonl}
+    prev = load_ingest_manifest(manifest_path)
+    if prev is not None and (prev.get("options") != options or prev.get("outputs") != outputs):
+        prev = None
+    prev_hashes = prev.get("output_sha256", {}) if prev else {}
+
+    if (
+        prev is not None
+        and prev.get("input_sha256") == input_sha
+        and all(output_unchanged(outputs[key], sha) for key, sha in prev_hashes.items())
+    ):
+        return {"added": [], "removed": [], "changed": [], "unchanged": True}
+
+    with ExitStack() as stack:
+        with profile_stage(profile, "read"):
+            if mode == "openapi":
+                spec = load_spec(input_path)
+                lines: List[str] = []
+            else:
+                lines = stack.enter_context(open_lines(input_path))
+        with profile_stage(profile, "parse"):
+            if mode == "openapi":
+                doc = openapi_document(spec)
+            elif mode == "generic":
+                doc = parse_generic_sections(lines, profile)
+            else:
+                doc = parse(lines, section_whitelist=whitelist, profile=profile)
+
+    # every chunk path starts with the document title, so a new title (the
+    # first line) leaves nothing to reuse
+    reusable = prev if prev is not None and prev.get("doc_title") == doc.title else None
+    old_chunk_lines = read_lines_if_exists(out_jsonl) if reusable else None
+    old_endpoint_lines = read_lines_if_exists(out_endpoints_jsonl) if reusable else None
+    prev_sections = reusable.get("sections", {}) if old_chunk_lines is not None else {}
+    prev_endpoints = reusable.get("endpoints", {}) if old_chunk_lines is not None else {}
+
+    chunk_lines: List[str] = []
+    endpoint_lines: List[str] = []
+    sections_state: Dict[str, Any] = {}
+    endpoints_state: Dict[str, Any] = {}
+    reused = 0
+
+    def reuse_chunks(entry: Optional[Dict[str, Any]], digest: str) -> Optional[List[str]]:
+        if not entry or entry.get("hash") != digest or old_chunk_lines is None:
+            return None
+        start, count = entry["chunk_offset"], entry["chunk_count"]
+        if start + count > len(old_chunk_lines):
+            return None
+        return old_chunk_lines[start : start + count]
+
+    doc_title = doc.title
+    for key, section in zip(keyed(s.id for s in doc.sections), doc.sections):
+        digest = entity_hash(section)
+        lines_for = reuse_chunks(prev_sections.get(key), digest)
+        if lines_for is None:
+            with profile_stage(profile, "chunk"):
+                chunks = section_chunks(
+                    section, doc_title=doc_title, source_file=source_file, doc_id=doc_id, chunker=chunker
+                )
+            lines_for = [json.dumps(chunk.to_dict(), ensure_ascii=True) for chunk in chunks]
+        else:
+            reused += 1
+        sections_state[key] = {"hash": digest, "chunk_offset": len(chunk_lines), "chunk_count": len(lines_for)}
+        chunk_lines.extend(lines_for)
+
+    for key, endpoint in zip(keyed(e.id for e in doc.endpoints), doc.endpoints):
+        digest = entity_hash(endpoint)
+        entry = prev_endpoints.get(key)
+        lines_for = reuse_chunks(entry, digest)
+        record_line = None
+        if lines_for is not None and old_endpoint_lines is not None and entry["record_index"] < len(old_endpoint_lines):
+            record_line = old_endpoint_lines[entry["record_index"]]
+            reused += 1
+        else:
+            with profile_stage(profile, "chunk"):
+                chunks = endpoint_chunks(
+                    endpoint, doc_title=doc_title, source_file=source_file, doc_id=doc_id, chunker=chunker
+                )
+            lines_for = [json.dumps(chunk.to_dict(), ensure_ascii=True) for chunk in chunks]
+        if mode in ENDPOINT_MODES:
+            if record_line is None:
+                record_line = json.dumps(endpoint.to_record(), ensure_ascii=True)
+            endpoint_lines.append(record_line)
+        endpoints_state[key] = {
+            "hash": digest,
+            "chunk_offset": len(chunk_lines),
+            "chunk_count": len(lines_for),
+            "record_index": len(endpoint_lines) - 1,
+        }
+        chunk_lines.extend(lines_for)
+
+    chunk_ids = [json.loads(line)["id"] for line in chunk_lines]
+    chunk_state = {key: sha256_text(line) for key, line in zip(keyed(chunk_ids), chunk_lines)}
+    prev_chunks = prev.get("chunks", {}) if prev else {}
+    delta = {
+        "added": sorted({key.split("#")[0] for key in chunk_state.keys() - prev_chunks.keys()}),
+        "removed": sorted({key.split("#")[0] for key in prev_chunks.keys() - chunk_state.keys()}),
+        "changed": sorted(
+            {key.split("#")[0] for key, sha in chunk_state.items() if key in prev_chunks and prev_chunks[key] != sha}
+        ),
+        "unchanged": False,
+        "reused_entities": reused,
+    }
+
+    write_start = time.perf_counter()
+    contents: Dict[str, str] = {
+        "jsonl": "".join(line + "\n" for line in chunk_lines),
+    }
+    if endpoint_lines:
+        contents["endpoints_jsonl"] = "".join(line + "\n" for line in endpoint_lines)
+    output_sha: Dict[str, str] = {key: sha256_text(value) for key, value in contents.items()}
+    rag_json_stale = (
+        bool(delta["added"] or delta["removed"] or delta["changed"])
+        or prev is None
+        or prev.get("input_sha256") != input_sha
+        or not output_unchanged(out_json, prev_hashes.get("json"))
+    )
+    if rag_json_stale:
+        chunks_json = [json.loads(line) for line in chunk_lines]
+        contents["json"] = json.dumps(doc.to_dict(rag_schema(), chunks_json), indent=2, ensure_ascii=True)
+        output_sha["json"] = sha256_text(contents["json"])
+    else:
+        output_sha["json"] = prev_hashes["json"]
+
+    written: List[str] = []
+    for key, content in contents.items():
+        if output_unchanged(outputs[key], output_sha[key]):
+            continue
+        Path(outputs[key]).write_text(content, encoding="utf-8")
+        written.append(outputs[key])
+    delta["written"] = written
+
+    manifest = {
+        "version": INGEST_MANIFEST_VERSION,
+        "input": str(input_path),
+        "input_sha256": input_sha,
+        "doc_title": doc.title,
+        "options": options,
+        "outputs": outputs,
+        "output_sha256": output_sha,
+        "sections": sections_state,
+        "endpoints": endpoints_state,
+        "chunks": chunk_state,
+        "delta": {key: delta[key] for key in ("added", "removed", "changed")},
+    }
+    write_text_atomic(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=True))
+    if profile is not None:
+        profile.stages["write"] = profile.stages.get("write", 0.0) + time.perf_counter() - write_start
+        if mode != "openapi":
+            profile.count("lines", len(lines))
+        for section in doc.sections:
+            profile.count_record("section", section)
+        for endpoint in doc.endpoints:
+            profile.count_record("endpoint", endpoint)
+        profile.count("chunks", len(chunk_lines))
+        profile.count("reused_entities", reused)
+        profile.count_bytes_written(written)
+    return delta
+
+
+def build_document(
+    input_path: str,
+    *,
+    mode: str,
+    whitelist: Optional[set],
+    doc_id: str,
+    out_json: str,
+    out_jsonl: str,
+    out_endpoints_jsonl: str,
+    stream: bool = False,
+    chunking: Optional[Dict[str, Any]] = None,
+    parse_jobs: int = 0,
+    profile: Optional[IngestProfile] = None,
+) -> None:
+    """Parse one source document and write its .rag.json, chunks JSONL and (in
+    discovery and openapi mode) endpoints JSONL. ``chunking`` selects a token
+    budget (see ``rag_chunker.make_chunker``); by default chunks are capped at
+    1400 characters. ``parse_jobs`` > 1 shards a discovery document across
+    processes (see ``parse_parallel``). In openapi mode the source is an OpenAPI
+    or JSON Schema document mapped structurally (see rag_openapi)."""
+    chunker = make_chunker(chunking)
+    spec: Optional[Dict[str, Any]] = None
+    with ExitStack() as stack:
+        with profile_stage(profile, "read"):
+            if mode == "openapi":
+                spec = load_spec(input_path)
+                lines: List[str] = []
+            else:
+                lines = stack.enter_context(open_lines(input_path))
+        if profile is not None and mode != "openapi":
+            profile.count("lines", len(lines))
+
+        if stream:
+            write_streaming(
+                lines,
+                mode=mode,
+                whitelist=whitelist,
+                source_file=str(input_path),
+                doc_id=doc_id,
+                out_json=out_json,
+                out_jsonl=out_jsonl,
+                out_endpoints_jsonl=out_endpoints_jsonl,
+                chunker=chunker,
+                profile=profile,
+                spec=spec,
+            )
+            return
+
+        with profile_stage(profile, "parse"):
+            if mode == "openapi":
+                doc = openapi_document(spec)
+            elif mode == "generic":
+                doc = parse_generic_sections(lines, profile)
+            elif parse_jobs > 1:
+                doc = parse_parallel(lines, whitelist, jobs=parse_jobs, profile=profile)
+            else:
+                doc = parse(lines, section_whitelist=whitelist, profile=profile)
+    with profile_stage(profile, "chunk"):
+        chunks = build_chunks(doc, source_file=str(input_path), doc_id=doc_id, chunker=chunker)
+    with profile_stage(profile, "write"):
+        endpoints_jsonl = build_endpoints_jsonl(doc) if mode in ENDPOINT_MODES else []
+        write_document(
+            doc,
+            chunks,
+            endpoints_jsonl,
+            out_json=out_json,
+            out_jsonl=out_jsonl,
+            out_endpoints_jsonl=out_endpoints_jsonl,
+        )
+    if profile is not None:
+        for section in doc.sections:
+            profile.count_record("section", section)
+        for endpoint in doc.endpoints:
+            profile.count_record("endpoint", endpoint)
+        profile.count("chunks", len(chunks))
+        profile.count_bytes_written([out_json, out_jsonl, out_endpoints_jsonl if endpoints_jsonl else ""])
+
+
+def write_document(
+    doc: Document,
+    chunks: List[Chunk],
+    endpoints_jsonl: List[EndpointRecord],
+    *,
+    out_json: str,
+    out_jsonl: str,
+    out_endpoints_jsonl: str,
+) -> None:
+    """Serialize a parsed document the way the buffered path always has. This is
+    where the IR becomes dicts, one record at a time as each is written."""
+    with Path(out_json).open("w", encoding="utf-8") as f:
+        write_rag_json(
+            f,
+            doc.title,
+            generic=doc.generic,
+            sections=lambda out: write_json_items(out, (section.to_dict() for section in doc.sections), "  "),
+            endpoints=lambda out: write_json_items(out, (endpoint.to_dict() for endpoint in doc.endpoints), "  "),
+            chunks=lambda out: write_json_items(out, (chunk.to_dict() for chunk in chunks), "  "),
+        )
+    with Path(out_jsonl).open("w", encoding="utf-8") as f:
         for chunk in chunks:
-            f.write(json.dumps(chunk, ensure_ascii=True) + "\n")
+            f.write(json.dumps(chunk.to_dict(), ensure_ascii=True) + "\n")
     if endpoints_jsonl:
-        with Path(args.out_endpoints_jsonl).open("w", encoding="utf-8") as f:
+        with Path(out_endpoints_jsonl).open("w", encoding="utf-8") as f:
             for item in endpoints_jsonl:
-                f.write(json.dumps(item, ensure_ascii=True) + "\n")
+                f.write(json.dumps(item.to_dict(), ensure_ascii=True) + "\n")
+
+
+def write_derived_artifacts(chunks_jsonl: str, *, bm25: Optional[str] = None, store: Optional[str] = None) -> None:
+    """Write the optional artifacts derived from a chunks JSONL file."""
+    if bm25:
+        write_prebuilt_index(chunks_jsonl, bm25)
+    if store:
+        write_chunk_store(load_chunks_jsonl(chunks_jsonl), store)
+
+
+def write_shared_schema_artifacts(artifact: Dict[str, Any], written: Optional[List[str]] = None) -> List[str]:
+    """Write the shared-schema forms (see rag_shared_schema) of an artifact's
+    .rag.json and endpoints JSONL named by ``shared_rag_json`` and
+    ``shared_endpoints_jsonl``. With ``written`` (paths a rebuild just wrote) an
+    output is only refreshed if its source is among them or it is missing."""
+    out: List[str] = []
+    for source_key, shared_key, write in (
+        ("rag_json", "shared_rag_json", write_shared_json),
+        ("endpoints_jsonl", "shared_endpoints_jsonl", write_shared_endpoints_jsonl),
+    ):
+        source, shared = artifact.get(source_key), artifact.get(shared_key)
+        if not source or not shared or not Path(source).exists():
+            continue
+        if written is None or source in written or not Path(shared).exists():
+            write(source, shared)
+            out.append(shared)
+    return out
+
+
+def write_block_artifacts(artifact: Dict[str, Any], written: Optional[List[str]] = None) -> List[str]:
+    """Write the block-compressed forms (see rag_blocks) of an artifact's chunks
+    and endpoints JSONL and the compact gzipped form of its .rag.json, if it has
+    a ``blocks`` object (optional ``block_bytes``, ``level``). With ``written``
+    an output is only refreshed if its source is among them or it is missing."""
+    options = artifact.get("blocks")
+    if options is None:
+        return []
+    out: List[str] = []
+    for key in ("chunks_jsonl", "endpoints_jsonl", "rag_json"):
+        source = artifact.get(key)
+        if not source or not Path(source).exists():
+            continue
+        if key == "rag_json":
+            outputs = [source + ".gz"]
+        else:
+            outputs = list(block_paths(source).values())
+        if written is not None and source not in written and all(Path(path).exists() for path in outputs):
+            continue
+        if key == "rag_json":
+            out.extend(write_compressed_json(source, level=options.get("level", DEFAULT_LEVEL)))
+        else:
+            out.extend(
+                write_block_jsonl(
+                    source,
+                    block_bytes=options.get("block_bytes", DEFAULT_BLOCK_BYTES),
+                    level=options.get("level", DEFAULT_LEVEL),
+                )
+            )
+    return out
+
+
+def artifact_mode(artifact: Dict[str, Any]) -> str:
+    # indexes written before "mode" was recorded: only discovery docs had endpoints
+    return artifact.get("mode") or ("discovery" if artifact.get("endpoints_jsonl") else "generic")
+
+
+def artifact_whitelist(artifact: Dict[str, Any], mode: str) -> Optional[set]:
+    if mode == "discovery":
+        return SECTION_WHITELIST
+    headings = artifact.get("section_whitelist") or []
+    return set(headings) if headings else None
+
+
+def build_index_artifact(artifact: Dict[str, Any], stream: bool, profile: bool = False) -> str:
+    """Process-pool entry point: build one per-document artifact from the index.
+    With ``profile`` the timings land in a sidecar next to its .rag.json."""
+    mode = artifact_mode(artifact)
+    recorder = IngestProfile() if profile else None
+    with profile_stage(recorder, "total"):
+        build_document(
+            artifact["source_file"],
+            mode=mode,
+            whitelist=artifact_whitelist(artifact, mode),
+            doc_id=artifact["doc_id"],
+            out_json=artifact["rag_json"],
+            out_jsonl=artifact["chunks_jsonl"],
+            out_endpoints_jsonl=artifact.get("endpoints_jsonl", ""),
+            stream=stream,
+            chunking=artifact.get("chunking"),
+            profile=recorder,
+        )
+        with profile_stage(recorder, "derived_artifacts"):
+            write_derived_artifacts(
+                artifact["chunks_jsonl"], bm25=artifact.get("bm25_json"), store=artifact.get("store_bin")
+            )
+            write_shared_schema_artifacts(artifact)
+            write_block_artifacts(artifact)
+    if recorder is not None:
+        write_profile(
+            recorder,
+            default_profile_path(artifact["rag_json"]),
+            input=artifact["source_file"],
+            mode=mode,
+            doc_id=artifact["doc_id"],
+            stream=stream,
+        )
+    return artifact["doc_id"]
+
+
+def write_bundle(sources: List[str], out_path: str) -> None:
+    """Merge per-document chunk JSONL files, in order, into one bundle file."""
+    tmp = Path(out_path).with_name(Path(out_path).name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as out:
+        wrote = False
+        for source in sources:
+            with Path(source).open("r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    out.write(line if line.endswith("\n") else line + "\n")
+                    wrote = True
+        if not wrote:
+            out.write("\n")
+    os.replace(tmp, out_path)
+
+
+def build_bundle(bundle: Dict[str, Any], hashers: Optional[Dict[str, MinHasher]] = None) -> List[str]:
+    """Merge (and dedup) a bundle artifact in a staging directory and move into
+    place only the files whose bytes changed; derived artifacts are rebuilt when
+    the chunks changed or are missing. ``hashers`` keeps a dedup hasher per
+    bundle, so a long-lived caller (``--watch``) reuses the signatures of
+    unchanged chunks. Returns the paths written."""
+    chunks_path = Path(bundle["chunks_jsonl"])
+    aliases = None
+    if bundle.get("dedup"):
+        aliases = Path(bundle.get("aliases_json") or chunks_path.with_suffix(".aliases.json"))
+    written: List[str] = []
+    with tempfile.TemporaryDirectory(prefix=".bundle-", dir=chunks_path.parent) as tmp:
+        staged = {chunks_path: Path(tmp) / chunks_path.name}
+        write_bundle(bundle["source_file"], str(staged[chunks_path]))
+        if aliases is not None:
+            staged[aliases] = Path(tmp) / aliases.name
+            hasher = None
+            if hashers is not None:
+                num_perm = bundle["dedup"].get("num_perm", DEFAULT_NUM_PERM)
+                hasher = hashers.get(str(chunks_path))
+                if hasher is None or hasher.num_perm != num_perm:
+                    hasher = hashers[str(chunks_path)] = MinHasher(num_perm)
+            dedup_bundle(str(staged[chunks_path]), str(staged[aliases]), hasher=hasher, **bundle["dedup"])
+        for final, staged_path in staged.items():
+            if final.exists() and final.read_bytes() == staged_path.read_bytes():
+                continue
+            os.replace(staged_path, final)
+            written.append(str(final))
+    derived = [bundle.get("bm25_json"), bundle.get("store_bin")]
+    if str(chunks_path) in written or any(path and not Path(path).exists() for path in derived):
+        write_derived_artifacts(str(chunks_path), bm25=bundle.get("bm25_json"), store=bundle.get("store_bin"))
+        written.extend(path for path in derived if path)
+    written.extend(write_block_artifacts(bundle, written))
+    spec = bundle.get("spec")
+    if spec:
+        written.extend(
+            write_spec_artifacts(
+                str(chunks_path),
+                spec["endpoints_jsonl"],
+                aliases_path=str(aliases) if aliases is not None else None,
+                params_json=spec.get("params_json"),
+                spec_json=spec.get("spec_json"),
+                spec_ts=spec.get("spec_ts"),
+            )
+        )
+    shards = bundle.get("shards")
+    if shards:
+        written.extend(
+            write_shards(
+                str(chunks_path),
+                shards["dir"],
+                shards["manifest_json"],
+                aliases_path=str(aliases) if aliases is not None else None,
+            )
+        )
+    answers = bundle.get("answer_cache")
+    if answers:
+        written.extend(write_answer_cache(str(chunks_path), answers["queries_json"], answers["cache_json"]))
+    return written
+
+
+def run_index_manifest(
+    index_path: Path, *, jobs: Optional[int] = None, stream: bool = False, profile: bool = False
+) -> Dict[str, Any]:
+    """Rebuild every artifact listed in a RAG index file.
+
+    Artifacts whose ``source_file`` is a single document are parsed in parallel
+    across a process pool, each with its own mode, whitelist and doc_id. Artifacts
+    whose ``source_file`` is a list are bundles, merged from the listed chunk files
+    once the documents are done; a bundle with a ``dedup`` object (see
+    rag_dedup.dedup_bundle) then drops near-duplicate chunks and records their
+    ids as aliases in ``aliases_json``; a bundle with a ``spec`` object
+    (``endpoints_jsonl``, ``params_json``, ``spec_json``, ``spec_ts``; see
+    rag_spec.write_spec_artifacts) then gets the parameter/field inverted index
+    and the planner spec emitted from it; a bundle with a ``shards`` object
+    (``dir``, ``manifest_json``; see rag_shards.write_shards) is also split into
+    per-(doc_id, type) chunk shards listed in a manifest, and one with an
+    ``answer_cache`` object (``queries_json``, ``cache_json``; see
+    rag_answer_cache.write_answer_cache) gets the ranked hits of a fixed query
+    set precomputed. Any artifact with a
+    ``bm25_json`` or ``store_bin`` path also gets a prebuilt BM25 index or packed chunk store,
+    one with a ``blocks`` object gets block-compressed, id-indexed forms of its
+    JSONL files (see write_block_artifacts), a document with ``shared_rag_json`` / ``shared_endpoints_jsonl`` paths gets the
+    shared-schema forms (see rag_shared_schema) of its .rag.json / endpoints
+    JSONL, and a ``chunking`` object (``max_tokens``, ``overlap_tokens``, ``tokenizer``) switches a document
+    to token-budget chunks. With ``profile`` each document also gets a
+    .profile.json sidecar. An index with a top-level ``publish`` object (``dir``,
+    optional ``prune``; see rag_publish.publish_index) then has every output
+    copied under a content-hash name, recorded in each artifact's ``published``
+    map. The index is then rewritten atomically with the mode used for each
+    document.
+    """
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    artifacts = index.get("artifacts", [])
+    documents = [a for a in artifacts if isinstance(a.get("source_file"), str)]
+    bundles = [a for a in artifacts if isinstance(a.get("source_file"), list)]
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(build_index_artifact, artifact, stream, profile) for artifact in documents]
+        for future in futures:
+            future.result()
+
+    for bundle in bundles:
+        build_bundle(bundle)
+
+    for artifact in documents:
+        artifact["mode"] = artifact_mode(artifact)
+    publish = index.get("publish")
+    if publish:
+        publish_index(index, publish["dir"], prune=publish.get("prune", False))
+    write_text_atomic(index_path, json.dumps(index, indent=2, ensure_ascii=True))
+    return index
+
+
+WATCH_POLL_INTERVAL = 0.1
+DEFAULT_DEBOUNCE = 0.3
+
+
+def rebuild_index_documents(
+    index_path: Path,
+    documents: List[Dict[str, Any]],
+    bundles: List[Dict[str, Any]],
+    *,
+    all_bundles: bool = False,
+    profile: bool = False,
+    hashers: Optional[Dict[str, MinHasher]] = None,
+) -> Dict[str, Any]:
+    """Incrementally rebuild ``documents`` from a RAG index (see ``run_incremental``),
+    then every bundle fed by a chunks file that changed (``all_bundles``: every
+    bundle; ``hashers`` as in ``build_bundle``). Outputs whose bytes are
+    unchanged are not rewritten. Returns a summary of the rebuild."""
+    start = time.perf_counter()
+    summary: Dict[str, Any] = {"documents": [], "added": 0, "removed": 0, "changed": 0, "written": []}
+    for artifact in documents:
+        mode = artifact_mode(artifact)
+        recorder = IngestProfile() if profile else None
+        with profile_stage(recorder, "total"):
+            delta = run_incremental(
+                Path(artifact["source_file"]),
+                mode=mode,
+                whitelist=artifact_whitelist(artifact, mode),
+                source_file=artifact["source_file"],
+                doc_id=artifact["doc_id"],
+                out_json=artifact["rag_json"],
+                out_jsonl=artifact["chunks_jsonl"],
+                out_endpoints_jsonl=artifact.get("endpoints_jsonl", ""),
+                manifest_path=default_ingest_manifest_path(artifact["rag_json"]),
+                chunking=artifact.get("chunking"),
+                profile=recorder,
+            )
+            if artifact["chunks_jsonl"] in delta.get("written", []):
+                with profile_stage(recorder, "derived_artifacts"):
+                    write_derived_artifacts(
+                        artifact["chunks_jsonl"], bm25=artifact.get("bm25_json"), store=artifact.get("store_bin")
+                    )
+            if not delta["unchanged"]:
+                delta["written"].extend(write_shared_schema_artifacts(artifact, delta["written"]))
+                delta["written"].extend(write_block_artifacts(artifact, delta["written"]))
+        if recorder is not None:
+            write_profile(
+                recorder,
+                default_profile_path(artifact["rag_json"]),
+                input=artifact["source_file"],
+                mode=mode,
+                doc_id=artifact["doc_id"],
+                incremental=True,
+            )
+        summary["documents"].append(artifact["doc_id"])
+        for key in ("added", "removed", "changed"):
+            summary[key] += len(delta[key])
+        summary["written"].extend(delta.get("written", []))
+
+    for bundle in bundles:
+        inputs = bundle["source_file"] + (bundle.get("spec") or {}).get("endpoints_jsonl", [])
+        if all_bundles or any(source in summary["written"] for source in inputs):
+            summary["written"].extend(build_bundle(bundle, hashers))
+    summary["seconds"] = round(time.perf_counter() - start, 4)
+    return summary
+
+
+def watch_index(
+    index_path: Path, *, debounce: float = DEFAULT_DEBOUNCE, profile: bool = False, poll: float = WATCH_POLL_INTERVAL
+) -> None:
+    """Rebuild the documents of a RAG index as their sources change, until interrupted.
+
+    Sources (and the index itself) are polled by mtime and size. A change starts a
+    debounce window that restarts on every further change, so a burst of saves
+    triggers one rebuild once the files have been quiet for ``debounce`` seconds.
+    Only the documents whose source changed are re-parsed; an edit to the index
+    rebuilds all of them. Each rebuild prints a JSON summary with its timing.
+    """
+
+    def load() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        artifacts = json.loads(index_path.read_text(encoding="utf-8")).get("artifacts", [])
+        return (
+            [a for a in artifacts if isinstance(a.get("source_file"), str)],
+            [a for a in artifacts if isinstance(a.get("source_file"), list)],
+        )
+
+    def snapshot(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        paths = [str(index_path)] + [a["source_file"] for a in documents]
+        return {path: file_signature(path) for path in paths}
+
+    def report(summary: Dict[str, Any]) -> None:
+        print(json.dumps(summary, ensure_ascii=True), flush=True)
+
+    documents, bundles = load()
+    # dedup signatures of this session, one hasher per bundle
+    hashers: Dict[str, MinHasher] = {}
+    # taken before each rebuild, so a save that lands while it runs still
+    # differs from ``seen`` afterwards and triggers the next one
+    seen = snapshot(documents)
+    # the first pass also brings the bundles up to date and warms the dedup signatures
+    report(
+        rebuild_index_documents(index_path, documents, bundles, all_bundles=True, profile=profile, hashers=hashers)
+    )
+    print(f"watching {len(documents)} documents from {index_path}", file=sys.stderr, flush=True)
+    while True:
+        time.sleep(poll)
+        current = snapshot(documents)
+        if current == seen:
+            continue
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < debounce:
+            time.sleep(poll)
+            latest = snapshot(documents)
+            if latest != current:
+                current, quiet_since = latest, time.monotonic()
+        try:
+            if current[str(index_path)] != seen[str(index_path)]:
+                documents, bundles = load()
+                # the reloaded index may list other sources
+                current = snapshot(documents)
+                changed = documents
+                rebuild_all = True
+            else:
+                changed = [a for a in documents if current[a["source_file"]] != seen[a["source_file"]]]
+                rebuild_all = False
+            changed = [a for a in changed if Path(a["source_file"]).exists()]
+            report(
+                rebuild_index_documents(
+                    index_path, changed, bundles, all_bundles=rebuild_all, profile=profile, hashers=hashers
+                )
+            )
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"rebuild failed: {exc}", file=sys.stderr, flush=True)
+        seen = current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="docs/Discovery_API.md")
+    parser.add_argument("--out-json", default="docs/Discovery_API.rag.json")
+    parser.add_argument("--out-jsonl", default="docs/Discovery_API.rag.chunks.jsonl")
+    parser.add_argument(
+        "--out-endpoints-jsonl",
+        default="docs/Discovery_API.rag.endpoints.jsonl",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["discovery", "generic", "openapi"],
+        default="discovery",
+        help="openapi: --input is an OpenAPI (2.0/3.x) or JSON Schema document, .json or .yaml (see rag_openapi.py)",
+    )
+    parser.add_argument(
+        "--section-whitelist",
+        help="Comma-separated section headings to include (generic mode)",
+        default="",
+    )
+    parser.add_argument("--doc-id", default="")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each record as soon as it is parsed instead of building the whole document in memory",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip unchanged sections/endpoints using the ingest manifest and report the chunk id delta",
+    )
+    parser.add_argument(
+        "--ingest-manifest",
+        default="",
+        help="Ingest manifest path for --incremental (default: next to --out-json)",
+    )
+    parser.add_argument(
+        "--manifest",
+        default="",
+        help="RAG index file (e.g. docs/Socrata.rag.index.json); rebuild every artifact it lists",
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes for --manifest (default: CPU count)")
+    parser.add_argument(
+        "--parse-jobs",
+        type=int,
+        default=0,
+        help="Parse a single discovery document in this many processes, sharded at endpoint boundaries",
+    )
+    parser.add_argument(
+        "--out-bm25",
+        default="",
+        help="Also write a prebuilt BM25 index (vocabulary, postings, doc lengths) for the chunks JSONL",
+    )
+    parser.add_argument(
+        "--out-store",
+        default="",
+        help="Also write the chunks as a packed binary store (see rag_store.py) for mmap lookups by id",
+    )
+    parser.add_argument(
+        "--out-shared-json",
+        default="",
+        help="Also write --out-json in the shared-schema form (params and fields interned once; see rag_shared_schema.py)",
+    )
+    parser.add_argument(
+        "--out-shared-endpoints-jsonl",
+        default="",
+        help="Also write --out-endpoints-jsonl in the shared-schema form",
+    )
+    parser.add_argument(
+        "--blocks",
+        action="store_true",
+        help="Also write the JSONL outputs block-compressed with a block index, and the .rag.json compact and gzipped (see rag_blocks.py)",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=0,
+        help="Chunk by token budget instead of 1400 characters, splitting long paragraphs at sentence boundaries",
+    )
+    parser.add_argument("--overlap-tokens", type=int, default=0, help="Tokens repeated from the previous chunk")
+    parser.add_argument("--tokenizer", choices=sorted(TOKENIZERS), default="words", help="Token counter for --max-tokens")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write per-stage timings and counters to a .profile.json sidecar next to --out-json",
+    )
+    parser.add_argument("--profile-out", default="", help="Sidecar path for --profile (single document)")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="With --manifest: keep running and incrementally rebuild documents (and bundles) whose sources change",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help="Seconds a burst of saves must be quiet before --watch rebuilds",
+    )
+    parser.add_argument(
+        "--serve",
+        default="",
+        metavar="[HOST:]PORT",
+        help="After building, serve the chunks and endpoints with the worker's /api/rag/* shapes (see rag_server.py)",
+    )
+    parser.add_argument(
+        "--cprofile",
+        default="",
+        help="Run under cProfile and dump stats here (read with python -m pstats); "
+        "--manifest workers run in other processes and are not included",
+    )
+    args = parser.parse_args()
+    if args.stream and args.incremental:
+        parser.error("--stream and --incremental cannot be combined")
+    if args.parse_jobs and (args.stream or args.incremental or args.manifest or args.mode != "discovery"):
+        parser.error("--parse-jobs only applies to a single discovery document without --stream or --incremental")
+    chunking = None
+    if args.max_tokens:
+        if not 0 <= args.overlap_tokens < args.max_tokens:
+            parser.error("--overlap-tokens must be smaller than --max-tokens")
+        chunking = {"max_tokens": args.max_tokens, "overlap_tokens": args.overlap_tokens, "tokenizer": args.tokenizer}
+    elif args.overlap_tokens:
+        parser.error("--overlap-tokens requires --max-tokens")
+
+    if args.watch and not args.manifest:
+        parser.error("--watch requires --manifest")
+    if args.profile_out and not args.profile:
+        parser.error("--profile-out requires --profile")
+    if args.profile_out and args.manifest:
+        parser.error("--profile-out cannot be combined with --manifest (each document gets its own sidecar)")
+
+    if args.watch:
+        if args.serve:
+            # serve from a side thread; it reloads whenever a rebuild rewrites an artifact
+            loader = partial(ChunkCatalog.from_index, args.manifest)
+            threading.Thread(target=serve, args=(loader(), args.serve), kwargs={"loader": loader}, daemon=True).start()
+        try:
+            watch_index(Path(args.manifest), debounce=args.debounce, profile=args.profile)
+        except KeyboardInterrupt:
+            pass
+        return
+    if not args.cprofile:
+        run_cli(args, chunking)
+    else:
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(run_cli, args, chunking)
+        finally:
+            profiler.dump_stats(args.cprofile)
+    if args.serve:
+        serve(serve_catalog(args), args.serve)
+
+
+def serve_catalog(args: argparse.Namespace) -> ChunkCatalog:
+    """What ``--serve`` serves: the index's bundles, or the document just built."""
+    if args.manifest:
+        return ChunkCatalog.from_index(args.manifest)
+    doc_id = args.doc_id or Path(args.input).stem
+    endpoints = {doc_id: args.out_endpoints_jsonl} if args.mode in ENDPOINT_MODES else {}
+    return ChunkCatalog.from_files([args.out_jsonl], endpoints_paths=endpoints)
+
+
+def run_cli(args: argparse.Namespace, chunking: Optional[Dict[str, Any]]) -> None:
+    if args.manifest:
+        run_index_manifest(Path(args.manifest), jobs=args.jobs or None, stream=args.stream, profile=args.profile)
+        return
+
+    path = Path(args.input)
+    whitelist = None
+    if args.mode == "discovery":
+        whitelist = SECTION_WHITELIST
+    elif args.section_whitelist:
+        whitelist = {s.strip() for s in args.section_whitelist.split(",") if s.strip()}
+    doc_id = args.doc_id or Path(args.input).stem
+    profile = IngestProfile() if args.profile else None
+    outputs = {
+        "rag_json": args.out_json,
+        "chunks_jsonl": args.out_jsonl,
+        "endpoints_jsonl": args.out_endpoints_jsonl,
+        "shared_rag_json": args.out_shared_json,
+        "shared_endpoints_jsonl": args.out_shared_endpoints_jsonl,
+    }
+    if args.blocks:
+        outputs["blocks"] = {}
+
+    with profile_stage(profile, "total"):
+        if args.incremental:
+            manifest_path = (
+                Path(args.ingest_manifest) if args.ingest_manifest else default_ingest_manifest_path(args.out_json)
+            )
+            delta = run_incremental(
+                path,
+                mode=args.mode,
+                whitelist=whitelist,
+                source_file=str(args.input),
+                doc_id=doc_id,
+                out_json=args.out_json,
+                out_jsonl=args.out_jsonl,
+                out_endpoints_jsonl=args.out_endpoints_jsonl,
+                manifest_path=manifest_path,
+                chunking=chunking,
+                profile=profile,
+            )
+            summary = {key: len(value) if isinstance(value, list) else value for key, value in delta.items()}
+            print(json.dumps(summary, ensure_ascii=True))
+            if not delta["unchanged"]:
+                with profile_stage(profile, "derived_artifacts"):
+                    write_derived_artifacts(args.out_jsonl, bm25=args.out_bm25, store=args.out_store)
+                    write_shared_schema_artifacts(outputs, delta["written"])
+                    write_block_artifacts(outputs, delta["written"])
+        else:
+            build_document(
+                args.input,
+                mode=args.mode,
+                whitelist=whitelist,
+                doc_id=doc_id,
+                out_json=args.out_json,
+                out_jsonl=args.out_jsonl,
+                out_endpoints_jsonl=args.out_endpoints_jsonl,
+                stream=args.stream,
+                chunking=chunking,
+                parse_jobs=args.parse_jobs,
+                profile=profile,
+            )
+            with profile_stage(profile, "derived_artifacts"):
+                write_derived_artifacts(args.out_jsonl, bm25=args.out_bm25, store=args.out_store)
+                write_shared_schema_artifacts(outputs)
+                write_block_artifacts(outputs)
+
+    if profile is not None:
+        write_profile(
+            profile,
+            Path(args.profile_out) if args.profile_out else default_profile_path(args.out_json),
+            input=str(args.input),
+            mode=args.mode,
+            doc_id=doc_id,
+            stream=args.stream,
+            incremental=args.incremental,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import assert from "node:assert/strict";
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const { parseJsonl, RagIndex, RAG_INDEX_LIMITS } = await import("../services/ragIndex.ts");
+const { createRagAnswerLookup, ragAnswerKey } = await import("../services/ragAnswerCache.ts");
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const readJson = (relativePath) => JSON.parse(fs.readFileSync(path.join(rootDir, relativePath), "utf8"));
+const bundle = fs.readFileSync(path.join(rootDir, "docs/Socrata.rag.bundle.jsonl"));
+const bundleSha256 = crypto.createHash("sha256").update(bundle).digest("hex");
+const cache = readJson("docs/Socrata.rag.answers.json");
+const { queries } = readJson("docs/Socrata.rag.queries.json");
+
+const options = { ...RAG_INDEX_LIMITS, minTokenLength: 2 };
+const chunks = parseJsonl(bundle.toString("utf8"));
+const index = new RagIndex(chunks, options);
+
+// The cache was built from the committed bundle.
+assert.equal(cache.chunk_set_sha256, bundleSha256);
+// Scores come from Python's math.log, so they may differ from V8's in the last bits.
+const assertSameHits = (actual, expected, message) => {
+  assert.ok(actual, message);
+  assert.equal(actual.length, expected.length, message);
+  actual.forEach((hit, i) => {
+    const { score, ...chunk } = hit;
+    const { score: expectedScore, ...expectedChunk } = expected[i];
+    assert.deepEqual(chunk, expectedChunk, `${message} rank ${i + 1}`);
+    assert.ok(Math.abs(score - expectedScore) < 1e-9, `${message} rank ${i + 1} score`);
+  });
+};
+
+const lookup = createRagAnswerLookup(cache, chunks, bundleSha256, options);
+assert.ok(lookup, "cache is compatible with the bundle and the worker's index options");
+
+// Every query in the set is answered exactly as RagIndex.query answers it.
+assert.equal(Object.keys(cache.entries).length, queries.length);
+for (const { query, filters } of queries) {
+  assert.ok(cache.entries[ragAnswerKey(query, filters)], `${query} is cached`);
+  for (const topK of [undefined, 1, 4, 12, 25, 40]) {
+    assertSameHits(lookup(query, { topK, filters }), index.query(query, { topK, filters }), `${query} topK=${topK}`);
+  }
+}
+
+// Equivalent requests share an entry; others fall through to scoring.
+const [first] = queries;
+const reordered = { ...first.filters, docIds: [...first.filters.docIds, ...first.filters.docIds].reverse(), tags: [] };
+assertSameHits(
+  lookup(`  ${first.query.toUpperCase().replace(/ /g, "\n\t")} `, { topK: 4, filters: reordered }),
+  index.query(first.query, { topK: 4, filters: first.filters }),
+  "normalized query"
+);
+assert.equal(lookup(first.query, { topK: 4 }), undefined, "unfiltered query is not cached");
+assert.equal(lookup("unlisted question", { topK: 4, filters: first.filters }), undefined);
+
+// A cache built from other chunks or with other options is ignored.
+assert.equal(createRagAnswerLookup(cache, chunks, "0".repeat(64), options), null);
+assert.equal(createRagAnswerLookup(cache, chunks.slice(1), bundleSha256, options), null);
+assert.equal(createRagAnswerLookup(cache, chunks, bundleSha256, { ...options, minTokenLength: 3 }), null);
+assert.equal(createRagAnswerLookup(cache, chunks, bundleSha256, { ...options, maxChunkChars: 100 }), null);
+assert.equal(createRagAnswerLookup({ ...cache, version: 2 }, chunks, bundleSha256, options), null);
+const hitChunk = Object.values(cache.entries)[0].hits[0].chunk;
+const renamed = chunks.map((chunk, n) => (n === hitChunk ? { ...chunk, id: `${chunk.id}-renamed` } : chunk));
+assert.equal(createRagAnswerLookup(cache, renamed, bundleSha256, options), null);
+
+console.log("rag-answer-cache.test.mjs: ok");
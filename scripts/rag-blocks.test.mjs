@@ -0,0 +1,61 @@
+import assert from "node:assert/strict";
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+import zlib from "node:zlib";
+import { fileURLToPath } from "node:url";
+
+const { parseJsonl } = await import("../services/ragIndex.ts");
+const { RagBlockReader } = await import("../services/ragBlocks.ts");
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const read = (relativePath) => fs.readFileSync(path.join(rootDir, relativePath));
+
+for (const jsonlPath of [
+  "docs/Socrata.rag.bundle.jsonl",
+  "docs/Discovery_API.rag.chunks.jsonl",
+  "docs/Discovery_API.rag.endpoints.jsonl"
+]) {
+  const records = parseJsonl(read(jsonlPath).toString("utf8"));
+  const index = JSON.parse(read(`${jsonlPath}.blocks.json`).toString("utf8"));
+  const data = read(`${jsonlPath}.gz`);
+
+  // The blocks file is one gzip stream of the compact records, in order.
+  assert.equal(data.length, index.bytes, `${jsonlPath} bytes`);
+  assert.equal(crypto.createHash("sha256").update(data).digest("hex"), index.sha256, `${jsonlPath} sha256`);
+  assert.ok(data.length < read(jsonlPath).length / 2, `${jsonlPath} compresses`);
+  assert.deepEqual(parseJsonl(zlib.gunzipSync(data).toString("utf8")), records, `${jsonlPath} round trip`);
+  assert.equal(index.records, records.length);
+  assert.equal(index.blocks.reduce((total, block) => total + block.count, 0), records.length);
+
+  // Lookups inflate only the blocks holding the id.
+  const loads = [];
+  const reader = new RagBlockReader(index, (offset, length) => {
+    loads.push(offset);
+    return data.subarray(offset, offset + length);
+  });
+  const target = records[records.length - 1];
+  const hits = await reader.getAll(target.id);
+  assert.deepEqual(hits, records.filter((record) => record.id === target.id), `${jsonlPath} ${target.id}`);
+  assert.deepEqual(await reader.get(target.id), hits[hits.length - 1]);
+  assert.equal(loads.length, index.ids[target.id].length);
+  assert.ok(loads.length < index.blocks.length, `${jsonlPath} lookup reads a fraction of the blocks`);
+  await reader.get(target.id);
+  assert.equal(loads.length, index.ids[target.id].length, "inflated blocks are reused");
+  assert.equal(await reader.get("no-such-id"), undefined);
+  assert.equal(await reader.get("constructor"), undefined);
+
+  // Every id resolves to the records that carry it.
+  for (const record of records) {
+    assert.ok((await reader.getAll(record.id)).some((hit) => JSON.stringify(hit) === JSON.stringify(record)));
+  }
+  assert.deepEqual(await reader.all(), records);
+}
+
+// The compact .rag.json holds the same document.
+assert.deepEqual(
+  JSON.parse(zlib.gunzipSync(read("docs/Discovery_API.rag.json.gz")).toString("utf8")),
+  JSON.parse(read("docs/Discovery_API.rag.json").toString("utf8"))
+);
+
+console.log("rag-blocks.test.mjs: ok");
@@ -0,0 +1,53 @@
+import assert from "node:assert/strict";
+import { execFileSync } from "node:child_process";
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const chunkerScript = path.join(rootDir, "scripts/rag_chunker.py");
+
+const INPUTS = [
+  { label: "repeated words", text: "word ".repeat(400) },
+  { label: "long sentence", text: `${"abcdefgh ".repeat(150)}and one ${"x".repeat(900)} word.` },
+  { label: "Discovery_API.md", text: fs.readFileSync(path.join(rootDir, "docs/Discovery_API.md"), "utf8") },
+  { label: "Discovery_API_2.txt", text: fs.readFileSync(path.join(rootDir, "docs/Discovery_API_2.txt"), "utf8") }
+];
+
+// The CLI recounts each emitted chunk with the chosen tokenizer.
+const chunk = (text, tokenizer, maxTokens, overlapTokens) =>
+  execFileSync(
+    "python3",
+    [
+      chunkerScript,
+      "--tokenizer", tokenizer,
+      "--max-tokens", String(maxTokens),
+      "--overlap-tokens", String(overlapTokens)
+    ],
+    { input: text, encoding: "utf8", maxBuffer: 64 << 20 }
+  )
+    .split("\n")
+    .filter(Boolean)
+    .map((line) => JSON.parse(line));
+
+for (const tokenizer of ["words", "bpe-approx"]) {
+  for (const maxTokens of [20, 100, 200]) {
+    for (const overlapTokens of [0, Math.floor(maxTokens / 4)]) {
+      for (const { label, text } of INPUTS) {
+        const records = chunk(text, tokenizer, maxTokens, overlapTokens);
+        assert.ok(records.length > 0, `${label}: chunks emitted`);
+        for (const record of records) {
+          // only a single word over budget on its own may exceed max_tokens
+          if (/\s/.test(record.text)) {
+            assert.ok(
+              record.tokens <= maxTokens,
+              `${label} (${tokenizer}, max ${maxTokens}, overlap ${overlapTokens}): chunk of ${record.tokens} tokens`
+            );
+          }
+        }
+      }
+    }
+  }
+}
+
+console.log("rag-chunker.test.mjs: ok");
@@ -0,0 +1,86 @@
+import assert from "node:assert/strict";
+import { execFileSync } from "node:child_process";
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const parseScript = path.join(rootDir, "scripts/parse_discovery_api.py");
+const tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "rag-incremental-"));
+
+const DOCUMENTS = [
+  { source: "docs/Discovery_API.md", mode: "discovery" },
+  { source: "docs/Discovery_API_2.txt", mode: "generic" }
+];
+
+const outputs = (dir) => ({
+  json: path.join(dir, "doc.rag.json"),
+  jsonl: path.join(dir, "doc.rag.chunks.jsonl"),
+  endpoints: path.join(dir, "doc.rag.endpoints.jsonl")
+});
+
+const build = (input, mode, dir, incremental) => {
+  fs.mkdirSync(dir, { recursive: true });
+  const out = outputs(dir);
+  const args = [
+    parseScript,
+    "--input", input,
+    "--mode", mode,
+    "--doc-id", "doc",
+    "--out-json", out.json,
+    "--out-jsonl", out.jsonl,
+    "--out-endpoints-jsonl", out.endpoints
+  ];
+  const stdout = execFileSync("python3", incremental ? [...args, "--incremental"] : args, { encoding: "utf8" });
+  return incremental ? JSON.parse(stdout.trim().split("\n").pop()) : null;
+};
+
+// --incremental must write what a full build writes after the edit.
+const assertSameAsFull = (input, mode, label) => {
+  const fullDir = path.join(tmpDir, "full");
+  fs.rmSync(fullDir, { recursive: true, force: true });
+  build(input, mode, fullDir, false);
+  const full = outputs(fullDir);
+  const incremental = outputs(path.join(tmpDir, "incremental"));
+  for (const key of ["json", "jsonl", "endpoints"]) {
+    assert.equal(fs.existsSync(incremental[key]), fs.existsSync(full[key]), `${label}: ${key} presence`);
+    if (fs.existsSync(full[key])) {
+      assert.ok(fs.readFileSync(incremental[key]).equals(fs.readFileSync(full[key])), `${label}: ${key} bytes`);
+    }
+  }
+};
+
+try {
+  for (const { source, mode } of DOCUMENTS) {
+    const input = path.join(tmpDir, path.basename(source));
+    const incrementalDir = path.join(tmpDir, "incremental");
+    fs.rmSync(incrementalDir, { recursive: true, force: true });
+    const lines = fs.readFileSync(path.join(rootDir, source), "utf8").split(/\r?\n/);
+    fs.writeFileSync(input, lines.join("\n"), "utf8");
+    build(input, mode, incrementalDir, true);
+    assertSameAsFull(input, mode, `${source} first run`);
+
+    // Only the title line changes: every chunk path carries it, so nothing is reused.
+    lines[0] = `${lines[0]} (edited)`;
+    fs.writeFileSync(input, lines.join("\n"), "utf8");
+    const titleDelta = build(input, mode, incrementalDir, true);
+    assert.equal(titleDelta.reused_entities, 0, `${source} title edit reuses nothing`);
+    assert.ok(titleDelta.changed > 0, `${source} title edit changes chunks`);
+    assertSameAsFull(input, mode, `${source} title edit`);
+    const written = fs.readFileSync(outputs(incrementalDir).jsonl, "utf8");
+    assert.ok(written.includes(JSON.stringify(lines[0].trim())), `${source} chunks carry the new title`);
+
+    // A body edit still reuses the untouched entities.
+    const middle = Math.floor(lines.length / 2);
+    lines.splice(middle, 0, "", "An extra paragraph for the incremental check.", "");
+    fs.writeFileSync(input, lines.join("\n"), "utf8");
+    const bodyDelta = build(input, mode, incrementalDir, true);
+    assert.ok(bodyDelta.reused_entities > 0, `${source} body edit reuses entities`);
+    assertSameAsFull(input, mode, `${source} body edit`);
+  }
+} finally {
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+}
+
+console.log("rag-incremental.test.mjs: ok");
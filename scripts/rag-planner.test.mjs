@@ -1,6 +1,8 @@
 import assert from "node:assert/strict";
 
 const { buildSocrataSodaEndpoint, planSocrataDiscoveryQuery, planSocrataSodaEndpoint } = await import("../services/socrataRagPlanner.ts");
+const { getRagUsageLog } = await import("../services/ragTelemetry.ts");
+const { default: ragSpec } = await import("../data/socrataRagSpec.ts");
 
 const plan = planSocrataDiscoveryQuery({
   portalUrl: "https://data.example.gov",
@@ -28,6 +30,16 @@ assert.ok(!plan.unknownParams.includes("categories"));
 assert.ok(!plan.unknownParams.includes("domains"));
 assert.ok(!plan.unknownParams.includes("tags"));
 
+const usage = getRagUsageLog().find((entry) => entry.id === plan.ragUsageId);
+assert.ok(usage, "Expected the discovery plan to record RAG usage.");
+for (const id of [...ragSpec.discovery.sourceChunkIds, ...ragSpec.discovery.paramChunkIds.categories]) {
+  assert.ok(usage.chunkIds.includes(id), `Expected usage to cite ${id}.`);
+}
+assert.ok(
+  !ragSpec.discovery.paramChunkIds.ids.some((id) => usage.chunkIds.includes(id)),
+  "Expected unused params not to be cited."
+);
+
 const planClamped = planSocrataDiscoveryQuery({
   portalUrl: "https://data.example.gov",
   query: "parcel",
@@ -0,0 +1,85 @@
+import assert from "node:assert/strict";
+import { execFileSync } from "node:child_process";
+import crypto from "node:crypto";
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const { buildRagIndexFromJsonl, buildRagIndexFromPrebuilt, parseJsonl } = await import("../services/ragIndex.ts");
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const bundlePath = path.join(rootDir, "docs/Socrata.rag.bundle.jsonl");
+const bm25Script = path.join(rootDir, "scripts/rag_bm25.py");
+const tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "rag-prebuilt-"));
+
+const QUERIES = [
+  { query: "catalog/v1 search_context q limit offset tags categories", topK: 4, filters: { docIds: ["socrata_discovery"] } },
+  { query: "SODA /resource/{id}.json /api/v3/views/{id}/query.json app token", topK: 4, filters: { docIds: ["socrata_soda_api"] } },
+  { query: "/api/v3/views/{id}/query.json app token", topK: 3 },
+  { query: "paginate results limit offset", topK: 6, filters: { types: ["request-params"] } },
+  { query: "response fields resource name", topK: 10, filters: { tags: ["response"] } },
+  { query: "authentication oauth basic", topK: 5 },
+  { query: "domain categories count", topK: 25, filters: { sourceFiles: ["docs/Discovery_API.md"] } },
+  { query: "the and of", topK: 5 }
+];
+
+try {
+  const prebuiltPath = path.join(tmpDir, "bundle.bm25.json");
+  const queriesPath = path.join(tmpDir, "queries.json");
+  execFileSync("python3", [bm25Script, "build", "--chunks", bundlePath, "--out", prebuiltPath]);
+  fs.writeFileSync(queriesPath, JSON.stringify(QUERIES), "utf8");
+  const pythonHits = JSON.parse(
+    execFileSync("python3", [bm25Script, "query", "--chunks", bundlePath, "--queries", queriesPath], { encoding: "utf8" })
+  );
+
+  const sha256 = (text) => crypto.createHash("sha256").update(text).digest("hex");
+  const bundle = fs.readFileSync(bundlePath, "utf8");
+  const bundleSha256 = sha256(bundle);
+  const prebuilt = JSON.parse(fs.readFileSync(prebuiltPath, "utf8"));
+  assert.equal(prebuilt.chunk_set_sha256, bundleSha256);
+  const runtimeIndex = buildRagIndexFromJsonl(bundle);
+  const prebuiltIndex = buildRagIndexFromPrebuilt(bundle, prebuilt, bundleSha256);
+
+  QUERIES.forEach(({ query, topK, filters }, n) => {
+    const expected = runtimeIndex.query(query, { topK, filters });
+    const loaded = prebuiltIndex.query(query, { topK, filters });
+    assert.deepEqual(loaded, expected, `Prebuilt index diverged from runtime index for "${query}".`);
+    assert.deepEqual(
+      pythonHits[n].map((hit) => hit.id),
+      expected.map((hit) => hit.id),
+      `Python BM25 ranking diverged from RagIndex.query for "${query}".`
+    );
+    pythonHits[n].forEach((hit, i) => {
+      assert.ok(Math.abs(hit.score - expected[i].score) < 1e-9, `Score mismatch for "${query}" at rank ${i + 1}.`);
+    });
+  });
+
+  // A matching prebuilt index really is what gets scored: doubled doc lengths change the scores.
+  const stretched = { ...prebuilt, doc_lengths: prebuilt.doc_lengths.map((length, n) => (n % 2 ? length * 2 : length)) };
+  assert.notDeepEqual(
+    buildRagIndexFromPrebuilt(bundle, stretched, bundleSha256).query(QUERIES[0].query, QUERIES[0]),
+    runtimeIndex.query(QUERIES[0].query, QUERIES[0]),
+    "Expected a compatible prebuilt index to be used."
+  );
+
+  const expectIgnored = (jsonl, index, chunkSetSha256, message) =>
+    assert.deepEqual(
+      buildRagIndexFromPrebuilt(jsonl, index, chunkSetSha256).query(QUERIES[0].query, QUERIES[0]),
+      buildRagIndexFromJsonl(jsonl).query(QUERIES[0].query, QUERIES[0]),
+      message
+    );
+  const stale = { ...prebuilt, ids: prebuilt.ids.map((id, n) => (n === 0 ? `${id}-stale` : id)) };
+  expectIgnored(bundle, stale, bundleSha256, "Expected a prebuilt index with other ids to be ignored.");
+  expectIgnored(bundle, stretched, "", "Expected a prebuilt index without a chunk hash to compare to be ignored.");
+
+  // A text edit that keeps every id still makes the postings stale.
+  const edited = parseJsonl(bundle)
+    .map((chunk, n) => JSON.stringify(n === 0 ? { ...chunk, text: `${chunk.text} catalog search_context catalog` } : chunk))
+    .join("\n") + "\n";
+  expectIgnored(edited, prebuilt, sha256(edited), "Expected a prebuilt index of other chunk text to be ignored.");
+} finally {
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+}
+
+console.log("rag-prebuilt-index.test.mjs: ok");
@@ -0,0 +1,97 @@
+import assert from "node:assert/strict";
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const { buildRagIndexFromJsonl, parseJsonl } = await import("../services/ragIndex.ts");
+const { ShardedRagIndex, selectRagShards } = await import("../services/ragShards.ts");
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const manifest = JSON.parse(fs.readFileSync(path.join(rootDir, "docs/Socrata.rag.shards.json"), "utf8"));
+const bundle = fs.readFileSync(path.join(rootDir, "docs/Socrata.rag.bundle.jsonl"), "utf8");
+const bundleChunks = parseJsonl(bundle);
+
+// Shards match their manifest entries and partition the bundle.
+const shardIds = [];
+let totalBytes = 0;
+for (const shard of manifest.shards) {
+  const content = fs.readFileSync(path.join(rootDir, shard.path));
+  assert.equal(content.length, shard.bytes, `${shard.path} bytes`);
+  assert.equal(crypto.createHash("sha256").update(content).digest("hex"), shard.sha256, `${shard.path} sha256`);
+  const chunks = parseJsonl(content.toString("utf8"));
+  assert.equal(chunks.length, shard.count, `${shard.path} count`);
+  for (const chunk of chunks) {
+    assert.equal(chunk.doc_id, shard.doc_id);
+    assert.equal(chunk.type, shard.type);
+    assert.ok(shard.source_files.includes(chunk.source_file));
+    shardIds.push(chunk.id);
+  }
+  totalBytes += shard.bytes;
+}
+assert.equal(manifest.chunk_count, bundleChunks.length);
+assert.equal(manifest.bytes, totalBytes);
+assert.deepEqual([...shardIds].sort(), bundleChunks.map((chunk) => chunk.id).sort());
+
+// Filters pick shards by doc id, type, source file and tag.
+const endpointFilters = { docIds: ["socrata_discovery"], types: ["endpoint"] };
+assert.deepEqual(
+  selectRagShards(manifest, endpointFilters).map((shard) => shard.path),
+  ["docs/shards/socrata_discovery.endpoint.jsonl"]
+);
+assert.equal(selectRagShards(manifest).length, manifest.shards.length);
+assert.ok(selectRagShards(manifest, { docIds: ["socrata_soda_api"] }).every((s) => s.doc_id === "socrata_soda_api"));
+assert.ok(selectRagShards(manifest, { tags: ["response"] }).every((s) => s.tags.includes("response")));
+assert.deepEqual(selectRagShards(manifest, { sourceFiles: ["docs/missing.md"] }), []);
+
+// Only the selected shards are fetched, once each.
+const loads = [];
+const sharded = new ShardedRagIndex(manifest, (shard) => {
+  loads.push(shard.path);
+  return fs.readFileSync(path.join(rootDir, shard.path), "utf8");
+});
+const endpointHits = await sharded.query("domain categories count", { topK: 5, filters: endpointFilters });
+assert.ok(endpointHits.length > 0, "endpoint shard returns hits");
+assert.ok(endpointHits.every((hit) => hit.doc_id === "socrata_discovery" && hit.type === "endpoint"));
+assert.deepEqual(loads, ["docs/shards/socrata_discovery.endpoint.jsonl"]);
+assert.ok(sharded.loadedBytes() < manifest.bytes / 2, "endpoint-only queries fetch a fraction of the bundle");
+await sharded.query("catalog search tags", { topK: 3, filters: endpointFilters });
+assert.equal(loads.length, 1, "repeat filters reuse the cached index");
+
+// A shard whose bytes drifted from the manifest is rejected, and not cached.
+let tampered = true;
+const checked = new ShardedRagIndex(manifest, (shard) => {
+  const content = fs.readFileSync(path.join(rootDir, shard.path), "utf8");
+  return tampered ? content.replace(/catalog/, "katalog") : content;
+});
+await assert.rejects(
+  checked.query("domain categories count", { filters: endpointFilters }),
+  /does not match its manifest hash/
+);
+tampered = false;
+assert.ok((await checked.query("domain categories count", { filters: endpointFilters })).length > 0);
+
+// Scores use the loaded shards' statistics, so a subset scores differently.
+const subsetScores = endpointHits.map((hit) => hit.score);
+const fullEndpointScores = buildRagIndexFromJsonl(bundle)
+  .query("domain categories count", { topK: 5, filters: endpointFilters })
+  .map((hit) => hit.score);
+assert.notDeepEqual(subsetScores, fullEndpointScores);
+
+// With every shard loaded, scores match the full bundle index.
+const fullIndex = buildRagIndexFromJsonl(bundle);
+for (const query of ["paginate results limit offset", "/api/v3/views/{id}/query.json app token"]) {
+  const expected = fullIndex.query(query, { topK: 10 });
+  const actual = await sharded.query(query, { topK: 10 });
+  assert.deepEqual(actual.map((hit) => hit.score), expected.map((hit) => hit.score), query);
+  // chunk ids are not unique in the bundle, so hits are keyed by their text too
+  const key = (hit) => `${hit.doc_id}/${hit.id}/${hit.text}`;
+  const expectedScores = new Map(expected.map((hit) => [key(hit), hit.score]));
+  for (const hit of actual) {
+    if (expectedScores.has(key(hit))) assert.equal(hit.score, expectedScores.get(key(hit)), `${query} ${hit.id}`);
+  }
+}
+assert.equal(sharded.loadedBytes(), manifest.bytes);
+assert.equal(new Set(loads).size, loads.length, "no shard is fetched twice");
+
+console.log("rag-shards.test.mjs: ok");
@@ -0,0 +1,94 @@
+import assert from "node:assert/strict";
+import { execFileSync } from "node:child_process";
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+const { parseJsonl } = await import("../services/ragIndex.ts");
+
+const rootDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const scriptsDir = path.join(rootDir, "scripts");
+const storeScript = path.join(scriptsDir, "rag_store.py");
+const bundlePath = path.join(rootDir, "docs/Socrata.rag.bundle.jsonl");
+const tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "rag-store-"));
+const storePath = path.join(tmpDir, "bundle.ragstore");
+
+// Dumps what ChunkStore reads back: every record in order, the id table order,
+// get_all/get for each id and by_doc for each doc_id.
+const DUMP = `
+import json, sys
+from rag_store import ChunkStore
+with ChunkStore(sys.argv[1]) as store:
+    table = [store._string(*store._id_entry(n)[:2]).decode("utf-8") for n in range(store.count)]
+    print(json.dumps({
+        "count": len(store),
+        "records": [record.to_dict() for record in store],
+        "id_table": table,
+        "get_all": {i: [r.to_dict() for r in store.get_all(i)] for i in table},
+        "get": {i: store.get(i).to_dict() for i in table},
+        "missing": store.get("no-such-chunk") is None and store.get_all("no-such-chunk") == [],
+        "doc_ids": store.doc_ids(),
+        "by_doc": {d: [r.to_dict() for r in store.by_doc(d)] for d in store.doc_ids() + ["no-such-doc"]},
+    }))
+`;
+
+const python = (args) => execFileSync("python3", args, { cwd: scriptsDir, encoding: "utf8", maxBuffer: 64 << 20 });
+
+try {
+  const chunks = parseJsonl(fs.readFileSync(bundlePath, "utf8"));
+  const written = Number(python([storeScript, "build", "--chunks", bundlePath, "--out", storePath]).trim());
+  assert.equal(written, chunks.length);
+
+  const dump = JSON.parse(python(["-c", DUMP, storePath]));
+
+  // Records round-trip in bundle order, text and metadata alike.
+  assert.equal(dump.count, chunks.length);
+  assert.deepEqual(dump.records, chunks);
+
+  // The id table is sorted by UTF-8 bytes and covers every record.
+  const ids = chunks.map((chunk) => String(chunk.id || ""));
+  const byBytes = (a, b) => Buffer.compare(Buffer.from(a, "utf8"), Buffer.from(b, "utf8"));
+  assert.deepEqual(dump.id_table, [...ids].sort(byBytes));
+
+  // Repeated ids: get_all keeps bundle order and get returns the last record.
+  const uniqueIds = new Set(ids);
+  assert.ok(uniqueIds.size < chunks.length, "the bundle repeats some chunk ids");
+  for (const id of uniqueIds) {
+    const expected = chunks.filter((chunk) => String(chunk.id || "") === id);
+    assert.deepEqual(dump.get_all[id], expected, `get_all ${id}`);
+    assert.deepEqual(dump.get[id], expected[expected.length - 1], `get ${id}`);
+  }
+  assert.ok(dump.missing, "unknown ids miss");
+
+  // doc_id ranges hold exactly that document's records, in bundle order.
+  const docIds = [...new Set(chunks.map((chunk) => String(chunk.doc_id || "")))];
+  assert.deepEqual(dump.doc_ids, [...docIds].sort(byBytes));
+  for (const docId of docIds) {
+    assert.deepEqual(
+      dump.by_doc[docId],
+      chunks.filter((chunk) => String(chunk.doc_id || "") === docId),
+      `by_doc ${docId}`
+    );
+  }
+  assert.deepEqual(dump.by_doc["no-such-doc"], []);
+
+  // The CLI prints a document's records, then the requested ids (last wins).
+  const repeated = [...uniqueIds].find((id) => ids.indexOf(id) !== ids.lastIndexOf(id));
+  const cli = parseJsonl(python([storeScript, "get", "--store", storePath, "--doc-id", docIds[0], repeated]));
+  assert.deepEqual(cli, [...dump.by_doc[docIds[0]], dump.get[repeated]]);
+
+  // Text read from a record outlives the store it came from.
+  const HELD = `
+import sys
+from rag_store import ChunkStore
+with ChunkStore(sys.argv[1]) as store:
+    held = store.get(sys.argv[2]).text_bytes
+print(held.decode("utf-8"), end="")
+`;
+  assert.equal(python(["-c", HELD, storePath, repeated]), dump.get[repeated].text);
+} finally {
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+}
+
+console.log("rag-store.test.mjs: ok");
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Precomputed answers for the fixed RAG lookups the app always makes.
+
+The client asks the worker the same few questions on every page load (the
+Discovery and SODA prompt context, see services/socrataRagClient.ts), and each
+one is scored against every chunk of the bundle. This module runs a query set
+through ``Bm25Index`` -- the scoring of ``RagIndex`` -- at build time and writes
+the ranked hits as an answer cache the worker consults before scoring.
+
+Entries are keyed by ``answer_key``: the query with whitespace runs collapsed and
+ASCII lowercased (tokenization lowercases and splits on both anyway) plus the
+non-empty filter lists sorted and deduplicated, so equivalent requests share an
+entry. Each entry keeps the best ``MAX_TOP_K`` hits, enough for any ``topK``.
+Hits point at the chunk's position among the parsed bundle lines and repeat its
+id, and the cache records the SHA-256 of the bundle it was built from and the
+index config, so a runtime whose chunks or options differ ignores it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rag_bm25 import (
+    DEFAULT_MAX_CHUNK_CHARS,
+    DEFAULT_MAX_CHUNKS,
+    DEFAULT_MAX_TOTAL_CHARS,
+    Bm25Index,
+    js_slice,
+    load_chunks_jsonl,
+    sha256_file,
+)
+
+ANSWER_CACHE_VERSION = 1
+# RagIndex.query clamps topK to 25
+MAX_TOP_K = 25
+FILTER_KEYS = ("docIds", "sourceFiles", "types", "tags")
+
+QUERY_SPACE_RE = re.compile(r"[ \t\r\n]+")
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def normalize_query(query: str) -> str:
+    """Keep in sync with normalizeRagAnswerQuery in services/ragAnswerCache.ts."""
+    return QUERY_SPACE_RE.sub(" ", (query or "").strip()).translate(ASCII_LOWER)
+
+
+def normalize_filters(filters: Optional[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """The non-empty filter lists, sorted and deduplicated, in FILTER_KEYS order.
+    Empty strings are kept: ``RagIndex`` filters on them like any other value."""
+    filters = filters or {}
+    return {key: sorted(set(filters[key])) for key in FILTER_KEYS if filters.get(key)}
+
+
+def answer_key(query: str, filters: Optional[Dict[str, List[str]]] = None) -> str:
+    """Keep in sync with ragAnswerKey in services/ragAnswerCache.ts."""
+    return normalize_query(query) + "\n" + json.dumps(normalize_filters(filters), separators=(",", ":"), ensure_ascii=False)
+
+
+def load_query_set(path: str) -> List[Dict[str, Any]]:
+    """The ``queries`` of a query-set file (``{"version": 1, "queries": [{id,
+    query, filters}]}``); a bare list of queries is accepted too."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    queries = data.get("queries", []) if isinstance(data, dict) else data
+    for item in queries:
+        if not isinstance(item.get("query"), str) or not item["query"].strip():
+            raise ValueError(f"Query set {path} has an entry without a query: {item!r}")
+    return queries
+
+
+def build_answer_cache(
+    chunks_jsonl: str, queries: List[Dict[str, Any]], *, limits: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """Score ``queries`` against ``chunks_jsonl`` and return the cache artifact."""
+    limits = {
+        "max_chunks": (limits or {}).get("max_chunks", DEFAULT_MAX_CHUNKS),
+        "max_chunk_chars": (limits or {}).get("max_chunk_chars", DEFAULT_MAX_CHUNK_CHARS),
+        "max_total_chars": (limits or {}).get("max_total_chars", DEFAULT_MAX_TOTAL_CHARS),
+    }
+    chunks = load_chunks_jsonl(chunks_jsonl)
+    index = Bm25Index.build(chunks, **limits)
+    # positions in the index count only the chunks normalizeChunks kept, which
+    # are the ones with text, in order, up to the first cap that was hit
+    kept = [n for n, chunk in enumerate(chunks) if js_slice(chunk.get("text") or "", limits["max_chunk_chars"])]
+    line_of = kept[: len(index.chunks)]
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for item in queries:
+        key = answer_key(item["query"], item.get("filters"))
+        if key in entries:
+            continue
+        hits = []
+        for doc, score in index.score(item["query"], normalize_filters(item.get("filters")))[:MAX_TOP_K]:
+            position = index.positions[doc]
+            hits.append({"chunk": line_of[position], "id": index.chunks[position].get("id"), "score": score})
+        entries[key] = {"id": item.get("id"), "hits": hits}
+
+    return {
+        "version": ANSWER_CACHE_VERSION,
+        "config": {
+            "min_token_length": index.min_token_length,
+            "stop_words": sorted(index.stop_words),
+            "limits": limits,
+            "max_top_k": MAX_TOP_K,
+        },
+        "chunk_set_sha256": sha256_file(chunks_jsonl),
+        "chunk_count": len(chunks),
+        "entries": entries,
+    }
+
+
+def write_answer_cache(chunks_jsonl: str, queries_json: str, out_path: str) -> List[str]:
+    """Build the answer cache for ``queries_json`` and write it to ``out_path``
+    unless its bytes would not change; returns the paths written."""
+    cache = build_answer_cache(chunks_jsonl, load_query_set(queries_json))
+    content = json.dumps(cache, indent=2, ensure_ascii=True).encode("utf-8")
+    out = Path(out_path)
+    if out.exists() and out.read_bytes() == content:
+        return []
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, out)
+    return [out_path]
+
+
+def lookup(cache: Dict[str, Any], query: str, top_k: Optional[int] = None, filters=None) -> Optional[List[Dict[str, Any]]]:
+    """Cached hits for a query, clamped to ``top_k`` like ``RagIndex.query``;
+    None when the query is not in the cache."""
+    entry = cache.get("entries", {}).get(answer_key(query, filters))
+    if entry is None:
+        return None
+    return entry["hits"][: max(1, min(MAX_TOP_K, 6 if top_k is None else top_k))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", required=True, help="Chunks JSONL the queries are answered from")
+    parser.add_argument("--queries", required=True, help="Query set JSON ({version, queries: [{id, query, filters}]})")
+    parser.add_argument("--out", required=True, help="Where to write the answer cache")
+    args = parser.parse_args()
+
+    written = write_answer_cache(args.chunks, args.queries, args.out)
+    cache = json.loads(Path(args.out).read_text(encoding="utf-8"))
+    print(json.dumps({"entries": len(cache["entries"]), "written": written}), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Block-compressed JSONL with a block index, for random access by id.
+
+Records are re-encoded with compact separators and packed, in order, into
+blocks of about ``block_bytes`` uncompressed bytes; each block is written as its
+own gzip member, so the file is still an ordinary gzip stream (``gzip -dc``
+yields the whole JSONL) but any one block can be inflated on its own. The
+index, a compact JSON file next to it, lists each block's first id, byte
+offset and length in the compressed file, uncompressed size and record count,
+and maps every id to the blocks holding it: ids are neither sorted nor unique
+(the bundle repeats some), so the first ids alone cannot locate a record.
+
+Members are written with a zero mtime and no file name, so the same records
+always give the same bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+BLOCK_INDEX_VERSION = 1
+DEFAULT_BLOCK_BYTES = 16 * 1024
+DEFAULT_LEVEL = 9
+
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def block_paths(jsonl_path: str) -> Dict[str, str]:
+    """Where the blocks and index of ``jsonl_path`` are written."""
+    return {"blocks": jsonl_path + ".gz", "index": jsonl_path + ".blocks.json"}
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    if path.exists() and path.read_bytes() == content:
+        return False
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return True
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def pack_blocks(
+    records: Iterable[Dict[str, Any]], *, block_bytes: int = DEFAULT_BLOCK_BYTES, level: int = DEFAULT_LEVEL
+) -> Dict[str, Any]:
+    """``{"data": compressed bytes, "index": block index}`` for ``records``."""
+    parts: List[bytes] = []
+    blocks: List[Dict[str, Any]] = []
+    id_blocks: Dict[str, List[int]] = {}
+    lines: List[bytes] = []
+    first_id: Optional[str] = None
+    raw = 0
+    offset = 0
+    count = 0
+
+    def flush() -> None:
+        nonlocal lines, first_id, raw, offset
+        member = _gzip(b"".join(lines), level)
+        blocks.append({"first_id": first_id, "offset": offset, "bytes": len(member), "raw_bytes": raw, "count": len(lines)})
+        parts.append(member)
+        offset += len(member)
+        lines, first_id, raw = [], None, 0
+
+    for record in records:
+        line = (compact_json(record) + "\n").encode("utf-8")
+        if lines and raw + len(line) > block_bytes:
+            flush()
+        record_id = record.get("id")
+        if not lines:
+            first_id = record_id
+        if isinstance(record_id, str):
+            ids = id_blocks.setdefault(record_id, [])
+            if not ids or ids[-1] != len(blocks):
+                ids.append(len(blocks))
+        lines.append(line)
+        raw += len(line)
+        count += 1
+    if lines:
+        flush()
+
+    data = b"".join(parts)
+    index = {
+        "version": BLOCK_INDEX_VERSION,
+        "format": "jsonl+gzip-members",
+        "records": count,
+        "bytes": len(data),
+        "raw_bytes": sum(block["raw_bytes"] for block in blocks),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "blocks": blocks,
+        "ids": id_blocks,
+    }
+    return {"data": data, "index": index}
+
+
+def _read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_block_jsonl(
+    jsonl_path: str,
+    out_path: Optional[str] = None,
+    index_path: Optional[str] = None,
+    *,
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+    level: int = DEFAULT_LEVEL,
+) -> List[str]:
+    """Write the block-compressed form of ``jsonl_path`` and its index (by
+    default at ``block_paths``); files whose bytes would not change are left
+    alone. Returns the paths written."""
+    paths = block_paths(jsonl_path)
+    out_path = out_path or paths["blocks"]
+    index_path = index_path or paths["index"]
+    packed = pack_blocks(_read_jsonl(jsonl_path), block_bytes=block_bytes, level=level)
+    index = {**packed["index"], "source": jsonl_path, "path": out_path}
+    written = []
+    if _write_if_changed(Path(out_path), packed["data"]):
+        written.append(out_path)
+    if _write_if_changed(Path(index_path), compact_json(index).encode("utf-8")):
+        written.append(index_path)
+    return written
+
+
+def write_compressed_json(json_path: str, out_path: Optional[str] = None, *, level: int = DEFAULT_LEVEL) -> List[str]:
+    """Write ``json_path`` re-encoded compactly and gzipped (by default to
+    ``<json_path>.gz``); returns the paths written."""
+    out_path = out_path or json_path + ".gz"
+    value = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    if _write_if_changed(Path(out_path), _gzip(compact_json(value).encode("utf-8"), level)):
+        return [out_path]
+    return []
+
+
+class BlockReader:
+    """Random access into a block-compressed JSONL file through its index. The
+    most recently inflated block is kept, so neighbouring lookups are cheap."""
+
+    def __init__(self, index_path: str, path: Optional[str] = None) -> None:
+        self.index = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        if self.index.get("version") != BLOCK_INDEX_VERSION:
+            raise ValueError(f"Unsupported block index version: {self.index.get('version')!r}")
+        self.path = path or self.index["path"]
+        self._cached: Optional[int] = None
+        self._records: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return self.index["records"]
+
+    def block(self, n: int) -> List[Dict[str, Any]]:
+        """The records of block ``n``."""
+        if self._cached != n:
+            entry = self.index["blocks"][n]
+            with Path(self.path).open("rb") as f:
+                f.seek(entry["offset"])
+                member = f.read(entry["bytes"])
+            text = gzip.decompress(member).decode("utf-8")
+            self._records = [json.loads(line) for line in text.splitlines() if line]
+            self._cached = n
+        return self._records
+
+    def get_all(self, record_id: str) -> List[Dict[str, Any]]:
+        """Every record with ``record_id``, in file order."""
+        return [
+            record
+            for n in self.index["ids"].get(record_id, [])
+            for record in self.block(n)
+            if record.get("id") == record_id
+        ]
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """The record for ``record_id``; for repeated ids the last one wins, as in
+        the worker's chunk map."""
+        hits = self.get_all(record_id)
+        return hits[-1] if hits else None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for n in range(len(self.index["blocks"])):
+            yield from self.block(n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    pack = sub.add_parser("pack", help="Write the block-compressed form of a JSONL file and its index")
+    pack.add_argument("--jsonl", required=True)
+    pack.add_argument("--out", default="", help="Blocks file (default: <jsonl>.gz)")
+    pack.add_argument("--index", default="", help="Block index (default: <jsonl>.blocks.json)")
+    pack.add_argument("--block-bytes", type=int, default=DEFAULT_BLOCK_BYTES)
+    pack.add_argument("--level", type=int, default=DEFAULT_LEVEL)
+    get = sub.add_parser("get", help="Print the records with an id, inflating only their blocks")
+    get.add_argument("--index", required=True)
+    get.add_argument("id")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        written = write_block_jsonl(
+            args.jsonl, args.out or None, args.index or None, block_bytes=args.block_bytes, level=args.level
+        )
+        print(json.dumps({"written": written}), file=sys.stderr)
+        return
+
+    for record in BlockReader(args.index).get_all(args.id):
+        print(compact_json(record))
+
+
+if __name__ == "__main__":
+    main()
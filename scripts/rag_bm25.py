@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""BM25 scoring and prebuilt index artifacts matching services/ragIndex.ts.
+
+Tokenization, chunk limits and scoring mirror ``RagIndex`` exactly so an index
+built here can be loaded by the runtime instead of re-tokenizing every chunk.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+PREBUILT_INDEX_VERSION = 1
+
+# Keep in sync with DEFAULT_STOP_WORDS / DEFAULT_* in services/ragIndex.ts.
+DEFAULT_STOP_WORDS = frozenset(
+    {
+        "the", "and", "or", "a", "an", "to", "of", "in", "for", "on", "by", "with",
+        "from", "at", "as", "is", "are", "be", "this", "that", "these", "those", "it",
+        "its", "into", "over", "under", "their", "your", "our", "we", "you", "they",
+        "them", "was", "were", "but", "not", "can", "will", "should", "may", "might",
+        "if", "else", "when", "where", "what", "which", "who", "how", "why", "about",
+        "more", "less",
+    }
+)
+DEFAULT_MIN_TOKEN_LENGTH = 2
+DEFAULT_MAX_CHUNKS = 2500
+DEFAULT_MAX_CHUNK_CHARS = 8000
+DEFAULT_MAX_TOTAL_CHARS = 1_500_000
+K1 = 1.2
+B = 0.75
+
+TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(
+    text: str,
+    min_token_length: int = DEFAULT_MIN_TOKEN_LENGTH,
+    stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+) -> List[str]:
+    return [
+        token
+        for token in TOKEN_SPLIT_RE.split(text.lower())
+        if len(token) >= min_token_length and token not in stop_words
+    ]
+
+
+def js_length(text: str) -> int:
+    """String length in UTF-16 code units, as JavaScript counts it."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def js_slice(text: str, end: int) -> str:
+    """``text.slice(0, end)`` with JavaScript (UTF-16) indexing."""
+    if text.isascii():
+        return text[:end]
+    data = text.encode("utf-16-le", "surrogatepass")[: end * 2]
+    return data.decode("utf-16-le", "surrogatepass")
+
+
+def load_chunks_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Read a chunks JSONL file, skipping malformed lines like ``parseJsonl``."""
+    chunks: List[Dict[str, Any]] = []
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                chunks.append(json.loads(line))
+            except ValueError:
+                continue
+    return chunks
+
+
+def normalize_chunks(
+    chunks: Iterable[Dict[str, Any]],
+    max_chunks: int = DEFAULT_MAX_CHUNKS,
+    max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+    max_total_chars: int = DEFAULT_MAX_TOTAL_CHARS,
+) -> List[Dict[str, Any]]:
+    """Apply the RAG_INDEX_LIMITS caps the same way ``normalizeChunks`` does."""
+    normalized: List[Dict[str, Any]] = []
+    total_chars = 0
+    for chunk in chunks:
+        if len(normalized) >= max_chunks:
+            break
+        text = js_slice(chunk.get("text") or "", max_chunk_chars)
+        if not text:
+            continue
+        next_total = total_chars + js_length(text)
+        if next_total > max_total_chars:
+            break
+        normalized.append({**chunk, "text": text})
+        total_chars = next_total
+    return normalized
+
+
+class Bm25Index:
+    """In-memory BM25 index with the scoring rules of ``RagIndex.query``."""
+
+    def __init__(
+        self,
+        chunks: List[Dict[str, Any]],
+        positions: List[int],
+        doc_lengths: List[int],
+        term_freqs: List[Dict[str, int]],
+        doc_freq: Dict[str, int],
+        *,
+        min_token_length: int = DEFAULT_MIN_TOKEN_LENGTH,
+        stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+    ) -> None:
+        self.chunks = chunks
+        self.positions = positions
+        self.doc_lengths = doc_lengths
+        self.term_freqs = term_freqs
+        self.doc_freq = doc_freq
+        self.min_token_length = min_token_length
+        self.stop_words = frozenset(stop_words)
+        total = sum(doc_lengths)
+        self.avgdl = total / len(doc_lengths) if doc_lengths else 0
+
+    @classmethod
+    def build(
+        cls,
+        chunks: Iterable[Dict[str, Any]],
+        *,
+        min_token_length: int = DEFAULT_MIN_TOKEN_LENGTH,
+        stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+        max_total_chars: int = DEFAULT_MAX_TOTAL_CHARS,
+    ) -> "Bm25Index":
+        stop_words = frozenset(stop_words)
+        normalized = normalize_chunks(chunks, max_chunks, max_chunk_chars, max_total_chars)
+        positions: List[int] = []
+        doc_lengths: List[int] = []
+        term_freqs: List[Dict[str, int]] = []
+        doc_freq: Dict[str, int] = {}
+        for position, chunk in enumerate(normalized):
+            tokens = tokenize(chunk["text"], min_token_length, stop_words)
+            if not tokens:
+                continue
+            tf: Dict[str, int] = {}
+            for token in tokens:
+                tf[token] = tf.get(token, 0) + 1
+            for token in tf:
+                doc_freq[token] = doc_freq.get(token, 0) + 1
+            positions.append(position)
+            doc_lengths.append(len(tokens))
+            term_freqs.append(tf)
+        return cls(
+            normalized,
+            positions,
+            doc_lengths,
+            term_freqs,
+            doc_freq,
+            min_token_length=min_token_length,
+            stop_words=stop_words,
+        )
+
+    def matches(self, chunk: Dict[str, Any], filters: Optional[Dict[str, List[str]]]) -> bool:
+        """``RagIndex.applyFilters`` for a single chunk."""
+        if not filters:
+            return True
+        doc_ids = filters.get("docIds") or []
+        source_files = filters.get("sourceFiles") or []
+        types = filters.get("types") or []
+        tags = filters.get("tags") or []
+        if doc_ids and (not chunk.get("doc_id") or chunk["doc_id"] not in doc_ids):
+            return False
+        if source_files and (not chunk.get("source_file") or chunk["source_file"] not in source_files):
+            return False
+        if types and (not chunk.get("type") or chunk["type"] not in types):
+            return False
+        if tags and (not chunk.get("tags") or all(tag not in tags for tag in chunk["tags"])):
+            return False
+        return True
+
+    def score(self, query: str, filters: Optional[Dict[str, List[str]]] = None) -> List[Tuple[int, float]]:
+        """All (doc, score) pairs with a positive score, best first."""
+        q = (query or "").strip()
+        if not q:
+            return []
+        tokens = tokenize(q, self.min_token_length, self.stop_words)
+        if not tokens:
+            return []
+        docs = [
+            doc
+            for doc, position in enumerate(self.positions)
+            if self.matches(self.chunks[position], filters)
+        ]
+        doc_count = len(docs) or 1
+        avgdl = self.avgdl or 1
+        scores: List[Tuple[int, float]] = []
+        for doc in docs:
+            tf_map = self.term_freqs[doc]
+            length = self.doc_lengths[doc]
+            score = 0.0
+            for token in tokens:
+                df = self.doc_freq.get(token, 0)
+                if not df:
+                    continue
+                tf = tf_map.get(token, 0)
+                if not tf:
+                    continue
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                denom = tf + K1 * (1 - B + B * (length / avgdl))
+                score += idf * ((tf * (K1 + 1)) / denom)
+            if score > 0:
+                scores.append((doc, score))
+        # stable, like Array.prototype.sort in the runtime
+        scores.sort(key=lambda item: -item[1])
+        return scores
+
+    def query(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        top_k = max(1, min(25, 6 if top_k is None else top_k))
+        return [
+            {**self.chunks[self.positions[doc]], "score": score}
+            for doc, score in self.score(query, filters)[:top_k]
+        ]
+
+    def to_prebuilt(self, chunk_set_sha256: str = "") -> Dict[str, Any]:
+        """Serialize as the prebuilt index artifact loaded by ``RagIndex``.
+
+        ``positions`` index the chunk list after the runtime limits are applied
+        (chunks without tokens are skipped); ``postings`` hold flattened
+        ``[doc, tf, doc, tf, ...]`` pairs per vocabulary term.
+        """
+        vocab = sorted(self.doc_freq)
+        term_ids = {term: n for n, term in enumerate(vocab)}
+        postings: List[List[int]] = [[] for _ in vocab]
+        for doc, tf_map in enumerate(self.term_freqs):
+            for term, tf in tf_map.items():
+                postings[term_ids[term]].extend((doc, tf))
+        return {
+            "version": PREBUILT_INDEX_VERSION,
+            "config": {
+                "min_token_length": self.min_token_length,
+                "stop_words": sorted(self.stop_words),
+                "k1": K1,
+                "b": B,
+            },
+            "chunk_set_sha256": chunk_set_sha256,
+            "chunk_count": len(self.chunks),
+            "doc_count": len(self.positions),
+            "avgdl": self.avgdl,
+            "positions": self.positions,
+            "ids": [self.chunks[position].get("id") for position in self.positions],
+            "doc_lengths": self.doc_lengths,
+            "vocab": vocab,
+            "postings": postings,
+        }
+
+
+def sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_prebuilt_index(chunks_jsonl: str, out_path: str, *, limits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """Build the prebuilt index for a chunks JSONL file and write it as compact JSON."""
+    index = Bm25Index.build(load_chunks_jsonl(chunks_jsonl), **(limits or {}))
+    prebuilt = index.to_prebuilt(sha256_file(chunks_jsonl))
+    prebuilt["config"]["limits"] = {
+        "max_chunks": (limits or {}).get("max_chunks", DEFAULT_MAX_CHUNKS),
+        "max_chunk_chars": (limits or {}).get("max_chunk_chars", DEFAULT_MAX_CHUNK_CHARS),
+        "max_total_chars": (limits or {}).get("max_total_chars", DEFAULT_MAX_TOTAL_CHARS),
+    }
+    Path(out_path).write_text(json.dumps(prebuilt, separators=(",", ":"), ensure_ascii=True), encoding="utf-8")
+    return prebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Write a prebuilt BM25 index for a chunks JSONL file")
+    build.add_argument("--chunks", required=True)
+    build.add_argument("--out", required=True)
+    query = sub.add_parser("query", help="Run a query set (JSON list of {query, topK, filters}) and print hits")
+    query.add_argument("--chunks", required=True)
+    query.add_argument("--queries", required=True)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        prebuilt = write_prebuilt_index(args.chunks, args.out)
+        print(json.dumps({"docs": prebuilt["doc_count"], "terms": len(prebuilt["vocab"])}))
+        return
+
+    index = Bm25Index.build(load_chunks_jsonl(args.chunks))
+    results = []
+    for item in json.loads(Path(args.queries).read_text(encoding="utf-8")):
+        hits = index.query(item["query"], item.get("topK"), item.get("filters"))
+        results.append([{"id": hit.get("id"), "score": hit["score"]} for hit in hits])
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Chunking for the RAG artifacts: the character-budget ``chunk_text`` used by the
+committed docs and a token-budget engine for prompt-sized chunks.
+
+Both accumulate pieces in lists and join once per chunk, so chunking is linear in
+the input. Token counts come from offline, deterministic tokenizers registered
+in ``TOKENIZERS``; any ``Callable[[str], int]`` can be passed instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Chunker = Callable[[str], List[str]]
+TokenCounter = Callable[[str], int]
+
+WORD_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+BPE_PIECE_RE = re.compile(r"\s?\w+|\s?[^\w\s]+|\s+")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_word_tokens(text: str) -> int:
+    """One token per word and per punctuation character."""
+    return len(WORD_TOKEN_RE.findall(text))
+
+
+def count_bpe_approx_tokens(text: str) -> int:
+    """Approximate BPE counts: GPT-style pre-tokenization, ~4 characters per token."""
+    return sum(1 + (len(piece) - 1) // 4 for piece in BPE_PIECE_RE.findall(text))
+
+
+TOKENIZERS: Dict[str, TokenCounter] = {
+    "words": count_word_tokens,
+    "bpe-approx": count_bpe_approx_tokens,
+}
+
+
+def chunk_text(text: str, max_chars: int = 1400) -> List[str]:
+    """Pack non-blank lines into chunks of at most ``max_chars`` characters.
+
+    A line longer than ``max_chars`` becomes a chunk on its own. The first line
+    of a chunk keeps its trailing whitespace and later lines keep their
+    indentation, exactly as the committed artifacts were generated.
+    """
+    chunks: List[str] = []
+    pieces: List[str] = []
+    size = 0
+    for para in text.split("\n"):
+        if not para.strip():
+            continue
+        if not pieces:
+            pieces.append(para)
+            size = len(para.lstrip())
+            continue
+        tail = para.rstrip()
+        if size + 1 + len(tail) > max_chars:
+            chunks.append("\n".join(pieces).strip())
+            pieces = [para]
+            size = len(para.lstrip())
+        else:
+            pieces.append(tail)
+            size += 1 + len(tail)
+    if pieces:
+        chunks.append("\n".join(pieces).strip())
+    return chunks
+
+
+def split_oversized(text: str, max_tokens: int, count_tokens: TokenCounter) -> List[Tuple[str, int]]:
+    """Split a paragraph over budget at sentence boundaries, falling back to
+    word windows for sentences that are still too large. Returns (piece, tokens);
+    a single word over budget is kept whole.
+
+    Words after the first in a window are counted with their separating space,
+    since BPE-style counters attach it to the word."""
+    pieces: List[Tuple[str, int]] = []
+    for sentence in SENTENCE_END_RE.split(text):
+        tokens = count_tokens(sentence)
+        if tokens <= max_tokens:
+            pieces.append((sentence, tokens))
+            continue
+        words: List[str] = []
+        used = 0
+        for word in sentence.split():
+            if words:
+                word_tokens = count_tokens(" " + word)
+                if used + word_tokens <= max_tokens:
+                    words.append(word)
+                    used += word_tokens
+                    continue
+                pieces.append((" ".join(words), used))
+            words, used = [word], count_tokens(word)
+        if words:
+            pieces.append((" ".join(words), used))
+    return pieces
+
+
+def chunk_tokens(
+    text: str,
+    max_tokens: int,
+    *,
+    overlap_tokens: int = 0,
+    count_tokens: TokenCounter = count_word_tokens,
+) -> List[str]:
+    """Pack non-blank lines into chunks of at most ``max_tokens`` tokens.
+
+    Lines over budget are split into sentences (then word windows) that continue
+    the same line. With ``overlap_tokens``, each chunk starts with the trailing
+    pieces of the previous one, up to that many tokens. A chunk's count is the
+    count of its first piece plus those of the later pieces each taken with the
+    separator before it; for the registered tokenizers that is the count of the
+    chunk's text, since pieces never end in whitespace and every separator is
+    whitespace.
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be positive")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be in [0, max_tokens)")
+
+    chunks: List[str] = []
+    # (separator before the piece, piece, tokens of separator + piece)
+    cur: List[Tuple[str, str, int]] = []
+    used = 0
+
+    def flush() -> None:
+        nonlocal cur, used
+        chunks.append("".join(sep + piece for sep, piece, _ in cur)[len(cur[0][0]) :].strip())
+        carry: List[Tuple[str, str, int]] = []
+        carried = 0
+        for item in reversed(cur[1:]):
+            if carried + item[2] > overlap_tokens:
+                break
+            carry.append(item)
+            carried += item[2]
+        carry.reverse()
+        cur = carry
+        # the first carried piece loses its separator
+        used = carried - carry[0][2] + count_tokens(carry[0][1]) if carry else 0
+
+    for para in text.split("\n"):
+        para = para.rstrip()
+        if not para.strip():
+            continue
+        if count_tokens(para) <= max_tokens:
+            pieces = [("\n", para)]
+        else:
+            pieces = [
+                ("\n" if n == 0 else " ", piece)
+                for n, (piece, _) in enumerate(split_oversized(para.strip(), max_tokens, count_tokens))
+            ]
+        for sep, piece in pieces:
+            tokens = count_tokens(sep + piece)
+            if cur and used + tokens > max_tokens:
+                flush()
+                if cur and used + tokens > max_tokens:
+                    cur, used = [], 0
+            if not cur:
+                used = count_tokens(piece)
+            else:
+                used += tokens
+            cur.append((sep, piece, tokens))
+    if cur:
+        chunks.append("".join(sep + piece for sep, piece, _ in cur)[len(cur[0][0]) :].strip())
+    return chunks
+
+
+def make_chunker(chunking: Optional[Dict[str, Any]] = None) -> Chunker:
+    """Chunker for a ``chunking`` option dict (``max_tokens``, ``overlap_tokens``,
+    ``tokenizer``); without ``max_tokens`` this is the character-budget
+    ``chunk_text`` used for the committed artifacts."""
+    if not chunking or not chunking.get("max_tokens"):
+        return chunk_text
+    tokenizer = chunking.get("tokenizer") or "words"
+    if tokenizer not in TOKENIZERS:
+        raise ValueError(f"unknown tokenizer {tokenizer!r} (expected one of {', '.join(sorted(TOKENIZERS))})")
+    return partial(
+        chunk_tokens,
+        max_tokens=int(chunking["max_tokens"]),
+        overlap_tokens=int(chunking.get("overlap_tokens") or 0),
+        count_tokens=TOKENIZERS[tokenizer],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Chunk stdin and print one JSON record per chunk")
+    parser.add_argument("--max-tokens", type=int, default=0, help="Token budget per chunk (default: 1400-char chunks)")
+    parser.add_argument("--overlap-tokens", type=int, default=0)
+    parser.add_argument("--tokenizer", choices=sorted(TOKENIZERS), default="words")
+    args = parser.parse_args()
+
+    chunking = {"max_tokens": args.max_tokens, "overlap_tokens": args.overlap_tokens, "tokenizer": args.tokenizer}
+    count = TOKENIZERS[args.tokenizer]
+    for chunk in make_chunker(chunking)(sys.stdin.read()):
+        print(json.dumps({"tokens": count(chunk), "chars": len(chunk), "text": chunk}, ensure_ascii=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Near-duplicate chunk elimination for RAG bundles.
+
+Chunks are fingerprinted with MinHash over word shingles and bucketed with LSH
+banding; candidates that share a bucket are confirmed with the exact Jaccard
+similarity of their shingle sets, so the threshold is never applied to an
+estimate. Chunks are visited in bundle order and compared only with chunks
+already kept in the same scope (doc_id and type by default), so the first
+chunk of every cluster survives and similarity never chains across clusters.
+Each dropped id is recorded as an alias of its survivor.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+DEDUP_VERSION = 1
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_SCOPE = ("doc_id", "type")
+
+MERSENNE_61 = (1 << 61) - 1
+WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> FrozenSet[str]:
+    """Lowercased word ``size``-grams; texts shorter than that use the whole text."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return frozenset([" ".join(words)]) if words else frozenset()
+    return frozenset(" ".join(words[i : i + size]) for i in range(len(words) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(bands, rows) with bands * rows <= num_perm whose S-curve midpoint
+    ``(1 / bands) ** (1 / rows)`` sits just below ``threshold`` (favouring recall;
+    precision comes from the exact Jaccard check)."""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class MinHasher:
+    """Deterministic MinHash: blake2b shingle hashes under seeded universal hashes.
+
+    Signatures are memoized per shingle set. A hasher kept across dedups of the
+    same bundle (``--watch`` keeps one per bundle) only hashes the chunks that
+    changed since the previous one; ``retain`` bounds the memo to what a dedup
+    used.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [(rng.randrange(1, MERSENNE_61), rng.randrange(0, MERSENNE_61)) for _ in range(num_perm)]
+        self._signatures: Dict[FrozenSet[str], Tuple[int, ...]] = {}
+
+    def signature(self, shingle_set: FrozenSet[str]) -> Tuple[int, ...]:
+        cached = self._signatures.get(shingle_set)
+        if cached is not None:
+            return cached
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") for s in shingle_set]
+        if not hashes:
+            signature = (MERSENNE_61,) * self.num_perm
+        else:
+            signature = tuple(min((a * h + b) % MERSENNE_61 for h in hashes) for a, b in self.params)
+        self._signatures[shingle_set] = signature
+        return signature
+
+    def retain(self, shingle_sets: Iterable[FrozenSet[str]]) -> None:
+        """Forget every signature but those of ``shingle_sets``."""
+        keep = set(shingle_sets)
+        self._signatures = {key: value for key, value in self._signatures.items() if key in keep}
+
+
+def dedup_chunks(
+    chunks: Sequence[Dict[str, Any]],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    scope: Sequence[str] = DEFAULT_SCOPE,
+    hasher: Optional[MinHasher] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, str], List[Dict[str, Any]]]:
+    """Drop chunks whose text is at least ``threshold`` Jaccard-similar to an
+    earlier kept chunk in the same scope.
+
+    Returns (kept chunks in order, {dropped id: survivor id}, cluster report).
+    Repeated ids are left alone unless every record with that id is dropped,
+    since an alias must not shadow a record that is still in the bundle.
+    A ``hasher`` passed in keeps the signatures of these chunks, and only
+    those, for the next call.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be in (0, 1]")
+    if hasher is None:
+        hasher = MinHasher(num_perm)
+    elif hasher.num_perm != num_perm:
+        raise ValueError(f"hasher has {hasher.num_perm} permutations, not {num_perm}")
+    bands, rows = lsh_bands(threshold, num_perm)
+    buckets: Dict[Tuple[Any, ...], List[int]] = {}
+    kept: List[Dict[str, Any]] = []
+    kept_shingles: List[FrozenSet[str]] = []
+    dropped: List[Tuple[Dict[str, Any], int, float]] = []
+    used: List[FrozenSet[str]] = []
+
+    for chunk in chunks:
+        shingle_set = shingles(chunk.get("text") or "", shingle_size)
+        used.append(shingle_set)
+        signature = hasher.signature(shingle_set)
+        key = tuple(chunk.get(field) for field in scope)
+        band_keys = [(key, band, signature[band * rows : (band + 1) * rows]) for band in range(bands)]
+        best: Optional[Tuple[float, int]] = None
+        seen = set()
+        for band_key in band_keys:
+            for survivor in buckets.get(band_key, ()):
+                if survivor in seen:
+                    continue
+                seen.add(survivor)
+                similarity = jaccard(shingle_set, kept_shingles[survivor])
+                if similarity >= threshold and (best is None or similarity > best[0]):
+                    best = (similarity, survivor)
+        if best is not None:
+            dropped.append((chunk, best[1], best[0]))
+            continue
+        position = len(kept)
+        kept.append(chunk)
+        kept_shingles.append(shingle_set)
+        for band_key in band_keys:
+            buckets.setdefault(band_key, []).append(position)
+    hasher.retain(used)
+
+    kept_ids = {chunk.get("id") for chunk in kept}
+    aliases: Dict[str, str] = {}
+    clusters: Dict[int, Dict[str, Any]] = {}
+    for chunk, survivor, similarity in dropped:
+        chunk_id = chunk.get("id")
+        survivor_id = kept[survivor].get("id")
+        cluster = clusters.setdefault(survivor, {"survivor": survivor_id, "dropped": []})
+        cluster["dropped"].append({"id": chunk_id, "jaccard": round(similarity, 4)})
+        if chunk_id and chunk_id not in kept_ids and chunk_id != survivor_id:
+            aliases.setdefault(chunk_id, survivor_id)
+    return kept, aliases, [clusters[k] for k in sorted(clusters)]
+
+
+def dedup_bundle(
+    bundle_path: str,
+    aliases_path: str,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    scope: Sequence[str] = DEFAULT_SCOPE,
+    hasher: Optional[MinHasher] = None,
+) -> Dict[str, Any]:
+    """Rewrite a chunks JSONL bundle without near-duplicates and write the alias
+    map next to it. Kept lines are copied byte for byte."""
+    lines: List[str] = []
+    chunks: List[Dict[str, Any]] = []
+    with Path(bundle_path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                chunks.append(json.loads(line))
+            except ValueError:
+                continue
+            lines.append(line if line.endswith("\n") else line + "\n")
+
+    kept, aliases, clusters = dedup_chunks(
+        chunks, threshold=threshold, num_perm=num_perm, shingle_size=shingle_size, scope=scope, hasher=hasher
+    )
+    kept_ids = {id(chunk) for chunk in kept}
+    tmp = Path(bundle_path).with_name(Path(bundle_path).name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as out:
+        out.writelines(line for line, chunk in zip(lines, chunks) if id(chunk) in kept_ids)
+        if not kept:
+            out.write("\n")
+    os.replace(tmp, bundle_path)
+
+    report = {
+        "version": DEDUP_VERSION,
+        "config": {
+            "threshold": threshold,
+            "num_perm": num_perm,
+            "shingle_size": shingle_size,
+            "scope": list(scope),
+        },
+        "input_chunks": len(chunks),
+        "kept_chunks": len(kept),
+        "aliases": dict(sorted(aliases.items())),
+        "clusters": clusters,
+    }
+    tmp = Path(aliases_path).with_name(Path(aliases_path).name + ".tmp")
+    tmp.write_text(json.dumps(report, indent=2, ensure_ascii=True), encoding="utf-8")
+    os.replace(tmp, aliases_path)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundle", required=True, help="Chunks JSONL to deduplicate in place")
+    parser.add_argument("--aliases", required=True, help="Where to write the alias map and cluster report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Minimum word-shingle Jaccard")
+    parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM)
+    parser.add_argument("--shingle-size", type=int, default=DEFAULT_SHINGLE_SIZE)
+    parser.add_argument("--scope", default=",".join(DEFAULT_SCOPE), help="Chunk fields that must match (comma-separated)")
+    args = parser.parse_args()
+
+    report = dedup_bundle(
+        args.bundle,
+        args.aliases,
+        threshold=args.threshold,
+        num_perm=args.num_perm,
+        shingle_size=args.shingle_size,
+        scope=[field for field in args.scope.split(",") if field],
+    )
+    print(json.dumps({key: report[key] for key in ("input_chunks", "kept_chunks")} | {"aliases": len(report["aliases"])}))
+
+
+if __name__ == "__main__":
+    main()
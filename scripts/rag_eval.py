@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Retrieval quality and latency of a chunks JSONL against labelled queries.
+
+A label file lists queries with the chunk ids that answer them::
+
+    {"version": 1, "queries": [{"id", "query", "filters"?, "expected": [ids]}]}
+
+Every ``--chunks`` file is evaluated in a fresh worker process, so build memory
+does not leak between runs, with one of two retrievers: ``bm25`` (the default;
+``rag_bm25.Bm25Index``, the scoring of ``RagIndex`` in the worker) or ``batch``
+(``rag_retrieval.BatchRetriever``, requires NumPy). Each run reports:
+
+    build       index build wall time (best of ``--repeat``), and the Python heap
+                the build peaked at and the index keeps (tracemalloc), plus the
+                process peak RSS afterwards
+    quality     mean recall@k for each ``--k`` and MRR over the labelled queries
+    latency_ms  p50/p95/p99/mean over every timed query run (``--repeat`` runs
+                per query after one warm-up)
+
+plus the same figures per query. Chunk ids end in a per-title counter
+(``section-app-tokens-2``) that shifts when chunk sizes change, so by default
+hits and labels are compared without it (``--match base``); ``--match id``
+compares whole ids. Labels that match no chunk in a file are listed under
+``unmatched_labels`` rather than silently scoring zero. With ``--baseline`` the
+report also holds each run's change against the same-named run of an earlier
+report. Output is JSON on stdout or ``--out``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import re
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from rag_bm25 import Bm25Index, load_chunks_jsonl, sha256_file
+
+EVAL_REPORT_VERSION = 1
+DEFAULT_KS = (1, 5, 10)
+# RagIndex.query clamps topK to 25
+MAX_TOP_K = 25
+COUNTER_RE = re.compile(r"-\d+$")
+
+Retrieve = Callable[[Dict[str, Any], int], List[Dict[str, Any]]]
+
+
+def base_id(chunk_id: str) -> str:
+    """A chunk id without its trailing per-title counter."""
+    return COUNTER_RE.sub("", chunk_id)
+
+
+def load_labels(path: str) -> List[Dict[str, Any]]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    queries = data.get("queries", []) if isinstance(data, dict) else data
+    for item in queries:
+        if not isinstance(item.get("query"), str) or not item.get("expected"):
+            raise ValueError(f"Label file {path} has an entry without a query or expected ids: {item!r}")
+    return queries
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_retriever(name: str, chunks: List[Dict[str, Any]]) -> Retrieve:
+    if name == "batch":
+        from rag_retrieval import BatchRetriever
+
+        batch = BatchRetriever.build(chunks)
+        return lambda item, top_k: batch.query_batch(
+            [{"query": item["query"], "topK": top_k, "filters": item.get("filters")}]
+        )[0]
+    index = Bm25Index.build(chunks)
+    return lambda item, top_k: index.query(item["query"], top_k, item.get("filters"))
+
+
+def evaluate(
+    chunks_jsonl: str,
+    labels_path: str,
+    *,
+    retriever: str = "bm25",
+    ks: Sequence[int] = DEFAULT_KS,
+    repeat: int = 5,
+    match: str = "base",
+) -> Dict[str, Any]:
+    """Worker entry point: build the index for one chunks file and score the labels."""
+    labels = load_labels(labels_path)
+    key: Callable[[str], str] = base_id if match == "base" else str
+    chunks = load_chunks_jsonl(chunks_jsonl)
+    known = {key(chunk["id"]) for chunk in chunks if isinstance(chunk.get("id"), str)}
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        retrieve = make_retriever(retriever, chunks)
+        best = min(best, time.perf_counter() - start)
+    del retrieve
+    gc.collect()
+    tracemalloc.start()
+    retrieve = make_retriever(retriever, chunks)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    top_k = min(MAX_TOP_K, max(ks))
+    per_query: List[Dict[str, Any]] = []
+    samples: List[float] = []
+    unmatched: List[Dict[str, str]] = []
+    for item in labels:
+        expected = {key(chunk_id) for chunk_id in item["expected"]}
+        unmatched.extend({"query": item.get("id") or item["query"], "id": i} for i in sorted(expected - known))
+        retrieve(item, top_k)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            hits = retrieve(item, top_k)
+            timings.append((time.perf_counter() - start) * 1000)
+        samples.extend(timings)
+
+        ranked = [key(hit.get("id") or "") for hit in hits]
+        first = next((n for n, hit in enumerate(ranked, 1) if hit in expected), None)
+        row: Dict[str, Any] = {"id": item.get("id"), "query": item["query"]}
+        for k in ks:
+            row[f"recall@{k}"] = round(len(expected.intersection(ranked[:k])) / len(expected), 4)
+        row["first_relevant_rank"] = first
+        row["reciprocal_rank"] = round(1 / first, 4) if first else 0.0
+        row["latency_ms_p50"] = round(percentile(sorted(timings), 50), 4)
+        per_query.append(row)
+
+    samples.sort()
+    count = len(per_query) or 1
+    quality: Dict[str, Any] = {
+        f"recall@{k}": round(sum(row[f"recall@{k}"] for row in per_query) / count, 4) for k in ks
+    }
+    quality["mrr"] = round(sum(row["reciprocal_rank"] for row in per_query) / count, 4)
+    return {
+        "name": chunks_jsonl,
+        "chunks": chunks_jsonl,
+        "chunks_sha256": sha256_file(chunks_jsonl),
+        "chunk_count": len(chunks),
+        "chunk_chars": sum(len(chunk.get("text") or "") for chunk in chunks),
+        "build": {
+            "wall_s": round(best, 6),
+            "peak_alloc_mb": round(peak / (1024 * 1024), 2),
+            "retained_mb": round(retained / (1024 * 1024), 2),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        },
+        "quality": quality,
+        "latency_ms": {
+            "p50": round(percentile(samples, 50), 4),
+            "p95": round(percentile(samples, 95), 4),
+            "p99": round(percentile(samples, 99), 4),
+            "mean": round(sum(samples) / len(samples), 4) if samples else 0.0,
+            "samples": len(samples),
+        },
+        "unmatched_labels": unmatched,
+        "queries": per_query,
+    }
+
+
+def compare(run: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    """``run`` minus ``base`` for the headline figures."""
+    delta: Dict[str, Any] = {}
+    for section in ("quality", "latency_ms", "build"):
+        delta[section] = {
+            name: round(value - base[section][name], 6)
+            for name, value in run[section].items()
+            if name in base.get(section, {}) and name != "samples"
+        }
+    delta["chunk_count"] = run["chunk_count"] - base["chunk_count"]
+    return delta
+
+
+def run_evaluation(
+    chunks_files: List[str],
+    labels_path: str,
+    *,
+    retriever: str = "bm25",
+    ks: Sequence[int] = DEFAULT_KS,
+    repeat: int = 5,
+    match: str = "base",
+    baseline: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    runs = []
+    for chunks_jsonl in chunks_files:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            runs.append(
+                pool.submit(
+                    evaluate, chunks_jsonl, labels_path, retriever=retriever, ks=ks, repeat=repeat, match=match
+                ).result()
+            )
+    if baseline is not None:
+        earlier = {run["name"]: run for run in baseline.get("runs", [])}
+        for run in runs:
+            if run["name"] in earlier:
+                run["delta"] = compare(run, earlier[run["name"]])
+    return {
+        "version": EVAL_REPORT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "labels": labels_path,
+        "labelled_queries": len(load_labels(labels_path)),
+        "retriever": retriever,
+        "k": list(ks),
+        "match": match,
+        "repeat": repeat,
+        "runs": runs,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--chunks",
+        action="append",
+        default=[],
+        help="Chunks JSONL to evaluate; repeat to compare several (default: docs/Socrata.rag.bundle.jsonl)",
+    )
+    parser.add_argument("--labels", default="docs/Socrata.rag.eval.json", help="Labelled queries")
+    parser.add_argument("--retriever", choices=("bm25", "batch"), default="bm25")
+    parser.add_argument("--k", default=",".join(str(k) for k in DEFAULT_KS), help="Comma-separated cutoffs for recall@k")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query and index builds per file")
+    parser.add_argument("--match", choices=("base", "id"), default="base", help="Compare ids without (base) or with their counter")
+    parser.add_argument("--baseline", default="", help="Earlier report to compare the runs against")
+    parser.add_argument("--out", default="", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    ks = sorted({int(k) for k in args.k.split(",") if k.strip()})
+    if not ks or ks[0] < 1:
+        parser.error("--k needs positive cutoffs")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    report = json.dumps(
+        run_evaluation(
+            args.chunks or ["docs/Socrata.rag.bundle.jsonl"],
+            args.labels,
+            retriever=args.retriever,
+            ks=ks,
+            repeat=args.repeat,
+            match=args.match,
+            baseline=baseline,
+        ),
+        indent=2,
+    )
+    if args.out:
+        Path(args.out).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Memory-mapped source documents read as a sequence of lines.
+
+``open_lines`` maps the file and indexes where every line starts in a compact
+``array('Q')`` (8 bytes per line); lines are decoded only when they are read,
+so the document is never held as one string plus a string per line. Lines
+split exactly like ``read_text(errors="replace").splitlines()``; a file that
+uses a separator other than ``\\n`` or ``\\r\\n`` (lone ``\\r``, form feeds,
+U+2028 ...) is rare enough that it is simply read that way instead.
+
+Slices are views on the same mapping, and a view pickles as its path and byte
+range, so a process pool worker maps its own shard instead of receiving the
+decoded lines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+from array import array
+from contextlib import contextmanager
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union, overload
+
+INDEX_BLOCK_BYTES = 1 << 22
+DECODE_BLOCK_LINES = 4096
+
+# Anything str.splitlines() breaks on besides "\n" and "\r\n" (as UTF-8 bytes),
+# apart from a lone "\r", which is counted instead.
+OTHER_LINE_BREAKS = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")
+
+
+def splits_like_splitlines(block: bytes, end: int) -> bool:
+    """True if ``\\n`` and ``\\r\\n`` are the only line breaks in ``block[:end]``."""
+    return block.count(b"\r", 0, end) == block.count(b"\r\n", 0, end) and all(
+        block.find(brk, 0, end) == -1 for brk in OTHER_LINE_BREAKS
+    )
+
+
+def line_offsets(buf: Union[bytes, mmap.mmap], start: int = 0, end: Optional[int] = None) -> Optional[array]:
+    """Start offsets of the lines in ``buf[start:end]`` followed by ``end``, so
+    line ``i`` is ``buf[offsets[i]:offsets[i + 1]]`` with its line break; None if
+    the text has line breaks other than ``\\n`` and ``\\r\\n``. Built a block at a time
+    so only one block is ever copied out of the mapping."""
+    end = len(buf) if end is None else end
+    offsets = array("Q", [start])
+    pos = start
+    while pos < end:
+        block = buf[pos : min(end, pos + INDEX_BLOCK_BYTES)]
+        cut = block.rfind(b"\n")
+        if cut == -1 and pos + len(block) < end:
+            # a line longer than the block: grow the block until it ends
+            cut = buf.find(b"\n", pos + len(block), end) - pos
+            block = buf[pos : end if cut < 0 else pos + cut + 1]
+        # only whole lines are checked; the tail is checked with the next block
+        if not splits_like_splitlines(block, len(block) if cut < 0 else cut + 1):
+            return None
+        if cut < 0:
+            break
+        offsets.extend(list(accumulate((len(line) + 1 for line in block[:cut].split(b"\n")), initial=pos))[1:])
+        pos += cut + 1
+    if pos < end:
+        offsets.append(end)
+    return offsets
+
+
+class MappedLines(Sequence[str]):
+    """The lines of a mapped file (or of a line range of it), decoded on access."""
+
+    __slots__ = ("path", "_mm", "_offsets", "_start", "_stop")
+
+    def __init__(self, path: str, mm: mmap.mmap, offsets: array, start: int = 0, stop: Optional[int] = None) -> None:
+        self.path = path
+        self._mm = mm
+        self._offsets = offsets
+        self._start = start
+        self._stop = len(offsets) - 1 if stop is None else stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def _decode(self, a: int, b: int) -> str:
+        raw = self._mm[a:b]
+        if raw.endswith(b"\n"):
+            raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1]
+        return raw.decode("utf-8", errors="replace")
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MappedLines": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return MappedLines(self.path, self._mm, self._offsets, self._start + start, self._start + max(start, stop))
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("line index out of range")
+        i = self._start + index
+        return self._decode(self._offsets[i], self._offsets[i + 1])
+
+    def __iter__(self) -> Iterator[str]:
+        # whole runs of lines decode at once; the file has no line breaks but \n and \r\n
+        offsets = self._offsets
+        for a in range(self._start, self._stop, DECODE_BLOCK_LINES):
+            b = min(self._stop, a + DECODE_BLOCK_LINES)
+            yield from self._mm[offsets[a] : offsets[b]].decode("utf-8", errors="replace").splitlines()
+
+    def __reduce__(self):
+        return reopen_lines, (self.path, self._offsets[self._start], self._offsets[self._stop])
+
+    @property
+    def nbytes(self) -> int:
+        return self._offsets[self._stop] - self._offsets[self._start]
+
+    @property
+    def index_bytes(self) -> int:
+        return self._offsets.itemsize * len(self._offsets)
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def map_lines(path: Union[str, Path], start: int = 0, end: Optional[int] = None) -> Optional[MappedLines]:
+    """Map ``path`` (or its bytes ``start:end``, which must be whole lines) and index
+    its lines; None when the file is empty or needs ``splitlines`` to split it."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None
+    offsets = line_offsets(mm, start, end)
+    if offsets is None:
+        mm.close()
+        return None
+    return MappedLines(str(path), mm, offsets)
+
+
+def reopen_lines(path: str, start: int, end: int) -> Sequence[str]:
+    """Unpickle a MappedLines view by mapping its byte range again."""
+    lines = map_lines(path, start, end)
+    return lines if lines is not None else []
+
+
+@contextmanager
+def open_lines(path: Union[str, Path]) -> Iterator[Sequence[str]]:
+    """Yield the lines of ``path`` as a MappedLines view, or as a list when the file
+    cannot be mapped line by line; the mapping is closed on exit."""
+    lines = map_lines(path)
+    if lines is None:
+        yield Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
+        return
+    try:
+        yield lines
+    finally:
+        lines.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="Document to map and index")
+    args = parser.parse_args()
+    with open_lines(args.input) as lines:
+        stats = {"lines": len(lines), "mapped": isinstance(lines, MappedLines)}
+        if isinstance(lines, MappedLines):
+            stats.update(bytes=lines.nbytes, index_bytes=lines.index_bytes)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
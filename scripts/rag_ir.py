@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Intermediate representation of a parsed RAG document.
+
+The parsers build these ``__slots__`` objects directly and every emitter writes
+from them, so a parsed document exists once, without a per-object ``__dict__``
+or a dict per endpoint, param, field and chunk repeating the same keys. Dicts
+are only materialized by the writers, record by record, through ``to_dict``
+(and ``Endpoint.to_record`` for the endpoints JSONL), which reproduce the output
+schema exactly, key order and optional keys included.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+PARAM_SECTIONS = ("query", "path", "header", "body")
+
+
+def slugify(text: str) -> str:
+    """The id form of a title, shared by every parser."""
+    text = text.strip().lower()
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    return text.strip("-") or "section"
+
+
+def join_paragraphs(lines: List[str]) -> List[str]:
+    """Blank-line separated runs of ``lines``, each joined into one paragraph."""
+    paragraphs: List[str] = []
+    cur: List[str] = []
+    for line in lines:
+        if not line.strip():
+            if cur:
+                paragraphs.append(" ".join(cur).strip())
+                cur = []
+            continue
+        cur.append(line.strip())
+    if cur:
+        paragraphs.append(" ".join(cur).strip())
+    return paragraphs
+
+
+class Param:
+    __slots__ = ("name", "type", "description")
+
+    def __init__(self, name: str, type: str, description: str) -> None:
+        self.name = name
+        self.type = type
+        self.description = description
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "type": self.type, "description": self.description}
+
+
+class Field:
+    """A response field; ``notes`` stays None (and out of the output) until one is added."""
+
+    __slots__ = ("name", "type", "description", "notes")
+
+    def __init__(self, name: str, type: str, description: str) -> None:
+        self.name = name
+        self.type = type
+        self.description = description
+        self.notes: Optional[List[str]] = None
+
+    def add_note(self, note: str) -> None:
+        if self.notes is None:
+            self.notes = []
+        self.notes.append(note)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"name": self.name, "type": self.type, "description": self.description}
+        if self.notes is not None:
+            out["notes"] = self.notes
+        return out
+
+
+class Request:
+    __slots__ = PARAM_SECTIONS + ("notes",)
+
+    def __init__(self) -> None:
+        self.query: List[Param] = []
+        self.path: List[Param] = []
+        self.header: List[Param] = []
+        self.body: List[Param] = []
+        self.notes: List[str] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query": [p.to_dict() for p in self.query],
+            "path": [p.to_dict() for p in self.path],
+            "header": [p.to_dict() for p in self.header],
+            "body": [p.to_dict() for p in self.body],
+            "notes": self.notes,
+        }
+
+
+class Response:
+    """``notes`` stays None (and out of the .rag.json) until one is added."""
+
+    __slots__ = ("content_type", "status", "fields", "notes")
+
+    def __init__(self) -> None:
+        self.content_type: Optional[str] = None
+        self.status: Optional[str] = None
+        self.fields: List[Field] = []
+        self.notes: Optional[List[str]] = None
+
+    def add_note(self, note: str) -> None:
+        if self.notes is None:
+            self.notes = []
+        self.notes.append(note)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "content_type": self.content_type,
+            "status": self.status,
+            "fields": [f.to_dict() for f in self.fields],
+        }
+        if self.notes is not None:
+            out["notes"] = self.notes
+        return out
+
+
+class Endpoint:
+    __slots__ = ("id", "title", "method", "path", "summary", "description", "examples", "request", "response")
+
+    def __init__(self, id: str, title: str, method: str, path: str) -> None:
+        self.id = id
+        self.title = title
+        self.method = method
+        self.path = path
+        self.summary = ""
+        self.description: List[str] = []
+        self.examples: List[str] = []
+        self.request = Request()
+        self.response = Response()
+
+    @property
+    def tags(self) -> List[str]:
+        return ["endpoint", self.method.lower(), self.path]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The endpoint as it appears in a .rag.json."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "method": self.method,
+            "path": self.path,
+            "summary": self.summary,
+            "description": self.description,
+            "examples": self.examples,
+            "request": self.request.to_dict(),
+            "response": self.response.to_dict(),
+        }
+
+    def to_record(self) -> Dict[str, Any]:
+        """The endpoint as a line of the endpoints JSONL."""
+        response = self.response
+        return {
+            "id": self.id,
+            "type": "endpoint",
+            "title": self.title,
+            "method": self.method,
+            "path": self.path,
+            "summary": self.summary,
+            "description": self.description,
+            "examples": self.examples,
+            "request": self.request.to_dict(),
+            "response": {
+                "content_type": response.content_type,
+                "status": response.status,
+                "fields": [f.to_dict() for f in response.fields],
+                "notes": response.notes if response.notes is not None else [],
+            },
+            "tags": self.tags,
+        }
+
+
+class EndpointRecord:
+    """An endpoint seen as its endpoints JSONL record (a view, not a copy)."""
+
+    __slots__ = ("endpoint",)
+
+    def __init__(self, endpoint: Endpoint) -> None:
+        self.endpoint = endpoint
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.endpoint.to_record()
+
+
+class Section:
+    """A document section; ``raw_lines`` collects its text until
+    ``parse_discovery_api.finalize_section`` joins it into paragraphs."""
+
+    __slots__ = ("id", "title", "paragraphs", "raw_lines")
+
+    def __init__(self, id: str, title: str) -> None:
+        self.id = id
+        self.title = title
+        self.paragraphs: List[str] = []
+        self.raw_lines: Optional[List[str]] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "title": self.title, "paragraphs": self.paragraphs}
+
+
+class Chunk:
+    __slots__ = ("id", "type", "title", "path", "text", "tags", "source_file", "doc_id")
+
+    def __init__(
+        self, id: str, type: str, title: str, path: List[str], text: str, tags: List[str], source_file: str, doc_id: str
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.title = title
+        self.path = path
+        self.text = text
+        self.tags = tags
+        self.source_file = source_file
+        self.doc_id = doc_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "title": self.title,
+            "path": self.path,
+            "text": self.text,
+            "tags": self.tags,
+            "source_file": self.source_file,
+            "doc_id": self.doc_id,
+        }
+
+
+class Document:
+    """A parsed document. Generic manuals have always carried an (empty)
+    ``chunks`` key from parsing, so in their .rag.json the chunks come before
+    the schema; discovery documents put the schema first."""
+
+    __slots__ = ("title", "sections", "endpoints", "generic")
+
+    def __init__(
+        self,
+        title: str,
+        sections: Optional[List[Section]] = None,
+        endpoints: Optional[List[Endpoint]] = None,
+        generic: bool = False,
+    ) -> None:
+        self.title = title
+        self.sections: List[Section] = sections if sections is not None else []
+        self.endpoints: List[Endpoint] = endpoints if endpoints is not None else []
+        self.generic = generic
+
+    def to_dict(
+        self, schema: Optional[Dict[str, Any]] = None, chunks: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """The .rag.json document with ``schema`` and the (already materialized)
+        ``chunks``; without them, what ``parse`` used to return."""
+        out: Dict[str, Any] = {
+            "title": self.title,
+            "sections": [section.to_dict() for section in self.sections],
+            "endpoints": [endpoint.to_dict() for endpoint in self.endpoints],
+        }
+        if self.generic:
+            out["chunks"] = chunks if chunks is not None else []
+        if schema is not None:
+            out["schema"] = schema
+        if not self.generic and chunks is not None:
+            out["chunks"] = chunks
+        return out
+
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""OpenAPI (2.0 / 3.x) and JSON Schema documents mapped straight into the RAG IR.
+
+Specs are already structured, so instead of the line heuristics of ``parse`` and
+``parse_generic_sections`` the document is walked once and every piece lands in
+the same ``Section`` and ``Endpoint`` records those parsers build; chunking and
+the writers are shared, so ``--mode openapi`` emits the usual chunk types
+(``section``, ``endpoint``, ``request-params``, ``response-fields``) and an
+endpoints JSONL.
+
+For an OpenAPI spec:
+
+    sections    an overview (``info``), the servers (or Swagger host and base
+                path), the security schemes and each described tag
+    endpoints   one per operation, in spec order: path- and operation-level
+                parameters (the operation's win), the request body's properties
+                as body params, the first 2xx response (else ``default``) as
+                the response, its schema's properties as fields and the other
+                status codes as response notes
+
+A plain JSON Schema becomes a section for the root and one per definition.
+Schemas are flattened to dotted field names (``items[].name``) down to
+``MAX_SCHEMA_DEPTH``; local ``$ref``s are resolved, and a reference cycle stops
+at the schema that repeats. The spec is read with ``json`` (or PyYAML for
+``.yaml``/``.yml``), which has no incremental parser, so it is loaded whole --
+specs are small next to the documents the line parsers handle.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from rag_ir import Document, Endpoint, Field, Param, Section, join_paragraphs, slugify
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+MAX_SCHEMA_DEPTH = 3
+# OpenAPI "in" -> request parameter section; cookies travel in a header
+PARAM_LOCATIONS = {
+    "query": "query",
+    "path": "path",
+    "header": "header",
+    "cookie": "header",
+    "body": "body",
+    "formData": "body",
+}
+
+Schema = Dict[str, Any]
+
+
+def load_spec(path: Union[str, Path]) -> Dict[str, Any]:
+    """The spec at ``path``: JSON, or YAML when the suffix says so."""
+    path = Path(path)
+    with path.open("rb") as f:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as exc:
+                raise ValueError(
+                    f"Reading {path} needs PyYAML (pip install pyyaml), or convert the spec to JSON"
+                ) from exc
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise ValueError(f"{path} is not an OpenAPI or JSON Schema document")
+    return spec
+
+
+def is_openapi(spec: Dict[str, Any]) -> bool:
+    return "openapi" in spec or "swagger" in spec or "paths" in spec
+
+
+def spec_title(spec: Dict[str, Any]) -> str:
+    info = spec.get("info") or {}
+    return str(info.get("title") or spec.get("title") or "API")
+
+
+def ref_name(ref: str) -> str:
+    return ref.rstrip("/").rsplit("/", 1)[-1] or ref
+
+
+class Resolver:
+    """Local ``$ref`` resolution (``#/components/schemas/...``) within one spec.
+    ``flat`` keeps each referenced schema's flattened properties, which many
+    operations share."""
+
+    __slots__ = ("spec", "flat")
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.spec = spec
+        self.flat: Dict[str, List[Tuple[str, str, str, List[str]]]] = {}
+
+    def lookup(self, ref: str) -> Optional[Any]:
+        if not ref.startswith("#"):
+            # other documents are not fetched
+            return None
+        node: Any = self.spec
+        for part in ref[1:].split("/")[1:]:
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and part in node:
+                node = node[part]
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                return None
+        return node
+
+    def deref(self, node: Any) -> Any:
+        """``node`` with its ``$ref`` chain followed; an unresolvable or cyclic
+        reference yields an empty object."""
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            ref = node["$ref"]
+            if ref in seen:
+                return {}
+            seen.add(ref)
+            target = self.lookup(ref)
+            node = target if target is not None else {}
+        return node
+
+
+def type_label(schema: Any, resolver: Resolver) -> str:
+    """A short type for a schema: ``string``, ``array<Dataset>``, ``string enum``..."""
+    if not isinstance(schema, dict):
+        return "any"
+    if isinstance(schema.get("$ref"), str):
+        return ref_name(schema["$ref"])
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        label = "|".join(str(k) for k in kind if k != "null") or "null"
+    elif kind == "array":
+        label = f"array<{type_label(schema.get('items'), resolver)}>"
+    elif kind:
+        label = str(kind)
+    elif schema.get("oneOf") or schema.get("anyOf"):
+        label = "|".join(type_label(option, resolver) for option in schema.get("oneOf") or schema.get("anyOf"))
+    elif schema.get("allOf"):
+        refs = [option for option in schema["allOf"] if isinstance(option, dict) and "$ref" in option]
+        label = type_label(refs[0], resolver) if len(refs) == 1 else "object"
+    elif "properties" in schema:
+        label = "object"
+    else:
+        label = "any"
+    if schema.get("format") and kind not in ("array", "object"):
+        label = f"{label} ({schema['format']})"
+    if schema.get("enum"):
+        label = f"{label} enum"
+    return label
+
+
+def schema_notes(schema: Schema, *, required: bool = False, deprecated: bool = False) -> List[str]:
+    """What a description should add about a schema: requiredness, allowed
+    values, default and limits."""
+    notes = []
+    if required:
+        notes.append("Required.")
+    if deprecated or schema.get("deprecated"):
+        notes.append("Deprecated.")
+    if schema.get("enum"):
+        notes.append("Allowed values: " + ", ".join(json.dumps(v, ensure_ascii=False) for v in schema["enum"]) + ".")
+    if "default" in schema:
+        notes.append(f"Default: {json.dumps(schema['default'], ensure_ascii=False)}.")
+    limits = [
+        f"{name} {schema[key]}"
+        for key, name in (
+            ("minimum", "min"),
+            ("maximum", "max"),
+            ("minLength", "min length"),
+            ("maxLength", "max length"),
+            ("minItems", "min items"),
+            ("maxItems", "max items"),
+        )
+        if key in schema
+    ]
+    if schema.get("pattern"):
+        limits.append(f"pattern {schema['pattern']}")
+    if limits:
+        notes.append("Constraints: " + ", ".join(limits) + ".")
+    return notes
+
+
+def describe(description: Any, notes: List[str]) -> str:
+    text = " ".join(join_paragraphs(str(description or "").splitlines()))
+    return " ".join(([text] + notes) if text else notes)
+
+
+def merged_schema(schema: Any, resolver: Resolver, seen: Tuple[str, ...] = ()) -> Schema:
+    """The dereferenced schema with any ``allOf`` members folded in."""
+    if isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+        if schema["$ref"] in seen:
+            return {}
+        seen = seen + (schema["$ref"],)
+    schema = resolver.deref(schema)
+    if not isinstance(schema, dict):
+        return {}
+    if not schema.get("allOf"):
+        return schema
+    merged: Schema = {key: value for key, value in schema.items() if key != "allOf"}
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for part in schema["allOf"]:
+        part = merged_schema(part, resolver, seen)
+        properties.update(part.get("properties") or {})
+        required.extend(part.get("required") or [])
+        for key, value in part.items():
+            merged.setdefault(key, value)
+    properties.update(schema.get("properties") or {})
+    merged["properties"] = properties
+    merged["required"] = required + list(schema.get("required") or [])
+    return merged
+
+
+def iter_schema_fields(
+    schema: Any, resolver: Resolver, prefix: str = "", depth: int = 0, stack: Tuple[str, ...] = ()
+) -> Iterator[Tuple[str, Schema, bool]]:
+    """(dotted name, property schema, required) for every property of
+    ``schema``, nested objects and array items included; an array of objects
+    is described through its items (``rows[].id``)."""
+    if depth >= MAX_SCHEMA_DEPTH:
+        return
+    if isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+        if schema["$ref"] in stack:
+            return
+        stack = stack + (schema["$ref"],)
+    resolved = merged_schema(schema, resolver)
+    if resolved.get("type") == "array" and not prefix:
+        yield from iter_schema_fields(resolved.get("items"), resolver, "[]", depth, stack)
+        return
+    required = set(resolved.get("required") or [])
+    for name, prop in (resolved.get("properties") or {}).items():
+        prop = prop if isinstance(prop, dict) else {}
+        dotted = f"{prefix}.{name}" if prefix else name
+        yield dotted, prop, name in required
+        target = merged_schema(prop, resolver)
+        if target.get("type") == "array":
+            yield from iter_schema_fields(target.get("items"), resolver, f"{dotted}[]", depth + 1, stack)
+        elif target.get("properties"):
+            yield from iter_schema_fields(prop, resolver, dotted, depth + 1, stack)
+
+
+def property_text(prop: Schema, required: bool, resolver: Resolver) -> Tuple[str, str, List[str]]:
+    """Type, description and notes of one property."""
+    resolved = merged_schema(prop, resolver)
+    description = describe(prop.get("description") or resolved.get("description"), [])
+    return type_label(prop, resolver), description, schema_notes(resolved, required=required)
+
+
+def flatten_schema(schema: Any, resolver: Resolver) -> List[Tuple[str, str, str, List[str]]]:
+    """(name, type, description, notes) for every property ``iter_schema_fields``
+    yields; computed once per referenced schema."""
+    ref = schema.get("$ref") if isinstance(schema, dict) and len(schema) == 1 else None
+    if isinstance(ref, str) and ref in resolver.flat:
+        return resolver.flat[ref]
+    flat = [
+        (name, *property_text(prop, required, resolver))
+        for name, prop, required in iter_schema_fields(schema, resolver)
+    ]
+    if isinstance(ref, str):
+        resolver.flat[ref] = flat
+    return flat
+
+
+def schema_fields(schema: Any, resolver: Resolver) -> List[Field]:
+    fields = []
+    for name, label, description, notes in flatten_schema(schema, resolver):
+        field = Field(name, label, description)
+        for note in notes:
+            field.add_note(note)
+        fields.append(field)
+    return fields
+
+
+def schema_params(schema: Any, resolver: Resolver) -> List[Param]:
+    return [
+        Param(name, label, describe(description, notes))
+        for name, label, description, notes in flatten_schema(schema, resolver)
+    ]
+
+
+def first_media(content: Any) -> Tuple[Optional[str], Schema]:
+    """The first media type of a 3.x ``content`` map and its entry."""
+    if isinstance(content, dict):
+        for media_type, entry in content.items():
+            return media_type, entry if isinstance(entry, dict) else {}
+    return None, {}
+
+
+def example_value(entry: Schema, resolver: Resolver) -> Any:
+    if "example" in entry:
+        return entry["example"]
+    for example in (entry.get("examples") or {}).values() if isinstance(entry.get("examples"), dict) else []:
+        example = resolver.deref(example)
+        if isinstance(example, dict) and "value" in example:
+            return example["value"]
+    schema = resolver.deref(entry.get("schema"))
+    if isinstance(schema, dict) and "example" in schema:
+        return schema["example"]
+    return None
+
+
+def param_example(param: Schema) -> Any:
+    if "example" in param:
+        return param["example"]
+    schema = param.get("schema") or {}
+    return schema.get("example") if isinstance(schema, dict) else None
+
+
+def build_endpoint(
+    path: str, method: str, operation: Schema, path_params: List[Any], spec: Dict[str, Any], resolver: Resolver
+) -> Endpoint:
+    method = method.upper()
+    title = str(operation.get("summary") or operation.get("operationId") or f"{method} {path}").strip()
+    endpoint = Endpoint(slugify(f"{method}-{path}-{title}"), title, method, path)
+    request = endpoint.request
+    response = endpoint.response
+
+    endpoint.description = text_paragraphs(operation.get("description"))
+    summary = describe(operation.get("summary"), [])
+    endpoint.summary = summary or (endpoint.description[0] if endpoint.description else "")
+
+    # operation-level parameters override path-level ones with the same name and location
+    params: Dict[Tuple[str, str], Schema] = {}
+    for param in path_params + list(operation.get("parameters") or []):
+        param = resolver.deref(param)
+        if isinstance(param, dict) and param.get("name"):
+            params[(param["name"], param.get("in", "query"))] = param
+    examples: List[str] = []
+    for (name, location), param in params.items():
+        section = PARAM_LOCATIONS.get(location)
+        if section is None:
+            continue
+        if location == "body":
+            # Swagger 2.0 body parameter: its schema's properties are the params
+            body = schema_params(param.get("schema"), resolver)
+            label = type_label(param.get("schema"), resolver)
+            request.body.extend(body or [Param(name, label, describe(param.get("description"), []))])
+            continue
+        # 3.x puts the type under "schema", 2.0 on the parameter itself
+        schema = param.get("schema") or param
+        resolved = merged_schema(schema, resolver)
+        notes = schema_notes(resolved, required=bool(param.get("required")), deprecated=bool(param.get("deprecated")))
+        if location == "cookie":
+            notes.insert(0, "Cookie.")
+        description = describe(param.get("description") or resolved.get("description"), notes)
+        getattr(request, section).append(Param(name, type_label(schema, resolver), description))
+        example = param_example(param)
+        if location == "query" and example is not None:
+            examples.append(f"{method} {path}?{name}={example if isinstance(example, str) else json.dumps(example)}")
+
+    body = resolver.deref(operation.get("requestBody"))
+    if isinstance(body, dict) and body:
+        media_type, entry = first_media(body.get("content"))
+        request.body.extend(schema_params(entry.get("schema"), resolver))
+        if media_type:
+            request.notes.append(f"Request body: {media_type}" + (" (required)" if body.get("required") else ""))
+        if body.get("description"):
+            request.notes.append(describe(body["description"], []))
+        example = example_value(entry, resolver)
+        if example is not None:
+            examples.append(f"{method} {path} {json.dumps(example, ensure_ascii=False, separators=(',', ':'))}")
+    endpoint.examples = examples
+
+    if operation.get("deprecated"):
+        request.notes.append("Deprecated.")
+    security = operation.get("security", spec.get("security"))
+    if security:
+        schemes = sorted({name for requirement in security if isinstance(requirement, dict) for name in requirement})
+        if schemes:
+            request.notes.append("Security: " + ", ".join(schemes))
+
+    # YAML reads unquoted status codes as integers
+    responses = {str(code): resolver.deref(entry) for code, entry in (operation.get("responses") or {}).items()}
+    chosen = next((code for code in responses if code.startswith("2")), "default" if "default" in responses else None)
+    if chosen is not None:
+        entry = responses[chosen] if isinstance(responses[chosen], dict) else {}
+        status = " ".join(join_paragraphs(str(entry.get("description") or "").splitlines()))
+        response.status = f"{chosen} - {status}" if status else chosen
+        media_type, media = first_media(entry.get("content"))
+        if media_type is None and "schema" in entry:
+            # Swagger 2.0: the schema sits on the response, the media type on the operation
+            produces = operation.get("produces") or spec.get("produces") or []
+            media_type, media = (produces[0] if produces else None), entry
+        response.content_type = media_type
+        response.fields.extend(schema_fields(media.get("schema"), resolver))
+    for code, entry in responses.items():
+        if code == chosen:
+            continue
+        description = entry.get("description") if isinstance(entry, dict) else ""
+        response.add_note(f"{code} - {describe(description, [])}" if description else code)
+    return endpoint
+
+
+def section(title: str, paragraphs: List[str], key: Optional[str] = None) -> Section:
+    record = Section(slugify(key or title), title)
+    record.paragraphs = paragraphs
+    record.raw_lines = None
+    return record
+
+
+def text_paragraphs(text: Any) -> List[str]:
+    return join_paragraphs(str(text or "").splitlines())
+
+
+def iter_openapi_sections(spec: Dict[str, Any], resolver: Resolver) -> Iterator[Section]:
+    info = spec.get("info") or {}
+    overview = text_paragraphs(info.get("description"))
+    if spec.get("openapi"):
+        version = f" (OpenAPI {spec['openapi']})"
+    else:
+        version = f" (Swagger {spec['swagger']})" if spec.get("swagger") else ""
+    if info.get("version"):
+        overview.append(f"Version: {info['version']}{version}")
+    if overview:
+        yield section(spec_title(spec), overview)
+
+    servers = []
+    for server in spec.get("servers") or []:
+        if isinstance(server, dict) and server.get("url"):
+            servers.append(f"{server['url']} - {server['description']}" if server.get("description") else server["url"])
+    if spec.get("host"):
+        schemes = spec.get("schemes") or ["https"]
+        servers.extend(f"{scheme}://{spec['host']}{spec.get('basePath', '')}" for scheme in schemes)
+    if servers:
+        yield section("Servers", servers)
+
+    schemes = (spec.get("components") or {}).get("securitySchemes") or spec.get("securityDefinitions") or {}
+    auth = []
+    for name, scheme in schemes.items():
+        scheme = resolver.deref(scheme)
+        if not isinstance(scheme, dict):
+            continue
+        kind = " ".join(str(scheme[key]) for key in ("type", "scheme", "in") if scheme.get(key))
+        if scheme.get("name"):
+            kind += f" {scheme['name']}"
+        line = f"{name} ({kind})" if kind else name
+        auth.append(f"{line}: {describe(scheme['description'], [])}" if scheme.get("description") else line)
+    if auth:
+        yield section("Authentication", auth)
+
+    for tag in spec.get("tags") or []:
+        if isinstance(tag, dict) and tag.get("name") and tag.get("description"):
+            yield section(str(tag["name"]), text_paragraphs(tag["description"]), f"tag-{tag['name']}")
+
+
+def schema_section(title: str, schema: Any, resolver: Resolver, key: Optional[str] = None) -> Section:
+    resolved = merged_schema(schema, resolver)
+    paragraphs = text_paragraphs(resolved.get("description"))
+    paragraphs.append(f"Type: {type_label(schema, resolver)}")
+    for field in schema_fields(schema, resolver):
+        line = f"- {field.name} ({field.type})" + (f": {field.description}" if field.description else "")
+        notes = " ".join(field.notes or [])
+        paragraphs.append(f"{line} {notes}" if notes else line)
+    return section(title, paragraphs, key)
+
+
+def iter_json_schema_sections(spec: Dict[str, Any], resolver: Resolver) -> Iterator[Section]:
+    yield schema_section(spec_title(spec), spec, resolver)
+    for group in ("$defs", "definitions"):
+        for name, schema in (spec.get(group) or {}).items():
+            title = schema.get("title") if isinstance(schema, dict) else None
+            yield schema_section(str(title or name), schema, resolver, f"schema-{name}")
+
+
+def iter_openapi(spec: Dict[str, Any]) -> Iterator[Tuple[str, Union[Section, Endpoint]]]:
+    """Yield ("section", section) records, then ("endpoint", endpoint) records in
+    spec order, as ``iter_parse`` does for a text document."""
+    resolver = Resolver(spec)
+    if not is_openapi(spec):
+        for record in iter_json_schema_sections(spec, resolver):
+            yield "section", record
+        return
+    for record in iter_openapi_sections(spec, resolver):
+        yield "section", record
+    for path, item in (spec.get("paths") or {}).items():
+        item = resolver.deref(item)
+        if not isinstance(item, dict):
+            continue
+        path_params = list(item.get("parameters") or [])
+        for method in item:
+            if method.lower() in HTTP_METHODS and isinstance(item[method], dict):
+                yield "endpoint", build_endpoint(str(path), method, item[method], path_params, spec, resolver)
+
+
+def openapi_document(spec: Dict[str, Any]) -> Document:
+    doc = Document(spec_title(spec))
+    for kind, record in iter_openapi(spec):
+        if kind == "endpoint":
+            doc.endpoints.append(record)
+        else:
+            doc.sections.append(record)
+    return doc
+
+
+def parse_openapi(path: Union[str, Path]) -> Document:
+    return openapi_document(load_spec(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("spec", help="OpenAPI or JSON Schema document (.json, .yaml, .yml)")
+    args = parser.parse_args()
+    doc = parse_openapi(args.spec)
+    summary = {
+        "title": doc.title,
+        "sections": [s.title for s in doc.sections],
+        "endpoints": [f"{e.method} {e.path}" for e in doc.endpoints],
+    }
+    print(json.dumps(summary, indent=2, ensure_ascii=True))
+
+
+if __name__ == "__main__":
+    main()
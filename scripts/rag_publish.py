@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Content-addressed copies of the artifacts of a RAG index, for immutable caching.
+
+Every output named by an index artifact is copied into a publish directory
+under a name carrying the first ``HASH_CHARS`` hex digits of its SHA-256
+(``Discovery_API.rag.chunks.<hash>.jsonl``), and the artifact gets a
+``published`` map from each output's role to its copy. A consumer that loads
+artifacts through ``published`` can cache them forever: a changed corpus
+yields new names, an unchanged one the same names, so nothing is revalidated,
+re-downloaded or re-indexed.
+
+The ingest writers are already byte-deterministic: records are materialized
+from the IR with a fixed key order, chunks follow document order, sets are
+sorted before they are written and compressed members carry no timestamp, so
+identical inputs give identical bytes (and names) whatever the hash seed.
+Outputs that name other outputs -- the shard manifest and block indexes -- are
+rewritten to point at the published copies before they are hashed, so a
+published set only references published files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from rag_blocks import block_paths, compact_json
+
+HASH_CHARS = 16
+# what content_name produces: <stem>.<hash>.<ext>, ext possibly "<inner>.gz"
+CONTENT_NAME_RE = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{%d}(?:\.[^.]+(?:\.gz)?)?$" % HASH_CHARS)
+
+# artifact keys naming a single output
+OUTPUT_KEYS = (
+    "rag_json",
+    "chunks_jsonl",
+    "endpoints_jsonl",
+    "shared_rag_json",
+    "shared_endpoints_jsonl",
+    "bm25_json",
+    "store_bin",
+    "aliases_json",
+)
+# nested objects with outputs: (object key, path key)
+NESTED_OUTPUT_KEYS = (("spec", "params_json"), ("spec", "spec_json"), ("answer_cache", "cache_json"))
+
+
+def content_name(path: str, digest: str) -> str:
+    """``name.ext`` -> ``name.<hash>.ext``; ``.gz`` keeps the extension before it."""
+    name = Path(path).name
+    stem, dot, ext = name.rpartition(".")
+    if not dot:
+        return f"{name}.{digest[:HASH_CHARS]}"
+    if ext == "gz" and "." in stem:
+        stem, _, inner = stem.rpartition(".")
+        ext = f"{inner}.gz"
+    return f"{stem}.{digest[:HASH_CHARS]}.{ext}"
+
+
+def published_stem(name: str) -> Optional[str]:
+    """The stem of a ``content_name`` file name; None for any other name."""
+    match = CONTENT_NAME_RE.match(name)
+    return match.group("stem") if match else None
+
+
+class Publisher:
+    """Copies files into ``out_dir`` under content-hash names; a name that
+    already exists holds the same bytes and is not rewritten."""
+
+    def __init__(self, out_dir: str) -> None:
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.published: Set[str] = set()
+        self.stems: Set[str] = set()
+        self.written: List[str] = []
+
+    def put(self, source: str, content: bytes) -> str:
+        target = self.out_dir / content_name(source, hashlib.sha256(content).hexdigest())
+        if not target.exists():
+            tmp = target.with_name(target.name + ".tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, target)
+            self.written.append(str(target))
+        self.published.add(target.name)
+        self.stems.add(published_stem(target.name))
+        return str(target)
+
+    def file(self, source: str) -> str:
+        return self.put(source, Path(source).read_bytes())
+
+    def prune(self) -> List[str]:
+        """Remove earlier published copies of this run's outputs that nothing
+        published this run: only content-hash names whose stem this run also
+        published are touched, so any other file in ``out_dir`` is kept."""
+        removed = []
+        for path in sorted(self.out_dir.iterdir()):
+            if not path.is_file() or path.name in self.published:
+                continue
+            if published_stem(path.name) in self.stems:
+                path.unlink()
+                removed.append(str(path))
+        return removed
+
+
+def _publish_block_index(publisher: Publisher, index_path: str, source: str, published: Dict[str, str]) -> str:
+    index = json.loads(Path(index_path).read_text(encoding="utf-8"))
+    index["source"] = published[source]
+    index["path"] = publisher.file(index["path"])
+    return publisher.put(index_path, compact_json(index).encode("utf-8"))
+
+
+def _publish_shards(publisher: Publisher, manifest_path: str, published: Dict[str, str]) -> str:
+    manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    for shard in manifest["shards"]:
+        shard["path"] = publisher.file(shard["path"])
+    manifest["bundle"] = published.get(manifest["bundle"], manifest["bundle"])
+    if manifest.get("aliases_json"):
+        manifest["aliases_json"] = published.get(manifest["aliases_json"], manifest["aliases_json"])
+    content = json.dumps(manifest, indent=2, ensure_ascii=True).encode("utf-8")
+    return publisher.put(manifest_path, content)
+
+
+def publish_artifact(publisher: Publisher, artifact: Dict[str, Any]) -> Dict[str, str]:
+    """Publish the outputs of one index artifact; returns its ``published`` map
+    (role -> published path). Outputs that do not exist are skipped."""
+    by_source: Dict[str, str] = {}
+    roles: Dict[str, str] = {}
+
+    def add(role: str, path: Optional[str]) -> None:
+        if path and Path(path).exists():
+            by_source[path] = roles[role] = publisher.file(path)
+
+    for key in OUTPUT_KEYS:
+        add(key, artifact.get(key))
+    for outer, key in NESTED_OUTPUT_KEYS:
+        add(f"{outer}.{key}", (artifact.get(outer) or {}).get(key))
+
+    if artifact.get("blocks") is not None:
+        for key in ("chunks_jsonl", "endpoints_jsonl"):
+            source = artifact.get(key)
+            if source not in by_source:
+                continue
+            paths = block_paths(source)
+            if Path(paths["index"]).exists() and Path(paths["blocks"]).exists():
+                roles[f"{key}.blocks"] = _publish_block_index(publisher, paths["index"], source, by_source)
+        if artifact.get("rag_json") in by_source:
+            add("rag_json.gz", artifact["rag_json"] + ".gz")
+
+    manifest = (artifact.get("shards") or {}).get("manifest_json")
+    if manifest and Path(manifest).exists():
+        roles["shards.manifest_json"] = _publish_shards(publisher, manifest, by_source)
+    return roles
+
+
+def publish_index(index: Dict[str, Any], out_dir: str, *, prune: bool = False) -> List[str]:
+    """Publish every artifact of a loaded RAG index into ``out_dir`` and record
+    each one's ``published`` map in ``index``; with ``prune`` older published
+    copies of its outputs that no artifact references any more are removed
+    (see ``Publisher.prune``). Returns the paths written."""
+    publisher = Publisher(out_dir)
+    for artifact in index.get("artifacts", []):
+        artifact["published"] = publish_artifact(publisher, artifact)
+    if prune:
+        publisher.prune()
+    return publisher.written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--index", required=True, help="RAG index whose artifacts are published; rewritten in place")
+    parser.add_argument("--dir", default="", help="Publish directory (default: the index's publish.dir)")
+    parser.add_argument("--prune", action="store_true", help="Remove older published copies no artifact references any more")
+    args = parser.parse_args()
+
+    index_path = Path(args.index)
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    publish = index.get("publish") or {}
+    out_dir = args.dir or publish.get("dir")
+    if not out_dir:
+        parser.error("no --dir and the index has no publish.dir")
+    written = publish_index(index, out_dir, prune=args.prune or publish.get("prune", False))
+    tmp = index_path.with_name(index_path.name + ".tmp")
+    tmp.write_text(json.dumps(index, indent=2, ensure_ascii=True), encoding="utf-8")
+    os.replace(tmp, index_path)
+    print(json.dumps({"written": written}), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
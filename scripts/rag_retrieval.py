@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""Batch BM25 retrieval over the RAG ingest outputs, vectorized with NumPy.
+
+``BatchRetriever`` holds the index as term-major CSR arrays (``indptr`` into
+parallel ``docs`` / ``weights`` postings), where each weight is the
+length-normalized term frequency ``tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avgdl))``.
+A batch of queries is scored by expanding every query token over its postings
+and accumulating ``idf * weight`` with one ``bincount`` per block of queries, so
+thousands of queries cost a few array operations instead of a loop over every
+chunk per query.
+
+Tokenization, runtime limits, filters (``RagQueryFilters``: docIds,
+sourceFiles, types, tags) and the per-query IDF over the filtered docs follow
+``RagIndex.query`` in services/ragIndex.ts. Contributions are summed in query
+token order and ties keep chunk order, so scores and rankings match
+``rag_bm25.Bm25Index`` exactly.
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from rag_bm25 import (
+    B,
+    DEFAULT_MAX_CHUNK_CHARS,
+    DEFAULT_MAX_CHUNKS,
+    DEFAULT_MAX_TOTAL_CHARS,
+    DEFAULT_MIN_TOKEN_LENGTH,
+    DEFAULT_STOP_WORDS,
+    K1,
+    PREBUILT_INDEX_VERSION,
+    Bm25Index,
+    load_chunks_jsonl,
+    normalize_chunks,
+    sha256_file,
+    tokenize,
+)
+
+
+Filters = Optional[Dict[str, List[str]]]
+
+# Upper bound on the dense (queries x docs) score block scored at once.
+DEFAULT_BLOCK_CELLS = 1 << 22
+
+FILTER_FIELDS = (("docIds", "doc_id"), ("sourceFiles", "source_file"), ("types", "type"))
+
+
+class BatchRetriever:
+    """BM25 over CSR postings, scoring many queries per call."""
+
+    def __init__(
+        self,
+        chunks: List[Dict[str, Any]],
+        positions: Sequence[int],
+        doc_lengths: Sequence[int],
+        vocab: Sequence[str],
+        indptr: np.ndarray,
+        docs: np.ndarray,
+        tfs: np.ndarray,
+        *,
+        min_token_length: int = DEFAULT_MIN_TOKEN_LENGTH,
+        stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+    ) -> None:
+        self.chunks = chunks
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+        self.term_ids = {term: n for n, term in enumerate(vocab)}
+        self.indptr = indptr
+        self.docs = docs
+        self.doc_freq = np.diff(indptr)
+        self.min_token_length = min_token_length
+        self.stop_words = frozenset(stop_words)
+        self.doc_count = len(self.positions)
+        self.avgdl = float(self.doc_lengths.sum()) / self.doc_count if self.doc_count else 0
+        avgdl = self.avgdl or 1
+        # same operation order as RagIndex.query, so the floats are identical
+        lengths = self.doc_lengths[docs]
+        self.weights = (tfs * (K1 + 1)) / (tfs + K1 * (1 - B + B * (lengths / avgdl)))
+        self._columns = self._filter_columns()
+
+    @classmethod
+    def from_index(cls, index: Bm25Index) -> "BatchRetriever":
+        """Convert the dict-of-counts postings of a ``Bm25Index``."""
+        vocab = sorted(index.doc_freq)
+        term_ids = {term: n for n, term in enumerate(vocab)}
+        terms: List[int] = []
+        docs: List[int] = []
+        tfs: List[int] = []
+        for doc, tf_map in enumerate(index.term_freqs):
+            for term, tf in tf_map.items():
+                terms.append(term_ids[term])
+                docs.append(doc)
+                tfs.append(tf)
+        term_array = np.asarray(terms, dtype=np.int64)
+        # stable, so each term's postings stay in doc order
+        order = np.argsort(term_array, kind="stable")
+        indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_array, minlength=len(vocab)), out=indptr[1:])
+        return cls(
+            index.chunks,
+            index.positions,
+            index.doc_lengths,
+            vocab,
+            indptr,
+            np.asarray(docs, dtype=np.int64)[order],
+            np.asarray(tfs, dtype=np.float64)[order],
+            min_token_length=index.min_token_length,
+            stop_words=index.stop_words,
+        )
+
+    @classmethod
+    def build(cls, chunks: Iterable[Dict[str, Any]], **options: Any) -> "BatchRetriever":
+        return cls.from_index(Bm25Index.build(chunks, **options))
+
+    @classmethod
+    def from_prebuilt(
+        cls,
+        chunks: List[Dict[str, Any]],
+        prebuilt: Dict[str, Any],
+        chunk_set_sha256: str,
+        *,
+        min_token_length: int = DEFAULT_MIN_TOKEN_LENGTH,
+        stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+        max_total_chars: int = DEFAULT_MAX_TOTAL_CHARS,
+    ) -> "BatchRetriever":
+        """Load the postings of a prebuilt index artifact built from the chunks
+        file hashing to ``chunk_set_sha256``; like ``RagIndex``, an incompatible
+        artifact (other options, or other chunks even with the same ids) is
+        ignored and the chunks are tokenized instead."""
+        stop_words = frozenset(stop_words)
+        normalized = normalize_chunks(chunks, max_chunks, max_chunk_chars, max_total_chars)
+        config = prebuilt.get("config") or {}
+        limits = config.get("limits") or {}
+        positions = prebuilt.get("positions") or []
+        ids = prebuilt.get("ids") or []
+        compatible = (
+            prebuilt.get("version") == PREBUILT_INDEX_VERSION
+            and bool(chunk_set_sha256)
+            and prebuilt.get("chunk_set_sha256") == chunk_set_sha256
+            and prebuilt.get("chunk_count") == len(normalized)
+            and config.get("min_token_length") == min_token_length
+            and set(config.get("stop_words") or []) == stop_words
+            and len(config.get("stop_words") or []) == len(stop_words)
+            and limits.get("max_chunks") == max_chunks
+            and limits.get("max_chunk_chars") == max_chunk_chars
+            and limits.get("max_total_chars") == max_total_chars
+            and len(positions) == len(ids)
+            and all(
+                0 <= position < len(normalized) and normalized[position].get("id") == chunk_id
+                for position, chunk_id in zip(positions, ids)
+            )
+        )
+        if not compatible:
+            return cls.from_index(
+                Bm25Index.build(
+                    normalized,
+                    min_token_length=min_token_length,
+                    stop_words=stop_words,
+                    max_chunks=max_chunks,
+                    max_chunk_chars=max_chunk_chars,
+                    max_total_chars=max_total_chars,
+                )
+            )
+
+        postings = prebuilt["postings"]
+        indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum([len(pairs) // 2 for pairs in postings], out=indptr[1:])
+        flat = np.fromiter(
+            (value for pairs in postings for value in pairs), dtype=np.int64, count=int(indptr[-1]) * 2
+        ).reshape(-1, 2)
+        return cls(
+            normalized,
+            positions,
+            prebuilt["doc_lengths"],
+            prebuilt["vocab"],
+            indptr,
+            flat[:, 0].copy(),
+            flat[:, 1].astype(np.float64),
+            min_token_length=min_token_length,
+            stop_words=stop_words,
+        )
+
+    def _filter_columns(self) -> Dict[str, Tuple[Dict[Any, int], np.ndarray]]:
+        """Per filter: (value -> code, per-doc codes); tags are (value -> code,
+        owner doc of every tag occurrence, tag codes)."""
+        columns: Dict[str, Any] = {}
+        doc_chunks = [self.chunks[position] for position in self.positions.tolist()]
+        for name, field in FILTER_FIELDS:
+            codes: Dict[Any, int] = {}
+            # a missing or empty value never matches, as in applyFilters
+            values = [codes.setdefault(chunk[field], len(codes)) if chunk.get(field) else -1 for chunk in doc_chunks]
+            columns[name] = (codes, np.asarray(values, dtype=np.int64))
+        tag_codes: Dict[Any, int] = {}
+        owners: List[int] = []
+        tags: List[int] = []
+        for doc, chunk in enumerate(doc_chunks):
+            for tag in chunk.get("tags") or ():
+                owners.append(doc)
+                tags.append(tag_codes.setdefault(tag, len(tag_codes)))
+        columns["tags"] = (tag_codes, np.asarray(owners, dtype=np.int64), np.asarray(tags, dtype=np.int64))
+        return columns
+
+    def filter_mask(self, filters: Filters) -> np.ndarray:
+        """Boolean mask over docs, as ``RagIndex.applyFilters``; empty lists are
+        no filter."""
+        mask = np.ones(self.doc_count, dtype=bool)
+        if not filters:
+            return mask
+        for name, _ in FILTER_FIELDS:
+            wanted = filters.get(name) or []
+            if wanted:
+                codes, values = self._columns[name]
+                mask &= np.isin(values, [codes[value] for value in wanted if value in codes])
+        wanted = filters.get("tags") or []
+        if wanted:
+            codes, owners, tags = self._columns["tags"]
+            hits = owners[np.isin(tags, [codes[value] for value in wanted if value in codes])]
+            mask &= np.bincount(hits, minlength=self.doc_count) > 0
+        return mask
+
+    def _query_terms(self, query: str) -> List[int]:
+        q = (query or "").strip()
+        if not q:
+            return []
+        # unknown tokens contribute nothing (df == 0) but an all-unknown query still
+        # returns no hits, so dropping them here is safe
+        tokens = tokenize(q, self.min_token_length, self.stop_words)
+        return [self.term_ids[token] for token in tokens if token in self.term_ids]
+
+    def score_batch(
+        self, queries: Sequence[str], filters: Filters = None, *, block_cells: int = DEFAULT_BLOCK_CELLS
+    ) -> np.ndarray:
+        """Dense (len(queries), doc_count) scores; docs outside ``filters`` score 0."""
+        n_docs = self.doc_count
+        scores = np.zeros((len(queries), n_docs), dtype=np.float64)
+        if not n_docs or not len(queries):
+            return scores
+        mask = self.filter_mask(filters)
+        doc_count = int(mask.sum()) or 1
+        idf_cache: Dict[int, float] = {}
+
+        def idf(term: int) -> float:
+            # math.log, not np.log, so the value is the one the runtime computes
+            if term not in idf_cache:
+                df = int(self.doc_freq[term])
+                idf_cache[term] = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            return idf_cache[term]
+
+        rows = max(1, block_cells // n_docs)
+        for start in range(0, len(queries), rows):
+            block = queries[start : start + rows]
+            owners: List[int] = []
+            terms: List[int] = []
+            for row, query in enumerate(block):
+                ids = self._query_terms(query)
+                owners.extend([row] * len(ids))
+                terms.extend(ids)
+            if not terms:
+                continue
+            term_array = np.asarray(terms, dtype=np.int64)
+            starts = self.indptr[term_array]
+            counts = self.indptr[term_array + 1] - starts
+            # postings of every (query, token) pair, laid out in token order
+            total = int(counts.sum())
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            docs = self.docs[offsets]
+            contributions = np.repeat(np.fromiter(map(idf, terms), np.float64, len(terms)), counts) * self.weights[offsets]
+            bins = np.repeat(np.asarray(owners, dtype=np.int64), counts) * n_docs + docs
+            block_scores = np.bincount(bins, weights=contributions, minlength=len(block) * n_docs)
+            scores[start : start + len(block)] = block_scores.reshape(len(block), n_docs)
+        scores[:, ~mask] = 0
+        return scores
+
+    def rank_batch(
+        self, queries: Sequence[str], top_k: Optional[int] = None, filters: Filters = None
+    ) -> List[List[Tuple[int, float]]]:
+        """Per query, the (doc, score) pairs with a positive score, best first,
+        truncated to ``top_k`` when given."""
+        scores = self.score_batch(queries, filters)
+        if not scores.size:
+            return [[] for _ in queries]
+        # stable, so ties keep chunk order like Array.prototype.sort
+        order = np.argsort(-scores, axis=1, kind="stable")
+        if top_k is not None:
+            order = order[:, :top_k]
+        ranked = np.take_along_axis(scores, order, axis=1)
+        return [
+            [(doc, score) for doc, score in zip(doc_row, score_row) if score > 0]
+            for doc_row, score_row in zip(order.tolist(), ranked.tolist())
+        ]
+
+    def query_batch(self, items: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Run ``{query, topK, filters}`` items; queries sharing filters and topK are
+        scored together. Hits are chunk records with a ``score``, as ``RagIndex.query``."""
+        groups: Dict[str, List[int]] = {}
+        for n, item in enumerate(items):
+            top_k = max(1, min(25, 6 if item.get("topK") is None else item["topK"]))
+            key = json.dumps([top_k, item.get("filters") or None], sort_keys=True)
+            groups.setdefault(key, []).append(n)
+        results: List[List[Dict[str, Any]]] = [[] for _ in items]
+        for key, members in groups.items():
+            top_k, filters = json.loads(key)
+            ranked = self.rank_batch([items[n].get("query") or "" for n in members], top_k, filters)
+            for n, hits in zip(members, ranked):
+                results[n] = [
+                    {**self.chunks[int(self.positions[doc])], "score": score} for doc, score in hits
+                ]
+        return results
+
+
+def load_retriever(chunks_jsonl: str, prebuilt_json: str = "") -> BatchRetriever:
+    chunks = load_chunks_jsonl(chunks_jsonl)
+    if prebuilt_json:
+        prebuilt = json.loads(Path(prebuilt_json).read_text(encoding="utf-8"))
+        return BatchRetriever.from_prebuilt(chunks, prebuilt, sha256_file(chunks_jsonl))
+    return BatchRetriever.build(chunks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score a query set against a chunks JSONL file in batches")
+    parser.add_argument("--chunks", required=True)
+    parser.add_argument("--prebuilt", default="", help="Prebuilt BM25 index for the chunks (skips tokenization)")
+    parser.add_argument("--queries", required=True, help="JSON list of {query, topK, filters}")
+    parser.add_argument("--out", default="", help="Write the hits here instead of stdout")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    retriever = load_retriever(args.chunks, args.prebuilt)
+    loaded = time.perf_counter()
+    items = json.loads(Path(args.queries).read_text(encoding="utf-8"))
+    hits = retriever.query_batch(items)
+    done = time.perf_counter()
+
+    results = json.dumps([[{"id": hit.get("id"), "score": hit["score"]} for hit in row] for row in hits])
+    if args.out:
+        Path(args.out).write_text(results + "\n", encoding="utf-8")
+    else:
+        print(results)
+    print(
+        json.dumps(
+            {
+                "docs": retriever.doc_count,
+                "terms": len(retriever.term_ids),
+                "queries": len(items),
+                "load_s": round(loaded - start, 4),
+                "query_s": round(done - loaded, 4),
+            }
+        ),
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""Local asyncio stand-in for the worker's RAG routes (workers/worker.ts).
+
+Serves the generated artifacts with the request and response shapes of the
+worker, so the client and load tests can run without wrangler:
+
+    POST /api/rag/chunks     {ids, limit} -> {chunks}; aliases resolve like
+                             getSocrataRagChunksById
+    POST /api/rag/query      {query, topK, filters} -> {hits} (rag_bm25 scoring)
+    GET  /api/rag/chunks     ?ids=a,b&limit=n or ?doc_id=x (local only)
+    GET  /api/rag/endpoints  ?doc_id=x -> {endpoints} (local only)
+    GET  /api/rag/stats      request, latency and cache counters (local only)
+
+Chunks are held in memory with an id index (last record wins, like the worker's
+chunk map) and a doc_id index. Responses are cached in an LRU keyed by route
+and normalized request, evicted by total body bytes, and carry a content
+ETag; a matching If-None-Match gets a 304 without a body. Given a loader, the
+server polls the artifact files it was built from and swaps in a fresh catalog
+when any of them changes (e.g. under ``parse_discovery_api.py --watch``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import sys
+import time
+from collections import OrderedDict, deque
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from rag_bm25 import Bm25Index, load_chunks_jsonl
+
+
+# Keep in sync with MAX_RAG_QUERY_BODY_BYTES / MAX_RAG_CHUNK_IDS in workers/worker.ts.
+MAX_RAG_QUERY_BODY_BYTES = 12_000
+MAX_RAG_CHUNK_IDS = 24
+MAX_RAG_TOP_K = 20
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8788
+DEFAULT_CACHE_BYTES = 8 << 20
+LATENCY_WINDOW = 10_000
+RELOAD_POLL_INTERVAL = 0.2
+MAX_HEADER_BYTES = 16_384
+
+REASONS = {
+    200: "OK",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization, If-Match, If-None-Match",
+    "Access-Control-Expose-Headers": "ETag",
+}
+
+Response = Tuple[int, Dict[str, str], bytes]
+FileSignature = Optional[Tuple[int, int]]
+
+
+def clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+def js_number(value: Any, default: float) -> float:
+    """``Number(value ?? default)`` for the JSON values a request can carry;
+    anything non-numeric falls back to ``default``."""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            number = float(value.strip() or 0)
+        except ValueError:
+            return default
+        return number if math.isfinite(number) else default
+    return default
+
+
+def encode_json(body: Any) -> bytes:
+    """Compact, non-ASCII-preserving JSON like ``JSON.stringify``."""
+    return json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def file_signature(path: str) -> FileSignature:
+    """(mtime_ns, size), or None for a missing file."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ChunkCatalog:
+    """Chunks and endpoint records held in memory, indexed for the routes."""
+
+    def __init__(
+        self,
+        chunks: List[Dict[str, Any]],
+        *,
+        aliases: Optional[Dict[str, str]] = None,
+        endpoints: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        paths: Iterable[str] = (),
+    ) -> None:
+        self.chunks = chunks
+        # files the catalog was loaded from, polled for reloads
+        self.paths = list(paths)
+        self.aliases = aliases or {}
+        self.endpoints = endpoints or {}
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_doc: Dict[str, List[Dict[str, Any]]] = {}
+        for chunk in chunks:
+            self.by_id[chunk.get("id")] = chunk
+            self.by_doc.setdefault(chunk.get("doc_id") or "", []).append(chunk)
+        self.index = Bm25Index.build(chunks)
+
+    @classmethod
+    def from_files(
+        cls,
+        chunks_paths: Iterable[str],
+        *,
+        aliases_paths: Iterable[str] = (),
+        endpoints_paths: Optional[Dict[str, str]] = None,
+    ) -> "ChunkCatalog":
+        chunks_paths = list(chunks_paths)
+        aliases_paths = list(aliases_paths)
+        chunks: List[Dict[str, Any]] = []
+        for path in chunks_paths:
+            chunks.extend(load_chunks_jsonl(path))
+        aliases: Dict[str, str] = {}
+        for path in aliases_paths:
+            if Path(path).exists():
+                aliases.update(json.loads(Path(path).read_text(encoding="utf-8")).get("aliases") or {})
+        endpoints = {
+            doc_id: load_chunks_jsonl(path)
+            for doc_id, path in (endpoints_paths or {}).items()
+            if path and Path(path).exists()
+        }
+        paths = chunks_paths + aliases_paths + [path for path in (endpoints_paths or {}).values() if path]
+        return cls(chunks, aliases=aliases, endpoints=endpoints, paths=paths)
+
+    @classmethod
+    def from_index(cls, index_path: str) -> "ChunkCatalog":
+        """What the worker serves for a RAG index file: its bundles (or, without
+        any, every document's chunks), plus each document's endpoints."""
+        index = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        artifacts = index.get("artifacts", [])
+        documents = [a for a in artifacts if isinstance(a.get("source_file"), str)]
+        bundles = [a for a in artifacts if isinstance(a.get("source_file"), list)]
+        catalog = cls.from_files(
+            [a["chunks_jsonl"] for a in bundles or documents],
+            aliases_paths=[a["aliases_json"] for a in bundles if a.get("aliases_json")],
+            endpoints_paths={a["doc_id"]: a["endpoints_jsonl"] for a in documents if a.get("endpoints_jsonl")},
+        )
+        catalog.paths.append(index_path)
+        return catalog
+
+    def chunks_by_id(self, ids: Iterable[str], limit: float = MAX_RAG_CHUNK_IDS) -> List[Dict[str, Any]]:
+        """``getSocrataRagChunksById``: trimmed, alias-resolved, de-duplicated ids
+        up to ``limit``, in request order; unknown ids are skipped."""
+        unique: List[str] = []
+        seen = set()
+        for raw in ids:
+            trimmed = (raw or "").strip()
+            value = self.aliases.get(trimmed, trimmed)
+            if not value or value in seen:
+                continue
+            seen.add(value)
+            unique.append(value)
+            if len(unique) >= limit:
+                break
+        return [self.by_id[value] for value in unique if value in self.by_id]
+
+    def chunks_by_doc(self, doc_id: str) -> List[Dict[str, Any]]:
+        return self.by_doc.get(doc_id, [])
+
+
+class ResponseCache:
+    """LRU of encoded responses, evicted once the cached bodies exceed ``max_bytes``."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        size = len(key) + len(body)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(key) + len(old[1])
+        self._entries[key] = (etag, body)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            old_key, (_, old_body) = self._entries.popitem(last=False)
+            self.bytes -= len(old_key) + len(old_body)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+class ServerStats:
+    """Request counters with latency percentiles over the last ``LATENCY_WINDOW``
+    requests per route and throughput since start."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.requests = 0
+        self.bytes_out = 0
+        self.status: Dict[str, int] = {}
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        self.connections = 0
+        self.open_connections = 0
+
+    def record(self, route: str, status: int, seconds: float, body_bytes: int) -> None:
+        self.requests += 1
+        self.bytes_out += body_bytes
+        self.status[str(status)] = self.status.get(str(status), 0) + 1
+        entry = self.routes.get(route)
+        if entry is None:
+            entry = self.routes[route] = {"count": 0, "total_s": 0.0, "max_s": 0.0, "window": deque(maxlen=LATENCY_WINDOW)}
+        entry["count"] += 1
+        entry["total_s"] += seconds
+        entry["max_s"] = max(entry["max_s"], seconds)
+        entry["window"].append(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        uptime = time.monotonic() - self.started
+        routes = {}
+        for route, entry in sorted(self.routes.items()):
+            window: Deque[float] = entry["window"]
+            ordered = sorted(window)
+            routes[route] = {
+                "count": entry["count"],
+                "mean_ms": round(entry["total_s"] / entry["count"] * 1000, 3),
+                "max_ms": round(entry["max_s"] * 1000, 3),
+                **{
+                    f"p{q}_ms": round(percentile(ordered, q / 100) * 1000, 3)
+                    for q in (50, 95, 99)
+                },
+            }
+        return {
+            "uptime_s": round(uptime, 3),
+            "requests": self.requests,
+            "requests_per_s": round(self.requests / uptime, 2) if uptime else None,
+            "bytes_out": self.bytes_out,
+            "connections": self.connections,
+            "open_connections": self.open_connections,
+            "status": dict(sorted(self.status.items())),
+            "routes": routes,
+        }
+
+
+class ChunkServer:
+    """Request handling for the RAG routes, independent of the socket layer."""
+
+    def __init__(
+        self,
+        catalog: ChunkCatalog,
+        *,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        loader: Optional[Callable[[], ChunkCatalog]] = None,
+    ) -> None:
+        self.catalog = catalog
+        self.cache = ResponseCache(cache_bytes)
+        self.stats = ServerStats()
+        self.loader = loader
+        self.reloads = 0
+
+    def reload(self, catalog: ChunkCatalog) -> None:
+        """Swap in rebuilt artifacts; cached responses are dropped with the old ones."""
+        self.catalog = catalog
+        self.cache.clear()
+        self.reloads += 1
+
+    async def reload_on_change(self, interval: float = RELOAD_POLL_INTERVAL) -> None:
+        """Poll the catalog's files and reload through ``loader`` when they change.
+        Loading runs in a thread; the swap happens on the event loop."""
+        loop = asyncio.get_running_loop()
+        seen = [file_signature(path) for path in self.catalog.paths]
+        while True:
+            await asyncio.sleep(interval)
+            current = [file_signature(path) for path in self.catalog.paths]
+            if current == seen:
+                continue
+            start = time.perf_counter()
+            try:
+                catalog = await loop.run_in_executor(None, self.loader)
+            except (OSError, ValueError, KeyError) as exc:
+                print(f"reload failed: {exc}", file=sys.stderr)
+                seen = current
+                continue
+            self.reload(catalog)
+            seen = [file_signature(path) for path in catalog.paths]
+            print(
+                f"reloaded {len(catalog.chunks)} chunks in {time.perf_counter() - start:.3f}s",
+                file=sys.stderr,
+            )
+
+    def json_response(self, body: Any, status: int = 200) -> Response:
+        return status, {"Content-Type": "application/json"}, encode_json(body)
+
+    def cached(self, key: str, build, if_none_match: str) -> Response:
+        entry = self.cache.get(key)
+        if entry is None:
+            status, headers, body = build()
+            if status != 200:
+                return status, headers, body
+            entry = (etag_for(body), body)
+            self.cache.put(key, *entry)
+        etag, body = entry
+        headers = {"Content-Type": "application/json", "ETag": etag}
+        if etag_matches(if_none_match, etag):
+            return 304, headers, b""
+        return 200, headers, body
+
+    def handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[str, Response]:
+        """(route label for the counters, response) for one request."""
+        url = urlsplit(target)
+        path = url.path
+        if method == "OPTIONS":
+            return "options", (204, {}, b"")
+        if_none_match = headers.get("if-none-match", "")
+
+        if path == "/api/rag/stats":
+            if method != "GET":
+                return path, self.json_response({"error": "Method not allowed"}, 405)
+            return path, self.json_response(
+                {"stats": self.stats.to_dict(), "cache": self.cache.to_dict(), "reloads": self.reloads}
+            )
+
+        if path == "/api/rag/chunks":
+            if method == "GET":
+                params = parse_qs(url.query)
+                doc_id = (params.get("doc_id") or [""])[0]
+                if doc_id:
+                    return path, self.cached(
+                        "doc\0" + doc_id,
+                        lambda: self.json_response({"chunks": self.catalog.chunks_by_doc(doc_id)}),
+                        if_none_match,
+                    )
+                ids = [value for raw in params.get("ids", []) for value in raw.split(",")]
+                return path, self.chunks_response(ids, (params.get("limit") or [None])[0], if_none_match)
+            if method != "POST":
+                return path, self.json_response({"error": "Method not allowed"}, 405)
+            data, error = self.read_json(body)
+            if error:
+                return path, self.json_response({"error": error}, 400)
+            raw_ids = data.get("ids") if isinstance(data, dict) and isinstance(data.get("ids"), list) else []
+            limit = data.get("limit") if isinstance(data, dict) else None
+            return path, self.chunks_response([v for v in raw_ids if isinstance(v, str)], limit, if_none_match)
+
+        if path == "/api/rag/query":
+            if method != "POST":
+                return path, self.json_response({"error": "Method not allowed"}, 405)
+            data, error = self.read_json(body)
+            if error:
+                return path, self.json_response({"error": error}, 400)
+            data = data if isinstance(data, dict) else {}
+            query = data["query"].strip() if isinstance(data.get("query"), str) else ""
+            if not query:
+                return path, self.json_response({"error": "Query required."}, 400)
+            top_k = int(clamp(js_number(data.get("topK"), 6), 1, MAX_RAG_TOP_K))
+            raw_filters = data.get("filters") if isinstance(data.get("filters"), dict) else {}
+            filters = {
+                name: [v for v in raw_filters.get(name) or [] if isinstance(v, str)]
+                if isinstance(raw_filters.get(name), list)
+                else []
+                for name in ("docIds", "sourceFiles", "types", "tags")
+            }
+            key = "query\0" + encode_json([query, top_k, filters]).decode("utf-8")
+            return path, self.cached(
+                key,
+                lambda: self.json_response({"hits": self.catalog.index.query(query, top_k, filters)}),
+                if_none_match,
+            )
+
+        if path == "/api/rag/endpoints":
+            if method != "GET":
+                return path, self.json_response({"error": "Method not allowed"}, 405)
+            doc_id = (parse_qs(url.query).get("doc_id") or [""])[0]
+            if doc_id and doc_id not in self.catalog.endpoints:
+                return path, self.json_response({"error": "Unknown doc_id."}, 404)
+            return path, self.cached(
+                "endpoints\0" + doc_id,
+                lambda: self.json_response(
+                    {"endpoints": self.catalog.endpoints[doc_id]}
+                    if doc_id
+                    else {"endpoints": [e for records in self.catalog.endpoints.values() for e in records]}
+                ),
+                if_none_match,
+            )
+
+        return "other", self.json_response({"error": "Not found"}, 404)
+
+    def read_json(self, body: bytes) -> Tuple[Any, str]:
+        if len(body) > MAX_RAG_QUERY_BODY_BYTES:
+            return None, "Request body too large."
+        try:
+            return json.loads(body.decode("utf-8")), ""
+        except ValueError:
+            return None, "Invalid JSON payload."
+
+    def chunks_response(self, ids: List[str], raw_limit: Any, if_none_match: str) -> Response:
+        if not ids:
+            return self.json_response({"error": "Chunk ids required."}, 400)
+        limit = clamp(js_number(raw_limit, MAX_RAG_CHUNK_IDS), 1, MAX_RAG_CHUNK_IDS)
+        # the key is the resolved id list, so spellings of the same request share an entry
+        resolved = [chunk.get("id") for chunk in self.catalog.chunks_by_id(ids, limit)]
+        return self.cached(
+            "chunks\0" + "\0".join(resolved),
+            lambda: self.json_response({"chunks": [self.catalog.by_id[value] for value in resolved]}),
+            if_none_match,
+        )
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        self.stats.open_connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                start = time.perf_counter()
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers: Dict[str, str] = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_RAG_QUERY_BODY_BYTES:
+                    # answered without reading the body, so the connection cannot be reused
+                    route, (status, extra, body) = "oversized", self.json_response({"error": "Request body too large."}, 400)
+                    keep_alive = False
+                else:
+                    payload = await reader.readexactly(length) if length else b""
+                    route, (status, extra, body) = self.handle(method.upper(), target, headers, payload)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                origin = headers.get("origin")
+                response_headers = {"Access-Control-Allow-Origin": origin or "*", **CORS_HEADERS, **extra}
+                response_headers["Content-Length"] = str(len(body))
+                response_headers["Connection"] = "keep-alive" if keep_alive else "close"
+                out = [f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}"]
+                out.extend(f"{name}: {value}" for name, value in response_headers.items())
+                writer.write(("\r\n".join(out) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                self.stats.record(route, status, time.perf_counter() - start, len(body))
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            return
+        finally:
+            self.stats.open_connections -= 1
+            writer.close()
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        bound = ", ".join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+        print(
+            f"serving {len(self.catalog.chunks)} chunks and {len(self.catalog.endpoints)} endpoint sets on {bound}",
+            file=sys.stderr,
+        )
+        if self.loader is not None:
+            # held so the task is not garbage-collected while it runs
+            self._reload_task = asyncio.create_task(self.reload_on_change())
+        async with server:
+            await server.serve_forever()
+
+
+def parse_address(value: str) -> Tuple[str, int]:
+    """``PORT`` or ``HOST:PORT``."""
+    host, sep, port = value.rpartition(":")
+    return (host if sep and host else DEFAULT_HOST), int(port)
+
+
+def serve(
+    catalog: ChunkCatalog,
+    address: str = str(DEFAULT_PORT),
+    *,
+    cache_bytes: int = DEFAULT_CACHE_BYTES,
+    loader: Optional[Callable[[], ChunkCatalog]] = None,
+) -> None:
+    """Run the server until interrupted, then print the counters. With ``loader``
+    the catalog is reloaded whenever its files change."""
+    host, port = parse_address(address)
+    server = ChunkServer(catalog, cache_bytes=cache_bytes, loader=loader)
+    try:
+        asyncio.run(server.serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps({"stats": server.stats.to_dict(), "cache": server.cache.to_dict()}), file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve RAG artifacts with the worker's /api/rag/* request shapes")
+    parser.add_argument("--index", default="docs/Socrata.rag.index.json", help="RAG index file to serve")
+    parser.add_argument("--chunks", action="append", default=[], help="Serve these chunks JSONL files instead of --index")
+    parser.add_argument("--aliases", action="append", default=[], help="Alias reports for --chunks")
+    parser.add_argument("--listen", default=str(DEFAULT_PORT), help="PORT or HOST:PORT")
+    parser.add_argument("--cache-bytes", type=int, default=DEFAULT_CACHE_BYTES, help="Response cache budget")
+    parser.add_argument("--reload", action="store_true", help="Reload whenever the served artifacts change")
+    args = parser.parse_args()
+
+    if args.chunks:
+        loader = partial(ChunkCatalog.from_files, args.chunks, aliases_paths=args.aliases)
+    else:
+        loader = partial(ChunkCatalog.from_index, args.index)
+    serve(loader(), args.listen, cache_bytes=args.cache_bytes, loader=loader if args.reload else None)
+
+
+if __name__ == "__main__":
+    main()
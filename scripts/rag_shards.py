@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Chunk shards of a RAG bundle, one per (doc_id, type), with a manifest.
+
+A consumer that only needs some documents or chunk types (the planner mostly
+touches Discovery endpoints) reads the manifest, picks the shards its
+``RagQueryFilters`` can match and fetches and indexes just those, instead of the
+whole bundle. Shard lines are copied byte for byte from the bundle, in bundle
+order, and each shard is listed with its chunk count, byte size and SHA-256, plus
+the source files and tags of its chunks so ``sourceFiles`` and ``tags`` filters
+can rule shards out too. Shards and manifest are written in first-seen order of
+their (doc_id, type), so the same bundle always yields the same bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+SHARD_MANIFEST_VERSION = 1
+UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+Filters = Optional[Dict[str, List[str]]]
+
+
+def shard_name(doc_id: Optional[str], chunk_type: Optional[str]) -> str:
+    """File name of a shard; ids missing from a chunk are spelled ``_``."""
+    parts = [UNSAFE_NAME_RE.sub("_", value) if value else "_" for value in (doc_id, chunk_type)]
+    return ".".join(parts) + ".jsonl"
+
+
+def split_bundle(bundle_path: str) -> Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]]:
+    """{(doc_id, type): {"lines", "source_files", "tags"}} in first-seen order."""
+    shards: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+    with Path(bundle_path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                chunk = json.loads(line)
+            except ValueError:
+                continue
+            shard = shards.setdefault(
+                (chunk.get("doc_id"), chunk.get("type")), {"lines": [], "source_files": set(), "tags": set()}
+            )
+            shard["lines"].append(line if line.endswith("\n") else line + "\n")
+            if chunk.get("source_file"):
+                shard["source_files"].add(chunk["source_file"])
+            shard["tags"].update(chunk.get("tags") or [])
+    return shards
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    if path.exists() and path.read_bytes() == content:
+        return False
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return True
+
+
+def write_shards(
+    bundle_path: str, shards_dir: str, manifest_path: str, *, aliases_path: Optional[str] = None
+) -> List[str]:
+    """Split ``bundle_path`` into ``shards_dir`` and write the manifest. Files whose
+    bytes would not change are left alone, and shards the previous manifest listed
+    that no longer exist are removed; returns the paths written."""
+    out_dir = Path(shards_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(manifest_path) if Path(manifest_path).exists() else {"shards": []}
+    written: List[str] = []
+    entries: List[Dict[str, Any]] = []
+    names: Set[str] = set()
+    total_bytes = 0
+    bundle_hash = hashlib.sha256()
+    for (doc_id, chunk_type), shard in split_bundle(bundle_path).items():
+        name = shard_name(doc_id, chunk_type)
+        stem, n = name[: -len(".jsonl")], 2
+        while name in names:
+            name, n = f"{stem}-{n}.jsonl", n + 1
+        names.add(name)
+        content = "".join(shard["lines"]).encode("utf-8")
+        path = out_dir / name
+        if _write_if_changed(path, content):
+            written.append(str(path))
+        bundle_hash.update(content)
+        total_bytes += len(content)
+        entries.append(
+            {
+                "doc_id": doc_id,
+                "type": chunk_type,
+                "path": str(path),
+                "count": len(shard["lines"]),
+                "bytes": len(content),
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "source_files": sorted(shard["source_files"]),
+                "tags": sorted(shard["tags"]),
+            }
+        )
+
+    current = {entry["path"] for entry in entries}
+    for entry in previous.get("shards", []):
+        stale = Path(entry.get("path", ""))
+        if entry.get("path") and str(stale) not in current and stale.exists():
+            stale.unlink()
+
+    manifest: Dict[str, Any] = {
+        "version": SHARD_MANIFEST_VERSION,
+        "bundle": bundle_path,
+        "chunk_count": sum(entry["count"] for entry in entries),
+        "bytes": total_bytes,
+        # hash of the shards concatenated in manifest order
+        "sha256": bundle_hash.hexdigest(),
+        "shards": entries,
+    }
+    if aliases_path:
+        manifest["aliases_json"] = aliases_path
+    if _write_if_changed(Path(manifest_path), json.dumps(manifest, indent=2, ensure_ascii=True).encode("utf-8")):
+        written.append(manifest_path)
+    return written
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if manifest.get("version") != SHARD_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shard manifest version: {manifest.get('version')!r}")
+    return manifest
+
+
+def select_shards(manifest: Dict[str, Any], filters: Filters = None) -> List[Dict[str, Any]]:
+    """The shards that can hold a chunk matching ``filters`` (RagQueryFilters:
+    docIds, sourceFiles, types, tags), in manifest order."""
+    filters = filters or {}
+    wanted = {key: set(filters[key]) for key in ("docIds", "sourceFiles", "types", "tags") if filters.get(key)}
+
+    def matches(shard: Dict[str, Any]) -> bool:
+        if "docIds" in wanted and shard.get("doc_id") not in wanted["docIds"]:
+            return False
+        if "types" in wanted and shard.get("type") not in wanted["types"]:
+            return False
+        if "sourceFiles" in wanted and wanted["sourceFiles"].isdisjoint(shard.get("source_files", [])):
+            return False
+        if "tags" in wanted and wanted["tags"].isdisjoint(shard.get("tags", [])):
+            return False
+        return True
+
+    return [shard for shard in manifest.get("shards", []) if matches(shard)]
+
+
+def read_shard(shard: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The chunks of one shard; raises ValueError if its bytes no longer match
+    the manifest."""
+    content = Path(shard["path"]).read_bytes()
+    if hashlib.sha256(content).hexdigest() != shard["sha256"]:
+        raise ValueError(f"Shard {shard['path']} does not match its manifest hash")
+    return [json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()]
+
+
+def load_shard_chunks(manifest_path: str, filters: Filters = None) -> List[Dict[str, Any]]:
+    """The chunks of every shard ``filters`` selects, shard by shard."""
+    chunks: List[Dict[str, Any]] = []
+    for shard in select_shards(load_manifest(manifest_path), filters):
+        chunks.extend(read_shard(shard))
+    return chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundle", required=True, help="Chunks JSONL to shard")
+    parser.add_argument("--dir", required=True, help="Directory for the shard files")
+    parser.add_argument("--manifest", required=True, help="Where to write the shard manifest")
+    parser.add_argument("--aliases", default="", help="Dedup alias map of the bundle, recorded in the manifest")
+    args = parser.parse_args()
+
+    written = write_shards(args.bundle, args.dir, args.manifest, aliases_path=args.aliases or None)
+    manifest = load_manifest(args.manifest)
+    print(
+        json.dumps({"shards": len(manifest["shards"]), "chunks": manifest["chunk_count"], "written": written}),
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Normalized ("shared schema") form of the endpoint artifacts.
+
+Endpoints repeat the same ``{name, type, description}`` parameter and response
+field definitions over and over. The shared form stores each distinct
+definition once, in a ``params`` or ``fields`` table, and the endpoint's
+``request.<query|path|header|body>`` and ``response.fields`` lists hold indexes
+into it. Rehydrating restores the original records exactly, key order included.
+
+Two files are written, both compact (no indentation or spaces):
+
+    .rag.json          the document with ``shared_schema`` before ``sections``
+    .endpoints.jsonl   a ``{"type": "shared_schema", ...}`` line, then one line
+                       per endpoint record
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SHARED_SCHEMA_VERSION = 1
+PARAM_SECTIONS = ("query", "path", "header", "body")
+COMPACT = (",", ":")
+
+
+class SchemaTable:
+    """Distinct param and field definitions, numbered in first-seen order."""
+
+    def __init__(self) -> None:
+        self.params: List[Dict[str, Any]] = []
+        self.fields: List[Dict[str, Any]] = []
+        self._ids: Dict[str, int] = {}
+
+    def _intern(self, table: List[Dict[str, Any]], kind: str, definition: Dict[str, Any]) -> int:
+        # key order is part of the identity so rehydrated records serialize identically
+        key = kind + json.dumps(definition, ensure_ascii=True)
+        ref = self._ids.get(key)
+        if ref is None:
+            ref = self._ids[key] = len(table)
+            table.append(definition)
+        return ref
+
+    def intern_endpoint(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """A copy of ``endpoint`` whose params and fields are table indexes."""
+        out = dict(endpoint)
+        request = endpoint.get("request")
+        if isinstance(request, dict):
+            out["request"] = {
+                key: [self._intern(self.params, "param", p) for p in value] if key in PARAM_SECTIONS else value
+                for key, value in request.items()
+            }
+        response = endpoint.get("response")
+        if isinstance(response, dict) and "fields" in response:
+            out["response"] = dict(response, fields=[self._intern(self.fields, "field", f) for f in response["fields"]])
+        return out
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"version": SHARED_SCHEMA_VERSION, "params": self.params, "fields": self.fields}
+
+
+def rehydrate_endpoint(endpoint: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """The full record for an endpoint in the shared form."""
+    params, fields = schema["params"], schema["fields"]
+    out = dict(endpoint)
+    request = endpoint.get("request")
+    if isinstance(request, dict):
+        out["request"] = {
+            key: [params[ref] for ref in value] if key in PARAM_SECTIONS else value for key, value in request.items()
+        }
+    response = endpoint.get("response")
+    if isinstance(response, dict) and "fields" in response:
+        out["response"] = dict(response, fields=[fields[ref] for ref in response["fields"]])
+    return out
+
+
+def normalize_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """A .rag.json document in the shared form."""
+    table = SchemaTable()
+    endpoints = [table.intern_endpoint(endpoint) for endpoint in doc.get("endpoints", [])]
+    out: Dict[str, Any] = {}
+    for key, value in doc.items():
+        if key == "sections":
+            out["shared_schema"] = table.to_json()
+        out[key] = endpoints if key == "endpoints" else value
+    out.setdefault("shared_schema", table.to_json())
+    return out
+
+
+def rehydrate_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """The original .rag.json document for one in the shared form."""
+    schema = doc.get("shared_schema")
+    if schema is None:
+        return doc
+    check_version(schema)
+    return {
+        key: [rehydrate_endpoint(e, schema) for e in value] if key == "endpoints" else value
+        for key, value in doc.items()
+        if key != "shared_schema"
+    }
+
+
+def check_version(schema: Dict[str, Any]) -> None:
+    if schema.get("version") != SHARED_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported shared schema version: {schema.get('version')!r}")
+
+
+def normalize_endpoint_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Endpoint JSONL records in the shared form, schema line first."""
+    table = SchemaTable()
+    interned = [table.intern_endpoint(record) for record in records]
+    return [{"type": "shared_schema", **table.to_json()}] + interned
+
+
+def rehydrate_endpoint_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Full endpoint records from shared-form JSONL records (plain records pass through)."""
+    schema: Optional[Dict[str, Any]] = None
+    out: List[Dict[str, Any]] = []
+    for record in records:
+        if record.get("type") == "shared_schema":
+            check_version(record)
+            schema = record
+        elif schema is not None:
+            out.append(rehydrate_endpoint(record, schema))
+        else:
+            out.append(record)
+    return out
+
+
+def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+    with Path(path).open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write_atomic(path: str, content: str) -> None:
+    tmp = Path(path).with_name(Path(path).name + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_shared_json(rag_json: str, out_path: str) -> None:
+    doc = json.loads(Path(rag_json).read_text(encoding="utf-8"))
+    _write_atomic(out_path, json.dumps(normalize_document(doc), separators=COMPACT, ensure_ascii=True))
+
+
+def write_shared_endpoints_jsonl(endpoints_jsonl: str, out_path: str) -> None:
+    records = normalize_endpoint_records(_read_jsonl(endpoints_jsonl))
+    _write_atomic(out_path, "".join(json.dumps(r, separators=COMPACT, ensure_ascii=True) + "\n" for r in records))
+
+
+def load_shared_json(path: str) -> Dict[str, Any]:
+    """Read a .rag.json in either form and return the full document."""
+    return rehydrate_document(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def load_shared_endpoints_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Read an endpoints JSONL in either form and return the full records."""
+    return rehydrate_endpoint_records(_read_jsonl(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rag-json", default="", help=".rag.json to normalize")
+    parser.add_argument("--out-json", default="", help="Where to write its shared form")
+    parser.add_argument("--endpoints-jsonl", default="", help="Endpoints JSONL to normalize")
+    parser.add_argument("--out-endpoints-jsonl", default="", help="Where to write its shared form")
+    args = parser.parse_args()
+    if bool(args.rag_json) != bool(args.out_json) or bool(args.endpoints_jsonl) != bool(args.out_endpoints_jsonl):
+        parser.error("each input needs its --out-* path")
+
+    stats: Dict[str, Any] = {}
+    for src, out, write in (
+        (args.rag_json, args.out_json, write_shared_json),
+        (args.endpoints_jsonl, args.out_endpoints_jsonl, write_shared_endpoints_jsonl),
+    ):
+        if src:
+            write(src, out)
+            stats[out] = {"bytes": os.path.getsize(out), "source_bytes": os.path.getsize(src)}
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
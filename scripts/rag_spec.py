@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Parameter and field inverted index for a RAG bundle, and the planner spec.
+
+The index maps every documented query parameter name to the endpoints that
+accept it and the bundle chunks that document it, and every response field name
+to the endpoints that return it and the chunks that describe it. Chunk ids are
+resolved through the bundle's dedup aliases, so each one names a chunk that is
+actually in the bundle.
+
+``data/socrataRagSpec.json`` (and its ``.ts`` twin) is emitted from that index:
+``allowedParams`` are its parameter names, ``paramChunkIds`` lets the planner
+cite the chunks behind each parameter it uses without scanning chunk text, and
+the pagination limits are read from the Discovery docs together with the chunks
+they came from.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rag_bm25 import load_chunks_jsonl
+
+
+SPEC_VERSION = 1
+PARAM_INDEX_VERSION = 1
+DISCOVERY_DOC_ID = "socrata_discovery"
+SODA_DOC_ID = "socrata_soda_api"
+
+CATALOG_BASE_URLS = {
+    "us": "https://api.us.socrata.com/api/catalog/v1",
+    "eu": "https://api.eu.socrata.com/api/catalog/v1",
+}
+SODA_V2_PATHS = {"resourcePath": "/resource/{id}.json"}
+SODA_V3_PATHS = {"queryPath": "/api/v3/views/{id}/query.json", "exportPath": "/api/v3/views/{id}/export.csv"}
+
+# Parameters the planner sends on every discovery request; the first chunk that
+# documents each (and the chunks stating the pagination limits) are its default
+# citations.
+DISCOVERY_CORE_PARAMS = ("q", "search_context", "limit", "offset", "scroll_id")
+PAGINATION_PATTERNS = {
+    "defaultLimit": re.compile(r"by default, we will return at most (\d+) results", re.I),
+    "maxOffsetPlusLimit": re.compile(r"sum of the offset and limit parameters is greater than (\d+)", re.I),
+}
+# The SODA manual has no endpoint records, so its citations are still picked by text.
+SODA_CHUNK_PATTERNS = {
+    "v2": re.compile(r"/resource/", re.I),
+    "v3": re.compile(r"api/v3/views", re.I),
+}
+SODA_CHUNK_LIMIT = 8
+
+
+def is_param_name(name: str) -> bool:
+    """Rejects parameter-table rows the parser mistook for names (constraints, prose)."""
+    if not name or name.lower().startswith("constraints"):
+        return False
+    return ":" not in name and not re.search(r"\s", name)
+
+
+def path_query_params(path: str) -> List[str]:
+    """Parameter names in the query string of an endpoint path template."""
+    if "?" not in path:
+        return []
+    names = [part.split("=")[0].strip() for part in path.split("?", 1)[1].split("&")]
+    return [name for name in names if is_param_name(name)]
+
+
+def documents(chunk_text: str, name: str) -> bool:
+    """True if a params or fields chunk has the ``- name (type): ...`` line for ``name``."""
+    return re.search(rf"^- {re.escape(name)} \(", chunk_text, re.M) is not None
+
+
+def _append_unique(values: List[str], items: Iterable[str]) -> None:
+    for item in items:
+        if item not in values:
+            values.append(item)
+
+
+def build_param_index(
+    endpoints: Sequence[Dict[str, Any]],
+    chunks: Sequence[Dict[str, Any]],
+    aliases: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """{"params": {name: {"endpoints", "chunk_ids"}}, "fields": {...}} over parsed
+    endpoint records and the bundle chunks built from them.
+
+    A query parameter is documented by the request-params chunks that list it and,
+    when it appears in the endpoint's path template, by the summary chunk that
+    shows the path; a field by the response-fields chunks that list it.
+    """
+    aliases = aliases or {}
+    by_id = {chunk.get("id"): chunk for chunk in chunks}
+
+    def endpoint_chunks(endpoint_id: str, kind: str) -> List[Dict[str, Any]]:
+        # same numbering as parse_discovery_api.endpoint_chunks; dropped ids resolve to their survivor
+        found: List[Dict[str, Any]] = []
+        n = 1
+        while True:
+            chunk_id = f"endpoint-{endpoint_id}-{kind}-{n}"
+            resolved = chunk_id if chunk_id in by_id else aliases.get(chunk_id)
+            if resolved not in by_id:
+                return found
+            found.append(by_id[resolved])
+            n += 1
+
+    params: Dict[str, Dict[str, List[str]]] = {}
+    fields: Dict[str, Dict[str, List[str]]] = {}
+
+    def add(table: Dict[str, Dict[str, List[str]]], name: str, endpoint_id: str, chunk_ids: Iterable[str]) -> None:
+        entry = table.setdefault(name, {"endpoints": [], "chunk_ids": []})
+        _append_unique(entry["endpoints"], [endpoint_id])
+        _append_unique(entry["chunk_ids"], chunk_ids)
+
+    for endpoint in endpoints:
+        endpoint_id = endpoint.get("id")
+        if not endpoint_id:
+            continue
+        query_chunks = endpoint_chunks(endpoint_id, "req-query")
+        for param in endpoint.get("request", {}).get("query", []):
+            name = (param.get("name") or "").strip()
+            if is_param_name(name):
+                add(params, name, endpoint_id, [c["id"] for c in query_chunks if documents(c.get("text", ""), name)])
+        summary = endpoint_chunks(endpoint_id, "summary")[:1]
+        for name in path_query_params(endpoint.get("path") or ""):
+            add(params, name, endpoint_id, [c["id"] for c in summary])
+        response_chunks = endpoint_chunks(endpoint_id, "resp")
+        for field in endpoint.get("response", {}).get("fields", []):
+            name = (field.get("name") or "").strip()
+            if name:
+                add(fields, name, endpoint_id, [c["id"] for c in response_chunks if documents(c.get("text", ""), name)])
+
+    return {
+        "version": PARAM_INDEX_VERSION,
+        "params": dict(sorted(params.items())),
+        "fields": dict(sorted(fields.items())),
+    }
+
+
+def discovery_pagination(chunks: Sequence[Dict[str, Any]]) -> Tuple[Dict[str, int], List[str]]:
+    """Pagination limits stated in the Discovery chunks, and the ids of the chunks
+    that state them. Raises ValueError if the docs no longer state one."""
+    pagination: Dict[str, int] = {}
+    chunk_ids: List[str] = []
+    for key, pattern in PAGINATION_PATTERNS.items():
+        for chunk in chunks:
+            if chunk.get("doc_id") != DISCOVERY_DOC_ID:
+                continue
+            match = pattern.search(chunk.get("text") or "")
+            if match:
+                pagination[key] = int(match.group(1))
+                _append_unique(chunk_ids, [chunk["id"]])
+                break
+        else:
+            raise ValueError(f"Discovery docs do not state the pagination {key}")
+    return pagination, chunk_ids
+
+
+def soda_chunk_ids(chunks: Sequence[Dict[str, Any]], pattern: re.Pattern) -> List[str]:
+    hits = [chunk.get("id") for chunk in chunks if chunk.get("doc_id") == SODA_DOC_ID and pattern.search(chunk.get("text") or "")]
+    ids: List[str] = []
+    _append_unique(ids, [chunk_id for chunk_id in hits[:SODA_CHUNK_LIMIT] if chunk_id])
+    return ids
+
+
+def build_spec(param_index: Dict[str, Any], chunks: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """The planner spec (see services/socrataRagPlanner.ts) for an inverted index
+    and the bundle chunks it points into."""
+    params = param_index["params"]
+    pagination, pagination_chunks = discovery_pagination(chunks)
+    source_chunks: List[str] = []
+    for name in DISCOVERY_CORE_PARAMS:
+        _append_unique(source_chunks, params.get(name, {}).get("chunk_ids", [])[:1])
+    _append_unique(source_chunks, pagination_chunks)
+    return {
+        "version": SPEC_VERSION,
+        "discovery": {
+            "catalogBaseUrls": dict(CATALOG_BASE_URLS),
+            "allowedParams": sorted(params),
+            "pagination": pagination,
+            "sourceChunkIds": source_chunks,
+            "paramChunkIds": {name: entry["chunk_ids"] for name, entry in params.items()},
+        },
+        "soda": {
+            "v2": {**SODA_V2_PATHS, "sourceChunkIds": soda_chunk_ids(chunks, SODA_CHUNK_PATTERNS["v2"])},
+            "v3": {**SODA_V3_PATHS, "sourceChunkIds": soda_chunk_ids(chunks, SODA_CHUNK_PATTERNS["v3"])},
+        },
+    }
+
+
+def load_aliases(path: Optional[str]) -> Dict[str, str]:
+    if not path or not Path(path).exists():
+        return {}
+    return json.loads(Path(path).read_text(encoding="utf-8")).get("aliases", {})
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    target = Path(path)
+    if target.exists() and target.read_text(encoding="utf-8") == content:
+        return False
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, target)
+    return True
+
+
+def write_spec_artifacts(
+    bundle_path: str,
+    endpoints_paths: Sequence[str],
+    *,
+    aliases_path: Optional[str] = None,
+    params_json: Optional[str] = None,
+    spec_json: Optional[str] = None,
+    spec_ts: Optional[str] = None,
+) -> List[str]:
+    """Build the inverted index over a bundle and write it and the spec (JSON and
+    a TypeScript module exporting it). Files whose bytes would not change are left
+    alone; returns the paths written."""
+    endpoints: List[Dict[str, Any]] = []
+    for path in endpoints_paths:
+        endpoints.extend(load_chunks_jsonl(path))
+    chunks = load_chunks_jsonl(bundle_path)
+    param_index = build_param_index(endpoints, chunks, load_aliases(aliases_path))
+    spec = json.dumps(build_spec(param_index, chunks), indent=2, ensure_ascii=False)
+    outputs = [
+        (params_json, json.dumps(param_index, indent=2, ensure_ascii=True)),
+        (spec_json, spec),
+        (spec_ts, f"const spec = {spec};\nexport default spec;\n"),
+    ]
+    return [path for path, content in outputs if path and _write_if_changed(path, content)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundle", required=True, help="Chunks JSONL the chunk ids point into")
+    parser.add_argument("--endpoints", action="append", required=True, help="Endpoints JSONL (repeatable)")
+    parser.add_argument("--aliases", default="", help="Dedup alias map of the bundle")
+    parser.add_argument("--params-json", default="", help="Where to write the inverted index")
+    parser.add_argument("--spec-json", default="", help="Where to write the planner spec")
+    parser.add_argument("--spec-ts", default="", help="Where to write the planner spec as a TypeScript module")
+    args = parser.parse_args()
+
+    written = write_spec_artifacts(
+        args.bundle,
+        args.endpoints,
+        aliases_path=args.aliases or None,
+        params_json=args.params_json or None,
+        spec_json=args.spec_json or None,
+        spec_ts=args.spec_ts or None,
+    )
+    print(json.dumps({"written": written}), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
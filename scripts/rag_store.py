@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Packed binary chunk store with mmap-backed lookups by chunk id or doc_id.
+
+Layout (little-endian):
+
+    header      magic, version, record/doc counts, section offsets
+    records     per chunk: u32 text_len, u32 meta_len, UTF-8 text, UTF-8 JSON meta
+    id table    fixed-size entries sorted by id: id offset/len, record index/offset
+    doc table   fixed-size entries sorted by doc_id: doc_id offset/len, start, count
+    doc records u64 record offsets grouped by doc_id (original order within a doc)
+    strings     UTF-8 ids and doc_ids referenced by the tables
+
+``meta`` is the chunk record with ``text`` nulled out. Lookups binary-search the id
+table directly in the mapped file, so nothing is decoded up front.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+STORE_MAGIC = b"RAGSTOR\x00"
+STORE_VERSION = 1
+
+HEADER = struct.Struct("<8sIIIIQQQQ")
+ID_ENTRY = struct.Struct("<QIIQ")
+DOC_ENTRY = struct.Struct("<QIII")
+RECORD_OFFSET = struct.Struct("<Q")
+RECORD_HEADER = struct.Struct("<II")
+
+
+def write_chunk_store(chunks: Iterable[Dict[str, Any]], out_path: str) -> int:
+    """Write ``chunks`` (in order) as a packed store; returns the record count."""
+    ids: List[Tuple[bytes, int, int]] = []
+    docs: Dict[bytes, List[int]] = {}
+    tmp = Path(out_path).with_name(Path(out_path).name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(b"\0" * HEADER.size)
+        records_offset = f.tell()
+        for index, chunk in enumerate(chunks):
+            offset = f.tell()
+            text = (chunk.get("text") or "").encode("utf-8")
+            # text is stored separately; a null placeholder keeps its key position
+            meta = json.dumps(
+                {key: None if key == "text" else value for key, value in chunk.items()},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+            f.write(RECORD_HEADER.pack(len(text), len(meta)))
+            f.write(text)
+            f.write(meta)
+            ids.append((str(chunk.get("id") or "").encode("utf-8"), index, offset))
+            docs.setdefault(str(chunk.get("doc_id") or "").encode("utf-8"), []).append(offset)
+
+        strings: Dict[bytes, int] = {}
+        pool: List[bytes] = []
+        id_table_offset = f.tell()
+        doc_table_offset = id_table_offset + ID_ENTRY.size * len(ids)
+        doc_records_offset = doc_table_offset + DOC_ENTRY.size * len(docs)
+        string_offset = doc_records_offset + RECORD_OFFSET.size * len(ids)
+
+        def intern(value: bytes) -> int:
+            nonlocal string_offset
+            if value not in strings:
+                strings[value] = string_offset
+                pool.append(value)
+                string_offset += len(value)
+            return strings[value]
+
+        for chunk_id, index, offset in sorted(ids):
+            f.write(ID_ENTRY.pack(intern(chunk_id), len(chunk_id), index, offset))
+        start = 0
+        doc_ids = sorted(docs)
+        for doc_id in doc_ids:
+            f.write(DOC_ENTRY.pack(intern(doc_id), len(doc_id), start, len(docs[doc_id])))
+            start += len(docs[doc_id])
+        for doc_id in doc_ids:
+            for offset in docs[doc_id]:
+                f.write(RECORD_OFFSET.pack(offset))
+        for value in pool:
+            f.write(value)
+
+        f.seek(0)
+        f.write(
+            HEADER.pack(
+                STORE_MAGIC,
+                STORE_VERSION,
+                len(ids),
+                len(docs),
+                0,
+                records_offset,
+                id_table_offset,
+                doc_table_offset,
+                doc_records_offset,
+            )
+        )
+    tmp.replace(out_path)
+    return len(ids)
+
+
+class StoredChunk:
+    """A record in a mapped store; text and meta are read from the map on access."""
+
+    __slots__ = ("_mm", "offset", "_text_len", "_meta_len")
+
+    def __init__(self, mm: mmap.mmap, offset: int) -> None:
+        self._mm = mm
+        self.offset = offset
+        self._text_len, self._meta_len = RECORD_HEADER.unpack_from(mm, offset)
+
+    @property
+    def text_bytes(self) -> bytes:
+        # a copy, not a memoryview: an exported view would keep ChunkStore.close() from unmapping
+        start = self.offset + RECORD_HEADER.size
+        return self._mm[start : start + self._text_len]
+
+    @property
+    def text(self) -> str:
+        return self.text_bytes.decode("utf-8")
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        start = self.offset + RECORD_HEADER.size + self._text_len
+        return json.loads(self._mm[start : start + self._meta_len].decode("utf-8"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the original chunk record."""
+        record = self.meta
+        record["text"] = self.text
+        return record
+
+
+class ChunkStore:
+    """Read-only view of a packed store through ``mmap``."""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.count,
+            self.doc_count,
+            _,
+            self._records_offset,
+            self._id_table,
+            self._doc_table,
+            self._doc_records,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {STORE_VERSION} chunk store")
+
+    def __enter__(self) -> "ChunkStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def _string(self, offset: int, length: int) -> bytes:
+        return self._mm[offset : offset + length]
+
+    def _id_entry(self, n: int) -> Tuple[int, int, int, int]:
+        return ID_ENTRY.unpack_from(self._mm, self._id_table + n * ID_ENTRY.size)
+
+    def _doc_entry(self, n: int) -> Tuple[int, int, int, int]:
+        return DOC_ENTRY.unpack_from(self._mm, self._doc_table + n * DOC_ENTRY.size)
+
+    def _lower_bound(self, key: bytes, count: int, entry) -> int:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length = entry(mid)[:2]
+            if self._string(offset, length) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def get_all(self, chunk_id: str) -> List[StoredChunk]:
+        """Every record with ``chunk_id``, in original order."""
+        key = chunk_id.encode("utf-8")
+        n = self._lower_bound(key, self.count, self._id_entry)
+        hits: List[StoredChunk] = []
+        while n < self.count:
+            offset, length, _, record_offset = self._id_entry(n)
+            if self._string(offset, length) != key:
+                break
+            hits.append(StoredChunk(self._mm, record_offset))
+            n += 1
+        return hits
+
+    def get(self, chunk_id: str) -> Optional[StoredChunk]:
+        """The record for ``chunk_id``; for repeated ids the last one wins, as in
+        the worker's chunk map."""
+        hits = self.get_all(chunk_id)
+        return hits[-1] if hits else None
+
+    def by_doc(self, doc_id: str) -> Iterator[StoredChunk]:
+        """Records belonging to ``doc_id``, in original order."""
+        key = doc_id.encode("utf-8")
+        n = self._lower_bound(key, self.doc_count, self._doc_entry)
+        if n >= self.doc_count:
+            return
+        offset, length, start, count = self._doc_entry(n)
+        if self._string(offset, length) != key:
+            return
+        base = self._doc_records + start * RECORD_OFFSET.size
+        for i in range(count):
+            (record_offset,) = RECORD_OFFSET.unpack_from(self._mm, base + i * RECORD_OFFSET.size)
+            yield StoredChunk(self._mm, record_offset)
+
+    def doc_ids(self) -> List[str]:
+        return [self._string(*self._doc_entry(n)[:2]).decode("utf-8") for n in range(self.doc_count)]
+
+    def __iter__(self) -> Iterator[StoredChunk]:
+        offset = self._records_offset
+        for _ in range(self.count):
+            record = StoredChunk(self._mm, offset)
+            yield record
+            offset += RECORD_HEADER.size + record._text_len + record._meta_len
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Pack a chunks JSONL file into a binary store")
+    build.add_argument("--chunks", required=True)
+    build.add_argument("--out", required=True)
+    get = sub.add_parser("get", help="Print chunks by id (or every chunk of --doc-id) as JSONL")
+    get.add_argument("--store", required=True)
+    get.add_argument("--doc-id", default="")
+    get.add_argument("ids", nargs="*")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        from rag_bm25 import load_chunks_jsonl
+
+        print(write_chunk_store(load_chunks_jsonl(args.chunks), args.out))
+        return
+
+    with ChunkStore(args.store) as store:
+        records = list(store.by_doc(args.doc_id)) if args.doc_id else []
+        records.extend(record for record in map(store.get, args.ids) if record is not None)
+        for record in records:
+            print(json.dumps(record.to_dict(), ensure_ascii=True))
+
+
+if __name__ == "__main__":
+    main()
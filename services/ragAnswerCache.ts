@@ -0,0 +1,79 @@
+import {
+  isRagIndexConfigCompatible,
+  RagChunk,
+  RagIndexOptions,
+  RagPrebuiltIndex,
+  RagQueryFilters,
+  RagQueryHit,
+  RagQueryOptions
+} from "./ragIndex";
+
+// Answer cache written by scripts/rag_answer_cache.py: the best hits of a fixed
+// query set, scored like RagIndex.query. `chunk` is the hit's position among the
+// parsed bundle lines.
+export type RagAnswerCacheHit = {
+  chunk: number;
+  id?: string;
+  score: number;
+};
+
+export type RagAnswerCache = {
+  version: number;
+  config: RagPrebuiltIndex["config"] & { max_top_k: number };
+  chunk_set_sha256: string;
+  chunk_count: number;
+  entries: Record<string, { id?: string | null; hits: RagAnswerCacheHit[] }>;
+};
+
+export type RagAnswerLookup = (query: string, options?: RagQueryOptions) => RagQueryHit[] | undefined;
+
+const ANSWER_CACHE_VERSION = 1;
+const FILTER_KEYS = ["docIds", "sourceFiles", "types", "tags"] as const;
+
+const clamp = (value: number, min: number, max: number) => Math.max(min, Math.min(max, value));
+
+// Keep in sync with normalize_query in scripts/rag_answer_cache.py.
+export const normalizeRagAnswerQuery = (query: string) =>
+  (query || "").trim().replace(/[ \t\r\n]+/g, " ").replace(/[A-Z]/g, (c) => c.toLowerCase());
+
+// Keep in sync with answer_key in scripts/rag_answer_cache.py.
+export const ragAnswerKey = (query: string, filters?: RagQueryFilters) => {
+  const normalized: RagQueryFilters = {};
+  for (const key of FILTER_KEYS) {
+    const values = filters?.[key];
+    if (values && values.length > 0) normalized[key] = [...new Set(values)].sort();
+  }
+  return `${normalizeRagAnswerQuery(query)}\n${JSON.stringify(normalized)}`;
+};
+
+// A lookup into `cache` for the parsed bundle `chunks` whose file hashes to
+// `chunkSetSha256`, or null when the cache was built from other chunks or with
+// other index options. The lookup returns what RagIndex.query would for cached
+// queries and undefined for the rest.
+export const createRagAnswerLookup = (
+  cache: RagAnswerCache | undefined,
+  chunks: RagChunk[],
+  chunkSetSha256: string,
+  options: RagIndexOptions = {}
+): RagAnswerLookup | null => {
+  if (!cache || cache.version !== ANSWER_CACHE_VERSION) return null;
+  if (cache.chunk_set_sha256 !== chunkSetSha256 || cache.chunk_count !== chunks.length) return null;
+  if (!isRagIndexConfigCompatible(cache.config, options)) return null;
+  const entries = Object.values(cache.entries || {});
+  if (!entries.every((entry) => entry.hits.every((hit) => chunks[hit.chunk]?.id === hit.id))) return null;
+
+  const maxTopK = cache.config.max_top_k;
+  const maxChunkChars = cache.config.limits?.max_chunk_chars ?? Infinity;
+  return (query, queryOptions = {}) => {
+    const entry = cache.entries[ragAnswerKey(query, queryOptions.filters)];
+    if (!entry) return undefined;
+    const topK = clamp(queryOptions.topK ?? 6, 1, 25);
+    // the entry may have been cut short of the hits asked for
+    if (topK > maxTopK && entry.hits.length >= maxTopK) return undefined;
+    return entry.hits.slice(0, topK).map(({ chunk, score }) => ({
+      ...chunks[chunk],
+      text: (chunks[chunk].text || "").slice(0, maxChunkChars),
+      score
+    }));
+  };
+};
@@ -0,0 +1,107 @@
+// Block index written by scripts/rag_blocks.py for a block-compressed JSONL
+// file: each block is an independent gzip member of compact JSON lines at
+// `offset`/`bytes` in the file, and `ids` maps every record id to its blocks.
+export type RagBlock = {
+  first_id: string | null;
+  offset: number;
+  bytes: number;
+  raw_bytes: number;
+  count: number;
+};
+
+export type RagBlockIndex = {
+  version: number;
+  format: string;
+  records: number;
+  bytes: number;
+  raw_bytes: number;
+  sha256: string;
+  blocks: RagBlock[];
+  ids: Record<string, number[]>;
+  source?: string;
+  path?: string;
+};
+
+// Returns the `length` bytes at `offset` of the blocks file, e.g. through an
+// HTTP range request or a slice of the whole file.
+export type RagBlockLoader = (offset: number, length: number) => Uint8Array | Promise<Uint8Array>;
+
+const BLOCK_INDEX_VERSION = 1;
+const DEFAULT_MAX_CACHED_BLOCKS = 4;
+
+export const inflateRagBlock = async (member: Uint8Array): Promise<string> => {
+  const stream = new Blob([member]).stream().pipeThrough(new DecompressionStream("gzip"));
+  return new Response(stream).text();
+};
+
+const parseBlock = <T>(text: string): T[] =>
+  text
+    .split("\n")
+    .filter((line) => line)
+    .map((line) => JSON.parse(line) as T);
+
+// Random access by id into a block-compressed JSONL file: only the blocks that
+// hold a requested id are fetched and inflated, and the most recently used
+// ones are kept.
+export class RagBlockReader<T extends { id?: string } = { id?: string }> {
+  private readonly index: RagBlockIndex;
+  private readonly load: RagBlockLoader;
+  private readonly maxCachedBlocks: number;
+  private readonly blocks = new Map<number, Promise<T[]>>();
+
+  constructor(index: RagBlockIndex, load: RagBlockLoader, maxCachedBlocks = DEFAULT_MAX_CACHED_BLOCKS) {
+    if (index.version !== BLOCK_INDEX_VERSION) {
+      throw new Error(`Unsupported block index version: ${index.version}`);
+    }
+    this.index = index;
+    this.load = load;
+    this.maxCachedBlocks = maxCachedBlocks;
+  }
+
+  get size(): number {
+    return this.index.records;
+  }
+
+  block(n: number): Promise<T[]> {
+    const cached = this.blocks.get(n);
+    if (cached) {
+      // most recently used last
+      this.blocks.delete(n);
+      this.blocks.set(n, cached);
+      return cached;
+    }
+    const entry = this.index.blocks[n];
+    if (!entry) return Promise.reject(new Error(`No block ${n}`));
+    const pending = Promise.resolve(this.load(entry.offset, entry.bytes))
+      .then(inflateRagBlock)
+      .then((text) => parseBlock<T>(text));
+    pending.catch(() => this.blocks.delete(n));
+    this.blocks.set(n, pending);
+    while (this.blocks.size > this.maxCachedBlocks) {
+      this.blocks.delete(this.blocks.keys().next().value as number);
+    }
+    return pending;
+  }
+
+  // Every record with `id`, in file order.
+  async getAll(id: string): Promise<T[]> {
+    const blockNumbers = Object.prototype.hasOwnProperty.call(this.index.ids, id) ? this.index.ids[id] : [];
+    const blocks = await Promise.all(blockNumbers.map((n) => this.block(n)));
+    return blocks.flat().filter((record) => record.id === id);
+  }
+
+  // The record for `id`; for repeated ids the last one wins, as in the worker's
+  // chunk map.
+  async get(id: string): Promise<T | undefined> {
+    const records = await this.getAll(id);
+    return records[records.length - 1];
+  }
+
+  async all(): Promise<T[]> {
+    const blocks = [];
+    for (let n = 0; n < this.index.blocks.length; n += 1) {
+      blocks.push(await this.block(n));
+    }
+    return blocks.flat();
+  }
+}
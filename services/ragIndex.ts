@@ -25,6 +25,29 @@ export type RagQueryHit = RagChunk & {
   score: number;
 };
 
+// Prebuilt index written by scripts/rag_bm25.py; postings are flattened
+// [doc, tf, doc, tf, ...] pairs per vocab term, docs index `positions`.
+// `chunk_set_sha256` is the SHA-256 of the chunks file it was built from.
+export type RagPrebuiltIndex = {
+  version: number;
+  config: {
+    min_token_length: number;
+    stop_words: string[];
+    limits?: {
+      max_chunks: number;
+      max_chunk_chars: number;
+      max_total_chars: number;
+    };
+  };
+  chunk_set_sha256: string;
+  chunk_count: number;
+  positions: number[];
+  ids: Array<string | undefined>;
+  doc_lengths: number[];
+  vocab: string[];
+  postings: number[][];
+};
+
 export type RagIndexOptions = {
   maxChunks?: number;
   maxChunkChars?: number;
@@ -160,13 +183,62 @@ const normalizeChunks = (chunks: RagChunk[], options: RagIndexOptions) => {
   return normalized;
 };
 
+const PREBUILT_INDEX_VERSION = 1;
+
+// Whether an artifact built by scripts/rag_bm25.py used the tokenization and
+// chunk limits of `options`.
+export const isRagIndexConfigCompatible = (
+  config: RagPrebuiltIndex["config"] | undefined,
+  options: RagIndexOptions
+) => {
+  if (!config) return false;
+  if (config.min_token_length !== (options.minTokenLength ?? DEFAULT_MIN_TOKEN_LENGTH)) return false;
+  const stopWords = options.stopWords ?? DEFAULT_STOP_WORDS;
+  const prebuiltStopWords = config.stop_words || [];
+  if (prebuiltStopWords.length !== stopWords.size || prebuiltStopWords.some((word) => !stopWords.has(word))) {
+    return false;
+  }
+  const limits = config.limits;
+  if (
+    !limits
+    || limits.max_chunks !== (options.maxChunks ?? DEFAULT_MAX_CHUNKS)
+    || limits.max_chunk_chars !== (options.maxChunkChars ?? DEFAULT_MAX_CHUNK_CHARS)
+    || limits.max_total_chars !== (options.maxTotalChars ?? DEFAULT_MAX_TOTAL_CHARS)
+  ) {
+    return false;
+  }
+  return true;
+};
+
+// Ids alone miss text edits that keep them, so the prebuilt index must also
+// come from the chunks file hashing to `chunkSetSha256`.
+const isPrebuiltCompatible = (
+  prebuilt: RagPrebuiltIndex,
+  chunks: RagChunk[],
+  chunkSetSha256: string | undefined,
+  options: RagIndexOptions
+) => {
+  if (!prebuilt || prebuilt.version !== PREBUILT_INDEX_VERSION) return false;
+  if (!chunkSetSha256 || prebuilt.chunk_set_sha256 !== chunkSetSha256) return false;
+  if (prebuilt.chunk_count !== chunks.length) return false;
+  if (!isRagIndexConfigCompatible(prebuilt.config, options)) return false;
+  return prebuilt.positions.every((position, doc) => chunks[position]?.id === prebuilt.ids[doc]);
+};
+
 export class RagIndex {
   private readonly docs: IndexDoc[];
   private readonly docFreq: Map<string, number>;
   private readonly avgDocLength: number;
   private readonly options: RagIndexOptions;
 
-  constructor(chunks: RagChunk[], options: RagIndexOptions = {}) {
+  // A `prebuilt` index built from the chunks file hashing to `chunkSetSha256`
+  // with the same options skips tokenization; otherwise it is ignored.
+  constructor(
+    chunks: RagChunk[],
+    options: RagIndexOptions = {},
+    prebuilt?: RagPrebuiltIndex,
+    chunkSetSha256?: string
+  ) {
     assertRagGuardrails({ allowEmbeddings: options.allowEmbeddings });
     this.options = options;
     const trimmed = normalizeChunks(chunks, options);
@@ -174,20 +246,34 @@ export class RagIndex {
     const docFreq = new Map<string, number>();
     let totalLength = 0;
 
-    for (const chunk of trimmed) {
-      const text = chunk.text || "";
-      const tokens = tokenize(text, options);
-      if (tokens.length === 0) continue;
-      const termFreq = new Map<string, number>();
-      tokens.forEach((token) => {
-        const normalized = normalizeToken(token);
-        termFreq.set(normalized, (termFreq.get(normalized) || 0) + 1);
+    if (prebuilt && isPrebuiltCompatible(prebuilt, trimmed, chunkSetSha256, options)) {
+      prebuilt.positions.forEach((position, doc) => {
+        docs.push({ chunk: trimmed[position], length: prebuilt.doc_lengths[doc], termFreq: new Map() });
+        totalLength += prebuilt.doc_lengths[doc];
+      });
+      prebuilt.vocab.forEach((term, termIndex) => {
+        const postings = prebuilt.postings[termIndex];
+        for (let i = 0; i < postings.length; i += 2) {
+          docs[postings[i]].termFreq.set(term, postings[i + 1]);
+        }
+        docFreq.set(term, postings.length / 2);
       });
-      for (const token of new Set(tokens.map(normalizeToken))) {
-        docFreq.set(token, (docFreq.get(token) || 0) + 1);
+    } else {
+      for (const chunk of trimmed) {
+        const text = chunk.text || "";
+        const tokens = tokenize(text, options);
+        if (tokens.length === 0) continue;
+        const termFreq = new Map<string, number>();
+        tokens.forEach((token) => {
+          const normalized = normalizeToken(token);
+          termFreq.set(normalized, (termFreq.get(normalized) || 0) + 1);
+        });
+        for (const token of new Set(tokens.map(normalizeToken))) {
+          docFreq.set(token, (docFreq.get(token) || 0) + 1);
+        }
+        docs.push({ chunk, length: tokens.length, termFreq });
+        totalLength += tokens.length;
       }
-      docs.push({ chunk, length: tokens.length, termFreq });
-      totalLength += tokens.length;
     }
 
     this.docs = docs;
@@ -253,4 +339,15 @@ export const buildRagIndexFromJsonl = (jsonl: string, options: RagIndexOptions =
   const chunks = parseJsonl<RagChunk>(jsonl);
   return new RagIndex(chunks, options);
 };
+
+// `chunkSetSha256` is the SHA-256 of the file `jsonl` was read from.
+export const buildRagIndexFromPrebuilt = (
+  jsonl: string,
+  prebuilt: RagPrebuiltIndex,
+  chunkSetSha256: string,
+  options: RagIndexOptions = {}
+) => {
+  const chunks = parseJsonl<RagChunk>(jsonl);
+  return new RagIndex(chunks, options, prebuilt, chunkSetSha256);
+};
 import { assertRagGuardrails } from "./ragGuardrails";
@@ -0,0 +1,137 @@
+import {
+  parseJsonl,
+  RagChunk,
+  RagIndex,
+  RagIndexOptions,
+  RagQueryFilters,
+  RagQueryHit,
+  RagQueryOptions
+} from "./ragIndex";
+
+// Manifest written by scripts/rag_shards.py: one JSONL shard per (doc_id, type)
+// of a bundle, in first-seen order, with the source files and tags of its chunks.
+export type RagShard = {
+  doc_id: string | null;
+  type: string | null;
+  path: string;
+  count: number;
+  bytes: number;
+  sha256: string;
+  source_files: string[];
+  tags: string[];
+};
+
+export type RagShardManifest = {
+  version: number;
+  bundle: string;
+  chunk_count: number;
+  bytes: number;
+  sha256: string;
+  shards: RagShard[];
+  aliases_json?: string;
+};
+
+export type RagShardLoader = (shard: RagShard) => string | Promise<string>;
+
+const SHARD_MANIFEST_VERSION = 1;
+const DEFAULT_MAX_CACHED_INDEXES = 8;
+
+const sha256Hex = async (text: string) => {
+  const digest = await crypto.subtle.digest("SHA-256", new TextEncoder().encode(text));
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+};
+
+const asSet = (values?: string[]) => (values && values.length > 0 ? new Set(values) : null);
+
+// Shards that can hold a chunk matching `filters`, in manifest order.
+export const selectRagShards = (manifest: RagShardManifest, filters?: RagQueryFilters): RagShard[] => {
+  const docIds = asSet(filters?.docIds);
+  const sourceFiles = asSet(filters?.sourceFiles);
+  const types = asSet(filters?.types);
+  const tags = asSet(filters?.tags);
+  return manifest.shards.filter((shard) => {
+    if (docIds && (!shard.doc_id || !docIds.has(shard.doc_id))) return false;
+    if (types && (!shard.type || !types.has(shard.type))) return false;
+    if (sourceFiles && shard.source_files.every((file) => !sourceFiles.has(file))) return false;
+    if (tags && shard.tags.every((tag) => !tags.has(tag))) return false;
+    return true;
+  });
+};
+
+// Fetches and indexes only the shards a query's filters select. Each fetched shard
+// must match its manifest SHA-256 (as rag_shards.read_shard checks), else the
+// query rejects. Shard chunks are cached by content hash and indexes by the set of
+// shards they cover, so repeat queries with the same filters reuse both.
+// BM25 statistics (document frequencies, average length) are those of the loaded
+// shards only, so scores differ from RagIndex.query on the full bundle unless
+// every shard is selected; rankings within a shard set are still comparable.
+export class ShardedRagIndex {
+  private readonly manifest: RagShardManifest;
+  private readonly load: RagShardLoader;
+  private readonly options: RagIndexOptions;
+  private readonly maxCachedIndexes: number;
+  private readonly chunks = new Map<string, Promise<RagChunk[]>>();
+  private readonly indexes = new Map<string, Promise<RagIndex>>();
+
+  constructor(
+    manifest: RagShardManifest,
+    load: RagShardLoader,
+    options: RagIndexOptions = {},
+    maxCachedIndexes = DEFAULT_MAX_CACHED_INDEXES
+  ) {
+    if (manifest.version !== SHARD_MANIFEST_VERSION) {
+      throw new Error(`Unsupported shard manifest version: ${manifest.version}`);
+    }
+    this.manifest = manifest;
+    this.load = load;
+    this.options = options;
+    this.maxCachedIndexes = maxCachedIndexes;
+  }
+
+  async query(query: string, options: RagQueryOptions = {}): Promise<RagQueryHit[]> {
+    const index = await this.indexFor(selectRagShards(this.manifest, options.filters));
+    return index.query(query, options);
+  }
+
+  // Bytes fetched so far, for telemetry.
+  loadedBytes(): number {
+    return this.manifest.shards.reduce((total, shard) => total + (this.chunks.has(shard.sha256) ? shard.bytes : 0), 0);
+  }
+
+  private shardChunks(shard: RagShard): Promise<RagChunk[]> {
+    let pending = this.chunks.get(shard.sha256);
+    if (!pending) {
+      pending = Promise.resolve(this.load(shard)).then(async (jsonl) => {
+        if ((await sha256Hex(jsonl)) !== shard.sha256) {
+          throw new Error(`Shard ${shard.path} does not match its manifest hash`);
+        }
+        return parseJsonl<RagChunk>(jsonl);
+      });
+      pending.catch(() => this.chunks.delete(shard.sha256));
+      this.chunks.set(shard.sha256, pending);
+    }
+    return pending;
+  }
+
+  private indexFor(shards: RagShard[]): Promise<RagIndex> {
+    const key = shards.map((shard) => shard.sha256).join(",");
+    const cached = this.indexes.get(key);
+    if (cached) {
+      // most recently used last
+      this.indexes.delete(key);
+      this.indexes.set(key, cached);
+      return cached;
+    }
+    const pending = Promise.all(shards.map((shard) => this.shardChunks(shard))).then(
+      (parts) => new RagIndex(parts.flat(), this.options)
+    );
+    pending.catch(() => this.indexes.delete(key));
+    this.indexes.set(key, pending);
+    while (this.indexes.size > this.maxCachedIndexes) {
+      this.indexes.delete(this.indexes.keys().next().value as string);
+    }
+    return pending;
+  }
+}
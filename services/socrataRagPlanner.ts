@@ -82,18 +82,18 @@ const matchParam = (param: string, allowCustomMetadata: boolean) => {
   for (const pattern of DISCOVERY_PARAM_PATTERNS) {
     if (pattern.kind === "customMetadata") continue;
     if (pattern.regex) {
-      if (pattern.regex.test(param)) return { allowed: true, kind: pattern.kind };
+      if (pattern.regex.test(param)) return { allowed: true, kind: pattern.kind, name: pattern.name };
       continue;
     }
-    if (pattern.name.toLowerCase() === lower) return { allowed: true, kind: pattern.kind };
+    if (pattern.name.toLowerCase() === lower) return { allowed: true, kind: pattern.kind, name: pattern.name };
   }
   if (allowCustomMetadata) {
     const customPattern = DISCOVERY_PARAM_PATTERNS.find((pattern) => pattern.kind === "customMetadata");
     if (customPattern?.regex?.test(param)) {
-      return { allowed: true, kind: "customMetadata" as const };
+      return { allowed: true, kind: "customMetadata" as const, name: customPattern.name };
     }
   }
-  return { allowed: false, kind: undefined };
+  return { allowed: false, kind: undefined, name: undefined };
 };
 
 const clamp = (value: number, min: number, max: number) => Math.max(min, Math.min(max, value));
@@ -113,6 +113,9 @@ export const planSocrataDiscoveryQuery = (input: {
   const params: Record<string, string> = {};
   const unknownParams: string[] = [];
   const warnings: string[] = [];
+  // chunks documenting each filter param, from the spec's build-time inverted index
+  const paramChunkIds = spec.discovery.paramChunkIds as Record<string, string[]>;
+  const chunkIds = new Set<string>(spec.discovery.sourceChunkIds);
 
   const query = input.query.trim();
   if (query) params.q = query;
@@ -130,6 +133,7 @@ export const planSocrataDiscoveryQuery = (input: {
       warnings.push(`Custom metadata param used: ${key}`);
     }
     params[key] = value;
+    (paramChunkIds[match.name ?? ""] || []).forEach((id) => chunkIds.add(id));
   });
 
   const limit = clamp(Math.floor(input.limit ?? spec.discovery.pagination.defaultLimit), 1, 1000);
@@ -156,10 +160,10 @@ export const planSocrataDiscoveryQuery = (input: {
   const endpoint = `${base}?${searchParams.toString()}`;
 
   let ragUsageId: string | undefined;
-  if (Array.isArray(spec.discovery.sourceChunkIds) && spec.discovery.sourceChunkIds.length > 0) {
+  if (chunkIds.size > 0) {
     const usage = recordRagUsageById({
       query: "socrata_discovery_parameters",
-      chunkIds: spec.discovery.sourceChunkIds,
+      chunkIds: Array.from(chunkIds),
       context: "socrata_discovery_plan"
     });
     ragUsageId = usage.id;
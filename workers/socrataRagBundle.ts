@@ -1 +1,6 @@
-export const SOCRATA_RAG_BUNDLE_JSONL = "{\"id\": \"section-purpose-1\", \"type\": \"section\", \"title\": \"Purpose\", \"path\": [\"Discovery API 1.0\", \"Purpose\"], \"text\": \"Purpose\\nOur data platform hosts tens of thousands of government assets. Governments large and small publish data on crime, permits, finance, healthcare, research, performance, and more for citizens to use. While this large corpus of government data is already accessible via opendatanetwork.com, this API opens up this corpus of government data for automated searching, research, and exploration. Assets can be found by keywords, high-level categorizations, tags, and much more. This API is a powerful way to access and explore data on our platform. The production API endpoints for this API are at https://api.us.socrata.com/api/catalog/v1 for domains in North America https://api.eu.socrata.com/api/catalog/v1 for all other domains For example, to query for datasets categorized as 'Public Safety', you could use the following query: http://api.us.socrata.com/api/catalog/v1?categories=public%20safety\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-asset-visibility-1\", \"type\": \"section\", \"title\": \"Asset Visibility\", \"path\": [\"Discovery API 1.0\", \"Asset Visibility\"], \"text\": \"Asset Visibility\\nThere are four key factors which control whether or not an asset can be viewed anonymously by an unauthenticated user. An asset must meet criteria for all factors which apply to the domain itself (this varies domain-by-domain, as not all domains employ relevant features or modules which utilize these). These factors are: the asset's audience - as public vs internal or private the asset's publication status - as published vs unpublished in a draft state the approval status of the asset - as approved vs pending or rejected whether the asset is hidden - as false i.e. not hidden vs true i.e. hidden\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"Discovery API 1.0\", \"Authentication\"], \"text\": \"Authentication\\nAuthentication is not required to use this API for read-only access to the corpus of anonymously-viewable (i.e. public, published, approved, and not hidden) assets. However, if you wish to search for private, unpublished, unapproved or hidden data, you must authenticate yourself and ensure that you have adequate permissions to view the data in question. To authenticate, you must: Use one of the methods discussed here and Provide the 'X-Socrata-Host' host header with the domain that has granted you access to view its assets. For example 'X-Socrata-Host:data.ny.gov'. When properly authenticated, you will be able to search over: All data that is anonymously-viewable. Any data that you own or that has been shared to you. Private, unpublished, unapproved, and hidden assets from domains that have granted you a right to view such assets.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-app-tokens-1\", \"type\": \"section\", \"title\": \"App Tokens\", \"path\": [\"Discovery API 1.0\", \"App Tokens\"], \"text\": \"App Tokens\\nAll programmatic usage of Socrata APIs should include an app token, either via the X-App-Token header or the $$app_token parameters set to a valid token. This is assumed and not documented in the API specs below.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-additional-api-facts-1\", \"type\": \"section\", \"title\": \"Additional API facts\", \"path\": [\"Discovery API 1.0\", \"Additional API facts\"], \"text\": \"Additional API facts\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-additional-api-facts-2\", \"type\": \"section\", \"title\": \"Additional API facts\", \"path\": [\"Discovery API 1.0\", \"Additional API facts\"], \"text\": \"Search without any parameters returns the set of data you are authorized to see. Any parameter usage serves to filter (or sort) this set of data - i.e. no parameters allow you to see more data than a search without parameters. This is important to know when considering parameters that let you search for assets not found in the public catalog. If you are unauthorized to see such things, your results will be empty. Multiple repetitive parameters are treated differently from multiple unique parameters. Unique parameters, for example ?tags=fire&provenance=official filters to the intersection of the values. In this example, the search is for official assets with the tag 'fire'. Repetitive parameters filter to the union of values. For example ?tags=fire&tags=commission searches for assets tagged as either 'fire' or 'commission'. The combination of both repetitive and unique parameters follow the same rules. Thus the query ?tags=fire&tags=commission&provenance=official would search for official assets tagged as either 'fire' or 'commission'. Many parameters support repetitive usage, using either the syntax above or the alternate syntax using brackets, e.g. ?tags[]=fire&tags[]=commission. Parameter descriptions will tell whether this is supported or not. Because this API supports custom metadata search and because custom metadata keys are arbitrary, any unrecognized params are assumed to be custom metadata. Thus, if you misname a parameter, for example ?domain=data.ny.gov (the parameter should be 'domains'), the results will be empty unless there are assets with the custom metadata key 'domain' and value 'data.ny.gov'.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\"], \"text\": \"Find assets by id\\nGET /catalog/v1?ids={4x4}\\nMost assets are uniquely identified by a string known as a four-by-four. This is a string made from eight alphanumeric characters split into two four-character phrases, e.g. ku42-jx2v. While most assets follow this pattern, their drafts do not. Draft IDs join the four-by-four of the published version with a colon and a draft identifier. For stories, which only ever support a single shared draft, the draft's identifier is \\\"draft\\\". For example, if a draft of story ku42-jx2v is created, its ID would be ku42-jx2v:draft. For non-story drafts, the draft's identifier is an integer. For example, if the 7th draft of asset cio5-yr56 is created, its ID would be cio5-yr56:7. The ids parameter will limit the results to the assets identified in this way.\\nExamples:\\n?ids=ku42-jx2v\\n?ids=ku42-jx2v&ids=ku42-jx2v:draft\\n?ids=cio5-yr56,cio5-yr56:7\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?ids={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\", \"Request\", \"query\"], \"text\": \"Find assets by id - query parameters\\n- ids (string): The four-by-four identifier of an asset. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\", \"Response\"], \"text\": \"Find assets by id - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by domain\", \"path\": [\"Discovery API 1.0\", \"Find assets by domain\"], \"text\": \"Find assets by domain\\nGET /catalog/v1?search_context={domain}&domains={domain}\\nEach asset is owned by a single domain. The domains and search_context parameters are used to limit the results to the inferred domains. If neither of the domains or search_context are provided, the inferred domains are all domains. Please note, that because of the size of this set, the user will not be authenticated across all of the domains and the user will effectively be treated as an anonymous user. If only a search_context is provided, the inferred domains will include the search_context and any domains which federate data into the search_context. Using this parameter allows you to see the returned data \\\"through the eyes\\\" of a given domain, e.g. filter and search across their tags/categories/custom metadata. If domains are provided, there is no need to infer domains and the given domains will be searched.\\nExamples:\\n?search_context=data.ny.gov\\n?domains=data.ny.gov\\n?domains=data.ny.gov,data.cityofchicago.org\\n?search_context=data.ny.gov&domains=data.ny.gov,data.cityofchicago.org\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={domain}&domains={domain}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by domain\", \"path\": [\"Discovery API 1.0\", \"Find assets by domain\", \"Request\", \"query\"], \"text\": \"Find assets by domain - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- domains (string): The domain name from which an asset comes. A comma-separated list of names is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by domain\", \"path\": [\"Discovery API 1.0\", \"Find assets by domain\", \"Response\"], \"text\": \"Find assets by domain - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-names-name-find-assets-by-name-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by name\", \"path\": [\"Discovery API 1.0\", \"Find assets by name\"], \"text\": \"Find assets by name\\nGET /catalog/v1?names={name}\\nEvery asset is given a name/title. The names parameter will limit results to those having the given name. This filter is case insensitive, but otherwise operates like an exact match. If the exact name is not known, consider using the q parameter to search by query or to autocomplete the name. Keep in mind that spaces and other special characters should be url-encoded.\\nExamples:\\n?names=NYS%20Attorney%20Registrations\\n?names=nys%20attorney%20registrations&names=OpenNY%20Press%20Releases\\n?names[]=NYS%20Attorney%20Registrations &names[]=OpenNY%20Press%20Releases\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?names={name}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-names-name-find-assets-by-name-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by name\", \"path\": [\"Discovery API 1.0\", \"Find assets by name\", \"Request\", \"query\"], \"text\": \"Find assets by name - query parameters\\n- names (string): The title of an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-names-name-find-assets-by-name-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by name\", \"path\": [\"Discovery API 1.0\", \"Find assets by name\", \"Response\"], \"text\": \"Find assets by name - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by category\", \"path\": [\"Discovery API 1.0\", \"Find assets by category\"], \"text\": \"Find assets by category\\nGET /catalog/v1?search_context={search_context}&categories={category}\\nEach domain is allowed to customize the categories they use and each asset may be assigned one of these categories or none. The categories parameter will limit the results to those having the given category, but only if the search_context is included.\\nExamples:\\n?search_context=data.ny.gov&categories=Recreation\\n?search_context=data.ny.gov&categories=Recreation&categories=Education\\n?search_context=data.ny.gov &categories[]=Recreation&categories[]=Education\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={search_context}&categories={category}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by category\", \"path\": [\"Discovery API 1.0\", \"Find assets by category\", \"Request\", \"query\"], \"text\": \"Find assets by category - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- categories (string): The category of an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by category\", \"path\": [\"Discovery API 1.0\", \"Find assets by category\", \"Response\"], \"text\": \"Find assets by category - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by tag\", \"path\": [\"Discovery API 1.0\", \"Find assets by tag\"], \"text\": \"Find assets by tag\\nGET /catalog/v1?search_context={search_context}&tags={tag}\\nEach asset may have none, one or more tags associated with it. The tags parameters will limit the results to those having the given tag, but only if the search_context is included.\\nExamples:\\n?search_context=data.ny.gov&tags=%23environment\\n?search_context=data.ny.gov&tags=%23environment&tags=2017\\n?search_context=data.ny.gov&tags[]=2018&tags[]=2017\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={search_context}&tags={tag}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by tag\", \"path\": [\"Discovery API 1.0\", \"Find assets by tag\", \"Request\", \"query\"], \"text\": \"Find assets by tag - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- tags (string): Any of the tags on an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by tag\", \"path\": [\"Discovery API 1.0\", \"Find assets by tag\", \"Response\"], \"text\": \"Find assets by tag - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-only-type-find-assets-by-type-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by type\", \"path\": [\"Discovery API 1.0\", \"Find assets by type\"], \"text\": \"Find assets by type\\nGET /catalog/v1?only={type}\\nEach asset has a logical type, such as a dataset or chart. The only parameter will limit the results to a particular type. The current taxonomy includes the following types: api, calendar, chart, dataset, federated_href, file, filter, form, href, link, map, measure, story, visualization You may use either the singular or plural variants of each type.\\nExamples:\\n?only=charts\\n?only=charts,maps\\n?only=datasets&only=link\\n?only[]=story&only[]=measure\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?only={type}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-only-type-find-assets-by-type-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by type\", \"path\": [\"Discovery API 1.0\", \"Find assets by type\", \"Request\", \"query\"], \"text\": \"Find assets by type - query parameters\\n- only (string enum): The datatype of an asset. Singular or plural terms are accepted. A comma-separated list of types is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-only-type-find-assets-by-type-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by type\", \"path\": [\"Discovery API 1.0\", \"Find assets by type\", \"Response\"], \"text\": \"Find assets by type - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by domain-specific metadata\", \"path\": [\"Discovery API 1.0\", \"Find by domain-specific metadata\"], \"text\": \"Find by domain-specific metadata\\nGET /catalog/v1?{custom_metadata_key}={value}\\nEach domain has the ability to add custom metadata to datasets beyond the default metadata. This custom metadata is different for every domain, but within a domain, all assets may be labeled with the metadata. The custom metadata is a named set of key-value pairs. For example one domain might have a set named 'Dataset Information' which has keys 'Localities' and 'Agencies & Authorities', while another domain has a set named 'Dataset Category' having key 'Agency'). The caller may restrict the results to a particular custom metadata pair by specifying the parameter name as a combination of the set's name and the key's name and the parameter value as the key's value. To construct the parameter name, join the set's name to the key's name with an underscore and replace all spaces with dashes. Some examples are given in the table below:\\nSet Name\\tField Name\\tParameter Dataset Information\\tLocalities\\t?Dataset-Information_Localities Data Summary\\tUnits\\t?Dataset-Summary_Units Informaci\\u00f3n de la Entidad\\tNombre de la Entidad\\t?Informaci\\u00f3n-de-la-Entidad_Nombre-de-la-Entidad\\nExamples:\\n?Dataset-Information_Localities=Albany%2C+City+of\\n?Dataset-Information_Localities=Albany%2C+City+of&Dataset-Summary_Units=Permits\\n?Dataset-Category_Agency=Office+of+the+Governor\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?{custom_metadata_key}={value}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by domain-specific metadata\", \"path\": [\"Discovery API 1.0\", \"Find by domain-specific metadata\", \"Request\", \"query\"], \"text\": \"Find by domain-specific metadata - query parameters\\n- custom-metadata_key (string): The name 'custom-metadata_key' is meant to represent any custom metadata field-set and field. See Find by domain-specific metadata for more details.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by domain-specific metadata\", \"path\": [\"Discovery API 1.0\", \"Find by domain-specific metadata\", \"Response\"], \"text\": \"Find by domain-specific metadata - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by attribution\", \"path\": [\"Discovery API 1.0\", \"Find assets by attribution\"], \"text\": \"Find assets by attribution\\nGET /catalog/v1?attribution={organization}\\nAssets can be attributed to various organizations. The attribution parameter will limit the results to those attributed to the given organization.\\nExamples:\\n?attribution=New%20York%20State%20Gaming%20Commission\\n?attribution=Texas%20Comptroller%20of%20Public%20Accounts\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?attribution={organization}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by attribution\", \"path\": [\"Discovery API 1.0\", \"Find assets by attribution\", \"Request\", \"query\"], \"text\": \"Find assets by attribution - query parameters\\n- attribution (string): The case-sensitive name of the attributing entity.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by attribution\", \"path\": [\"Discovery API 1.0\", \"Find assets by attribution\", \"Response\"], \"text\": \"Find assets by attribution - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-license-license-find-assets-by-license-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by license\", \"path\": [\"Discovery API 1.0\", \"Find assets by license\"], \"text\": \"Find assets by license\\nGET /catalog/v1?license={license}\\nAssets can be released under various licenses. The license parameter will limit the results to those with the given license.\\nExamples:\\n?license=Public%20Domain\\n?license= Creative%20Commons%201.0%20Universal%20(Public%20Domain%20Dedication)\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?license={license}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-license-license-find-assets-by-license-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by license\", \"path\": [\"Discovery API 1.0\", \"Find assets by license\", \"Request\", \"query\"], \"text\": \"Find assets by license - query parameters\\n- license (string): The case-sensitive license name.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-license-license-find-assets-by-license-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by license\", \"path\": [\"Discovery API 1.0\", \"Find assets by license\", \"Response\"], \"text\": \"Find assets by license - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by query term\", \"path\": [\"Discovery API 1.0\", \"Find assets by query term\"], \"text\": \"Find assets by query term\\nGET /catalog/v1?q={query}&min_should_match={match_term}\\nAssets may be searched by any of the text found in the name, description, category, tags, column names, column fieldnames, column descriptions, attribution fields. The q parameter takes arbitrary text and will limit the results to those having some or all of the text. The optional min_should_match parameter may be used to explicitly specify the number or percent of words that must match. See the Elasticsearch docs for the format of arguments to min_should_match. If min_should_match is not specified, the service's default is '3<60%', meaning that if there are 3 or fewer search terms specified, all of them must match; otherwise 60% of the search terms must be found in the fields specified above. For example, if min_should_match is '3<60%', searching for\\n'city dog park' will require stemmed matches for all three words; thus, 'Western Cities Association Dog Parks' will match, but 'New York City Parks' will not. 'trees green spaces new york' will require 60% of the words to match, which is 3 out of 5 words. Thus, 'New York Tree Map', and 'New Green Spaces Initiative' will both match.\\nExamples:\\n?q=result\\n?q=school%20result%20SAT\\n?q=school%20result%20SAT&min_should_match=-1\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?q={query}&min_should_match={match_term}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by query term\", \"path\": [\"Discovery API 1.0\", \"Find assets by query term\", \"Request\", \"query\"], \"text\": \"Find assets by query term - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\\n- min_should_match (string): The number or percent of words that must match. Acceptable formats are defined here.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by query term\", \"path\": [\"Discovery API 1.0\", \"Find assets by query term\", \"Response\"], \"text\": \"Find assets by query term - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by parent id\", \"path\": [\"Discovery API 1.0\", \"Find assets by parent id\"], \"text\": \"Find assets by parent id\\nGET /catalog/v1?parent_ids={4x4}\\nSome assets are uploaded directly and others are created from already existing data. For example, charts are derived from an existing parent dataset. The parent_ids parameter will limit the results to those having the parent dataset ids given.\\nExamples:\\n?parent_ids=nqur-w4p7\\n?parent_ids=nqur-w4p7&parent_ids=qzve-kjga\\n?parent_ids=nqur-w4p7,qzve-kjga\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?parent_ids={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by parent id\", \"path\": [\"Discovery API 1.0\", \"Find assets by parent id\", \"Request\", \"query\"], \"text\": \"Find assets by parent id - query parameters\\n- parent_ids (string): The four-by-four identifier of a parent asset having child assets. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by parent id\", \"path\": [\"Discovery API 1.0\", \"Find assets by parent id\", \"Response\"], \"text\": \"Find assets by parent id - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets derived from others\", \"path\": [\"Discovery API 1.0\", \"Find assets derived from others\"], \"text\": \"Find assets derived from others\\nGET /catalog/v1?derived_from={4x4}\\nSome assets are uploaded directly and others are created from or use other data. For example, charts are derived from an existing parent dataset and stories may then incorporate those charts. Measures may also incorporate one or more datasets. The derived_from parameter will limit the results to those that derive from the given dataset.\\nExamples:\\n?derived_from=8f6m-78bg\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?derived_from={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets derived from others\", \"path\": [\"Discovery API 1.0\", \"Find assets derived from others\", \"Request\", \"query\"], \"text\": \"Find assets derived from others - query parameters\\n- derived_from (string): The four-by-four identifier of an asset from which other assets are derived.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets derived from others\", \"path\": [\"Discovery API 1.0\", \"Find assets derived from others\", \"Response\"], \"text\": \"Find assets derived from others - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by provenance\", \"path\": [\"Discovery API 1.0\", \"Find by provenance\"], \"text\": \"Find by provenance\\nGET /catalog/v1?provenance={provenance}\\nWhile many assets on our platform are owned by government data publishers and other staff, some visualizations, maps, filtered views, and more are created by a member of the community. These assets are usually denoted with a 'Community' badge on the data catalog. A provenance=official parameter will limit the results to official assets, i.e. those owned by roled users on the domain. A provenance=community parameter will limit the results to community created assets.\\nExamples:\\n?provenance=official\\n?provenance=community\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?provenance={provenance}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by provenance\", \"path\": [\"Discovery API 1.0\", \"Find by provenance\", \"Request\", \"query\"], \"text\": \"Find by provenance - query parameters\\n- provenance (string enum): The provenance of an asset.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by provenance\", \"path\": [\"Discovery API 1.0\", \"Find by provenance\", \"Response\"], \"text\": \"Find by provenance - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by owner\", \"path\": [\"Discovery API 1.0\", \"Find by owner\"], \"text\": \"Find by owner\\nGET /catalog/v1?for_user={4x4}\\nEach asset has an owner, which may be a user or a team. The for_user parameter will limit the results to those owned by the user or team having the provided four-by-four identifier.\\nExamples:\\n?for_user=xzik-pf59\\n?for_user=xzik-pf59,fpiq-yg3w\\n?for_user=xzik-pf59&for_user=fpiq-yg3w\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?for_user={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by owner\", \"path\": [\"Discovery API 1.0\", \"Find by owner\", \"Request\", \"query\"], \"text\": \"Find by owner - query parameters\\n- for_user (string): The four-by-four identifier of a user who owns data. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by owner\", \"path\": [\"Discovery API 1.0\", \"Find by owner\", \"Response\"], \"text\": \"Find by owner - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by granted shares\", \"path\": [\"Discovery API 1.0\", \"Find by granted shares\"], \"text\": \"Find by granted shares\\nGET /catalog/v1?search_context={domain}&shared_to={4x4}\\nEach asset may be shared to teams or individual users. The shared_to param allows you to specify four-by-four identifier of a user or team and the results will be limited to those which were shared to them. Please note:\\nIf you are not an administrator, you may only specify yourself as the user to whom assets are shared. If you are not an administrator, you may only specify teams that you are on (as a member or an owner) as the teams to which assets are shared. If you are an administrator, you may see what's shared to any user or team on the domain where you are an administrator. You must include the domain name with the search_context parameter. If you search for assets shared to you, with or without assets shared to your teams, assets owned by you will be filtered out. You must authenticate in order to see any assets when using this param.\\nExamples:\\n?search_context=data.ny.gov&shared_to=xzik-pf59\\n?search_context=data.ny.gov&shared_to=8xiq-st2k,xzik-pf59\\n?search_context=data.ny.gov&shared_to=8xiq-st2k&shared_to=xzik-pf59\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={domain}&shared_to={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by granted shares\", \"path\": [\"Discovery API 1.0\", \"Find by granted shares\", \"Request\", \"query\"], \"text\": \"Find by granted shares - query parameters\\n- shared_to (string): The four-by-four identifier of a user who is shared data. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by granted shares\", \"path\": [\"Discovery API 1.0\", \"Find by granted shares\", \"Response\"], \"text\": \"Find by granted shares - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-column-names-name-find-by-column-name-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by column name\", \"path\": [\"Discovery API 1.0\", \"Find by column name\"], \"text\": \"Find by column name\\nGET /catalog/v1?column_names={name}\\nTabular assets are composed of rows and columns. The column_names parameter will limit the results to those having the given column names. The search is case insensitive, but otherwise looks for an exact match. Keep in mind that spaces and other special characters should be url-encoded.\\nExamples:\\n?column_names=Winning%20numbers\\n?column_names=Winning%20numbers&column_names=Draw%20Date\\n?column_names[]=winning%20NUMBERS&column_names[]=draw%20date\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?column_names={name}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-column-names-name-find-by-column-name-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by column name\", \"path\": [\"Discovery API 1.0\", \"Find by column name\", \"Request\", \"query\"], \"text\": \"Find by column name - query parameters\\n- column_names (string): The name of a column within a dataset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-column-names-name-find-by-column-name-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by column name\", \"path\": [\"Discovery API 1.0\", \"Find by column name\", \"Response\"], \"text\": \"Find by column name - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by visibility\", \"path\": [\"Discovery API 1.0\", \"Find by visibility\"], \"text\": \"Find by visibility\\nGET /catalog/v1?visibility={visibility}&show_visibility={true|false}\\nWhile many assets on our platform are discoverable and accessible via the open data catalog, others are held internally for government use. A visibility=open parameter will limit the results to only those that would show in the public catalog. A visibility=internal parameter will limit the results to those held internally, but note that only authenticated users who have sufficient rights and provide either a search_context or domains parameter will receive results. As discussed in the \\\"Asset Visibility\\\" at the beginning of this documentation, this visibility status is a product of four factors. This parameter is thus a convenience parameter where a 'open' value corresponds to\\naudience=public&published=true&approval_status=approved&explicitly_hidden=false.\\nBy default, visibility information is not included on the returned assets. To have it returned, attach a show_visibility=true parameter.\\nExamples:\\n?visibility=open\\n?visibility=open&show_visibility=true\\n?search_context=data.texas.gov&visibility=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?visibility={visibility}&show_visibility={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by visibility\", \"path\": [\"Discovery API 1.0\", \"Find by visibility\", \"Request\", \"query\"], \"text\": \"Find by visibility - query parameters\\n- visibility (string enum): The visibility of an asset.\\n- show_visibility (boolean): Whether to include visibility information in the response.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by visibility\", \"path\": [\"Discovery API 1.0\", \"Find by visibility\", \"Response\"], \"text\": \"Find by visibility - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-audience-audience-find-by-audience-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by audience\", \"path\": [\"Discovery API 1.0\", \"Find by audience\"], \"text\": \"Find by audience\\nGET /catalog/v1?audience={audience}\\nThe audience is the first of four factors which control an asset\\u2019s visibility. Each asset has one of three different audiences. These include:\\nprivate if the asset is only visible to the owner and any individuals the owner has shared the asset to site if the asset is visible to all members of a site/domain public if the asset is visible to anyone, within or outside the site/domain Only the audience=public parameter may be used by any user. The audience=site and audience=private parameters are only available to authenticated users who have sufficient rights and provide either a search_context or domains parameter, else a 401 error is returned.\\nExamples:\\n?audience=public\\n?search_context=data.texas.gov&audience=site\\n?domains=data.texas.gov&audience=private\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?audience={audience}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-audience-audience-find-by-audience-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by audience\", \"path\": [\"Discovery API 1.0\", \"Find by audience\", \"Request\", \"query\"], \"text\": \"Find by audience - query parameters\\n- audience (string enum): The audience of an asset.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-audience-audience-find-by-audience-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by audience\", \"path\": [\"Discovery API 1.0\", \"Find by audience\", \"Response\"], \"text\": \"Find by audience - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by publication status\", \"path\": [\"Discovery API 1.0\", \"Find by publication status\"], \"text\": \"Find by publication status\\nGET /catalog/v1?published={true|false}\\nThe publication status of each asset is the second of four factors which control an asset\\u2019s visibility. A published=true parameter will limit the results to those that are published; A published=false parameter will limit the results to those that are unpublished, but note that only authenticated users who have sufficient rights and provide a search_context or domains parameter will receive results.\\nExamples:\\n?published=true\\n?search_context=data.texas.gov&published=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?published={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by publication status\", \"path\": [\"Discovery API 1.0\", \"Find by publication status\", \"Request\", \"query\"], \"text\": \"Find by publication status - query parameters\\n- published (boolean): Whether the asset is published or not.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by publication status\", \"path\": [\"Discovery API 1.0\", \"Find by publication status\", \"Response\"], \"text\": \"Find by publication status - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Find hidden/unhidden assets\", \"path\": [\"Discovery API 1.0\", \"Find hidden/unhidden assets\"], \"text\": \"Find hidden/unhidden assets\\nGET /catalog/v1?explicitly_hidden={true|false}\\nThe hidden status of each asset is the third of four factors which control an asset\\u2019s visibility. Some sites selectively and explicitly hide certain assets from their public catalog for different reasons. A explicitly_hidden=false parameter will limit the results to those that are not hidden. A explicitly_hidden=true parameter will limit the results to those that are hidden, but note that only authenticated users who have sufficient rights and provide a search_context or domains parameter will receive results.\\nExamples:\\n?explicitly_hidden=false\\n?search_context=data.texas.gov&explicitly_hidden=true\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?explicitly_hidden={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Find hidden/unhidden assets\", \"path\": [\"Discovery API 1.0\", \"Find hidden/unhidden assets\", \"Request\", \"query\"], \"text\": \"Find hidden/unhidden assets - query parameters\\n- explicitly_hidden (boolean): Whether the asset is hidden from the public catalog or not.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-resp-1\", \"type\": \"response-fields\", \"title\": \"Find hidden/unhidden assets\", \"path\": [\"Discovery API 1.0\", \"Find hidden/unhidden assets\", \"Response\"], \"text\": \"Find hidden/unhidden assets - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\"], \"text\": \"Find by approval status\\nGET /catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\\nThe approval status of each asset is the fourth of four factors which control an asset\\u2019s visibility. Assets must be approved in order to become anonymously or internally viewable. At any point in time, the status of these views may be 'pending', 'rejected', 'approved' or 'not_ready' (to be approved) for either of the public or internal audiences. The approval_status parameter accepts one of those values and will limit the results to those assets with the given state. The target_audience parameter accepts either 'public' or 'internal' and further limits the results to those with the given approvals status destined for the given target audience. Note that no results will be returned when searching for rejected, pending or not_ready approval statuses unless the data is already anonymously viewable or the user has authenticated and provided a search_context or domains parameter.\\nExamples:\\n?approval_status=approved\\n?approval_status=approved&target_audience=public\\n?domains=data.ny.gov&approval_status=rejected,pending\\n?domains=data.ny.gov&approval_status=rejected&approval_status=approved\\n?domains=data.ny.gov&approval_status[]=rejected &approval_status[]=approved\\n?search_context=datahub.hhs.gov&approval_status=not_ready &target_audience=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-2\", \"type\": \"endpoint\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\"], \"text\": \"?search_context=datahub.hhs.gov&approval_status=approved &target_audience[]=public&target_audience[]=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\", \"Request\", \"query\"], \"text\": \"Find by approval status - query parameters\\n- approval_status (string enum): The internal or public approval status of an asset. Combine with a target_audience=public or target_audience=internal parameter to limit to the approval status of public-bound or internal-bound data. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\\n- target_audience (string enum): The audience a submitted asset desires if approved. Combine with the approval_status parameter to limit to particular stages of the approval process. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\", \"Response\"], \"text\": \"Find by approval status - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by submitter\", \"path\": [\"Discovery API 1.0\", \"Find by submitter\"], \"text\": \"Find by submitter\\nGET /catalog/v1?submitter_id={4x4}\\nFor assets that have been submitted for approval and are currently pending, rejected or approved, the 'submitter_id' parameter accepts the submitting user's four-by-four identifier and will limit the results to those assets which have been submitted by that user.\\nExamples:\\n?submitter_id=xzik-pf59\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?submitter_id={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by submitter\", \"path\": [\"Discovery API 1.0\", \"Find by submitter\", \"Request\", \"query\"], \"text\": \"Find by submitter - query parameters\\n- submitter_id (string): The four-by-four identifier of a user who has submitted an asset for approval.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by submitter\", \"path\": [\"Discovery API 1.0\", \"Find by submitter\", \"Response\"], \"text\": \"Find by submitter - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by reviewer\", \"path\": [\"Discovery API 1.0\", \"Find by reviewer\"], \"text\": \"Find by reviewer\\nGET /catalog/v1?reviewer_id={4x4}\\nFor assets that have been submitted for approval and reviewed, and are currently rejected or approved, the 'reviewer_id' parameter accepts the reviewing user's four-by-four identifier and will limit the results to those assets which have been reviewed by that user.\\nExamples:\\n?reviewer_id=r4qn-dwdd\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?reviewer_id={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by reviewer\", \"path\": [\"Discovery API 1.0\", \"Find by reviewer\", \"Request\", \"query\"], \"text\": \"Find by reviewer - query parameters\\n- reviewer_id (string): The four-by-four identifier of a user who has submitted an asset for approval.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-resp-1\", \"type\": \"response-fields\", \"title\": \"Find by reviewer\", \"path\": [\"Discovery API 1.0\", \"Find by reviewer\", \"Response\"], \"text\": \"Find by reviewer - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Find derived/base assets\", \"path\": [\"Discovery API 1.0\", \"Find derived/base assets\"], \"text\": \"Find derived/base assets\\nGET /catalog/v1?derived={true|false}\\nSome assets are uploaded directly and others are created from already existing data. For example, charts are derived from an existing parent dataset. The derived parameter will limit the results to one or other of these classes of data. A 'true' value finds derived assets and a 'false' value finds base assets.\\nExamples:\\n?derived=true\\n?derived=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?derived={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Find derived/base assets\", \"path\": [\"Discovery API 1.0\", \"Find derived/base assets\", \"Request\", \"query\"], \"text\": \"Find derived/base assets - query parameters\\n- derived (boolean): Whether the asset was derived from another or uploaded directly.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-resp-1\", \"type\": \"response-fields\", \"title\": \"Find derived/base assets\", \"path\": [\"Discovery API 1.0\", \"Find derived/base assets\", \"Response\"], \"text\": \"Find derived/base assets - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-order-sort-order-sort-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Sort results\", \"path\": [\"Discovery API 1.0\", \"Sort results\"], \"text\": \"Sort results\\nGET /catalog/v1?order={sort_order}\\nThe results of all the above filters can be sorted by any of the attributes in the list below. If not specified, the results are sorted by relevance. All sort values can optionally append a space and either 'ASC' or 'DESC' for ascending or descending sorts, but note that the space must be URL-escaped with '+' or '%20'. The default for each attribute is given in the table. It is possible for search results to have missing values for some of these sort fields (such as 'domain_category', for example). Any assets missing a value altogether for the field being sorted on will show up at the end of the results list.\\nAttribute\\tDefault Sort Order relevance (default)\\tdescending name\\tascending owner\\tascending dataset_id\\tascending datatype\\tascending domain_category\\tascending createdAt\\tdescending updatedAt\\tdescending page_views_total\\tdescending page_views_last_month\\tdescending page_views_last_week\\tdescending\\nExamples:\\n?order=name\\n?order=dataset_id%20ASC\\norder=page_views_total+DESC\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?order={sort_order}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-order-sort-order-sort-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Sort results\", \"path\": [\"Discovery API 1.0\", \"Sort results\", \"Request\", \"query\"], \"text\": \"Sort results - query parameters\\n- order (string enum): The field to sort assets by. Optionally append a space and 'ASC' or 'DESC' to direct the sort.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-order-sort-order-sort-results-resp-1\", \"type\": \"response-fields\", \"title\": \"Sort results\", \"path\": [\"Discovery API 1.0\", \"Sort results\", \"Response\"], \"text\": \"Sort results - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Paginate results\", \"path\": [\"Discovery API 1.0\", \"Paginate results\"], \"text\": \"Paginate results\\nGET /catalog/v1?limit={number}&offset={number}\\nThe search service allows pagination of results. By default, we will return at most 100 results starting from 0. Using the limit and offset params will return at most {limit} results starting from {offset}.\\nIf the sum of the offset and limit parameters is greater than 10000, the server will respond with a 400. If your use-case involves scanning over a large set of results, you will want to use the scroll_id parameter in conjunction with the limit parameter. For more detail, refer to Deep scrolling results.\\nExamples:\\n?limit=10&offset=0\\n?limit=10&offset=10\\n?limit=10&offset=20\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&offset={number}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Paginate results\", \"path\": [\"Discovery API 1.0\", \"Paginate results\", \"Request\", \"query\"], \"text\": \"Paginate results - query parameters\\n- limit (number): The max number of results to return.\\n- Constraints: Range: [0,10000] (offset): number The starting point for paging.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-resp-1\", \"type\": \"response-fields\", \"title\": \"Paginate results\", \"path\": [\"Discovery API 1.0\", \"Paginate results\", \"Response\"], \"text\": \"Paginate results - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\"], \"text\": \"Deep scroll results\\nGET /catalog/v1?limit={number}&scroll_id={id}\\nThe search API is optimized for the prototypical use-case -- namely, providing some queries or filter conditions, and retrieving a relatively small number of search results. As a result, the search service does not support paging over a large set of search results. Specifically, if the sum of the offset and limit parameters is greater than 10000, the server will respond with a 400. This will happen regardless of the actual result set size. Larger result sets can be incrementally paged over via the scroll_id parameter.\\nThis parameter takes a value corresponding to an asset ID, specifically, the ID of the last result in the previously fetched chunk of results. So for example, suppose you execute a query and find that it returns a large set of results (ie. more than 10000). You should execute the same query again, including a reasonable value for the limit parameter, being sure to include the scroll_id parameter as well. Initially, you won't have a value for the scroll_id parameter, so you will leave it blank. But with each subsequent request, you should pass the asset id corresponding to the last result from the previously fetched batch of results.\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&scroll_id={id}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-2\", \"type\": \"endpoint\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\"], \"text\": \"Note that sorting parameters are not honored when used in conjunction with deep scrolling via the scroll_id parameter. If the order or offset parameters are specified at the same time as the scroll_id parameter, the server will respond with a 400.\\nExamples:\\n?limit=100&scroll_id\\n?limit=100&scroll_id=6rrk-xbdr\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&scroll_id={id}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\", \"Request\", \"query\"], \"text\": \"Deep scroll results - query parameters\\n- limit (number): The max number of results to return.\\n- Constraints: Range: [0,10000] (scroll_id): string Initially empty, but afterwards, the four-by-four identifier of the final asset in the current results.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-resp-1\", \"type\": \"response-fields\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\", \"Response\"], \"text\": \"Deep scroll results - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-boost-key-number-boost-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Boost assets\", \"path\": [\"Discovery API 1.0\", \"Boost assets\"], \"text\": \"Boost assets\\nGET /catalog/v1?boost{key}={number}\\nIt is possible to adjust the rankings of assets to promote them above others. This leverages the weight function of function score queries. This weight acts as a multiplier for the relevance score of each document. Thus, a number between 0 and 1 will demote assets, while any number greater than 1 will boost them.\\nSeveral parameters allow for different types of boosting. Some notes about the table below:\\nThe Explanation assumes a greater than 1 value Where you see {variable_name} in the Parameter, that requires substituting in a value. See the examples below. The boost params boostTitle, boostDesc and boostColumns work in conjunction with the q param Parameter\\tExplanation boostOfficial\\tOfficial assets boosted; community assets not boost{Datatype}\\tAssets having the given {Datatype} boosted; others not boostDomains[{DomainName}]\\tAssets from the given {DomainName} boosted; others not boostTitle\\tAssets with titles matching the 'q' query boosted; others not boostDesc\\tAssets with descriptions matching the 'q' query boosted; others not boostColumns\\tAssets with column names matching the 'q' query boosted; others not\\nExamples:\\n?boostOfficial=3.6\\n?boostStories=2&boostMaps=3\\n?boostDomains[data.ny.gov]=2\\n?boostTitle=2&q=Lotto\\n?boostDesc=1.5&q=hospitalizations\\n?boostColumns=5.67&q=vendor\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?boost{key}={number}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Boost assets\", \"path\": [\"Discovery API 1.0\", \"Boost assets\", \"Request\", \"query\"], \"text\": \"Boost assets - query parameters\\n- boostOfficial (number): Multiplier for the relevance score of official assets.\\n- boost{Datatype} (number): Multiplier for the relevance score of assets with the given {Datatype}. A parameter name for example is boostStories or boostMaps.\\n- boostDomains[{DomainName}] (number): Multiplier for the relevance score of assets from the given {DomainName}. A parameter name for example is boostDomains[data.ny.gov] or boostDomains[data.texas.gov].\\n- boostTitle (number): Multiplier for the relevance score of assets having a title that matches the given query. Use with the q parameter to define the query.\\n- boostDesc (number): Multiplier for the relevance score of assets having a description that matches the given query. Use with the q parameter to define the query.\\n- boostDesc (number): Multiplier for the relevance score of assets having column names that matches the given query. Use with the q parameter to define the query.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-boost-key-number-boost-assets-resp-1\", \"type\": \"response-fields\", \"title\": \"Boost assets\", \"path\": [\"Discovery API 1.0\", \"Boost assets\", \"Response\"], \"text\": \"Boost assets - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-summary-1\", \"type\": \"endpoint\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\"], \"text\": \"Autocomplete asset names\\nGET /catalog/v1/autocomplete?q={query}&deduplicate={true|false}\\nThe Discovery API supports autocomplete of asset names and tags. Using the autocomplete endpoint for asset names returns assets having titles that match the search query. Any of the filtering parameters described above may be used with the required q parameter. Note that while this endpoint mirrors the top-level search endpoint, the behavior of the q parameter differs slightly. Just as with the full search endpoint, it takes arbitrary text. However, the autocomplete search is restricted to the 'name' field of the asset (i.e. the asset title). Additionally, this autocomplete search can return different assets than the top-level search. An simplified explanation is that the former matches characters while the latter matches words.\\nAn additional and optional parameter, deduplicate, provides two different behaviors. If 'true', no asset title will appear more than once. If 'false', every matching asset is returned along with its four-by-four identifier.\\nExamples:\\n?q=medi\\n?q=medi&deduplicate=true\\n?q=medi&deduplicate=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/autocomplete?q={query}&deduplicate={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-req-query-1\", \"type\": \"request-params\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\", \"Request\", \"query\"], \"text\": \"Autocomplete asset names - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\\n- deduplicate (boolean): Whether the results returned from autocomplete return distinct titles or not. When 'false', asset ids are returned in addition to the typical response.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-resp-1\", \"type\": \"response-fields\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\", \"Response\"], \"text\": \"Autocomplete asset names - response fields\\n- title (string): The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-summary-1\", \"type\": \"endpoint\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\"], \"text\": \"Autocomplete asset tags\\nGET /catalog/v1/tags/autocomplete?q={query}\\nThe Discovery API supports autocomplete of asset names and tags. Using the autocomplete endpoint for tags returns assets having tags that match the search query. Any of the filtering parameters described above may be used with the required q parameter. Note that while this endpoint mirrors the top-level search endpoint, the behavior of the q parameter differs slightly. Just as with the full search endpoint, it takes arbitrary text. However, the autocomplete search is restricted to the 'tags' field of the asset.\\nExamples:\\n?q=medi\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/tags/autocomplete?q={query}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-req-query-1\", \"type\": \"request-params\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\", \"Request\", \"query\"], \"text\": \"Autocomplete asset tags - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-resp-1\", \"type\": \"response-fields\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\", \"Response\"], \"text\": \"Autocomplete asset tags - response fields\\n- tag_text (string): The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-count-assets-by-domain-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by domain\", \"path\": [\"Discovery API 1.0\", \"Count assets by domain\"], \"text\": \"Count assets by domain\\nGET /catalog/v1/domains\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by domain. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by domain.\\nExamples:\\n?\\n?audience=public&q=dog\\n?only=maps\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domains\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-count-assets-by-domain-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by domain\", \"path\": [\"Discovery API 1.0\", \"Count assets by domain\", \"Response\"], \"text\": \"Count assets by domain - response fields\\n- domain (string): The domain's name.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-tags-count-assets-by-tag-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by tag\", \"path\": [\"Discovery API 1.0\", \"Count assets by tag\"], \"text\": \"Count assets by tag\\nGET /catalog/v1/domain_tags\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by tag. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by tag.\\nExamples:\\n?\\n?domains=data.texas.gov\\n?only=datasets&q=popul\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domain_tags\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-tags-count-assets-by-tag-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by tag\", \"path\": [\"Discovery API 1.0\", \"Count assets by tag\", \"Response\"], \"text\": \"Count assets by tag - response fields\\n- domain_tag (string): The tag.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-categories-count-assets-by-category-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by category\", \"path\": [\"Discovery API 1.0\", \"Count assets by category\"], \"text\": \"Count assets by category\\nGET /catalog/v1/domain_categories\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by category. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by category.\\nExamples:\\n?\\n?domains=data.ny.gov\\n?provenance=official\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domain_categories\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-categories-count-assets-by-category-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by category\", \"path\": [\"Discovery API 1.0\", \"Count assets by category\", \"Response\"], \"text\": \"Count assets by category - response fields\\n- domain_category (string): The category.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\"], \"text\": \"Count assets by facets\\nGET /catalog/v1/domains/{domain}/facets\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by the following facets:\\ndatatypes categories tags provenance custom metadata Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by each facet.\\nExamples:\\n?\\n?only=stories\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domains/{domain}/facets\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"Count assets by facets - response fields\\n- facet (string): The facet class.\\n- value (string): The facet value.\\n  note: Parameters Describes operation parameters. A unique parameter is defined by a combination of a name and location.\\n  note: approval_status Field Type Description string enum The internal or public approval status of an asset. Combine with a target_audience=public or target_audience=internal parameter to limit to the approval status of public-bound or internal-bound data. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\\n  note: Constraints: Range: [0,10000] Default: 100 Example: 10 min_should_match Field Type Description string The number or percent of words that must match. Acceptable formats are defined here.\\n  note: Constraints: Range: [0,10000] Default: 0 Example: 10 only Field Type Description string enum The datatype of an asset. Singular or plural terms are accepted. A comma-separated list of types is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-2\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Default: relevance Allowed: relevance \\u2503 name \\u2503 owner \\u2503 dataset_id \\u2503 datatype \\u2503 domain_category \\u2503 createdAt \\u2503 updatedAt \\u2503 page_views_total \\u2503 page_views_last_month \\u2503 page_views_last_week parent_ids Field Type Description string The four-by-four identifier of a parent asset having child assets. A comma-separated list of IDs is supported. Repeated params are supported.\\n  note: For autocomplete, a token matching either an asset's name or tags.\\n  note: Field Type Description state string enum The approvals state of the asset.\\n  note: Field Type Description Resource Primary metadata about the asset.\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-3\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n  note: Field Type Description domain_category string The category.\\n  note: Field Type Description categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n  note: Field Type Description id string The four-by-four identifier of the user.\\n  note: Field Type Description domain string The domain's name.\\n  note: Field Type Description facet string The facet class.\\n- value (string): The facet value.\\n  note: Field Type Description start number Where the matched query term starts, as a character count, in the associated asset field.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-4\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- length (number): The number of characters the matched query term has.\\n  note: Field Type Description domain string The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n  note: Field Type Description id string The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n  note: Field Type Description page_views_last_week integer The number of views the asset has had in the last week.\\n  note: Field Type Description name string The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: TagAndCount The tag and the count of matching assets.\\n  note: Field Type Description domain_tag string The tag.\\n  note: Field Type Description tag_text string The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n  note: Field Type Description serviceMillis number The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-5\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Field Type Description title string The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n  note: Field Type Description value string The facet value.\\n  note: 200 - Autocomplete Tags Response The response from a query to api/catalog/v1/tags/autocomplete.\\n  note: Field Type Description [TagMatch] An array of the autocomplete matches from a query.\\n- tag_text (string): The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [TitleMatch] An array of the autocomplete matches from a query.\\n- title (string): The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-6\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [CategoryAndCount] An array of categories and counts.\\n- domain_category (string): The category.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [DomainAndCount] An array of domains and counts.\\n- domain (string): The domain's name.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description facet string The facet class.\\n- value (string): The facet value.\\n  note: Field Type Description [TagAndCount] An array of tags and counts.\\n- domain_tag (string): The tag.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [Asset] An array of the assets returned from a query.\\n  note: Resource Primary metadata about the asset.\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-7\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description error string The error message\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-8\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-api-endpoints-1\", \"type\": \"section\", \"title\": \"API Endpoints\", \"path\": [\"API Endpoints\", \"API Endpoints\"], \"text\": \"API Endpoints\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-api-endpoints-2\", \"type\": \"section\", \"title\": \"API Endpoints\", \"path\": [\"API Endpoints\", \"API Endpoints\"], \"text\": \"API Endpoints What is an API Endpoint? The \\u201cendpoint\\u201d of a SODA API is simply a unique URL that represents an object or collection of objects. Every Socrata dataset, and even every individual data record, has its own endpoint. The endpoint is what you\\u2019ll point your HTTP client at to interact with data resources. All resources are accessed through a common endpoint of /api/v3/views/IDENTIFIER/query.json along with their dataset identifier. This paradigm holds true for every dataset in every SODA API. All datasets have a unique identifier - eight alphanumeric characters split into two four-character phrases by a dash. For example, ydr8-5enu is the identifier for the Building Permits. This identifier can then be inserted into the /api/v3/views/IDENTIFIER/query endpoint to construct the API endpoint. The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Once you\\u2019ve got your API endpoint, you can make requests with SoQL to filter and manipulate your dataset. Locating the API endpoint for a dataset You can also find API endpoints, and links to detailed developer documentation for each dataset, in a number of different places, depending on where you are: If you\\u2019re viewing a dataset listing within the Open Data Network, there will be a prominent \\u201cAPI\\u201d button that will take you directly to the API documentation for that dataset.  See this If you\\u2019re viewing a dataset directly, there will be an \\u201cAPI Documentation\\u201d button under \\u201cExport\\u201d and then \\u201cSODA API\\u201d.  See this\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-endpoint-versioning-1\", \"type\": \"section\", \"title\": \"Endpoint Versioning\", \"path\": [\"API Endpoints\", \"Endpoint Versioning\"], \"text\": \"Endpoint Versioning\\nSODA and SoQL are very flexible and allow us to add functionality over time without needing to completely deprecate and replace our APIs. We can do so in several different ways: By introducing new SoQL functions that provide new functionality. We could, for example, add a new function that allows you to filter or aggregate a dataset in a new way. By adding new datatypes to represent new data, like a new datatype for a new class of geospatial data. This allows us to introduce additional capabilities while still allowing you to issue the same kinds of queries in a backwards-compatible manner. We can extend SODA APIs without needing all developers to migrate their code to a new version. However, some functionalities are not available on all of our API endpoints, which is why we differentiate between versions of a dataset\\u2019s API. Functions made available on a newer version might not be available on an API endpoint of an older version. In the sidebar of our automatic API documentation, we list the version that that endpoint complies with, as well as other useful information.  See this Throughout the documentation on this developer portal you\\u2019ll notice version toggles and info boxes that will help you understand the difference between SODA endpoint versions.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-3-0-latest-1\", \"type\": \"section\", \"title\": \"Version 3.0 (Latest)\", \"path\": [\"API Endpoints\", \"Version 3.0 (Latest)\"], \"text\": \"Version 3.0 (Latest)\\nThe next iteration of SODA will be released in 2025 and changes the endpoint from /resource/IDENTIFIER.json to /api/v3/IDENTIFIER/query.json. Notable changes: Query requests must be either authenticated by a user or marked with a valid application token. We have separated the endpoint into two: /query for querying (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/query.json) Query primarily supports machine-readability and has more options for customizing the request. /export for exports (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/export.csv) Export supports more formats and focuses on generating something readable by humans. We strongly prefer that use the HTTP POST method when requesting queries, as this allows for longer queries and clearer options.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-1-1\", \"type\": \"section\", \"title\": \"Version 2.1\", \"path\": [\"API Endpoints\", \"Version 2.1\"], \"text\": \"Version 2.1\\nThe first SODA 2.1 APIs (previously referred to as our \\u201chigh-performance Socrata Open Data APIs\\u201d) were released in April of 2015, and in November of 2015 they received the \\u201c2.1\\u201d version designation for clarity. SODA 2.1 introduces a number of new datatypes as well as numerous new SoQL functions: Tons of new advanced SoQL functions to introduce powerful filtering and analysis into your queries New geospatial datatypes like Point , Line , and Polygon replace the Location datatype Support for the standardized GeoJSON output format, for direct use within geospatial tools like Leaflet Closer compliance with SQL semantics, such as Text comparisons becoming case-sensitive Currently only the JSON, CSV, and GeoJSON output formats are supported New functionality will be added to this version over time. For more information: SoQL functions that work with version 2.1 Datatypes that are available in version 2.1\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-1\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Version 2.0\\nSODA 2.0 was originally released in 2011. Although 2.1 is backwards-compatible with 2.0, there are a number of differences between the two APIs: 2.0 supports fewer SoQL functions than 2.1. The only geospatial datatype supported is the Location datatype Text comparisons are case-insensitive For more information: SoQL functions that work with version 2.0 Datatypes that are available in version 2.0 Versioning HTTP headers The simplest way to tell the difference between a 2.0 API and a 2.1 API is via the X-SODA2-Legacy-Types header, which will be true if you\\u2019re accessing a legacy 2.0 API. When we will increment endpoint versions From time to time, we\\u2019ll introduce new SoQL functions and datatypes to the latest version of the SODA API. Those changes will be non-breaking, and old queries and applications will continue to function unchanged. The SODA API is designed to make it easy to introduce new functionality over time without making breaking changes.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-row-identifiers-1\", \"type\": \"section\", \"title\": \"Row Identifiers\", \"path\": [\"API Endpoints\", \"Row Identifiers\"], \"text\": \"Row Identifiers\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-row-identifiers-2\", \"type\": \"section\", \"title\": \"Row Identifiers\", \"path\": [\"API Endpoints\", \"Row Identifiers\"], \"text\": \"What is a Row Identifier? Socrata datasets are essentially a collection of rows. Each row can be uniquely designated by its \\u201crow identifier\\u201d, much like a driver\\u2019s license number or social security number identifies an individual. For those familiar with database concepts, they essentially act the same way as primary keys. Internal Identifiers vs Publisher-Specified Identifiers Row identifiers come in two flavors: Internal identifiers are auto-generated by the Socrata platform every time a new row is created. Publisher-specified identifiers are configured by the dataset owner and use a field of unique values within the dataset as the row identifier. Depending on what dataset you're accessing, internal row identifiers may be simple integers, or alphanumeric strings. There's no difference between the two in how you use them. To learn more about how to access internal row identifiers, read the System Fields documentation. Establishing a Publisher-Specified Identifier Setting a row identifier requires that you are either the owner of a dataset, or that you've been granted a role of Publisher or Administrator on a Socrata customer site. Basically, if you can't modify the dataset, you can't set a row identifier. A publisher-specified row identifier can be established for any Socrata dataset. A common column to use as a row identifier is an \\u2018ID\\u2019 column with some kind of number or code that uniquely identifies that row of data. For example, the \\u2018Inspection ID\\u2019 column of Chicago\\u2019s Food Inspections dataset is a Publisher-specified row identifier. How to Set a Row Identifier See this helpful guide on how to set a row identifier in Socrata. RESTful Verbs The Socrata API follows the REST (REpresentational State Transfer) design pattern. This means that the CRUD (Create, Read, Update, and Delete) operations are specified by using HTTP methods. These are referred to as RESTful verbs. GET Use the HTTP GET method to obtain data. As described in the Endpoints section, GET can be used to retrieve column data from multiple rows or from one single row. The Queries section describes how to do sophisticated queries, all with the GET method. For SODA3, you must authenticate or use an application token in order to query for or export data. You may preferentially use POST, which is useful if your SoQL query is very long. POST Use the HTTP POST method to add new rows in a dataset. See the SODA Producer API section for more details on how to add data. Note that you will need to authenticate in order to make changes. See the Authentication section for more information on how to do this. PUT Use the HTTP PUT method to modify data. Like POST, you will need authentication. Again, see the SODA Producer API and Authentication sections for more information. DELETE Use the HTTP DELETE method to remove data. Like POST and PUT, you will need authentication. Again, see the SODA Producer API and Authentication sections for more information.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-application-tokens-1\", \"type\": \"section\", \"title\": \"Application Tokens\", \"path\": [\"API Endpoints\", \"Application Tokens\"], \"text\": \"Application Tokens\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-application-tokens-2\", \"type\": \"section\", \"title\": \"Application Tokens\", \"path\": [\"API Endpoints\", \"Application Tokens\"], \"text\": \"The Socrata Open Data API uses application tokens for two purposes: Using an application token allows us to throttle by application, rather than via IP address, which gives you a higher throttling limit Authentication using OAuth Throttling limits Without an application token, we can only track usage and perform throttling based on a few simple criteria, mainly source IP address. As such, requests that aren\\u2019t using an application token come from a shared pool via IP address. IP addresses that make too many requests during a given period may be subject to throttling. When requests are made using an application token, we can actually attribute each request to a particular application and developer, granting each their own pool of API requests. Currently we do not throttle API requests that are using an application token, unless those requests are determined to be abusive or malicious. We reserve the right to change these throttling limits with notice, and we will post an update to announce any such change. If you are throttled for any reason, you will receive a status code 429 response. Don\\u2019t be a jerk! Dont do that! Yes, I know it says you get unlimited requests. But keep in mind that you\\u2019re using a shared platform, and you should still be deliberate in how you design your application to use our API. Applications that are determined to be abusive or malicious, or that otherwise monopolize the use of our API may be throttled. If we detect that your application is nearing the point where we may have to throttle it, we will likely pro-actively reach out to you to discuss how you can optimize your usage. If you have any questions, feel free to contact us and we\\u2019d be glad to help! Obtaining an Application Token You can obtain an application token by registering for one in your Socrata profile. Using your Application Token While it is possible to perform simple unauthenticated queries against the Socrata Open Data API without making use of an application token, you\\u2019ll receive much higher throttling limits if you include an application token in your requests. If you elect not to use an application token, you\\u2019ll be subjected to a much lower throttling limit for all requests originating from your IP address. Here\\u2019s how you include the application token in the request: SODA Version\\tMethod 3.0, 2.x\\tUse the X-App-Token HTTP header. 2.1, 2.0\\tUse the $$app_token parameter in your request. 1.0\\tUse the app_token parameter in your request. Using the header is the preferred method. Note: Application tokens are not necessarily used for authentication, but you should still preserve the security of your application token by always using HTTPS requests. If your application token is duplicated by another developer, their requests will count against your quota. The following is an example of using the X-App-Token HTTP header to pass an application token: POST /api/v3/views/kzjm-xkqj/query.json HTTP/1.1 Host: data.seattle.gov Accept: application/json X-App-Token: [REDACTED] The same application token could also be passed as a URL parameter: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Using the Application Token as part of the OAuth 2.0 authentication process Application tokens can also be used for authentication using OAuth 2.0. For more information, see the authentication section.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"Authentication\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-2\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"There are two methods available for authentication: HTTP Basic and OAuth 2.0. For non-interactive applications, we only support HTTP Basic Authentication. We encourage all our developers of interactive applications to use the OAuth 2.0 workflow to authenticate their users. HTTP Basic Authentication is required when you are authenticating from a script that runs without interaction with the user, like your ETL tool, an update script, or any other data management automation. OAuth 2.0 is the preferred option for cases where you are building a web or mobile application that needs to perform actions on behalf of the user, like accessing data, and the interaction model allows you to present the user with a form to obtain their permission for the app to do so. Authenticating using HTTP Basic Authentication Requests can be authenticated using HTTP Basic Authentication. You can use your HTTP library\\u2019s Basic Auth feature to pass your credentials. All HTTP-basic-authenticated requests must be performed over a secure (https) connection. Authenticated requests made over an insecure connection will be denied. Users may use their username and password or an API key and secret pair to authenticate using Basic Authentication. Documentation on how to create and manage API keys can be found here. We recommend using API keys! They provide the following benefits: Access Socrata APIs without the risk of embedding your username and password in scripts or code Users on domains that require SSO (and thus without passwords) can access Socrata APIs Create individual keys for different apps or jobs so that if any one needs to be revoked or rotated, other apps are unaffected Change your account password without disrupting apps or rotate API keys without disrupting logins Here is a sample HTTP session that uses HTTP Basic Authentication: POST /api/v3/views/4tka-6guv/query.json HTTP/1.1 Host: soda.demo.socrata.com Authorization: Basic [REDACTED] Content-Type: application/json X-App-Token: [REDACTED] Note that the Authorization header in this request will usually be generated via your HTTP library\\u2019s Basic Auth feature (as opposed to manually constructing the Base64 encoding of your credentials yourself). For example, if you\\u2019re using Python\\u2019s requests module, it supports Basic Authentication out of the box. Similarly, an API tool like Postman also handles Basic Authentication. OAuth 2.0 Note: When developing applications that make use of OAuth, you must provide a web-accessible callback URL when registering your application token. This can make it difficult to develop on a machine that isn't directly exposed to the Internet. One great option is to use a tool like ngrok to create a secure tunnel to expose your web application in a secure manner.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-workflow-1\", \"type\": \"section\", \"title\": \"Workflow\", \"path\": [\"API Endpoints\", \"Workflow\"], \"text\": \"Workflow\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-workflow-2\", \"type\": \"section\", \"title\": \"Workflow\", \"path\": [\"API Endpoints\", \"Workflow\"], \"text\": \"We support a subset of OAuth 2.0 \\u2014 the server-based flow with a callback URL \\u2014 which we believe is more secure than the other flows in the specification. This OAuth flow is used by several other popular API services on the web. We have made the authentication flow similar to Google AuthSub. To authenticate with OAuth 2.0, you will first need to register your application, which will create an app token and a secret token. When registering your application, you must preregister your server by filling out the Callback Prefix field), so that we can be sure that access through your application is secure even if both your tokens are stolen. The Callback Prefix is the beginning of the URL that you will use as your redirect URL. Generally, you\\u2019ll want to provide as much of your callback URL as you can. For example, if your authentication callback is https://my-website.com/socrata-app/auth/callback, you might want to specify https://my-website.com/socrata-app as your callback URL. Once you have an application and a secret token, you\\u2019ll be able to authenticate with the SODA OAuth 2.0 endpoint. You\\u2019ll first need to redirect the user to the Socrata-powered site you wish to access so that they may log in and approve your application. For example: https://soda.demo.socrata.com/oauth/authorize?client_id=YOUR_AUTH_TOKEN&response_type=code &redirect_uri=YOUR_REDIRECT_URI Note that the redirect_uri here must be an absolute, secure (https:) URI which starts with the Callback Prefix you specified when you registered your application. If any of these cases fail, the user will be shown an error indicating as much. Should the user authorize your application, they will be redirected back to the your redirect_uri. For example, if I provide https://my-website.com/socrata-app/auth/callback as my redirect_uri, the user will be redirected to this URL: https://my-website.com/socrata-app/auth/callback?code=CODE where CODE is an authorization code that you will use later. If your redirect_uri contains a querystring, it will be preserved, and the code parameter will be added onto the end of it. Likewise, if you provide the optional state parameter in the original redirect to /authenticate, it will be preserved and sent back to you. Now that the user has authorized your application, the next step is to retrieve an access_token so that you can perform operations on their behalf. You can do this by making the following POST request from your server: https://soda.demo.socrata.com/oauth/access_token \\\"client_id\\\": YOUR_AUTH_TOKEN, \\\"client_secret\\\": YOUR_SECRET_TOKEN, \\\"grant_type\\\": \\\"authorization_code\\\", \\\"redirect_uri\\\": YOUR_REDIRECT_URI, \\\"code\\\": CODE where YOUR_AUTH_TOKEN and YOUR_SECRET_TOKEN are the tokens you received when registering your app, YOUR_REDIRECT_URI is the same value as what you used previously, and CODE is the value of the code query parameter of the URL that the user was redirected to. You\\u2019ll receive the following response: { access_token: ACCESS_TOKEN } Use this access_token in your requests when you have to do work on behalf of the now-authenticated user, as described below in the Using an OAuth 2.0 Access Token section. We have a sample app available on GitHub that illustrates how to do all of the above with the Ruby OAuth2 gem. Using an OAuth 2.0 Access Token Once you have obtained an access_token, you should include it on requests which need to happen on behalf of the user. The token must be included in the Authorization HTTP Header field as follows: Authorization: OAuth YOUR_ACCESS_TOKEN Note: All authenticated requests must be performed over a secure connection (https). Any attempt to use an access_token over a non-secure connection will result in immediate revocation of the token. Who am I? One quirk of authenticating via OAuth 2.0 is that the entire process happens without the 3rd party application (that\\u2019s you!) having any knowledge of who, exactly, the user is that just authorized the application. To remedy this, we have set up an endpoint that simply returns the information of the current user. To return the data in JSON: https://soda.demo.socrata.com/api/users/current.json To return the data in XML: https://soda.demo.socrata.com/users/current.xml\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-response-codes-headers-1\", \"type\": \"section\", \"title\": \"Response Codes & Headers\", \"path\": [\"API Endpoints\", \"Response Codes & Headers\"], \"text\": \"Response Codes & Headers\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-response-codes-1\", \"type\": \"section\", \"title\": \"Response Codes\", \"path\": [\"API Endpoints\", \"Response Codes\"], \"text\": \"Response Codes\\nThe Socrata Open Data API responds with standard HTTP Status Codes for both successful requests and for errors. The table below lists the response codes you should expect to see. 200\\tOK\\tYour request was successful 202\\tRequest Processing\\tYou can retry your request, and when it\\u2019s complete, you\\u2019ll get a 200 instead 400\\tBad Request\\tProbably your request was malformed. See the error message in the body for details 401\\tUnauthorized\\tYou attempted to authenticate but something went wrong. Make sure you follow the instructions to authenticate properly 403\\tForbidden\\tYou\\u2019re not authorized to access this resource. Make sure you authenticate to access private datasets 404\\tNot Found\\tThe resource requested doesn\\u2019t exist 429\\tToo Many Requests\\tYour client is currently being rate limited. Make sure you\\u2019re using an app token 500\\tServer Error\\tOur bad! Something has gone wrong with Socrata\\u2019s platform. Please let us know if you encounter a 500 error\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-headers-1\", \"type\": \"section\", \"title\": \"Headers\", \"path\": [\"API Endpoints\", \"Headers\"], \"text\": \"Headers\\nFor SODA 2.1 API calls, we include a few response headers that may be useful: X-Socrata-RequestId\\taqe1bgaxzvhitfgrsvy6semhi\\tA unique ID for this particular request. Very useful to include when asking for help, as it allows us to track your error down in our system Access-Control-Allow-Origin\\t*\\tAllows browsers to make cross-origin requests for data X-SODA2-Fields\\t[\\\"business\\\",\\\"category\\\", ...] (truncated)\\tAn array of the field names that may be included in this response X-SODA2-Types\\t[\\\"text\\\",\\\"text\\\",...] (truncated)\\tAn array of the data types for fields included in this response Last-Modified\\tTue, 24 Feb 2015 18:51:22 GMT\\tWhen the dataset backing this request was updated; may be used for caching ETag\\t\\\"YWxwaGEuNTQzNV8...-gzip\\\" (truncated)\\tAn HTTP ETag which may be used for cache validation There may be other headers included in responses, but they should not be relied upon and may change without notice. HTTP Headers are limited by practical constraints to a maximum size of 4K. In order to keep our request header sizes below that limit, the X-SODA2-Fields and X-SODA2-Types headers may be omitted for datasets with a very large number of columns.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-error-messages-1\", \"type\": \"section\", \"title\": \"Error Messages\", \"path\": [\"API Endpoints\", \"Error Messages\"], \"text\": \"Error Messages\\nFor any variety of error, we return a standard error message format that looks like the following: \\\"code\\\" : \\\"soql.analyzer.typechecker.type-mismatch\\\", \\\"error\\\" : true, \\\"message\\\" : \\\"Type mismatch: expected text, but found number\\\", \\\"status\\\" : 400, \\\"data\\\" : { \\\"found\\\" : \\\"number\\\", \\\"expected\\\" : [ \\\"text\\\" ]\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\n\\\"source\\\" : { \\\"position\\\" : { \\\"column\\\" : 30, \\\"row\\\" : 1, \\\"text\\\" : \\\"select * where string_column > 42\\\" \\\"type\\\" : \\\"anonymous\\\" In particular: code: An enumeration for the particular class of error you have encountered error: A boolean flag you can check in your code if your library masks the HTTP error code. Ex: if(response.error) { // handle error } message: A human-readable error message that will help you debug what caused the error data: Machine-readable data about the error, most importantly the query generated by our SoQL parser based on your inputs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-system-fields-1\", \"type\": \"section\", \"title\": \"System Fields\", \"path\": [\"API Endpoints\", \"System Fields\"], \"text\": \"System Fields\\nIn addition to the fields provided by the dataset owner, Socrata also provides a number of useful system fields you can make use of. They\\u2019re very useful for detecting when datasets have changed. :id\\tThe internal Socrata identifier for this record. :created_at\\tA Fixed Timestamp representing when this record was created. :updated_at\\tA Fixed Timestamp representing when this record was last updated. System fields are not included by default, and the method that you use to request the inclusion of the hidden system fields depends on what version of the SODA API specification the API you are accessing complies with. To learn more about API versioning, see the API Endpoint documentation.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-1-1\", \"type\": \"section\", \"title\": \"Version 2.1\", \"path\": [\"API Endpoints\", \"Version 2.1\"], \"text\": \"Version 2.1\\nWith version 2.1 APIs, accessing the system fields is as simple as including them in your $select parameter, either explicitly or via a wildcard. You can either $select=:id, :updated_at, name, address, or you could be even more broad and simply select :*, * to retrieve both all of the hidden internal fields and the fields from the dataset itself. For example: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Since :created_at and :updated_at are Fixed Timestamp, you can query them to get recent updates to a dataset using the $where query parameter, like this example: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. A note on how datasets are updated Data providers use many different methods to update datasets. In some cases, they use tools like DataSync or the SODA Producer API to update datasets, and we can tell which records within the dataset have actually been modified, and only update them accordingly. When data providers perform a full replace of the dataset using the SODA Producer Replace API, all of its records will be updated within a short period of time, in which case a query based on :updated_at will show that all of the records have changed.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-1\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Version 2.0\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-2\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Getting the SODA API to return system fields is as simple as adding the parameter $$exclude_system_fields=false to your request. The double dollar sign ($$) is significant - it denotes a Socrata-specific parameter that is not part of the SODA standard. The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. CORS & JSONP For security reasons, web browsers prevent what are called \\u201ccross-origin\\u201d or \\u201ccross-site\\u201d requests from one domain to another. JavaScript XMLHTTPRequests (commonly called \\u201cAJAX\\u201d requests) inherit all of the authentication context of the currently logged in user, so a malicious web page could attempt to make malicious requests that cross domain contexts and cause trouble. Historically, that has made it difficult for web developers to build web applications making use of third-party APIs. Fortunately, techniques have since been developed that allow developers to securely access APIs cross-domain. The two most popular ones, and the techniques that Socrata supports, are CORS and JSONP. A note on CORS, JSONP, and dataset permissions In order to prevent the aforementioned malicious cross-site attacks, Socrata automatically drops all authentication and authorization on requests that come in via CORS and JSONP. As a result, these techniques can only be used to access public datasets in a read-only fashion. Cross-Origin Resource Sharing (CORS) CORS is a proposed standard for allowing your web browser and a web server to negotiate and allow requests to be made across domain contexts. CORS is currently supported in modern Chrome, Firefox, Safari, and Internet Explorer (10+) web browsers. The standard itself is working its way through the W3C on its way to becoming official. You don\\u2019t need to do anything special to use CORS with JavaScript in a modern browser. Your web browser and our servers will automatically negotiate the cross-origin request. For example, to make a CORS request with jQuery, you\\u2019d make your request just like you were performing it within the context of your own domain. $.ajax({ url: \\\"https://data.chattlibrary.org/api/v3/views/e968-fnk9/query.json\\\", method: \\\"POST\\\", dataType: \\\"json\\\", data: JSON.stringify({ \\\"query\\\": \\\"SELECT * WHERE status = 'CLOSED'\\\", \\\"page\\\": { \\\"pageNumber\\\": 1, \\\"pageSize\\\": 1000\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\n\\\"includeSynthetic\\\": false\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"}),\", \"path\": [\"API Endpoints\", \"}),\"], \"text\": \"}),\\nheaders: { 'Content-Type': 'application/json', 'X-App-Token': app_token\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\nsuccess: function( data, status, jqxhr ){ console.log( \\\"Request received:\\\", data ); error: function( jqxhr, status, error ){ console.log( \\\"Something went wrong!\\\" );\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"});\", \"path\": [\"API Endpoints\", \"});\"], \"text\": \"});\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-2\", \"type\": \"section\", \"title\": \"});\", \"path\": [\"API Endpoints\", \"});\"], \"text\": \"\\u201cJavaScript with Padding\\u201d (JSONP) If you\\u2019re developing for older browsers, or you just feel like being nostalgic, you can also make use of our support for JSONP. Also called \\u201cJSON with Padding\\u201d, it is a technique for fooling a web browser into performing cross-origin requests using a special <script> tag that uses the src attribute to make a special API request. Instead of responding with just a JSON object, the server responds with JavaScript code that calls a client-declared callback function, passing the data as that function\\u2019s first parameter. With the Socrata API, the name of that callback function is declared using the $jsonp parameter. Sounds hacky, huh? Fortunately, tools like jQuery make it easy to use JSONP: $.ajax({ url: \\\"https://data.chattlibrary.org/resource/e968-fnk9.json\\\", jsonp: \\\"$jsonp\\\", dataType: \\\"jsonp\\\" }).done(function(data) { console.log(\\\"Request received: \\\" + data); But, as we mentioned, you should only need to use JSONP as a fallback in cases where you\\u2019re working with a browser that doesn\\u2019t support CORS. Queries using SODA3 The Socrata APIs provide rich query functionality through a query language we call the \\u201cSocrata Query Language\\u201d or \\u201cSoQL\\u201d. As its name might suggest, it borrows heavily from Structured Query Language (SQL), used by many relational database systems. Its paradigms should be familiar to most developers who have previously worked with SQL, and are easy to learn for those who are new to it. Requests must be either authenticated by a user or marked with a valid application token. Developers should now use the HTTP POST method when requesting queries, as this allows for longer queries and clearer options. The endpoints are split into two: /query for querying (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/query.json) Query has more options for customizing the request so that you can fine-tune what data you want back. /export for exports (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/export.csv) Export focuses on providing the entire dataset to be consumed by humans or Microsoft Excel or similar programs. You can click on each option to see more information about them: Request Option\\t/query\\t/export\\tDescription query\\tavailable\\tavailable\\tThe SoQL query to run page\\tavailable\\tnot available\\t{ pageNumber: 1, pageSize: 1000 } to indicate which page (1-indexed) and how many rows per page parameters\\tavailable\\tavailable\\tSome views require parameters to be provided by the user. Details to be provided at a later date timeout\\tdefault: 600\\tdefault: 600\\tThe number of seconds before timing out the request. Default: 600 (10 minutes) includeSystem\\tdefault: true\\tnot available\\tWhether or not to include system columns includeSynthetic\\tdefault: true\\tnot available\\tWhether or not to include not-explicitly-requested columns, such as system fields orderingSpecifier\\tdefault: total\\tdefault: total\\tCan be set to discard if you do not care about order and just want the data. Can improve performance significantly serializationOptions\\tnot available\\tavailable\\tDifferent formats have specific customization options.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-example-1\", \"type\": \"section\", \"title\": \"Example\", \"path\": [\"API Endpoints\", \"Example\"], \"text\": \"Example\\nYou might use the popular program cURL to make the request with the appropriate payload, or use an appropriate HTTP client library in your preferred programming language. Query for the first 100 rows of a dataset: curl --header 'X-App-Token: your-application-token' \\\\ --json '{ \\\"query\\\": \\\"SELECT *\\\", \\\"page\\\": { \\\"pageNumber\\\": 1, \\\"pageSize\\\": 100\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\n\\\"includeSynthetic\\\": false\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"}' \\\\\", \"path\": [\"API Endpoints\", \"}' \\\\\"], \"text\": \"}' \\\\\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-2\", \"type\": \"section\", \"title\": \"}' \\\\\", \"path\": [\"API Endpoints\", \"}' \\\\\"], \"text\": \"https://soda.demo.socrata.com/api/v3/views/4tka-6guv/query.json Export the dataset as CSV with a byte-order mark and a separator character of TAB: curl --header 'X-App-Token: your-application-token' \\\\ --json '{ \\\"serializationOptions\\\": { \\\"separator\\\": \\\"\\\\t\\\", \\\"bom\\\": true https://soda.demo.socrata.com/api/v3/views/4tka-6guv/export.csv SoQL Function and Keyword Listing The following are all the functions and keywords available in SoQL. Some only work on the the latest version of our API endpoints, while some work on legacy versions as well. You can filter them by endpoint version and datatype using the filters below. For a list of valid operators, see the Datatypes documentation. distinct\\tReturns distinct set of records\\t2.1 and 3.0 avg(...)\\tReturns the average of a given set of numbers\\t2.0, 2.1, and 3.0 between ... and ...\\tReturns TRUE for values in a given range\\t2.1 and 3.0 case(...)\\tReturns different values based on the evaluation of boolean comparisons\\t2.1 and 3.0 convex_hull(...)\\tReturns the minimum convex geometry that encloses all of another geometry\\t2.1 and 3.0 count(...)\\tReturns a count of a given set of records\\t2.0, 2.1, and 3.0 date_extract_d(...)\\tExtracts the day from the date as an integer.\\t2.1 and 3.0 date_extract_dow(...)\\tExtracts the day of the week as an integer between 0 and 6 (inclusive).\\t2.1 and 3.0 date_extract_hh(...)\\tExtracts the hour of the day as an integer between 0 and 23 (inclusive).\\t2.1 and 3.0 date_extract_m(...)\\tExtracts the month as an integer.\\t2.1 and 3.0 date_extract_mm(...)\\tExtracts the minute from the time as an integer.\\t2.1 and 3.0 date_extract_ss(...)\\tExtracts the second from the time as an integer.\\t2.1 and 3.0 date_extract_woy(...)\\tExtracts the week of the year as an integer between 0 and 51 (inclusive).\\t2.1 and 3.0 date_extract_y(...)\\tExtracts the year as an integer.\\t2.1 and 3.0 date_trunc_y(...)\\tTruncates a calendar date at the year threshold\\t2.0, 2.1, and 3.0 date_trunc_ym(...)\\tTruncates a calendar date at the year/month threshold\\t2.0, 2.1, and 3.0 date_trunc_ymd(...)\\tTruncates a calendar date at the year/month/date threshold\\t2.0, 2.1, and 3.0 distance_in_meters(...)\\tReturns the distance between two Points in meters\\t2.1 and 3.0 extent(...)\\tReturns a bounding box that encloses a set of geometries\\t2.1 and 3.0 greatest(...)\\tReturns the largest value among its arguments, ignoring NULLs.\\t2.1 and 3.0 in(...)\\tMatches values in a given set of options\\t2.1 and 3.0 intersects(...)\\tAllows you to compare two geospatial types to see if they intersect or overlap each other\\t2.1 and 3.0 least(...)\\tReturns the smallest value among its arguments, ignoring NULLs.\\t2.1 and 3.0 like '...'\\tAllows for substring searches in text strings\\t2.1 and 3.0 ln(...)\\tReturns the natural log of a number\\t2.1 and 3.0 lower(...)\\tReturns the lowercase equivalent of a string of text\\t2.1 and 3.0 max(...)\\tReturns the maximum of a given set of numbers\\t2.1 and 3.0 min(...)\\tReturns the minimum of a given set of numbers\\t2.1 and 3.0 not between ... and ...\\tReturns TRUE for values not in a given range\\t2.1 and 3.0 not in(...)\\tMatches values not in a given set of options\\t2.1 and 3.0 not like '...'\\tAllows for matching text fields that do not contain a substring\\t2.1 and 3.0 num_points(...)\\tReturns the number of vertices in a geospatial data record\\t2.1 and 3.0 regr_intercept(...)\\tReturns the y-intercept of the linear least squares fit\\t2.1 and 3.0 regr_r2(...)\\tReturns the square of the correlation coefficient (r\\u00b2)\\t2.1 and 3.0 regr_slope(...)\\tReturns the slope of the linear least squares fit\\t2.1 and 3.0 simplify(...)\\tReduces the number of vertices in a line or polygon\\t2.1 and 3.0 simplify_preserve_topology(...)\\tReduces the number of vertices in a line or polygon, preserving topology\\t2.1 and 3.0 starts_with(...)\\tMatches on text strings that start with a given substring\\t2.1 and 3.0 stddev_pop(...)\\tReturns the population standard deviation of a given set of numbers\\t2.1 and 3.0 stddev_samp(...)\\tReturns a sampled standard deviation of a given set of numbers\\t2.1 and 3.0 sum(...)\\tReturns the sum of a given set of numbers\\t2.1 and 3.0 unaccent(...)\\tRemoves accents (diacritical marks) from a string.\\t2.1 and 3.0 upper(...)\\tReturns the uppercase equivalent of a string of text\\t2.1 and 3.0 within_box(...)\\tReturns the rows that have geodata within the specified box, defined by latitude, longitude corners\\t2.0, 2.1, and 3.0 within_circle(...)\\tReturns the rows that have locations within a specified circle, measured in meters\\t2.0, 2.1, and 3.0 within_polygon(...)\\tReturns the rows that have locations within the specified box, defined by latitude, longitude corners\\t2.1 and 3.0\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-data-transform-listing-1\", \"type\": \"section\", \"title\": \"Data Transform Listing\", \"path\": [\"API Endpoints\", \"Data Transform Listing\"], \"text\": \"Data Transform Listing\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-data-transform-listing-2\", \"type\": \"section\", \"title\": \"Data Transform Listing\", \"path\": [\"API Endpoints\", \"Data Transform Listing\"], \"text\": \"These are the transformation functions available in the Dataset Management API. These functions can be used to transform and validate your data before you publish your dataset for consumption. These functions can be used in the \\u201cData Transforms\\u201d editor of the the Dataset Management Experience interface. Check out some of the examples on our Support Portal here! See the Dataset Management API docs for more info on how to use the transform functions as an API user. +\\tKeep a number\\u2019s sign and\\tLogical and of two boolean values ||\\tconcatenate two strings /\\tDivide a number by another =\\tReturn true if the left side equals the right ==\\tReturn true if the left side equals the right ^\\tNo documentation is available. >\\tReturn true if the value on the left is greater than the value on the right >=\\tReturn true if the value on the left is greater than or equal to the value on the right <\\tReturn true if the value on the left is less than the value on the right <=\\tReturn true if the value on the left is less than or equal to the value on the right %\\tFind the remainder(modulus) of one number divided by another *\\tMultiply two numbers together not\\tInvert a boolean <>\\tReturn true if the left side does not equal the right !=\\tReturn true if the left side does not equal the right or\\tLogical or of two boolean values -\\tSubtract a number from another abs\\tProduce the absolute value of a number between\\tReturn true if the left is within the range of the right values case\\tEvaluate a series of true/false expressions (predicates) and return the next consequent. centroid\\treturns the geometric centroid of a polygon or multipolygon. Please refer to coalesce\\tTake the leftmost non-null value. contains\\ttell whether or not a string contains another string county_boundary\\tReturns the boundary of the US county as a multipolygon. The state name is not case sensitive. date_extract_d\\tExtract the day from the date as an integer date_extract_dow\\tExtracts the day of the week as an integer between 0 and 6 where date_extract_hh\\tExtract the hour the date as an integer date_extract_m\\tExtract the month as an integer date_extract_mm\\tExtract the minute from the date as an integer date_extract_ss\\tExtract the second from the date as an integer date_extract_woy\\tExtracts the week of the year as an integer between 0 and 51 date_extract_y\\tExtract the year as an integer date_trunc_y\\tTruncates a calendar date at the year threshold date_trunc_ym\\tTruncates a calendar date at the year/month threshold date_trunc_ymd\\tTruncates a calendar date at the year/month/day threshold datetime_add_d\\tAdds or subtracts the specified number of days to the timestamp datetime_add_hh\\tAdds or subtracts the specified number of hours to the timestamp datetime_add_mm\\tAdds or subtracts the specified number of minutes to the timestamp datetime_add_ss\\tAdds or subtracts the specified number of seconds to the timestamp datetime_diff\\tCalculates the difference between two dates in seconds, minutes, hours, days, business days, weeks, calendar weeks, months, or years. domain_categories\\tReturns the categories currently configured on the domain. Useful primarily domain_licenses\\tReturns the licenses currently configured on the domain. Useful primarily email_parse\\tParse an email. This is best effort as most things are actually ensure_within\\tensure_within is a function which takes a point and a multipolygon error\\tMake an error. This is useful in conjunction with a case function, floating_timestamp_day\\tExtract the day from a calendar date floating_timestamp_day_of_week\\tExtract the day of the week as an integer between 0 and 6 where Sunday is 0. floating_timestamp_hour\\tExtract the hour from a calendar date floating_timestamp_minute\\tExtract the minute from a calendar date floating_timestamp_month\\tExtract the month from a calendar date floating_timestamp_second\\tExtract the second from a calendar date floating_timestamp_week_of_year\\tExtract the week from a calendar date as an integer between 0 and 51. floating_timestamp_year\\tExtract the year from a calendar date forgive\\tforgive can take an optional default argument from_polyline\\tconvert a linestring encode in Google\\u2019s polyline format with the given precision to a Line geocode\\tgeocode is a function which takes human readable addresses geocode_esri\\tgeocode_esri is a function which takes human readable addresses grapheme_length\\tthe length of a piece of text in unicode grapheme clusters. greatest\\treturn the largest value among its arguments (ignoring null) hash\\tConstruct a hash value from a string value using either the md5 or sha256 algorithm. haversine_distance\\tReturn the distance of the line using haversine formula http_get\\tMake an HTTP Get request to a URL. The response is returned. If the server in\\tWhether or not a value is in a set of other values is_empty\\tReturns whether or not the input is empty. Empty means null values, is_not_null\\tWhether or not a value is not null is_null\\tWhether or not a value is null is_within\\tis_within is a function which takes a point and a multipolygon json_array_contains\\tTest if a json array contains an item. If the JSON passed to this function is not an array, json_pluck\\tPluck a value out of a JSON string. The returned value will be a SoQL Json value. json_pluck_boolean\\tPluck a boolean value out of a JSON string. The returned value must be a boolean, otherwise json_pluck_number\\tPluck a number value out of a JSON string. The returned value must be a number, otherwise json_pluck_text\\tPluck a text value out of a JSON string. The returned value may be a primitive like a least\\treturn the smallest value among its arguments (ignoring null) left_pad\\tPad text with the minimum number of copies of pad to reach desired_length. length\\tthe length of a piece of text in unicode code points. This is usually, but not like\\tIf a string is like another string. location_address\\tExtract the address from a location location_city\\tExtract the city from a location location_point\\tExtract the point from a location location_state\\tExtract the state from a location location_to_point\\tTurn a location value into a point location_zip\\tExtract the zip from a location lower\\tlowercase a string make_location\\tThis function has been deprecated. Please use the make_point function instead. make_point\\tfunction to make a point out of a Y (latitude) and X (longitude) coordinate. make_url\\tNo documentation is available. not_between\\tReturn true if the left is not within the range of the right values not_in\\tWhether or not a value is absent from a set of other values not_like\\tIf a string is not like another string. parse_address\\tExtract a street address from a full US address. parse_city\\tExtract a city from a full US address. parse_point\\tExtract the point from a full US address with point. parse_state\\tExtract a state from a full US address. parse_zip\\tExtract a ZIP code from a full US address. point_latitude\\tExtract the latitude from a point point_longitude\\tExtract the longitude from a point polylabel\\tReturns a point that must exist within the polygon borders. It uses the recursive grid-based algorithm described here: https://github.com/mapbox/polylabel#how-the-algorithm-works. When given a multipolygon, the point it returns is within the largest (by area) sub-polygon. random_number_between\\tReturns a random float using a uniform distribution between the lower and upper values supplied: random_number_between(lower, upper) random_number_normal\\tReturns a random float using a normal distribution with the mean and variance supplied: random_number_normal(mean, variance) regex_capture\\tfunction to capture a piece of text based on a regular expression regex_named_capture\\tcapture a piece of text based on a regular expression regex_replace\\tfunction to replace a piece of text based on a regular expression region_code\\tTurn a point into the ID of a region, based on which region the point falls within. For example, if this dataset can produce region_code_label\\tIdentical to region_code, but returns a text value. repair_geometry\\tAttempt to repair the geometry. replace\\treplace text with another piece of text replace_first\\treplace the first occurrence of a piece of text with another piece of text reproject\\treproject a geometry from one projection to another. reproject_to_wgs84\\tfunction to reproject a geometry to WGS84. This will allow the geometry right_pad\\tPad text with the minimum number of copies of pad to reach desired_length. round\\tRound a number to a given precision. Trailing zeros are removed by default. Negative precisions round numbers to the left of the decimal. set_projection\\tfunction to explicitly set the projection value on geometries which do not have projection simplify\\tReturns a simplified version of the Line, Polygon, MultiLine, or MultiPolygon using simplify_preserve_topology\\tReturns a simplified version of the Line, Polygon, MultiLine, or MultiPolygon using slice\\tGet a substring of a specified length of a text from a start index source_created_at\\tGet the fixed timestamp that this data source was created (ie: started uploading or importing). split_select\\tfunction to split a piece of text on a token, and then select starts_with\\ttell whether or a not a string is prefixed with another string state_boundary\\treturns the boundary of the US state title_case\\tMake string title case with the exception of small words as defined by NYT Style Guide: to_boolean\\tcast a value to a true or false to_checkbox\\tNo documentation is available. to_fixed_timestamp\\tTurn a text value into a datetime with a fixed timezone. to_floating_timestamp\\tTurn a text value into a floating datetime. \\u201cFloating\\u201d means the timezone to_json\\tcast a text value to json to_line\\tparse a WKT (text) representation of a line into a line value to_location\\tThis function has been deprecated. Please use the to_point function instead. to_multiline\\tconvert a line into a multiline to_multipoint\\tconvert a point into a multipoint to_multipolygon\\tconvert a polygon into a multipolygon to_number\\tcast a value to a number to_point\\tparse a WKT (text) representation of a point into a point value to_polygon\\tparse a WKT (text) representation of a polygon into a polygon value to_text\\tNo documentation is available. to_url\\tNo documentation is available. trim\\ttrim characters off the start and end of a string trim_leading\\ttrim characters off the start of a string trim_trailing\\ttrim characters off the end of a string upper\\tuppercase a string uri_parse\\tParse a URI. url_decode\\tURL Decode a value url_description\\tExtract the description part of a link. url_encode\\tURL Encode a value. url_url\\tExtract the url part of a link. validate_geometry\\tTest that the geometry is valid. xml_pluck\\tPluck a value out of an XML string using XPath. The returned value will be a string.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-output-formats-1\", \"type\": \"section\", \"title\": \"Output Formats\", \"path\": [\"API Endpoints\", \"Output Formats\"], \"text\": \"Output Formats\\nThe Socrata Open Data API supports a number of different response formats that can be specified either via response type extensions on the API endpoint or HTTP Accept headers. CSV\\tcsv\\ttext/csv; charset=utf-8\\t2.0, 2.1, and 3.0 GeoJSON\\tgeojson\\tapplication/vnd.geo+json;charset=utf-8\\t2.1 and 3.0 JSON\\tjson\\tapplication/json;charset=utf-8\\t2.0, 2.1, and 3.0 RDF-XML\\trdf\\tapplication/rdf+xml; charset=utf-8\\t2.0 XML\\txml\\ttext/xml; charset=utf-8\\t2.0 and 3.0 Neither type is better than the other - simply select the one that works best for your framework and application.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-extensions-1\", \"type\": \"section\", \"title\": \"Extensions\", \"path\": [\"API Endpoints\", \"Extensions\"], \"text\": \"Extensions\\nThe simplest way to specify the response format is by appending a response type extension to the URL. This allows you to set the response format without requiring the ability to set headers in your HTTP client. Simply add the extension to the endpoint. For example, if your resource endpoint is /resource/644b-gaut, and you wanted to get CSV output, your path would be /resource/644b-gaut.csv. HTTP Accept Headers HTTP Accept headers allow applications to automatically negotiate content types with a web service. With SODA, this also means you can request content types using Accept headers without needing to provide a response type extension. Simply send an Accept header along with the desired mimetype for the desired response type. For example, to request JSON, you\\u2019d use a header of Accept: application/json. The SODA API response will also include a Content-type header to specify the format of the data that it is returning.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-datatypes-1\", \"type\": \"section\", \"title\": \"Datatypes\", \"path\": [\"API Endpoints\", \"Datatypes\"], \"text\": \"Datatypes\\nThere are many core datatypes in SODA. What datatypes you may find depends on the version of your API endpoint: Checkbox\\t2.0, 2.1, and 3.0 Fixed Timestamp\\t2.0, 2.1, and 3.0 Floating Timestamp\\t2.0 and 2.1 Line\\t2.1 and 3.0 Location\\t2.0, 2.1, and 3.0 MultiLine\\t2.1 and 3.0 MultiPoint\\t2.1 and 3.0 MultiPolygon\\t2.1 and 3.0 Number\\t2.0, 2.1, and 3.0 Point\\t2.1 and 3.0 Polygon\\t2.1 and 3.0 Text\\t2.0, 2.1, and 3.0 URL\\t2.0, 2.1, and 3.0 Other APIs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-dataset-management-1\", \"type\": \"section\", \"title\": \"Dataset Management\", \"path\": [\"API Endpoints\", \"Dataset Management\"], \"text\": \"Dataset Management\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-approvals-1\", \"type\": \"section\", \"title\": \"Approvals\", \"path\": [\"API Endpoints\", \"Approvals\"], \"text\": \"Approvals\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-curated-region-jobs-1\", \"type\": \"section\", \"title\": \"Curated Region Jobs\", \"path\": [\"API Endpoints\", \"Curated Region Jobs\"], \"text\": \"Curated Region Jobs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-curated-regions-1\", \"type\": \"section\", \"title\": \"Curated Regions\", \"path\": [\"API Endpoints\", \"Curated Regions\"], \"text\": \"Curated Regions\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-metadata-1\", \"type\": \"section\", \"title\": \"Metadata\", \"path\": [\"API Endpoints\", \"Metadata\"], \"text\": \"Metadata\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-publishing-1\", \"type\": \"section\", \"title\": \"Publishing\", \"path\": [\"API Endpoints\", \"Publishing\"], \"text\": \"Publishing\\nSearch and Discovery\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-discovery-1\", \"type\": \"section\", \"title\": \"Discovery\", \"path\": [\"API Endpoints\", \"Discovery\"], \"text\": \"Discovery\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-team-search-1\", \"type\": \"section\", \"title\": \"Team Search\", \"path\": [\"API Endpoints\", \"Team Search\"], \"text\": \"Team Search\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-user-search-1\", \"type\": \"section\", \"title\": \"User Search\", \"path\": [\"API Endpoints\", \"User Search\"], \"text\": \"User Search\\nExport and Integration OData V2 ODN\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"Authentication\\nAPI Keys\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-permissions-1\", \"type\": \"section\", \"title\": \"Permissions\", \"path\": [\"API Endpoints\", \"Permissions\"], \"text\": \"Permissions\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n";
+import type { RagAnswerCache } from "../services/ragAnswerCache";
+
+export const SOCRATA_RAG_BUNDLE_JSONL = "{\"id\": \"section-purpose-1\", \"type\": \"section\", \"title\": \"Purpose\", \"path\": [\"Discovery API 1.0\", \"Purpose\"], \"text\": \"Purpose\\nOur data platform hosts tens of thousands of government assets. Governments large and small publish data on crime, permits, finance, healthcare, research, performance, and more for citizens to use. While this large corpus of government data is already accessible via opendatanetwork.com, this API opens up this corpus of government data for automated searching, research, and exploration. Assets can be found by keywords, high-level categorizations, tags, and much more. This API is a powerful way to access and explore data on our platform. The production API endpoints for this API are at https://api.us.socrata.com/api/catalog/v1 for domains in North America https://api.eu.socrata.com/api/catalog/v1 for all other domains For example, to query for datasets categorized as 'Public Safety', you could use the following query: http://api.us.socrata.com/api/catalog/v1?categories=public%20safety\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-asset-visibility-1\", \"type\": \"section\", \"title\": \"Asset Visibility\", \"path\": [\"Discovery API 1.0\", \"Asset Visibility\"], \"text\": \"Asset Visibility\\nThere are four key factors which control whether or not an asset can be viewed anonymously by an unauthenticated user. An asset must meet criteria for all factors which apply to the domain itself (this varies domain-by-domain, as not all domains employ relevant features or modules which utilize these). These factors are: the asset's audience - as public vs internal or private the asset's publication status - as published vs unpublished in a draft state the approval status of the asset - as approved vs pending or rejected whether the asset is hidden - as false i.e. not hidden vs true i.e. hidden\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"Discovery API 1.0\", \"Authentication\"], \"text\": \"Authentication\\nAuthentication is not required to use this API for read-only access to the corpus of anonymously-viewable (i.e. public, published, approved, and not hidden) assets. However, if you wish to search for private, unpublished, unapproved or hidden data, you must authenticate yourself and ensure that you have adequate permissions to view the data in question. To authenticate, you must: Use one of the methods discussed here and Provide the 'X-Socrata-Host' host header with the domain that has granted you access to view its assets. For example 'X-Socrata-Host:data.ny.gov'. When properly authenticated, you will be able to search over: All data that is anonymously-viewable. Any data that you own or that has been shared to you. Private, unpublished, unapproved, and hidden assets from domains that have granted you a right to view such assets.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-app-tokens-1\", \"type\": \"section\", \"title\": \"App Tokens\", \"path\": [\"Discovery API 1.0\", \"App Tokens\"], \"text\": \"App Tokens\\nAll programmatic usage of Socrata APIs should include an app token, either via the X-App-Token header or the $$app_token parameters set to a valid token. This is assumed and not documented in the API specs below.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-additional-api-facts-1\", \"type\": \"section\", \"title\": \"Additional API facts\", \"path\": [\"Discovery API 1.0\", \"Additional API facts\"], \"text\": \"Additional API facts\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-additional-api-facts-2\", \"type\": \"section\", \"title\": \"Additional API facts\", \"path\": [\"Discovery API 1.0\", \"Additional API facts\"], \"text\": \"Search without any parameters returns the set of data you are authorized to see. Any parameter usage serves to filter (or sort) this set of data - i.e. no parameters allow you to see more data than a search without parameters. This is important to know when considering parameters that let you search for assets not found in the public catalog. If you are unauthorized to see such things, your results will be empty. Multiple repetitive parameters are treated differently from multiple unique parameters. Unique parameters, for example ?tags=fire&provenance=official filters to the intersection of the values. In this example, the search is for official assets with the tag 'fire'. Repetitive parameters filter to the union of values. For example ?tags=fire&tags=commission searches for assets tagged as either 'fire' or 'commission'. The combination of both repetitive and unique parameters follow the same rules. Thus the query ?tags=fire&tags=commission&provenance=official would search for official assets tagged as either 'fire' or 'commission'. Many parameters support repetitive usage, using either the syntax above or the alternate syntax using brackets, e.g. ?tags[]=fire&tags[]=commission. Parameter descriptions will tell whether this is supported or not. Because this API supports custom metadata search and because custom metadata keys are arbitrary, any unrecognized params are assumed to be custom metadata. Thus, if you misname a parameter, for example ?domain=data.ny.gov (the parameter should be 'domains'), the results will be empty unless there are assets with the custom metadata key 'domain' and value 'data.ny.gov'.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\"], \"text\": \"Find assets by id\\nGET /catalog/v1?ids={4x4}\\nMost assets are uniquely identified by a string known as a four-by-four. This is a string made from eight alphanumeric characters split into two four-character phrases, e.g. ku42-jx2v. While most assets follow this pattern, their drafts do not. Draft IDs join the four-by-four of the published version with a colon and a draft identifier. For stories, which only ever support a single shared draft, the draft's identifier is \\\"draft\\\". For example, if a draft of story ku42-jx2v is created, its ID would be ku42-jx2v:draft. For non-story drafts, the draft's identifier is an integer. For example, if the 7th draft of asset cio5-yr56 is created, its ID would be cio5-yr56:7. The ids parameter will limit the results to the assets identified in this way.\\nExamples:\\n?ids=ku42-jx2v\\n?ids=ku42-jx2v&ids=ku42-jx2v:draft\\n?ids=cio5-yr56,cio5-yr56:7\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?ids={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\", \"Request\", \"query\"], \"text\": \"Find assets by id - query parameters\\n- ids (string): The four-by-four identifier of an asset. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1\", \"type\": \"response-fields\", \"title\": \"Find assets by id\", \"path\": [\"Discovery API 1.0\", \"Find assets by id\", \"Response\"], \"text\": \"Find assets by id - response fields\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by domain\", \"path\": [\"Discovery API 1.0\", \"Find assets by domain\"], \"text\": \"Find assets by domain\\nGET /catalog/v1?search_context={domain}&domains={domain}\\nEach asset is owned by a single domain. The domains and search_context parameters are used to limit the results to the inferred domains. If neither of the domains or search_context are provided, the inferred domains are all domains. Please note, that because of the size of this set, the user will not be authenticated across all of the domains and the user will effectively be treated as an anonymous user. If only a search_context is provided, the inferred domains will include the search_context and any domains which federate data into the search_context. Using this parameter allows you to see the returned data \\\"through the eyes\\\" of a given domain, e.g. filter and search across their tags/categories/custom metadata. If domains are provided, there is no need to infer domains and the given domains will be searched.\\nExamples:\\n?search_context=data.ny.gov\\n?domains=data.ny.gov\\n?domains=data.ny.gov,data.cityofchicago.org\\n?search_context=data.ny.gov&domains=data.ny.gov,data.cityofchicago.org\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={domain}&domains={domain}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by domain\", \"path\": [\"Discovery API 1.0\", \"Find assets by domain\", \"Request\", \"query\"], \"text\": \"Find assets by domain - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- domains (string): The domain name from which an asset comes. A comma-separated list of names is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-names-name-find-assets-by-name-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by name\", \"path\": [\"Discovery API 1.0\", \"Find assets by name\"], \"text\": \"Find assets by name\\nGET /catalog/v1?names={name}\\nEvery asset is given a name/title. The names parameter will limit results to those having the given name. This filter is case insensitive, but otherwise operates like an exact match. If the exact name is not known, consider using the q parameter to search by query or to autocomplete the name. Keep in mind that spaces and other special characters should be url-encoded.\\nExamples:\\n?names=NYS%20Attorney%20Registrations\\n?names=nys%20attorney%20registrations&names=OpenNY%20Press%20Releases\\n?names[]=NYS%20Attorney%20Registrations &names[]=OpenNY%20Press%20Releases\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?names={name}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-names-name-find-assets-by-name-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by name\", \"path\": [\"Discovery API 1.0\", \"Find assets by name\", \"Request\", \"query\"], \"text\": \"Find assets by name - query parameters\\n- names (string): The title of an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by category\", \"path\": [\"Discovery API 1.0\", \"Find assets by category\"], \"text\": \"Find assets by category\\nGET /catalog/v1?search_context={search_context}&categories={category}\\nEach domain is allowed to customize the categories they use and each asset may be assigned one of these categories or none. The categories parameter will limit the results to those having the given category, but only if the search_context is included.\\nExamples:\\n?search_context=data.ny.gov&categories=Recreation\\n?search_context=data.ny.gov&categories=Recreation&categories=Education\\n?search_context=data.ny.gov &categories[]=Recreation&categories[]=Education\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={search_context}&categories={category}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by category\", \"path\": [\"Discovery API 1.0\", \"Find assets by category\", \"Request\", \"query\"], \"text\": \"Find assets by category - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- categories (string): The category of an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by tag\", \"path\": [\"Discovery API 1.0\", \"Find assets by tag\"], \"text\": \"Find assets by tag\\nGET /catalog/v1?search_context={search_context}&tags={tag}\\nEach asset may have none, one or more tags associated with it. The tags parameters will limit the results to those having the given tag, but only if the search_context is included.\\nExamples:\\n?search_context=data.ny.gov&tags=%23environment\\n?search_context=data.ny.gov&tags=%23environment&tags=2017\\n?search_context=data.ny.gov&tags[]=2018&tags[]=2017\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={search_context}&tags={tag}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by tag\", \"path\": [\"Discovery API 1.0\", \"Find assets by tag\", \"Request\", \"query\"], \"text\": \"Find assets by tag - query parameters\\n- search_context (string): A domain name that represents the named domain and all incoming federations. Required with category and tag search.\\n- tags (string): Any of the tags on an asset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-only-type-find-assets-by-type-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by type\", \"path\": [\"Discovery API 1.0\", \"Find assets by type\"], \"text\": \"Find assets by type\\nGET /catalog/v1?only={type}\\nEach asset has a logical type, such as a dataset or chart. The only parameter will limit the results to a particular type. The current taxonomy includes the following types: api, calendar, chart, dataset, federated_href, file, filter, form, href, link, map, measure, story, visualization You may use either the singular or plural variants of each type.\\nExamples:\\n?only=charts\\n?only=charts,maps\\n?only=datasets&only=link\\n?only[]=story&only[]=measure\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?only={type}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-only-type-find-assets-by-type-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by type\", \"path\": [\"Discovery API 1.0\", \"Find assets by type\", \"Request\", \"query\"], \"text\": \"Find assets by type - query parameters\\n- only (string enum): The datatype of an asset. Singular or plural terms are accepted. A comma-separated list of types is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by domain-specific metadata\", \"path\": [\"Discovery API 1.0\", \"Find by domain-specific metadata\"], \"text\": \"Find by domain-specific metadata\\nGET /catalog/v1?{custom_metadata_key}={value}\\nEach domain has the ability to add custom metadata to datasets beyond the default metadata. This custom metadata is different for every domain, but within a domain, all assets may be labeled with the metadata. The custom metadata is a named set of key-value pairs. For example one domain might have a set named 'Dataset Information' which has keys 'Localities' and 'Agencies & Authorities', while another domain has a set named 'Dataset Category' having key 'Agency'). The caller may restrict the results to a particular custom metadata pair by specifying the parameter name as a combination of the set's name and the key's name and the parameter value as the key's value. To construct the parameter name, join the set's name to the key's name with an underscore and replace all spaces with dashes. Some examples are given in the table below:\\nSet Name\\tField Name\\tParameter Dataset Information\\tLocalities\\t?Dataset-Information_Localities Data Summary\\tUnits\\t?Dataset-Summary_Units Informaci\\u00f3n de la Entidad\\tNombre de la Entidad\\t?Informaci\\u00f3n-de-la-Entidad_Nombre-de-la-Entidad\\nExamples:\\n?Dataset-Information_Localities=Albany%2C+City+of\\n?Dataset-Information_Localities=Albany%2C+City+of&Dataset-Summary_Units=Permits\\n?Dataset-Category_Agency=Office+of+the+Governor\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?{custom_metadata_key}={value}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by domain-specific metadata\", \"path\": [\"Discovery API 1.0\", \"Find by domain-specific metadata\", \"Request\", \"query\"], \"text\": \"Find by domain-specific metadata - query parameters\\n- custom-metadata_key (string): The name 'custom-metadata_key' is meant to represent any custom metadata field-set and field. See Find by domain-specific metadata for more details.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by attribution\", \"path\": [\"Discovery API 1.0\", \"Find assets by attribution\"], \"text\": \"Find assets by attribution\\nGET /catalog/v1?attribution={organization}\\nAssets can be attributed to various organizations. The attribution parameter will limit the results to those attributed to the given organization.\\nExamples:\\n?attribution=New%20York%20State%20Gaming%20Commission\\n?attribution=Texas%20Comptroller%20of%20Public%20Accounts\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?attribution={organization}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by attribution\", \"path\": [\"Discovery API 1.0\", \"Find assets by attribution\", \"Request\", \"query\"], \"text\": \"Find assets by attribution - query parameters\\n- attribution (string): The case-sensitive name of the attributing entity.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-license-license-find-assets-by-license-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by license\", \"path\": [\"Discovery API 1.0\", \"Find assets by license\"], \"text\": \"Find assets by license\\nGET /catalog/v1?license={license}\\nAssets can be released under various licenses. The license parameter will limit the results to those with the given license.\\nExamples:\\n?license=Public%20Domain\\n?license= Creative%20Commons%201.0%20Universal%20(Public%20Domain%20Dedication)\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?license={license}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-license-license-find-assets-by-license-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by license\", \"path\": [\"Discovery API 1.0\", \"Find assets by license\", \"Request\", \"query\"], \"text\": \"Find assets by license - query parameters\\n- license (string): The case-sensitive license name.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by query term\", \"path\": [\"Discovery API 1.0\", \"Find assets by query term\"], \"text\": \"Find assets by query term\\nGET /catalog/v1?q={query}&min_should_match={match_term}\\nAssets may be searched by any of the text found in the name, description, category, tags, column names, column fieldnames, column descriptions, attribution fields. The q parameter takes arbitrary text and will limit the results to those having some or all of the text. The optional min_should_match parameter may be used to explicitly specify the number or percent of words that must match. See the Elasticsearch docs for the format of arguments to min_should_match. If min_should_match is not specified, the service's default is '3<60%', meaning that if there are 3 or fewer search terms specified, all of them must match; otherwise 60% of the search terms must be found in the fields specified above. For example, if min_should_match is '3<60%', searching for\\n'city dog park' will require stemmed matches for all three words; thus, 'Western Cities Association Dog Parks' will match, but 'New York City Parks' will not. 'trees green spaces new york' will require 60% of the words to match, which is 3 out of 5 words. Thus, 'New York Tree Map', and 'New Green Spaces Initiative' will both match.\\nExamples:\\n?q=result\\n?q=school%20result%20SAT\\n?q=school%20result%20SAT&min_should_match=-1\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?q={query}&min_should_match={match_term}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by query term\", \"path\": [\"Discovery API 1.0\", \"Find assets by query term\", \"Request\", \"query\"], \"text\": \"Find assets by query term - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\\n- min_should_match (string): The number or percent of words that must match. Acceptable formats are defined here.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets by parent id\", \"path\": [\"Discovery API 1.0\", \"Find assets by parent id\"], \"text\": \"Find assets by parent id\\nGET /catalog/v1?parent_ids={4x4}\\nSome assets are uploaded directly and others are created from already existing data. For example, charts are derived from an existing parent dataset. The parent_ids parameter will limit the results to those having the parent dataset ids given.\\nExamples:\\n?parent_ids=nqur-w4p7\\n?parent_ids=nqur-w4p7&parent_ids=qzve-kjga\\n?parent_ids=nqur-w4p7,qzve-kjga\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?parent_ids={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets by parent id\", \"path\": [\"Discovery API 1.0\", \"Find assets by parent id\", \"Request\", \"query\"], \"text\": \"Find assets by parent id - query parameters\\n- parent_ids (string): The four-by-four identifier of a parent asset having child assets. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-summary-1\", \"type\": \"endpoint\", \"title\": \"Find assets derived from others\", \"path\": [\"Discovery API 1.0\", \"Find assets derived from others\"], \"text\": \"Find assets derived from others\\nGET /catalog/v1?derived_from={4x4}\\nSome assets are uploaded directly and others are created from or use other data. For example, charts are derived from an existing parent dataset and stories may then incorporate those charts. Measures may also incorporate one or more datasets. The derived_from parameter will limit the results to those that derive from the given dataset.\\nExamples:\\n?derived_from=8f6m-78bg\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?derived_from={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-req-query-1\", \"type\": \"request-params\", \"title\": \"Find assets derived from others\", \"path\": [\"Discovery API 1.0\", \"Find assets derived from others\", \"Request\", \"query\"], \"text\": \"Find assets derived from others - query parameters\\n- derived_from (string): The four-by-four identifier of an asset from which other assets are derived.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by provenance\", \"path\": [\"Discovery API 1.0\", \"Find by provenance\"], \"text\": \"Find by provenance\\nGET /catalog/v1?provenance={provenance}\\nWhile many assets on our platform are owned by government data publishers and other staff, some visualizations, maps, filtered views, and more are created by a member of the community. These assets are usually denoted with a 'Community' badge on the data catalog. A provenance=official parameter will limit the results to official assets, i.e. those owned by roled users on the domain. A provenance=community parameter will limit the results to community created assets.\\nExamples:\\n?provenance=official\\n?provenance=community\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?provenance={provenance}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by provenance\", \"path\": [\"Discovery API 1.0\", \"Find by provenance\", \"Request\", \"query\"], \"text\": \"Find by provenance - query parameters\\n- provenance (string enum): The provenance of an asset.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by owner\", \"path\": [\"Discovery API 1.0\", \"Find by owner\"], \"text\": \"Find by owner\\nGET /catalog/v1?for_user={4x4}\\nEach asset has an owner, which may be a user or a team. The for_user parameter will limit the results to those owned by the user or team having the provided four-by-four identifier.\\nExamples:\\n?for_user=xzik-pf59\\n?for_user=xzik-pf59,fpiq-yg3w\\n?for_user=xzik-pf59&for_user=fpiq-yg3w\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?for_user={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by owner\", \"path\": [\"Discovery API 1.0\", \"Find by owner\", \"Request\", \"query\"], \"text\": \"Find by owner - query parameters\\n- for_user (string): The four-by-four identifier of a user who owns data. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by granted shares\", \"path\": [\"Discovery API 1.0\", \"Find by granted shares\"], \"text\": \"Find by granted shares\\nGET /catalog/v1?search_context={domain}&shared_to={4x4}\\nEach asset may be shared to teams or individual users. The shared_to param allows you to specify four-by-four identifier of a user or team and the results will be limited to those which were shared to them. Please note:\\nIf you are not an administrator, you may only specify yourself as the user to whom assets are shared. If you are not an administrator, you may only specify teams that you are on (as a member or an owner) as the teams to which assets are shared. If you are an administrator, you may see what's shared to any user or team on the domain where you are an administrator. You must include the domain name with the search_context parameter. If you search for assets shared to you, with or without assets shared to your teams, assets owned by you will be filtered out. You must authenticate in order to see any assets when using this param.\\nExamples:\\n?search_context=data.ny.gov&shared_to=xzik-pf59\\n?search_context=data.ny.gov&shared_to=8xiq-st2k,xzik-pf59\\n?search_context=data.ny.gov&shared_to=8xiq-st2k&shared_to=xzik-pf59\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?search_context={domain}&shared_to={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by granted shares\", \"path\": [\"Discovery API 1.0\", \"Find by granted shares\", \"Request\", \"query\"], \"text\": \"Find by granted shares - query parameters\\n- shared_to (string): The four-by-four identifier of a user who is shared data. A comma-separated list of IDs is supported. Repeated params are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-column-names-name-find-by-column-name-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by column name\", \"path\": [\"Discovery API 1.0\", \"Find by column name\"], \"text\": \"Find by column name\\nGET /catalog/v1?column_names={name}\\nTabular assets are composed of rows and columns. The column_names parameter will limit the results to those having the given column names. The search is case insensitive, but otherwise looks for an exact match. Keep in mind that spaces and other special characters should be url-encoded.\\nExamples:\\n?column_names=Winning%20numbers\\n?column_names=Winning%20numbers&column_names=Draw%20Date\\n?column_names[]=winning%20NUMBERS&column_names[]=draw%20date\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?column_names={name}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-column-names-name-find-by-column-name-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by column name\", \"path\": [\"Discovery API 1.0\", \"Find by column name\", \"Request\", \"query\"], \"text\": \"Find by column name - query parameters\\n- column_names (string): The name of a column within a dataset. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by visibility\", \"path\": [\"Discovery API 1.0\", \"Find by visibility\"], \"text\": \"Find by visibility\\nGET /catalog/v1?visibility={visibility}&show_visibility={true|false}\\nWhile many assets on our platform are discoverable and accessible via the open data catalog, others are held internally for government use. A visibility=open parameter will limit the results to only those that would show in the public catalog. A visibility=internal parameter will limit the results to those held internally, but note that only authenticated users who have sufficient rights and provide either a search_context or domains parameter will receive results. As discussed in the \\\"Asset Visibility\\\" at the beginning of this documentation, this visibility status is a product of four factors. This parameter is thus a convenience parameter where a 'open' value corresponds to\\naudience=public&published=true&approval_status=approved&explicitly_hidden=false.\\nBy default, visibility information is not included on the returned assets. To have it returned, attach a show_visibility=true parameter.\\nExamples:\\n?visibility=open\\n?visibility=open&show_visibility=true\\n?search_context=data.texas.gov&visibility=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?visibility={visibility}&show_visibility={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by visibility\", \"path\": [\"Discovery API 1.0\", \"Find by visibility\", \"Request\", \"query\"], \"text\": \"Find by visibility - query parameters\\n- visibility (string enum): The visibility of an asset.\\n- show_visibility (boolean): Whether to include visibility information in the response.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-audience-audience-find-by-audience-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by audience\", \"path\": [\"Discovery API 1.0\", \"Find by audience\"], \"text\": \"Find by audience\\nGET /catalog/v1?audience={audience}\\nThe audience is the first of four factors which control an asset\\u2019s visibility. Each asset has one of three different audiences. These include:\\nprivate if the asset is only visible to the owner and any individuals the owner has shared the asset to site if the asset is visible to all members of a site/domain public if the asset is visible to anyone, within or outside the site/domain Only the audience=public parameter may be used by any user. The audience=site and audience=private parameters are only available to authenticated users who have sufficient rights and provide either a search_context or domains parameter, else a 401 error is returned.\\nExamples:\\n?audience=public\\n?search_context=data.texas.gov&audience=site\\n?domains=data.texas.gov&audience=private\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?audience={audience}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-audience-audience-find-by-audience-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by audience\", \"path\": [\"Discovery API 1.0\", \"Find by audience\", \"Request\", \"query\"], \"text\": \"Find by audience - query parameters\\n- audience (string enum): The audience of an asset.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by publication status\", \"path\": [\"Discovery API 1.0\", \"Find by publication status\"], \"text\": \"Find by publication status\\nGET /catalog/v1?published={true|false}\\nThe publication status of each asset is the second of four factors which control an asset\\u2019s visibility. A published=true parameter will limit the results to those that are published; A published=false parameter will limit the results to those that are unpublished, but note that only authenticated users who have sufficient rights and provide a search_context or domains parameter will receive results.\\nExamples:\\n?published=true\\n?search_context=data.texas.gov&published=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?published={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by publication status\", \"path\": [\"Discovery API 1.0\", \"Find by publication status\", \"Request\", \"query\"], \"text\": \"Find by publication status - query parameters\\n- published (boolean): Whether the asset is published or not.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Find hidden/unhidden assets\", \"path\": [\"Discovery API 1.0\", \"Find hidden/unhidden assets\"], \"text\": \"Find hidden/unhidden assets\\nGET /catalog/v1?explicitly_hidden={true|false}\\nThe hidden status of each asset is the third of four factors which control an asset\\u2019s visibility. Some sites selectively and explicitly hide certain assets from their public catalog for different reasons. A explicitly_hidden=false parameter will limit the results to those that are not hidden. A explicitly_hidden=true parameter will limit the results to those that are hidden, but note that only authenticated users who have sufficient rights and provide a search_context or domains parameter will receive results.\\nExamples:\\n?explicitly_hidden=false\\n?search_context=data.texas.gov&explicitly_hidden=true\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?explicitly_hidden={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Find hidden/unhidden assets\", \"path\": [\"Discovery API 1.0\", \"Find hidden/unhidden assets\", \"Request\", \"query\"], \"text\": \"Find hidden/unhidden assets - query parameters\\n- explicitly_hidden (boolean): Whether the asset is hidden from the public catalog or not.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\"], \"text\": \"Find by approval status\\nGET /catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\\nThe approval status of each asset is the fourth of four factors which control an asset\\u2019s visibility. Assets must be approved in order to become anonymously or internally viewable. At any point in time, the status of these views may be 'pending', 'rejected', 'approved' or 'not_ready' (to be approved) for either of the public or internal audiences. The approval_status parameter accepts one of those values and will limit the results to those assets with the given state. The target_audience parameter accepts either 'public' or 'internal' and further limits the results to those with the given approvals status destined for the given target audience. Note that no results will be returned when searching for rejected, pending or not_ready approval statuses unless the data is already anonymously viewable or the user has authenticated and provided a search_context or domains parameter.\\nExamples:\\n?approval_status=approved\\n?approval_status=approved&target_audience=public\\n?domains=data.ny.gov&approval_status=rejected,pending\\n?domains=data.ny.gov&approval_status=rejected&approval_status=approved\\n?domains=data.ny.gov&approval_status[]=rejected &approval_status[]=approved\\n?search_context=datahub.hhs.gov&approval_status=not_ready &target_audience=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-2\", \"type\": \"endpoint\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\"], \"text\": \"?search_context=datahub.hhs.gov&approval_status=approved &target_audience[]=public&target_audience[]=internal\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?approval_status={approved|rejected|pending|not_ready}&target_audience={public|internal}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by approval status\", \"path\": [\"Discovery API 1.0\", \"Find by approval status\", \"Request\", \"query\"], \"text\": \"Find by approval status - query parameters\\n- approval_status (string enum): The internal or public approval status of an asset. Combine with a target_audience=public or target_audience=internal parameter to limit to the approval status of public-bound or internal-bound data. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\\n- target_audience (string enum): The audience a submitted asset desires if approved. Combine with the approval_status parameter to limit to particular stages of the approval process. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by submitter\", \"path\": [\"Discovery API 1.0\", \"Find by submitter\"], \"text\": \"Find by submitter\\nGET /catalog/v1?submitter_id={4x4}\\nFor assets that have been submitted for approval and are currently pending, rejected or approved, the 'submitter_id' parameter accepts the submitting user's four-by-four identifier and will limit the results to those assets which have been submitted by that user.\\nExamples:\\n?submitter_id=xzik-pf59\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?submitter_id={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by submitter\", \"path\": [\"Discovery API 1.0\", \"Find by submitter\", \"Request\", \"query\"], \"text\": \"Find by submitter - query parameters\\n- submitter_id (string): The four-by-four identifier of a user who has submitted an asset for approval.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-summary-1\", \"type\": \"endpoint\", \"title\": \"Find by reviewer\", \"path\": [\"Discovery API 1.0\", \"Find by reviewer\"], \"text\": \"Find by reviewer\\nGET /catalog/v1?reviewer_id={4x4}\\nFor assets that have been submitted for approval and reviewed, and are currently rejected or approved, the 'reviewer_id' parameter accepts the reviewing user's four-by-four identifier and will limit the results to those assets which have been reviewed by that user.\\nExamples:\\n?reviewer_id=r4qn-dwdd\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?reviewer_id={4x4}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-req-query-1\", \"type\": \"request-params\", \"title\": \"Find by reviewer\", \"path\": [\"Discovery API 1.0\", \"Find by reviewer\", \"Request\", \"query\"], \"text\": \"Find by reviewer - query parameters\\n- reviewer_id (string): The four-by-four identifier of a user who has submitted an asset for approval.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Find derived/base assets\", \"path\": [\"Discovery API 1.0\", \"Find derived/base assets\"], \"text\": \"Find derived/base assets\\nGET /catalog/v1?derived={true|false}\\nSome assets are uploaded directly and others are created from already existing data. For example, charts are derived from an existing parent dataset. The derived parameter will limit the results to one or other of these classes of data. A 'true' value finds derived assets and a 'false' value finds base assets.\\nExamples:\\n?derived=true\\n?derived=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?derived={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Find derived/base assets\", \"path\": [\"Discovery API 1.0\", \"Find derived/base assets\", \"Request\", \"query\"], \"text\": \"Find derived/base assets - query parameters\\n- derived (boolean): Whether the asset was derived from another or uploaded directly.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-order-sort-order-sort-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Sort results\", \"path\": [\"Discovery API 1.0\", \"Sort results\"], \"text\": \"Sort results\\nGET /catalog/v1?order={sort_order}\\nThe results of all the above filters can be sorted by any of the attributes in the list below. If not specified, the results are sorted by relevance. All sort values can optionally append a space and either 'ASC' or 'DESC' for ascending or descending sorts, but note that the space must be URL-escaped with '+' or '%20'. The default for each attribute is given in the table. It is possible for search results to have missing values for some of these sort fields (such as 'domain_category', for example). Any assets missing a value altogether for the field being sorted on will show up at the end of the results list.\\nAttribute\\tDefault Sort Order relevance (default)\\tdescending name\\tascending owner\\tascending dataset_id\\tascending datatype\\tascending domain_category\\tascending createdAt\\tdescending updatedAt\\tdescending page_views_total\\tdescending page_views_last_month\\tdescending page_views_last_week\\tdescending\\nExamples:\\n?order=name\\n?order=dataset_id%20ASC\\norder=page_views_total+DESC\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?order={sort_order}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-order-sort-order-sort-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Sort results\", \"path\": [\"Discovery API 1.0\", \"Sort results\", \"Request\", \"query\"], \"text\": \"Sort results - query parameters\\n- order (string enum): The field to sort assets by. Optionally append a space and 'ASC' or 'DESC' to direct the sort.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Paginate results\", \"path\": [\"Discovery API 1.0\", \"Paginate results\"], \"text\": \"Paginate results\\nGET /catalog/v1?limit={number}&offset={number}\\nThe search service allows pagination of results. By default, we will return at most 100 results starting from 0. Using the limit and offset params will return at most {limit} results starting from {offset}.\\nIf the sum of the offset and limit parameters is greater than 10000, the server will respond with a 400. If your use-case involves scanning over a large set of results, you will want to use the scroll_id parameter in conjunction with the limit parameter. For more detail, refer to Deep scrolling results.\\nExamples:\\n?limit=10&offset=0\\n?limit=10&offset=10\\n?limit=10&offset=20\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&offset={number}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Paginate results\", \"path\": [\"Discovery API 1.0\", \"Paginate results\", \"Request\", \"query\"], \"text\": \"Paginate results - query parameters\\n- limit (number): The max number of results to return.\\n- Constraints: Range: [0,10000] (offset): number The starting point for paging.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1\", \"type\": \"endpoint\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\"], \"text\": \"Deep scroll results\\nGET /catalog/v1?limit={number}&scroll_id={id}\\nThe search API is optimized for the prototypical use-case -- namely, providing some queries or filter conditions, and retrieving a relatively small number of search results. As a result, the search service does not support paging over a large set of search results. Specifically, if the sum of the offset and limit parameters is greater than 10000, the server will respond with a 400. This will happen regardless of the actual result set size. Larger result sets can be incrementally paged over via the scroll_id parameter.\\nThis parameter takes a value corresponding to an asset ID, specifically, the ID of the last result in the previously fetched chunk of results. So for example, suppose you execute a query and find that it returns a large set of results (ie. more than 10000). You should execute the same query again, including a reasonable value for the limit parameter, being sure to include the scroll_id parameter as well. Initially, you won't have a value for the scroll_id parameter, so you will leave it blank. But with each subsequent request, you should pass the asset id corresponding to the last result from the previously fetched batch of results.\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&scroll_id={id}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-2\", \"type\": \"endpoint\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\"], \"text\": \"Note that sorting parameters are not honored when used in conjunction with deep scrolling via the scroll_id parameter. If the order or offset parameters are specified at the same time as the scroll_id parameter, the server will respond with a 400.\\nExamples:\\n?limit=100&scroll_id\\n?limit=100&scroll_id=6rrk-xbdr\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?limit={number}&scroll_id={id}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-req-query-1\", \"type\": \"request-params\", \"title\": \"Deep scroll results\", \"path\": [\"Discovery API 1.0\", \"Deep scroll results\", \"Request\", \"query\"], \"text\": \"Deep scroll results - query parameters\\n- limit (number): The max number of results to return.\\n- Constraints: Range: [0,10000] (scroll_id): string Initially empty, but afterwards, the four-by-four identifier of the final asset in the current results.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-boost-key-number-boost-assets-summary-1\", \"type\": \"endpoint\", \"title\": \"Boost assets\", \"path\": [\"Discovery API 1.0\", \"Boost assets\"], \"text\": \"Boost assets\\nGET /catalog/v1?boost{key}={number}\\nIt is possible to adjust the rankings of assets to promote them above others. This leverages the weight function of function score queries. This weight acts as a multiplier for the relevance score of each document. Thus, a number between 0 and 1 will demote assets, while any number greater than 1 will boost them.\\nSeveral parameters allow for different types of boosting. Some notes about the table below:\\nThe Explanation assumes a greater than 1 value Where you see {variable_name} in the Parameter, that requires substituting in a value. See the examples below. The boost params boostTitle, boostDesc and boostColumns work in conjunction with the q param Parameter\\tExplanation boostOfficial\\tOfficial assets boosted; community assets not boost{Datatype}\\tAssets having the given {Datatype} boosted; others not boostDomains[{DomainName}]\\tAssets from the given {DomainName} boosted; others not boostTitle\\tAssets with titles matching the 'q' query boosted; others not boostDesc\\tAssets with descriptions matching the 'q' query boosted; others not boostColumns\\tAssets with column names matching the 'q' query boosted; others not\\nExamples:\\n?boostOfficial=3.6\\n?boostStories=2&boostMaps=3\\n?boostDomains[data.ny.gov]=2\\n?boostTitle=2&q=Lotto\\n?boostDesc=1.5&q=hospitalizations\\n?boostColumns=5.67&q=vendor\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1?boost{key}={number}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-boost-key-number-boost-assets-req-query-1\", \"type\": \"request-params\", \"title\": \"Boost assets\", \"path\": [\"Discovery API 1.0\", \"Boost assets\", \"Request\", \"query\"], \"text\": \"Boost assets - query parameters\\n- boostOfficial (number): Multiplier for the relevance score of official assets.\\n- boost{Datatype} (number): Multiplier for the relevance score of assets with the given {Datatype}. A parameter name for example is boostStories or boostMaps.\\n- boostDomains[{DomainName}] (number): Multiplier for the relevance score of assets from the given {DomainName}. A parameter name for example is boostDomains[data.ny.gov] or boostDomains[data.texas.gov].\\n- boostTitle (number): Multiplier for the relevance score of assets having a title that matches the given query. Use with the q parameter to define the query.\\n- boostDesc (number): Multiplier for the relevance score of assets having a description that matches the given query. Use with the q parameter to define the query.\\n- boostDesc (number): Multiplier for the relevance score of assets having column names that matches the given query. Use with the q parameter to define the query.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-summary-1\", \"type\": \"endpoint\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\"], \"text\": \"Autocomplete asset names\\nGET /catalog/v1/autocomplete?q={query}&deduplicate={true|false}\\nThe Discovery API supports autocomplete of asset names and tags. Using the autocomplete endpoint for asset names returns assets having titles that match the search query. Any of the filtering parameters described above may be used with the required q parameter. Note that while this endpoint mirrors the top-level search endpoint, the behavior of the q parameter differs slightly. Just as with the full search endpoint, it takes arbitrary text. However, the autocomplete search is restricted to the 'name' field of the asset (i.e. the asset title). Additionally, this autocomplete search can return different assets than the top-level search. An simplified explanation is that the former matches characters while the latter matches words.\\nAn additional and optional parameter, deduplicate, provides two different behaviors. If 'true', no asset title will appear more than once. If 'false', every matching asset is returned along with its four-by-four identifier.\\nExamples:\\n?q=medi\\n?q=medi&deduplicate=true\\n?q=medi&deduplicate=false\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/autocomplete?q={query}&deduplicate={true|false}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-req-query-1\", \"type\": \"request-params\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\", \"Request\", \"query\"], \"text\": \"Autocomplete asset names - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\\n- deduplicate (boolean): Whether the results returned from autocomplete return distinct titles or not. When 'false', asset ids are returned in addition to the typical response.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-resp-1\", \"type\": \"response-fields\", \"title\": \"Autocomplete asset names\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset names\", \"Response\"], \"text\": \"Autocomplete asset names - response fields\\n- title (string): The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-summary-1\", \"type\": \"endpoint\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\"], \"text\": \"Autocomplete asset tags\\nGET /catalog/v1/tags/autocomplete?q={query}\\nThe Discovery API supports autocomplete of asset names and tags. Using the autocomplete endpoint for tags returns assets having tags that match the search query. Any of the filtering parameters described above may be used with the required q parameter. Note that while this endpoint mirrors the top-level search endpoint, the behavior of the q parameter differs slightly. Just as with the full search endpoint, it takes arbitrary text. However, the autocomplete search is restricted to the 'tags' field of the asset.\\nExamples:\\n?q=medi\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/tags/autocomplete?q={query}\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-req-query-1\", \"type\": \"request-params\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\", \"Request\", \"query\"], \"text\": \"Autocomplete asset tags - query parameters\\n- q (string): For search, a token matching one from an asset's name, description, category, tags, column names, column fieldnames, column descriptions or attribution.\", \"tags\": [\"request\", \"query\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-resp-1\", \"type\": \"response-fields\", \"title\": \"Autocomplete asset tags\", \"path\": [\"Discovery API 1.0\", \"Autocomplete asset tags\", \"Response\"], \"text\": \"Autocomplete asset tags - response fields\\n- tag_text (string): The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-count-assets-by-domain-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by domain\", \"path\": [\"Discovery API 1.0\", \"Count assets by domain\"], \"text\": \"Count assets by domain\\nGET /catalog/v1/domains\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by domain. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by domain.\\nExamples:\\n?\\n?audience=public&q=dog\\n?only=maps\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domains\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-count-assets-by-domain-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by domain\", \"path\": [\"Discovery API 1.0\", \"Count assets by domain\", \"Response\"], \"text\": \"Count assets by domain - response fields\\n- domain (string): The domain's name.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-tags-count-assets-by-tag-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by tag\", \"path\": [\"Discovery API 1.0\", \"Count assets by tag\"], \"text\": \"Count assets by tag\\nGET /catalog/v1/domain_tags\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by tag. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by tag.\\nExamples:\\n?\\n?domains=data.texas.gov\\n?only=datasets&q=popul\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domain_tags\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-tags-count-assets-by-tag-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by tag\", \"path\": [\"Discovery API 1.0\", \"Count assets by tag\", \"Response\"], \"text\": \"Count assets by tag - response fields\\n- domain_tag (string): The tag.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-categories-count-assets-by-category-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by category\", \"path\": [\"Discovery API 1.0\", \"Count assets by category\"], \"text\": \"Count assets by category\\nGET /catalog/v1/domain_categories\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by category. Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by category.\\nExamples:\\n?\\n?domains=data.ny.gov\\n?provenance=official\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domain_categories\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domain-categories-count-assets-by-category-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by category\", \"path\": [\"Discovery API 1.0\", \"Count assets by category\", \"Response\"], \"text\": \"Count assets by category - response fields\\n- domain_category (string): The category.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-summary-1\", \"type\": \"endpoint\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\"], \"text\": \"Count assets by facets\\nGET /catalog/v1/domains/{domain}/facets\\nThis endpoint mirrors the top-level endpoint, accepting any of the filtering params described above. It returns the count of assets matching the query grouped by the following facets:\\ndatatypes categories tags provenance custom metadata Providing no parameters returns the count of assets the user is able to view, subject to authentication, grouped by each facet.\\nExamples:\\n?\\n?only=stories\", \"tags\": [\"endpoint\", \"get\", \"/catalog/v1/domains/{domain}/facets\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-1\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"Count assets by facets - response fields\\n- facet (string): The facet class.\\n- value (string): The facet value.\\n  note: Parameters Describes operation parameters. A unique parameter is defined by a combination of a name and location.\\n  note: approval_status Field Type Description string enum The internal or public approval status of an asset. Combine with a target_audience=public or target_audience=internal parameter to limit to the approval status of public-bound or internal-bound data. A comma-separated list of statuses is supported. Repeated params, with or without brackets, are supported.\\n  note: Constraints: Range: [0,10000] Default: 100 Example: 10 min_should_match Field Type Description string The number or percent of words that must match. Acceptable formats are defined here.\\n  note: Constraints: Range: [0,10000] Default: 0 Example: 10 only Field Type Description string enum The datatype of an asset. Singular or plural terms are accepted. A comma-separated list of types is supported. Repeated params, with or without brackets, are supported.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-2\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Default: relevance Allowed: relevance \\u2503 name \\u2503 owner \\u2503 dataset_id \\u2503 datatype \\u2503 domain_category \\u2503 createdAt \\u2503 updatedAt \\u2503 page_views_total \\u2503 page_views_last_month \\u2503 page_views_last_week parent_ids Field Type Description string The four-by-four identifier of a parent asset having child assets. A comma-separated list of IDs is supported. Repeated params are supported.\\n  note: For autocomplete, a token matching either an asset's name or tags.\\n  note: Field Type Description state string enum The approvals state of the asset.\\n  note: Field Type Description Resource Primary metadata about the asset.\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\\n  note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-3\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n  note: Field Type Description domain_category string The category.\\n  note: Field Type Description categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n  note: Field Type Description id string The four-by-four identifier of the user.\\n  note: Field Type Description domain string The domain's name.\\n  note: Field Type Description facet string The facet class.\\n- value (string): The facet value.\\n  note: Field Type Description start number Where the matched query term starts, as a character count, in the associated asset field.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-4\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- length (number): The number of characters the matched query term has.\\n  note: Field Type Description domain string The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n  note: Field Type Description id string The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n  note: Field Type Description page_views_last_week integer The number of views the asset has had in the last week.\\n  note: Field Type Description name string The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: TagAndCount The tag and the count of matching assets.\\n  note: Field Type Description domain_tag string The tag.\\n  note: Field Type Description tag_text string The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n  note: Field Type Description serviceMillis number The number of milliseconds needed to return the API response.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-5\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Field Type Description title string The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n  note: Field Type Description value string The facet value.\\n  note: 200 - Autocomplete Tags Response The response from a query to api/catalog/v1/tags/autocomplete.\\n  note: Field Type Description [TagMatch] An array of the autocomplete matches from a query.\\n- tag_text (string): The tag of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [TitleMatch] An array of the autocomplete matches from a query.\\n- title (string): The raw title of the matching asset.\\n  note: MatchOffsets An array of indices defining the location of the match.\\n- start (number): Where the matched query term starts, as a character count, in the associated asset field.\\n- length (number): The number of characters the matched query term has.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-6\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [CategoryAndCount] An array of categories and counts.\\n- domain_category (string): The category.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [DomainAndCount] An array of domains and counts.\\n- domain (string): The domain's name.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description facet string The facet class.\\n- value (string): The facet value.\\n  note: Field Type Description [TagAndCount] An array of tags and counts.\\n- domain_tag (string): The tag.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description [Asset] An array of the assets returned from a query.\\n  note: Resource Primary metadata about the asset.\\n- name (string): The name of the asset.\\n- page_views_last_week (integer): The number of views the asset has had in the last week.\\n- download_count (integer): The number of times the asset has been downloaded.\\n  note: lens_display_type Replaced by 'type' field denoting the asset's datatype.\\n  note: Classification Category, tags and custom metadata for the asset.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-7\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: categories In the past, assets were assigned a domain-independent category. Thus older assets may have this field and newer assets will not.\\n  note: tags In the past, assets were assigned a domain-independent tag. Thus older assets may have this field and newer assets will not.\\n- domain_category (string): The category of the asset; or not present in the response if not provided.\\n- key (string): The custom metadata key that can be used as a parameter with custom metadata search.\\n- domain (string): The domain the asset belongs to.\\n- state (string enum): The approvals state of the asset.\\n- id (string): The four-by-four identifier of the user.\\n  note: Search by this fieldhere. Sort by this field here.\\n- id (string): The four-by-four identifier of the user.\\n- serviceMillis (number): The number of milliseconds needed to return the API response.\\n  note: Field Type Description error string The error message\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-resp-8\", \"type\": \"response-fields\", \"title\": \"Count assets by facets\", \"path\": [\"Discovery API 1.0\", \"Count assets by facets\", \"Response\"], \"text\": \"note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\\n  note: Field Type Description error string The error message.\", \"tags\": [\"response\"], \"source_file\": \"docs/Discovery_API.md\", \"doc_id\": \"socrata_discovery\"}\n{\"id\": \"section-api-endpoints-1\", \"type\": \"section\", \"title\": \"API Endpoints\", \"path\": [\"API Endpoints\", \"API Endpoints\"], \"text\": \"API Endpoints\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-api-endpoints-2\", \"type\": \"section\", \"title\": \"API Endpoints\", \"path\": [\"API Endpoints\", \"API Endpoints\"], \"text\": \"API Endpoints What is an API Endpoint? The \\u201cendpoint\\u201d of a SODA API is simply a unique URL that represents an object or collection of objects. Every Socrata dataset, and even every individual data record, has its own endpoint. The endpoint is what you\\u2019ll point your HTTP client at to interact with data resources. All resources are accessed through a common endpoint of /api/v3/views/IDENTIFIER/query.json along with their dataset identifier. This paradigm holds true for every dataset in every SODA API. All datasets have a unique identifier - eight alphanumeric characters split into two four-character phrases by a dash. For example, ydr8-5enu is the identifier for the Building Permits. This identifier can then be inserted into the /api/v3/views/IDENTIFIER/query endpoint to construct the API endpoint. The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Once you\\u2019ve got your API endpoint, you can make requests with SoQL to filter and manipulate your dataset. Locating the API endpoint for a dataset You can also find API endpoints, and links to detailed developer documentation for each dataset, in a number of different places, depending on where you are: If you\\u2019re viewing a dataset listing within the Open Data Network, there will be a prominent \\u201cAPI\\u201d button that will take you directly to the API documentation for that dataset.  See this If you\\u2019re viewing a dataset directly, there will be an \\u201cAPI Documentation\\u201d button under \\u201cExport\\u201d and then \\u201cSODA API\\u201d.  See this\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-endpoint-versioning-1\", \"type\": \"section\", \"title\": \"Endpoint Versioning\", \"path\": [\"API Endpoints\", \"Endpoint Versioning\"], \"text\": \"Endpoint Versioning\\nSODA and SoQL are very flexible and allow us to add functionality over time without needing to completely deprecate and replace our APIs. We can do so in several different ways: By introducing new SoQL functions that provide new functionality. We could, for example, add a new function that allows you to filter or aggregate a dataset in a new way. By adding new datatypes to represent new data, like a new datatype for a new class of geospatial data. This allows us to introduce additional capabilities while still allowing you to issue the same kinds of queries in a backwards-compatible manner. We can extend SODA APIs without needing all developers to migrate their code to a new version. However, some functionalities are not available on all of our API endpoints, which is why we differentiate between versions of a dataset\\u2019s API. Functions made available on a newer version might not be available on an API endpoint of an older version. In the sidebar of our automatic API documentation, we list the version that that endpoint complies with, as well as other useful information.  See this Throughout the documentation on this developer portal you\\u2019ll notice version toggles and info boxes that will help you understand the difference between SODA endpoint versions.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-3-0-latest-1\", \"type\": \"section\", \"title\": \"Version 3.0 (Latest)\", \"path\": [\"API Endpoints\", \"Version 3.0 (Latest)\"], \"text\": \"Version 3.0 (Latest)\\nThe next iteration of SODA will be released in 2025 and changes the endpoint from /resource/IDENTIFIER.json to /api/v3/IDENTIFIER/query.json. Notable changes: Query requests must be either authenticated by a user or marked with a valid application token. We have separated the endpoint into two: /query for querying (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/query.json) Query primarily supports machine-readability and has more options for customizing the request. /export for exports (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/export.csv) Export supports more formats and focuses on generating something readable by humans. We strongly prefer that use the HTTP POST method when requesting queries, as this allows for longer queries and clearer options.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-1-1\", \"type\": \"section\", \"title\": \"Version 2.1\", \"path\": [\"API Endpoints\", \"Version 2.1\"], \"text\": \"Version 2.1\\nThe first SODA 2.1 APIs (previously referred to as our \\u201chigh-performance Socrata Open Data APIs\\u201d) were released in April of 2015, and in November of 2015 they received the \\u201c2.1\\u201d version designation for clarity. SODA 2.1 introduces a number of new datatypes as well as numerous new SoQL functions: Tons of new advanced SoQL functions to introduce powerful filtering and analysis into your queries New geospatial datatypes like Point , Line , and Polygon replace the Location datatype Support for the standardized GeoJSON output format, for direct use within geospatial tools like Leaflet Closer compliance with SQL semantics, such as Text comparisons becoming case-sensitive Currently only the JSON, CSV, and GeoJSON output formats are supported New functionality will be added to this version over time. For more information: SoQL functions that work with version 2.1 Datatypes that are available in version 2.1\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-1\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Version 2.0\\nSODA 2.0 was originally released in 2011. Although 2.1 is backwards-compatible with 2.0, there are a number of differences between the two APIs: 2.0 supports fewer SoQL functions than 2.1. The only geospatial datatype supported is the Location datatype Text comparisons are case-insensitive For more information: SoQL functions that work with version 2.0 Datatypes that are available in version 2.0 Versioning HTTP headers The simplest way to tell the difference between a 2.0 API and a 2.1 API is via the X-SODA2-Legacy-Types header, which will be true if you\\u2019re accessing a legacy 2.0 API. When we will increment endpoint versions From time to time, we\\u2019ll introduce new SoQL functions and datatypes to the latest version of the SODA API. Those changes will be non-breaking, and old queries and applications will continue to function unchanged. The SODA API is designed to make it easy to introduce new functionality over time without making breaking changes.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-row-identifiers-1\", \"type\": \"section\", \"title\": \"Row Identifiers\", \"path\": [\"API Endpoints\", \"Row Identifiers\"], \"text\": \"Row Identifiers\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-row-identifiers-2\", \"type\": \"section\", \"title\": \"Row Identifiers\", \"path\": [\"API Endpoints\", \"Row Identifiers\"], \"text\": \"What is a Row Identifier? Socrata datasets are essentially a collection of rows. Each row can be uniquely designated by its \\u201crow identifier\\u201d, much like a driver\\u2019s license number or social security number identifies an individual. For those familiar with database concepts, they essentially act the same way as primary keys. Internal Identifiers vs Publisher-Specified Identifiers Row identifiers come in two flavors: Internal identifiers are auto-generated by the Socrata platform every time a new row is created. Publisher-specified identifiers are configured by the dataset owner and use a field of unique values within the dataset as the row identifier. Depending on what dataset you're accessing, internal row identifiers may be simple integers, or alphanumeric strings. There's no difference between the two in how you use them. To learn more about how to access internal row identifiers, read the System Fields documentation. Establishing a Publisher-Specified Identifier Setting a row identifier requires that you are either the owner of a dataset, or that you've been granted a role of Publisher or Administrator on a Socrata customer site. Basically, if you can't modify the dataset, you can't set a row identifier. A publisher-specified row identifier can be established for any Socrata dataset. A common column to use as a row identifier is an \\u2018ID\\u2019 column with some kind of number or code that uniquely identifies that row of data. For example, the \\u2018Inspection ID\\u2019 column of Chicago\\u2019s Food Inspections dataset is a Publisher-specified row identifier. How to Set a Row Identifier See this helpful guide on how to set a row identifier in Socrata. RESTful Verbs The Socrata API follows the REST (REpresentational State Transfer) design pattern. This means that the CRUD (Create, Read, Update, and Delete) operations are specified by using HTTP methods. These are referred to as RESTful verbs. GET Use the HTTP GET method to obtain data. As described in the Endpoints section, GET can be used to retrieve column data from multiple rows or from one single row. The Queries section describes how to do sophisticated queries, all with the GET method. For SODA3, you must authenticate or use an application token in order to query for or export data. You may preferentially use POST, which is useful if your SoQL query is very long. POST Use the HTTP POST method to add new rows in a dataset. See the SODA Producer API section for more details on how to add data. Note that you will need to authenticate in order to make changes. See the Authentication section for more information on how to do this. PUT Use the HTTP PUT method to modify data. Like POST, you will need authentication. Again, see the SODA Producer API and Authentication sections for more information. DELETE Use the HTTP DELETE method to remove data. Like POST and PUT, you will need authentication. Again, see the SODA Producer API and Authentication sections for more information.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-application-tokens-1\", \"type\": \"section\", \"title\": \"Application Tokens\", \"path\": [\"API Endpoints\", \"Application Tokens\"], \"text\": \"Application Tokens\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-application-tokens-2\", \"type\": \"section\", \"title\": \"Application Tokens\", \"path\": [\"API Endpoints\", \"Application Tokens\"], \"text\": \"The Socrata Open Data API uses application tokens for two purposes: Using an application token allows us to throttle by application, rather than via IP address, which gives you a higher throttling limit Authentication using OAuth Throttling limits Without an application token, we can only track usage and perform throttling based on a few simple criteria, mainly source IP address. As such, requests that aren\\u2019t using an application token come from a shared pool via IP address. IP addresses that make too many requests during a given period may be subject to throttling. When requests are made using an application token, we can actually attribute each request to a particular application and developer, granting each their own pool of API requests. Currently we do not throttle API requests that are using an application token, unless those requests are determined to be abusive or malicious. We reserve the right to change these throttling limits with notice, and we will post an update to announce any such change. If you are throttled for any reason, you will receive a status code 429 response. Don\\u2019t be a jerk! Dont do that! Yes, I know it says you get unlimited requests. But keep in mind that you\\u2019re using a shared platform, and you should still be deliberate in how you design your application to use our API. Applications that are determined to be abusive or malicious, or that otherwise monopolize the use of our API may be throttled. If we detect that your application is nearing the point where we may have to throttle it, we will likely pro-actively reach out to you to discuss how you can optimize your usage. If you have any questions, feel free to contact us and we\\u2019d be glad to help! Obtaining an Application Token You can obtain an application token by registering for one in your Socrata profile. Using your Application Token While it is possible to perform simple unauthenticated queries against the Socrata Open Data API without making use of an application token, you\\u2019ll receive much higher throttling limits if you include an application token in your requests. If you elect not to use an application token, you\\u2019ll be subjected to a much lower throttling limit for all requests originating from your IP address. Here\\u2019s how you include the application token in the request: SODA Version\\tMethod 3.0, 2.x\\tUse the X-App-Token HTTP header. 2.1, 2.0\\tUse the $$app_token parameter in your request. 1.0\\tUse the app_token parameter in your request. Using the header is the preferred method. Note: Application tokens are not necessarily used for authentication, but you should still preserve the security of your application token by always using HTTPS requests. If your application token is duplicated by another developer, their requests will count against your quota. The following is an example of using the X-App-Token HTTP header to pass an application token: POST /api/v3/views/kzjm-xkqj/query.json HTTP/1.1 Host: data.seattle.gov Accept: application/json X-App-Token: [REDACTED] The same application token could also be passed as a URL parameter: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Using the Application Token as part of the OAuth 2.0 authentication process Application tokens can also be used for authentication using OAuth 2.0. For more information, see the authentication section.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"Authentication\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-2\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"There are two methods available for authentication: HTTP Basic and OAuth 2.0. For non-interactive applications, we only support HTTP Basic Authentication. We encourage all our developers of interactive applications to use the OAuth 2.0 workflow to authenticate their users. HTTP Basic Authentication is required when you are authenticating from a script that runs without interaction with the user, like your ETL tool, an update script, or any other data management automation. OAuth 2.0 is the preferred option for cases where you are building a web or mobile application that needs to perform actions on behalf of the user, like accessing data, and the interaction model allows you to present the user with a form to obtain their permission for the app to do so. Authenticating using HTTP Basic Authentication Requests can be authenticated using HTTP Basic Authentication. You can use your HTTP library\\u2019s Basic Auth feature to pass your credentials. All HTTP-basic-authenticated requests must be performed over a secure (https) connection. Authenticated requests made over an insecure connection will be denied. Users may use their username and password or an API key and secret pair to authenticate using Basic Authentication. Documentation on how to create and manage API keys can be found here. We recommend using API keys! They provide the following benefits: Access Socrata APIs without the risk of embedding your username and password in scripts or code Users on domains that require SSO (and thus without passwords) can access Socrata APIs Create individual keys for different apps or jobs so that if any one needs to be revoked or rotated, other apps are unaffected Change your account password without disrupting apps or rotate API keys without disrupting logins Here is a sample HTTP session that uses HTTP Basic Authentication: POST /api/v3/views/4tka-6guv/query.json HTTP/1.1 Host: soda.demo.socrata.com Authorization: Basic [REDACTED] Content-Type: application/json X-App-Token: [REDACTED] Note that the Authorization header in this request will usually be generated via your HTTP library\\u2019s Basic Auth feature (as opposed to manually constructing the Base64 encoding of your credentials yourself). For example, if you\\u2019re using Python\\u2019s requests module, it supports Basic Authentication out of the box. Similarly, an API tool like Postman also handles Basic Authentication. OAuth 2.0 Note: When developing applications that make use of OAuth, you must provide a web-accessible callback URL when registering your application token. This can make it difficult to develop on a machine that isn't directly exposed to the Internet. One great option is to use a tool like ngrok to create a secure tunnel to expose your web application in a secure manner.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-workflow-1\", \"type\": \"section\", \"title\": \"Workflow\", \"path\": [\"API Endpoints\", \"Workflow\"], \"text\": \"Workflow\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-workflow-2\", \"type\": \"section\", \"title\": \"Workflow\", \"path\": [\"API Endpoints\", \"Workflow\"], \"text\": \"We support a subset of OAuth 2.0 \\u2014 the server-based flow with a callback URL \\u2014 which we believe is more secure than the other flows in the specification. This OAuth flow is used by several other popular API services on the web. We have made the authentication flow similar to Google AuthSub. To authenticate with OAuth 2.0, you will first need to register your application, which will create an app token and a secret token. When registering your application, you must preregister your server by filling out the Callback Prefix field), so that we can be sure that access through your application is secure even if both your tokens are stolen. The Callback Prefix is the beginning of the URL that you will use as your redirect URL. Generally, you\\u2019ll want to provide as much of your callback URL as you can. For example, if your authentication callback is https://my-website.com/socrata-app/auth/callback, you might want to specify https://my-website.com/socrata-app as your callback URL. Once you have an application and a secret token, you\\u2019ll be able to authenticate with the SODA OAuth 2.0 endpoint. You\\u2019ll first need to redirect the user to the Socrata-powered site you wish to access so that they may log in and approve your application. For example: https://soda.demo.socrata.com/oauth/authorize?client_id=YOUR_AUTH_TOKEN&response_type=code &redirect_uri=YOUR_REDIRECT_URI Note that the redirect_uri here must be an absolute, secure (https:) URI which starts with the Callback Prefix you specified when you registered your application. If any of these cases fail, the user will be shown an error indicating as much. Should the user authorize your application, they will be redirected back to the your redirect_uri. For example, if I provide https://my-website.com/socrata-app/auth/callback as my redirect_uri, the user will be redirected to this URL: https://my-website.com/socrata-app/auth/callback?code=CODE where CODE is an authorization code that you will use later. If your redirect_uri contains a querystring, it will be preserved, and the code parameter will be added onto the end of it. Likewise, if you provide the optional state parameter in the original redirect to /authenticate, it will be preserved and sent back to you. Now that the user has authorized your application, the next step is to retrieve an access_token so that you can perform operations on their behalf. You can do this by making the following POST request from your server: https://soda.demo.socrata.com/oauth/access_token \\\"client_id\\\": YOUR_AUTH_TOKEN, \\\"client_secret\\\": YOUR_SECRET_TOKEN, \\\"grant_type\\\": \\\"authorization_code\\\", \\\"redirect_uri\\\": YOUR_REDIRECT_URI, \\\"code\\\": CODE where YOUR_AUTH_TOKEN and YOUR_SECRET_TOKEN are the tokens you received when registering your app, YOUR_REDIRECT_URI is the same value as what you used previously, and CODE is the value of the code query parameter of the URL that the user was redirected to. You\\u2019ll receive the following response: { access_token: ACCESS_TOKEN } Use this access_token in your requests when you have to do work on behalf of the now-authenticated user, as described below in the Using an OAuth 2.0 Access Token section. We have a sample app available on GitHub that illustrates how to do all of the above with the Ruby OAuth2 gem. Using an OAuth 2.0 Access Token Once you have obtained an access_token, you should include it on requests which need to happen on behalf of the user. The token must be included in the Authorization HTTP Header field as follows: Authorization: OAuth YOUR_ACCESS_TOKEN Note: All authenticated requests must be performed over a secure connection (https). Any attempt to use an access_token over a non-secure connection will result in immediate revocation of the token. Who am I? One quirk of authenticating via OAuth 2.0 is that the entire process happens without the 3rd party application (that\\u2019s you!) having any knowledge of who, exactly, the user is that just authorized the application. To remedy this, we have set up an endpoint that simply returns the information of the current user. To return the data in JSON: https://soda.demo.socrata.com/api/users/current.json To return the data in XML: https://soda.demo.socrata.com/users/current.xml\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-response-codes-headers-1\", \"type\": \"section\", \"title\": \"Response Codes & Headers\", \"path\": [\"API Endpoints\", \"Response Codes & Headers\"], \"text\": \"Response Codes & Headers\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-response-codes-1\", \"type\": \"section\", \"title\": \"Response Codes\", \"path\": [\"API Endpoints\", \"Response Codes\"], \"text\": \"Response Codes\\nThe Socrata Open Data API responds with standard HTTP Status Codes for both successful requests and for errors. The table below lists the response codes you should expect to see. 200\\tOK\\tYour request was successful 202\\tRequest Processing\\tYou can retry your request, and when it\\u2019s complete, you\\u2019ll get a 200 instead 400\\tBad Request\\tProbably your request was malformed. See the error message in the body for details 401\\tUnauthorized\\tYou attempted to authenticate but something went wrong. Make sure you follow the instructions to authenticate properly 403\\tForbidden\\tYou\\u2019re not authorized to access this resource. Make sure you authenticate to access private datasets 404\\tNot Found\\tThe resource requested doesn\\u2019t exist 429\\tToo Many Requests\\tYour client is currently being rate limited. Make sure you\\u2019re using an app token 500\\tServer Error\\tOur bad! Something has gone wrong with Socrata\\u2019s platform. Please let us know if you encounter a 500 error\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-headers-1\", \"type\": \"section\", \"title\": \"Headers\", \"path\": [\"API Endpoints\", \"Headers\"], \"text\": \"Headers\\nFor SODA 2.1 API calls, we include a few response headers that may be useful: X-Socrata-RequestId\\taqe1bgaxzvhitfgrsvy6semhi\\tA unique ID for this particular request. Very useful to include when asking for help, as it allows us to track your error down in our system Access-Control-Allow-Origin\\t*\\tAllows browsers to make cross-origin requests for data X-SODA2-Fields\\t[\\\"business\\\",\\\"category\\\", ...] (truncated)\\tAn array of the field names that may be included in this response X-SODA2-Types\\t[\\\"text\\\",\\\"text\\\",...] (truncated)\\tAn array of the data types for fields included in this response Last-Modified\\tTue, 24 Feb 2015 18:51:22 GMT\\tWhen the dataset backing this request was updated; may be used for caching ETag\\t\\\"YWxwaGEuNTQzNV8...-gzip\\\" (truncated)\\tAn HTTP ETag which may be used for cache validation There may be other headers included in responses, but they should not be relied upon and may change without notice. HTTP Headers are limited by practical constraints to a maximum size of 4K. In order to keep our request header sizes below that limit, the X-SODA2-Fields and X-SODA2-Types headers may be omitted for datasets with a very large number of columns.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-error-messages-1\", \"type\": \"section\", \"title\": \"Error Messages\", \"path\": [\"API Endpoints\", \"Error Messages\"], \"text\": \"Error Messages\\nFor any variety of error, we return a standard error message format that looks like the following: \\\"code\\\" : \\\"soql.analyzer.typechecker.type-mismatch\\\", \\\"error\\\" : true, \\\"message\\\" : \\\"Type mismatch: expected text, but found number\\\", \\\"status\\\" : 400, \\\"data\\\" : { \\\"found\\\" : \\\"number\\\", \\\"expected\\\" : [ \\\"text\\\" ]\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\n\\\"source\\\" : { \\\"position\\\" : { \\\"column\\\" : 30, \\\"row\\\" : 1, \\\"text\\\" : \\\"select * where string_column > 42\\\" \\\"type\\\" : \\\"anonymous\\\" In particular: code: An enumeration for the particular class of error you have encountered error: A boolean flag you can check in your code if your library masks the HTTP error code. Ex: if(response.error) { // handle error } message: A human-readable error message that will help you debug what caused the error data: Machine-readable data about the error, most importantly the query generated by our SoQL parser based on your inputs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-system-fields-1\", \"type\": \"section\", \"title\": \"System Fields\", \"path\": [\"API Endpoints\", \"System Fields\"], \"text\": \"System Fields\\nIn addition to the fields provided by the dataset owner, Socrata also provides a number of useful system fields you can make use of. They\\u2019re very useful for detecting when datasets have changed. :id\\tThe internal Socrata identifier for this record. :created_at\\tA Fixed Timestamp representing when this record was created. :updated_at\\tA Fixed Timestamp representing when this record was last updated. System fields are not included by default, and the method that you use to request the inclusion of the hidden system fields depends on what version of the SODA API specification the API you are accessing complies with. To learn more about API versioning, see the API Endpoint documentation.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-1-1\", \"type\": \"section\", \"title\": \"Version 2.1\", \"path\": [\"API Endpoints\", \"Version 2.1\"], \"text\": \"Version 2.1\\nWith version 2.1 APIs, accessing the system fields is as simple as including them in your $select parameter, either explicitly or via a wildcard. You can either $select=:id, :updated_at, name, address, or you could be even more broad and simply select :*, * to retrieve both all of the hidden internal fields and the fields from the dataset itself. For example: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. Since :created_at and :updated_at are Fixed Timestamp, you can query them to get recent updates to a dataset using the $where query parameter, like this example: The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. A note on how datasets are updated Data providers use many different methods to update datasets. In some cases, they use tools like DataSync or the SODA Producer API to update datasets, and we can tell which records within the dataset have actually been modified, and only update them accordingly. When data providers perform a full replace of the dataset using the SODA Producer Replace API, all of its records will be updated within a short period of time, in which case a query based on :updated_at will show that all of the records have changed.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-1\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Version 2.0\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-version-2-0-2\", \"type\": \"section\", \"title\": \"Version 2.0\", \"path\": [\"API Endpoints\", \"Version 2.0\"], \"text\": \"Getting the SODA API to return system fields is as simple as adding the parameter $$exclude_system_fields=false to your request. The double dollar sign ($$) is significant - it denotes a Socrata-specific parameter that is not part of the SODA standard. The TryIt macro has been disabled until future notice while we upgrade this site to SODA3. CORS & JSONP For security reasons, web browsers prevent what are called \\u201ccross-origin\\u201d or \\u201ccross-site\\u201d requests from one domain to another. JavaScript XMLHTTPRequests (commonly called \\u201cAJAX\\u201d requests) inherit all of the authentication context of the currently logged in user, so a malicious web page could attempt to make malicious requests that cross domain contexts and cause trouble. Historically, that has made it difficult for web developers to build web applications making use of third-party APIs. Fortunately, techniques have since been developed that allow developers to securely access APIs cross-domain. The two most popular ones, and the techniques that Socrata supports, are CORS and JSONP. A note on CORS, JSONP, and dataset permissions In order to prevent the aforementioned malicious cross-site attacks, Socrata automatically drops all authentication and authorization on requests that come in via CORS and JSONP. As a result, these techniques can only be used to access public datasets in a read-only fashion. Cross-Origin Resource Sharing (CORS) CORS is a proposed standard for allowing your web browser and a web server to negotiate and allow requests to be made across domain contexts. CORS is currently supported in modern Chrome, Firefox, Safari, and Internet Explorer (10+) web browsers. The standard itself is working its way through the W3C on its way to becoming official. You don\\u2019t need to do anything special to use CORS with JavaScript in a modern browser. Your web browser and our servers will automatically negotiate the cross-origin request. For example, to make a CORS request with jQuery, you\\u2019d make your request just like you were performing it within the context of your own domain. $.ajax({ url: \\\"https://data.chattlibrary.org/api/v3/views/e968-fnk9/query.json\\\", method: \\\"POST\\\", dataType: \\\"json\\\", data: JSON.stringify({ \\\"query\\\": \\\"SELECT * WHERE status = 'CLOSED'\\\", \\\"page\\\": { \\\"pageNumber\\\": 1, \\\"pageSize\\\": 1000\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\n\\\"includeSynthetic\\\": false\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"}),\", \"path\": [\"API Endpoints\", \"}),\"], \"text\": \"}),\\nheaders: { 'Content-Type': 'application/json', 'X-App-Token': app_token\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"},\", \"path\": [\"API Endpoints\", \"},\"], \"text\": \"},\\nsuccess: function( data, status, jqxhr ){ console.log( \\\"Request received:\\\", data ); error: function( jqxhr, status, error ){ console.log( \\\"Something went wrong!\\\" );\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-1\", \"type\": \"section\", \"title\": \"});\", \"path\": [\"API Endpoints\", \"});\"], \"text\": \"});\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-2\", \"type\": \"section\", \"title\": \"});\", \"path\": [\"API Endpoints\", \"});\"], \"text\": \"\\u201cJavaScript with Padding\\u201d (JSONP) If you\\u2019re developing for older browsers, or you just feel like being nostalgic, you can also make use of our support for JSONP. Also called \\u201cJSON with Padding\\u201d, it is a technique for fooling a web browser into performing cross-origin requests using a special <script> tag that uses the src attribute to make a special API request. Instead of responding with just a JSON object, the server responds with JavaScript code that calls a client-declared callback function, passing the data as that function\\u2019s first parameter. With the Socrata API, the name of that callback function is declared using the $jsonp parameter. Sounds hacky, huh? Fortunately, tools like jQuery make it easy to use JSONP: $.ajax({ url: \\\"https://data.chattlibrary.org/resource/e968-fnk9.json\\\", jsonp: \\\"$jsonp\\\", dataType: \\\"jsonp\\\" }).done(function(data) { console.log(\\\"Request received: \\\" + data); But, as we mentioned, you should only need to use JSONP as a fallback in cases where you\\u2019re working with a browser that doesn\\u2019t support CORS. Queries using SODA3 The Socrata APIs provide rich query functionality through a query language we call the \\u201cSocrata Query Language\\u201d or \\u201cSoQL\\u201d. As its name might suggest, it borrows heavily from Structured Query Language (SQL), used by many relational database systems. Its paradigms should be familiar to most developers who have previously worked with SQL, and are easy to learn for those who are new to it. Requests must be either authenticated by a user or marked with a valid application token. Developers should now use the HTTP POST method when requesting queries, as this allows for longer queries and clearer options. The endpoints are split into two: /query for querying (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/query.json) Query has more options for customizing the request so that you can fine-tune what data you want back. /export for exports (e.g., https://data.cityofchicago.org/api/v3/views/ydr8-5enu/export.csv) Export focuses on providing the entire dataset to be consumed by humans or Microsoft Excel or similar programs. You can click on each option to see more information about them: Request Option\\t/query\\t/export\\tDescription query\\tavailable\\tavailable\\tThe SoQL query to run page\\tavailable\\tnot available\\t{ pageNumber: 1, pageSize: 1000 } to indicate which page (1-indexed) and how many rows per page parameters\\tavailable\\tavailable\\tSome views require parameters to be provided by the user. Details to be provided at a later date timeout\\tdefault: 600\\tdefault: 600\\tThe number of seconds before timing out the request. Default: 600 (10 minutes) includeSystem\\tdefault: true\\tnot available\\tWhether or not to include system columns includeSynthetic\\tdefault: true\\tnot available\\tWhether or not to include not-explicitly-requested columns, such as system fields orderingSpecifier\\tdefault: total\\tdefault: total\\tCan be set to discard if you do not care about order and just want the data. Can improve performance significantly serializationOptions\\tnot available\\tavailable\\tDifferent formats have specific customization options.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-example-1\", \"type\": \"section\", \"title\": \"Example\", \"path\": [\"API Endpoints\", \"Example\"], \"text\": \"Example\\nYou might use the popular program cURL to make the request with the appropriate payload, or use an appropriate HTTP client library in your preferred programming language. Query for the first 100 rows of a dataset: curl --header 'X-App-Token: your-application-token' \\\\ --json '{ \\\"query\\\": \\\"SELECT *\\\", \\\"page\\\": { \\\"pageNumber\\\": 1, \\\"pageSize\\\": 100\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-section-2\", \"type\": \"section\", \"title\": \"}' \\\\\", \"path\": [\"API Endpoints\", \"}' \\\\\"], \"text\": \"https://soda.demo.socrata.com/api/v3/views/4tka-6guv/query.json Export the dataset as CSV with a byte-order mark and a separator character of TAB: curl --header 'X-App-Token: your-application-token' \\\\ --json '{ \\\"serializationOptions\\\": { \\\"separator\\\": \\\"\\\\t\\\", \\\"bom\\\": true https://soda.demo.socrata.com/api/v3/views/4tka-6guv/export.csv SoQL Function and Keyword Listing The following are all the functions and keywords available in SoQL. Some only work on the the latest version of our API endpoints, while some work on legacy versions as well. You can filter them by endpoint version and datatype using the filters below. For a list of valid operators, see the Datatypes documentation. distinct\\tReturns distinct set of records\\t2.1 and 3.0 avg(...)\\tReturns the average of a given set of numbers\\t2.0, 2.1, and 3.0 between ... and ...\\tReturns TRUE for values in a given range\\t2.1 and 3.0 case(...)\\tReturns different values based on the evaluation of boolean comparisons\\t2.1 and 3.0 convex_hull(...)\\tReturns the minimum convex geometry that encloses all of another geometry\\t2.1 and 3.0 count(...)\\tReturns a count of a given set of records\\t2.0, 2.1, and 3.0 date_extract_d(...)\\tExtracts the day from the date as an integer.\\t2.1 and 3.0 date_extract_dow(...)\\tExtracts the day of the week as an integer between 0 and 6 (inclusive).\\t2.1 and 3.0 date_extract_hh(...)\\tExtracts the hour of the day as an integer between 0 and 23 (inclusive).\\t2.1 and 3.0 date_extract_m(...)\\tExtracts the month as an integer.\\t2.1 and 3.0 date_extract_mm(...)\\tExtracts the minute from the time as an integer.\\t2.1 and 3.0 date_extract_ss(...)\\tExtracts the second from the time as an integer.\\t2.1 and 3.0 date_extract_woy(...)\\tExtracts the week of the year as an integer between 0 and 51 (inclusive).\\t2.1 and 3.0 date_extract_y(...)\\tExtracts the year as an integer.\\t2.1 and 3.0 date_trunc_y(...)\\tTruncates a calendar date at the year threshold\\t2.0, 2.1, and 3.0 date_trunc_ym(...)\\tTruncates a calendar date at the year/month threshold\\t2.0, 2.1, and 3.0 date_trunc_ymd(...)\\tTruncates a calendar date at the year/month/date threshold\\t2.0, 2.1, and 3.0 distance_in_meters(...)\\tReturns the distance between two Points in meters\\t2.1 and 3.0 extent(...)\\tReturns a bounding box that encloses a set of geometries\\t2.1 and 3.0 greatest(...)\\tReturns the largest value among its arguments, ignoring NULLs.\\t2.1 and 3.0 in(...)\\tMatches values in a given set of options\\t2.1 and 3.0 intersects(...)\\tAllows you to compare two geospatial types to see if they intersect or overlap each other\\t2.1 and 3.0 least(...)\\tReturns the smallest value among its arguments, ignoring NULLs.\\t2.1 and 3.0 like '...'\\tAllows for substring searches in text strings\\t2.1 and 3.0 ln(...)\\tReturns the natural log of a number\\t2.1 and 3.0 lower(...)\\tReturns the lowercase equivalent of a string of text\\t2.1 and 3.0 max(...)\\tReturns the maximum of a given set of numbers\\t2.1 and 3.0 min(...)\\tReturns the minimum of a given set of numbers\\t2.1 and 3.0 not between ... and ...\\tReturns TRUE for values not in a given range\\t2.1 and 3.0 not in(...)\\tMatches values not in a given set of options\\t2.1 and 3.0 not like '...'\\tAllows for matching text fields that do not contain a substring\\t2.1 and 3.0 num_points(...)\\tReturns the number of vertices in a geospatial data record\\t2.1 and 3.0 regr_intercept(...)\\tReturns the y-intercept of the linear least squares fit\\t2.1 and 3.0 regr_r2(...)\\tReturns the square of the correlation coefficient (r\\u00b2)\\t2.1 and 3.0 regr_slope(...)\\tReturns the slope of the linear least squares fit\\t2.1 and 3.0 simplify(...)\\tReduces the number of vertices in a line or polygon\\t2.1 and 3.0 simplify_preserve_topology(...)\\tReduces the number of vertices in a line or polygon, preserving topology\\t2.1 and 3.0 starts_with(...)\\tMatches on text strings that start with a given substring\\t2.1 and 3.0 stddev_pop(...)\\tReturns the population standard deviation of a given set of numbers\\t2.1 and 3.0 stddev_samp(...)\\tReturns a sampled standard deviation of a given set of numbers\\t2.1 and 3.0 sum(...)\\tReturns the sum of a given set of numbers\\t2.1 and 3.0 unaccent(...)\\tRemoves accents (diacritical marks) from a string.\\t2.1 and 3.0 upper(...)\\tReturns the uppercase equivalent of a string of text\\t2.1 and 3.0 within_box(...)\\tReturns the rows that have geodata within the specified box, defined by latitude, longitude corners\\t2.0, 2.1, and 3.0 within_circle(...)\\tReturns the rows that have locations within a specified circle, measured in meters\\t2.0, 2.1, and 3.0 within_polygon(...)\\tReturns the rows that have locations within the specified box, defined by latitude, longitude corners\\t2.1 and 3.0\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-data-transform-listing-1\", \"type\": \"section\", \"title\": \"Data Transform Listing\", \"path\": [\"API Endpoints\", \"Data Transform Listing\"], \"text\": \"Data Transform Listing\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-data-transform-listing-2\", \"type\": \"section\", \"title\": \"Data Transform Listing\", \"path\": [\"API Endpoints\", \"Data Transform Listing\"], \"text\": \"These are the transformation functions available in the Dataset Management API. These functions can be used to transform and validate your data before you publish your dataset for consumption. These functions can be used in the \\u201cData Transforms\\u201d editor of the the Dataset Management Experience interface. Check out some of the examples on our Support Portal here! See the Dataset Management API docs for more info on how to use the transform functions as an API user. +\\tKeep a number\\u2019s sign and\\tLogical and of two boolean values ||\\tconcatenate two strings /\\tDivide a number by another =\\tReturn true if the left side equals the right ==\\tReturn true if the left side equals the right ^\\tNo documentation is available. >\\tReturn true if the value on the left is greater than the value on the right >=\\tReturn true if the value on the left is greater than or equal to the value on the right <\\tReturn true if the value on the left is less than the value on the right <=\\tReturn true if the value on the left is less than or equal to the value on the right %\\tFind the remainder(modulus) of one number divided by another *\\tMultiply two numbers together not\\tInvert a boolean <>\\tReturn true if the left side does not equal the right !=\\tReturn true if the left side does not equal the right or\\tLogical or of two boolean values -\\tSubtract a number from another abs\\tProduce the absolute value of a number between\\tReturn true if the left is within the range of the right values case\\tEvaluate a series of true/false expressions (predicates) and return the next consequent. centroid\\treturns the geometric centroid of a polygon or multipolygon. Please refer to coalesce\\tTake the leftmost non-null value. contains\\ttell whether or not a string contains another string county_boundary\\tReturns the boundary of the US county as a multipolygon. The state name is not case sensitive. date_extract_d\\tExtract the day from the date as an integer date_extract_dow\\tExtracts the day of the week as an integer between 0 and 6 where date_extract_hh\\tExtract the hour the date as an integer date_extract_m\\tExtract the month as an integer date_extract_mm\\tExtract the minute from the date as an integer date_extract_ss\\tExtract the second from the date as an integer date_extract_woy\\tExtracts the week of the year as an integer between 0 and 51 date_extract_y\\tExtract the year as an integer date_trunc_y\\tTruncates a calendar date at the year threshold date_trunc_ym\\tTruncates a calendar date at the year/month threshold date_trunc_ymd\\tTruncates a calendar date at the year/month/day threshold datetime_add_d\\tAdds or subtracts the specified number of days to the timestamp datetime_add_hh\\tAdds or subtracts the specified number of hours to the timestamp datetime_add_mm\\tAdds or subtracts the specified number of minutes to the timestamp datetime_add_ss\\tAdds or subtracts the specified number of seconds to the timestamp datetime_diff\\tCalculates the difference between two dates in seconds, minutes, hours, days, business days, weeks, calendar weeks, months, or years. domain_categories\\tReturns the categories currently configured on the domain. Useful primarily domain_licenses\\tReturns the licenses currently configured on the domain. Useful primarily email_parse\\tParse an email. This is best effort as most things are actually ensure_within\\tensure_within is a function which takes a point and a multipolygon error\\tMake an error. This is useful in conjunction with a case function, floating_timestamp_day\\tExtract the day from a calendar date floating_timestamp_day_of_week\\tExtract the day of the week as an integer between 0 and 6 where Sunday is 0. floating_timestamp_hour\\tExtract the hour from a calendar date floating_timestamp_minute\\tExtract the minute from a calendar date floating_timestamp_month\\tExtract the month from a calendar date floating_timestamp_second\\tExtract the second from a calendar date floating_timestamp_week_of_year\\tExtract the week from a calendar date as an integer between 0 and 51. floating_timestamp_year\\tExtract the year from a calendar date forgive\\tforgive can take an optional default argument from_polyline\\tconvert a linestring encode in Google\\u2019s polyline format with the given precision to a Line geocode\\tgeocode is a function which takes human readable addresses geocode_esri\\tgeocode_esri is a function which takes human readable addresses grapheme_length\\tthe length of a piece of text in unicode grapheme clusters. greatest\\treturn the largest value among its arguments (ignoring null) hash\\tConstruct a hash value from a string value using either the md5 or sha256 algorithm. haversine_distance\\tReturn the distance of the line using haversine formula http_get\\tMake an HTTP Get request to a URL. The response is returned. If the server in\\tWhether or not a value is in a set of other values is_empty\\tReturns whether or not the input is empty. Empty means null values, is_not_null\\tWhether or not a value is not null is_null\\tWhether or not a value is null is_within\\tis_within is a function which takes a point and a multipolygon json_array_contains\\tTest if a json array contains an item. If the JSON passed to this function is not an array, json_pluck\\tPluck a value out of a JSON string. The returned value will be a SoQL Json value. json_pluck_boolean\\tPluck a boolean value out of a JSON string. The returned value must be a boolean, otherwise json_pluck_number\\tPluck a number value out of a JSON string. The returned value must be a number, otherwise json_pluck_text\\tPluck a text value out of a JSON string. The returned value may be a primitive like a least\\treturn the smallest value among its arguments (ignoring null) left_pad\\tPad text with the minimum number of copies of pad to reach desired_length. length\\tthe length of a piece of text in unicode code points. This is usually, but not like\\tIf a string is like another string. location_address\\tExtract the address from a location location_city\\tExtract the city from a location location_point\\tExtract the point from a location location_state\\tExtract the state from a location location_to_point\\tTurn a location value into a point location_zip\\tExtract the zip from a location lower\\tlowercase a string make_location\\tThis function has been deprecated. Please use the make_point function instead. make_point\\tfunction to make a point out of a Y (latitude) and X (longitude) coordinate. make_url\\tNo documentation is available. not_between\\tReturn true if the left is not within the range of the right values not_in\\tWhether or not a value is absent from a set of other values not_like\\tIf a string is not like another string. parse_address\\tExtract a street address from a full US address. parse_city\\tExtract a city from a full US address. parse_point\\tExtract the point from a full US address with point. parse_state\\tExtract a state from a full US address. parse_zip\\tExtract a ZIP code from a full US address. point_latitude\\tExtract the latitude from a point point_longitude\\tExtract the longitude from a point polylabel\\tReturns a point that must exist within the polygon borders. It uses the recursive grid-based algorithm described here: https://github.com/mapbox/polylabel#how-the-algorithm-works. When given a multipolygon, the point it returns is within the largest (by area) sub-polygon. random_number_between\\tReturns a random float using a uniform distribution between the lower and upper values supplied: random_number_between(lower, upper) random_number_normal\\tReturns a random float using a normal distribution with the mean and variance supplied: random_number_normal(mean, variance) regex_capture\\tfunction to capture a piece of text based on a regular expression regex_named_capture\\tcapture a piece of text based on a regular expression regex_replace\\tfunction to replace a piece of text based on a regular expression region_code\\tTurn a point into the ID of a region, based on which region the point falls within. For example, if this dataset can produce region_code_label\\tIdentical to region_code, but returns a text value. repair_geometry\\tAttempt to repair the geometry. replace\\treplace text with another piece of text replace_first\\treplace the first occurrence of a piece of text with another piece of text reproject\\treproject a geometry from one projection to another. reproject_to_wgs84\\tfunction to reproject a geometry to WGS84. This will allow the geometry right_pad\\tPad text with the minimum number of copies of pad to reach desired_length. round\\tRound a number to a given precision. Trailing zeros are removed by default. Negative precisions round numbers to the left of the decimal. set_projection\\tfunction to explicitly set the projection value on geometries which do not have projection simplify\\tReturns a simplified version of the Line, Polygon, MultiLine, or MultiPolygon using simplify_preserve_topology\\tReturns a simplified version of the Line, Polygon, MultiLine, or MultiPolygon using slice\\tGet a substring of a specified length of a text from a start index source_created_at\\tGet the fixed timestamp that this data source was created (ie: started uploading or importing). split_select\\tfunction to split a piece of text on a token, and then select starts_with\\ttell whether or a not a string is prefixed with another string state_boundary\\treturns the boundary of the US state title_case\\tMake string title case with the exception of small words as defined by NYT Style Guide: to_boolean\\tcast a value to a true or false to_checkbox\\tNo documentation is available. to_fixed_timestamp\\tTurn a text value into a datetime with a fixed timezone. to_floating_timestamp\\tTurn a text value into a floating datetime. \\u201cFloating\\u201d means the timezone to_json\\tcast a text value to json to_line\\tparse a WKT (text) representation of a line into a line value to_location\\tThis function has been deprecated. Please use the to_point function instead. to_multiline\\tconvert a line into a multiline to_multipoint\\tconvert a point into a multipoint to_multipolygon\\tconvert a polygon into a multipolygon to_number\\tcast a value to a number to_point\\tparse a WKT (text) representation of a point into a point value to_polygon\\tparse a WKT (text) representation of a polygon into a polygon value to_text\\tNo documentation is available. to_url\\tNo documentation is available. trim\\ttrim characters off the start and end of a string trim_leading\\ttrim characters off the start of a string trim_trailing\\ttrim characters off the end of a string upper\\tuppercase a string uri_parse\\tParse a URI. url_decode\\tURL Decode a value url_description\\tExtract the description part of a link. url_encode\\tURL Encode a value. url_url\\tExtract the url part of a link. validate_geometry\\tTest that the geometry is valid. xml_pluck\\tPluck a value out of an XML string using XPath. The returned value will be a string.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-output-formats-1\", \"type\": \"section\", \"title\": \"Output Formats\", \"path\": [\"API Endpoints\", \"Output Formats\"], \"text\": \"Output Formats\\nThe Socrata Open Data API supports a number of different response formats that can be specified either via response type extensions on the API endpoint or HTTP Accept headers. CSV\\tcsv\\ttext/csv; charset=utf-8\\t2.0, 2.1, and 3.0 GeoJSON\\tgeojson\\tapplication/vnd.geo+json;charset=utf-8\\t2.1 and 3.0 JSON\\tjson\\tapplication/json;charset=utf-8\\t2.0, 2.1, and 3.0 RDF-XML\\trdf\\tapplication/rdf+xml; charset=utf-8\\t2.0 XML\\txml\\ttext/xml; charset=utf-8\\t2.0 and 3.0 Neither type is better than the other - simply select the one that works best for your framework and application.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-extensions-1\", \"type\": \"section\", \"title\": \"Extensions\", \"path\": [\"API Endpoints\", \"Extensions\"], \"text\": \"Extensions\\nThe simplest way to specify the response format is by appending a response type extension to the URL. This allows you to set the response format without requiring the ability to set headers in your HTTP client. Simply add the extension to the endpoint. For example, if your resource endpoint is /resource/644b-gaut, and you wanted to get CSV output, your path would be /resource/644b-gaut.csv. HTTP Accept Headers HTTP Accept headers allow applications to automatically negotiate content types with a web service. With SODA, this also means you can request content types using Accept headers without needing to provide a response type extension. Simply send an Accept header along with the desired mimetype for the desired response type. For example, to request JSON, you\\u2019d use a header of Accept: application/json. The SODA API response will also include a Content-type header to specify the format of the data that it is returning.\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-datatypes-1\", \"type\": \"section\", \"title\": \"Datatypes\", \"path\": [\"API Endpoints\", \"Datatypes\"], \"text\": \"Datatypes\\nThere are many core datatypes in SODA. What datatypes you may find depends on the version of your API endpoint: Checkbox\\t2.0, 2.1, and 3.0 Fixed Timestamp\\t2.0, 2.1, and 3.0 Floating Timestamp\\t2.0 and 2.1 Line\\t2.1 and 3.0 Location\\t2.0, 2.1, and 3.0 MultiLine\\t2.1 and 3.0 MultiPoint\\t2.1 and 3.0 MultiPolygon\\t2.1 and 3.0 Number\\t2.0, 2.1, and 3.0 Point\\t2.1 and 3.0 Polygon\\t2.1 and 3.0 Text\\t2.0, 2.1, and 3.0 URL\\t2.0, 2.1, and 3.0 Other APIs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-dataset-management-1\", \"type\": \"section\", \"title\": \"Dataset Management\", \"path\": [\"API Endpoints\", \"Dataset Management\"], \"text\": \"Dataset Management\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-approvals-1\", \"type\": \"section\", \"title\": \"Approvals\", \"path\": [\"API Endpoints\", \"Approvals\"], \"text\": \"Approvals\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-curated-region-jobs-1\", \"type\": \"section\", \"title\": \"Curated Region Jobs\", \"path\": [\"API Endpoints\", \"Curated Region Jobs\"], \"text\": \"Curated Region Jobs\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-curated-regions-1\", \"type\": \"section\", \"title\": \"Curated Regions\", \"path\": [\"API Endpoints\", \"Curated Regions\"], \"text\": \"Curated Regions\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-metadata-1\", \"type\": \"section\", \"title\": \"Metadata\", \"path\": [\"API Endpoints\", \"Metadata\"], \"text\": \"Metadata\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-publishing-1\", \"type\": \"section\", \"title\": \"Publishing\", \"path\": [\"API Endpoints\", \"Publishing\"], \"text\": \"Publishing\\nSearch and Discovery\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-discovery-1\", \"type\": \"section\", \"title\": \"Discovery\", \"path\": [\"API Endpoints\", \"Discovery\"], \"text\": \"Discovery\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-team-search-1\", \"type\": \"section\", \"title\": \"Team Search\", \"path\": [\"API Endpoints\", \"Team Search\"], \"text\": \"Team Search\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-user-search-1\", \"type\": \"section\", \"title\": \"User Search\", \"path\": [\"API Endpoints\", \"User Search\"], \"text\": \"User Search\\nExport and Integration OData V2 ODN\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-authentication-1\", \"type\": \"section\", \"title\": \"Authentication\", \"path\": [\"API Endpoints\", \"Authentication\"], \"text\": \"Authentication\\nAPI Keys\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n{\"id\": \"section-permissions-1\", \"type\": \"section\", \"title\": \"Permissions\", \"path\": [\"API Endpoints\", \"Permissions\"], \"text\": \"Permissions\", \"tags\": [\"section\"], \"source_file\": \"docs/Discovery_API_2.txt\", \"doc_id\": \"socrata_soda_api\"}\n";
+export const SOCRATA_RAG_BUNDLE_ALIASES: Record<string, string> = {"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-audience-audience-find-by-audience-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-boost-key-number-boost-assets-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-column-names-name-find-by-column-name-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-custom-metadata-key-value-find-by-domain-specific-metadata-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-for-user-4x4-find-by-owner-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-license-license-find-assets-by-license-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-names-name-find-assets-by-name-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-only-type-find-assets-by-type-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-order-sort-order-sort-results-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-published-true-false-find-by-publication-status-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-resp-1":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1"};
+export const SOCRATA_RAG_BUNDLE_SHA256 = "d9f6c3731bea01a3eb945d0277f01ffa96269b6b9d94bdfc5645247e61c6c110";
+export const SOCRATA_RAG_ANSWER_CACHE: RagAnswerCache | null = {"version":1,"config":{"min_token_length":2,"stop_words":["a","about","an","and","are","as","at","be","but","by","can","else","for","from","how","if","in","into","is","it","its","less","may","might","more","not","of","on","or","our","over","should","that","the","their","them","these","they","this","those","to","under","was","we","were","what","when","where","which","who","why","will","with","you","your"],"limits":{"max_chunks":2500,"max_chunk_chars":8000,"max_total_chars":1500000},"max_top_k":25},"chunk_set_sha256":"d9f6c3731bea01a3eb945d0277f01ffa96269b6b9d94bdfc5645247e61c6c110","chunk_count":132,"entries":{"catalog/v1 search_context q limit offset tags categories\n{\"docIds\":[\"socrata_discovery\"],\"sourceFiles\":[\"docs/Discovery_API.md\"]}":{"id":"socrata_discovery_prompt","hits":[{"chunk":13,"id":"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1","score":11.937052683956656},{"chunk":15,"id":"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1","score":11.077997435754785},{"chunk":58,"id":"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1","score":10.277271882967355},{"chunk":9,"id":"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-summary-1","score":9.900394287542536},{"chunk":43,"id":"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-summary-1","score":7.525189876096285},{"chunk":45,"id":"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-summary-1","score":7.2877213606049605},{"chunk":14,"id":"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1","score":6.564413783245643},{"chunk":39,"id":"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1","score":6.435200573660503},{"chunk":60,"id":"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1","score":6.401469199448966},{"chunk":16,"id":"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1","score":6.341500304510273},{"chunk":68,"id":"endpoint-get-catalog-v1-tags-autocomplete-q-query-autocomplete-asset-tags-summary-1","score":6.163806579265231},{"chunk":35,"id":"endpoint-get-catalog-v1-search-context-domain-shared-to-4x4-find-by-granted-shares-summary-1","score":6.011360132983773},{"chunk":77,"id":"endpoint-get-catalog-v1-domains-domain-facets-count-assets-by-facets-summary-1","score":5.828166614958722},{"chunk":59,"id":"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1","score":5.817079724406987},{"chunk":61,"id":"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-2","score":5.480828408209961},{"chunk":0,"id":"section-purpose-1","score":5.381565800782116},{"chunk":41,"id":"endpoint-get-catalog-v1-audience-audience-find-by-audience-summary-1","score":5.08565874997711},{"chunk":47,"id":"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1","score":4.911984094683864},{"chunk":5,"id":"section-additional-api-facts-2","score":4.4420077275696155},{"chunk":75,"id":"endpoint-get-catalog-v1-domain-categories-count-assets-by-category-summary-1","score":4.301595667199889},{"chunk":8,"id":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-resp-1","score":4.193605530773109},{"chunk":65,"id":"endpoint-get-catalog-v1-autocomplete-q-query-deduplicate-true-false-autocomplete-asset-names-summary-1","score":4.176959359113848},{"chunk":25,"id":"endpoint-get-catalog-v1-q-query-min-should-match-match-term-find-assets-by-query-term-summary-1","score":4.149012842892268},{"chunk":48,"id":"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-2","score":4.114192633750424},{"chunk":37,"id":"endpoint-get-catalog-v1-column-names-name-find-by-column-name-summary-1","score":4.035098356653522}]},"soda /resource/{id}.json /api/v3/views/{id}/query.json app token\n{\"docIds\":[\"socrata_soda_api\"],\"sourceFiles\":[\"docs/Discovery_API_2.txt\"]}":{"id":"socrata_soda_prompt","hits":[{"chunk":89,"id":"section-version-3-0-latest-1","score":11.09538349061515},{"chunk":110,"id":"section-section-1","score":8.679565470784492},{"chunk":95,"id":"section-application-tokens-2","score":7.1932871071435915},{"chunk":99,"id":"section-workflow-2","score":7.1234342952441825},{"chunk":119,"id":"section-extensions-1","score":6.936071465524342},{"chunk":114,"id":"section-example-1","score":6.425749445104024},{"chunk":87,"id":"section-api-endpoints-2","score":5.91763361956412},{"chunk":97,"id":"section-authentication-2","score":5.7328418246524935},{"chunk":113,"id":"section-section-2","score":5.701760547459973},{"chunk":108,"id":"section-version-2-0-2","score":5.586278362048624},{"chunk":115,"id":"section-section-2","score":4.955046201964764},{"chunk":101,"id":"section-response-codes-1","score":4.637392786644654},{"chunk":118,"id":"section-output-formats-1","score":4.149678475697508},{"chunk":90,"id":"section-version-2-1-1","score":3.40443433791378},{"chunk":117,"id":"section-data-transform-listing-2","score":2.9586497340016127},{"chunk":105,"id":"section-system-fields-1","score":2.606524774800292},{"chunk":93,"id":"section-row-identifiers-2","score":2.324264914595909},{"chunk":102,"id":"section-headers-1","score":1.9343921420194037},{"chunk":106,"id":"section-version-2-1-1","score":1.879960772561804},{"chunk":91,"id":"section-version-2-0-1","score":1.7449742553718537},{"chunk":88,"id":"section-endpoint-versioning-1","score":1.5784395938538602},{"chunk":120,"id":"section-datatypes-1","score":1.5378306995652884},{"chunk":86,"id":"section-api-endpoints-1","score":0.2115810088797487},{"chunk":130,"id":"section-authentication-1","score":0.20967567441495064}]},"catalog search parameters q search_context domains categories tags only\n{\"docIds\":[\"socrata_discovery\"],\"types\":[\"request-params\"]}":{"id":"socrata_discovery_parameters","hits":[{"chunk":14,"id":"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-req-query-1","score":1.3985636243369406},{"chunk":10,"id":"endpoint-get-catalog-v1-search-context-domain-domains-domain-find-assets-by-domain-req-query-1","score":0.9128661775330141},{"chunk":16,"id":"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-req-query-1","score":0.8685496714897554}]},"limit offset scroll_id pagination results\n{\"docIds\":[\"socrata_discovery\"]}":{"id":"socrata_discovery_paging","hits":[{"chunk":58,"id":"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-summary-1","score":17.88778810343952},{"chunk":61,"id":"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-2","score":13.363666063393323},{"chunk":60,"id":"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-summary-1","score":12.383300368392671},{"chunk":62,"id":"endpoint-get-catalog-v1-limit-number-scroll-id-id-deep-scroll-results-req-query-1","score":9.949593872185659},{"chunk":59,"id":"endpoint-get-catalog-v1-limit-number-offset-number-paginate-results-req-query-1","score":7.593324763908655},{"chunk":50,"id":"endpoint-get-catalog-v1-submitter-id-4x4-find-by-submitter-summary-1","score":4.810277901475279},{"chunk":52,"id":"endpoint-get-catalog-v1-reviewer-id-4x4-find-by-reviewer-summary-1","score":4.810277901475279},{"chunk":27,"id":"endpoint-get-catalog-v1-parent-ids-4x4-find-assets-by-parent-id-summary-1","score":3.7589724826060245},{"chunk":6,"id":"endpoint-get-catalog-v1-ids-4x4-find-assets-by-id-summary-1","score":3.591240264147431},{"chunk":43,"id":"endpoint-get-catalog-v1-published-true-false-find-by-publication-status-summary-1","score":3.249638788955279},{"chunk":56,"id":"endpoint-get-catalog-v1-order-sort-order-sort-results-summary-1","score":3.1541980285855384},{"chunk":45,"id":"endpoint-get-catalog-v1-explicitly-hidden-true-false-find-hidden-unhidden-assets-summary-1","score":3.065955354230254},{"chunk":31,"id":"endpoint-get-catalog-v1-provenance-provenance-find-by-provenance-summary-1","score":3.0540388169659787},{"chunk":23,"id":"endpoint-get-catalog-v1-license-license-find-assets-by-license-summary-1","score":2.7143213366884122},{"chunk":39,"id":"endpoint-get-catalog-v1-visibility-visibility-show-visibility-true-false-find-by-visibility-summary-1","score":2.6992289020485045},{"chunk":21,"id":"endpoint-get-catalog-v1-attribution-organization-find-assets-by-attribution-summary-1","score":2.694939785309339},{"chunk":33,"id":"endpoint-get-catalog-v1-for-user-4x4-find-by-owner-summary-1","score":2.5493132660621587},{"chunk":29,"id":"endpoint-get-catalog-v1-derived-from-4x4-find-assets-derived-from-others-summary-1","score":2.482246657990503},{"chunk":54,"id":"endpoint-get-catalog-v1-derived-true-false-find-derived-base-assets-summary-1","score":2.4186183349803594},{"chunk":15,"id":"endpoint-get-catalog-v1-search-context-search-context-tags-tag-find-assets-by-tag-summary-1","score":2.300670502977346},{"chunk":37,"id":"endpoint-get-catalog-v1-column-names-name-find-by-column-name-summary-1","score":2.259352634458596},{"chunk":13,"id":"endpoint-get-catalog-v1-search-context-search-context-categories-category-find-assets-by-category-summary-1","score":2.2326221119853473},{"chunk":17,"id":"endpoint-get-catalog-v1-only-type-find-assets-by-type-summary-1","score":2.206516694359685},{"chunk":11,"id":"endpoint-get-catalog-v1-names-name-find-assets-by-name-summary-1","score":2.1560954678328885},{"chunk":47,"id":"endpoint-get-catalog-v1-approval-status-approved-rejected-pending-not-ready-target-audience-public-internal-find-by-approval-status-summary-1","score":2.0682396687578852}]},"/resource/{id}.json $limit $offset paging\n{\"docIds\":[\"socrata_soda_api\"]}":{"id":"socrata_soda_v2_paging","hits":[{"chunk":119,"id":"section-extensions-1","score":4.096265167769898},{"chunk":89,"id":"section-version-3-0-latest-1","score":3.4263417922796355},{"chunk":101,"id":"section-response-codes-1","score":2.2024130184436506},{"chunk":108,"id":"section-version-2-0-2","score":2.134186907889},{"chunk":113,"id":"section-section-2","score":1.9854909294940892},{"chunk":118,"id":"section-output-formats-1","score":1.9849957823077344},{"chunk":110,"id":"section-section-1","score":1.8035278585650079},{"chunk":114,"id":"section-example-1","score":1.4757206402903846},{"chunk":117,"id":"section-data-transform-listing-2","score":1.4490408891205155},{"chunk":95,"id":"section-application-tokens-2","score":1.065724136794017},{"chunk":99,"id":"section-workflow-2","score":1.050569030973676},{"chunk":90,"id":"section-version-2-1-1","score":1.0447928426502917},{"chunk":97,"id":"section-authentication-2","score":0.8756310401193879},{"chunk":102,"id":"section-headers-1","score":0.834581683915502},{"chunk":87,"id":"section-api-endpoints-2","score":0.7875378920986307},{"chunk":115,"id":"section-section-2","score":0.6829852428650923},{"chunk":105,"id":"section-system-fields-1","score":0.6580448766207255},{"chunk":106,"id":"section-version-2-1-1","score":0.4758940111257384},{"chunk":93,"id":"section-row-identifiers-2","score":0.46525841055643125}]},"/api/v3/views/{id}/query.json page pagenumber pagesize app token\n{\"docIds\":[\"socrata_soda_api\"]}":{"id":"socrata_soda_v3_paging","hits":[{"chunk":114,"id":"section-example-1","score":13.6936257445368},{"chunk":113,"id":"section-section-2","score":7.399551134984066},{"chunk":110,"id":"section-section-1","score":6.876037612219484},{"chunk":89,"id":"section-version-3-0-latest-1","score":6.717638747306076},{"chunk":108,"id":"section-version-2-0-2","score":6.632837350082855},{"chunk":95,"id":"section-application-tokens-2","score":5.994423552772181},{"chunk":99,"id":"section-workflow-2","score":4.996063307481049},{"chunk":97,"id":"section-authentication-2","score":4.387414172639497},{"chunk":87,"id":"section-api-endpoints-2","score":3.8350273156434413},{"chunk":115,"id":"section-section-2","score":3.6655159589562674},{"chunk":101,"id":"section-response-codes-1","score":2.4349797682010026},{"chunk":118,"id":"section-output-formats-1","score":2.1646826933897736},{"chunk":119,"id":"section-extensions-1","score":1.5564607861230184},{"chunk":117,"id":"section-data-transform-listing-2","score":1.5096088448810971},{"chunk":90,"id":"section-version-2-1-1","score":1.0447928426502917},{"chunk":93,"id":"section-row-identifiers-2","score":0.8864329838259032},{"chunk":105,"id":"section-system-fields-1","score":0.8775038792956771},{"chunk":102,"id":"section-headers-1","score":0.6072105525560533},{"chunk":106,"id":"section-version-2-1-1","score":0.25096627559232376},{"chunk":91,"id":"section-version-2-0-1","score":0.2178098553659312},{"chunk":86,"id":"section-api-endpoints-1","score":0.2115810088797487},{"chunk":130,"id":"section-authentication-1","score":0.20967567441495064},{"chunk":88,"id":"section-endpoint-versioning-1","score":0.19070018719570825},{"chunk":120,"id":"section-datatypes-1","score":0.16989675572852117}]}}};
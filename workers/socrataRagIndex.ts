@@ -7,8 +7,14 @@ import {
   RAG_INDEX_LIMITS,
   RAG_INDEX_STORAGE_STRATEGY
 } from "../services/ragIndex";
+import { createRagAnswerLookup } from "../services/ragAnswerCache";
 import { RAG_GUARDRAILS, assertRagGuardrails } from "../services/ragGuardrails";
-import { SOCRATA_RAG_BUNDLE_JSONL } from "./socrataRagBundle";
+import {
+  SOCRATA_RAG_ANSWER_CACHE,
+  SOCRATA_RAG_BUNDLE_ALIASES,
+  SOCRATA_RAG_BUNDLE_JSONL,
+  SOCRATA_RAG_BUNDLE_SHA256
+} from "./socrataRagBundle";
 
 // In-memory index only (zero-cost); no KV caching. Keep size bounded.
 const INDEX_OPTIONS = {
@@ -26,16 +32,25 @@ assertRagGuardrails({
 const socrataChunks = parseJsonl<RagChunk>(SOCRATA_RAG_BUNDLE_JSONL);
 const socrataIndex = new RagIndex(socrataChunks, INDEX_OPTIONS);
 const socrataChunkMap = new Map(socrataChunks.map((chunk) => [chunk.id, chunk]));
+// Hits of the client's fixed lookups, precomputed at build time; null if stale.
+const socrataAnswers = createRagAnswerLookup(
+  SOCRATA_RAG_ANSWER_CACHE ?? undefined,
+  socrataChunks,
+  SOCRATA_RAG_BUNDLE_SHA256,
+  INDEX_OPTIONS
+);
 
 export const querySocrataRag = (query: string, options?: RagQueryOptions): RagQueryHit[] => {
-  return socrataIndex.query(query, options);
+  return socrataAnswers?.(query, options) ?? socrataIndex.query(query, options);
 };
 
 export const getSocrataRagChunksById = (ids: string[], limit = 12): RagChunk[] => {
   const unique: string[] = [];
   const seen = new Set<string>();
   for (const raw of ids || []) {
-    const value = (raw || "").trim();
+    const trimmed = (raw || "").trim();
+    // near-duplicate chunks were folded into a survivor when the bundle was built
+    const value = SOCRATA_RAG_BUNDLE_ALIASES[trimmed] ?? trimmed;
     if (!value || seen.has(value)) continue;
     seen.add(value);
     unique.push(value);